@@ -4,7 +4,9 @@ import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
-from utils import load_data, filter_data, create_player_profile, create_team_comparison
+from shared_dataset import shared_dataset_enabled
+from utils import load_data, filter_data, create_player_profile, create_team_comparison, file_signature
+from game_stats import GAME_FILE, GameStatsStore, player_game_log
 
 # Import new functions with fallback for deployment environments
 try:
@@ -78,12 +80,25 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Load data
-@st.cache_data
 def load_cached_data():
     return load_data()
 
+# In shared dataset mode every session reuses the same memory-mapped frame;
+# st.cache_data would hand each session its own deserialized copy
+if shared_dataset_enabled():
+    load_cached_data = st.cache_resource(load_cached_data)
+else:
+    load_cached_data = st.cache_data(load_cached_data)
+
 data = load_cached_data()
 
+@st.cache_data(max_entries=2)
+def load_cached_games(signature):
+    """Box scores, re-read only when the game file's signature changes"""
+    return GameStatsStore().load_games()
+
+games = load_cached_games(file_signature(GAME_FILE))
+
 # Header
 st.title("🏈 CJFL Analytics Dashboard")
 st.markdown("**Canadian Junior Football League Player Statistics (2022-2024)**")
@@ -263,7 +278,8 @@ else:
                 st.metric("Position", latest_data['Position'])
             
             # Create comprehensive trend analysis
-            trend_tabs = st.tabs(["Offensive Trends", "Defensive Trends", "Per Game Trends", "Season Comparison"])
+            trend_tabs = st.tabs(["Offensive Trends", "Defensive Trends", "Per Game Trends", "Season Comparison",
+                                  "Game by Game"])
             
             with trend_tabs[0]:
                 # Offensive trends
@@ -391,6 +407,49 @@ else:
                     comparison_data[col] = comparison_data[col].apply(lambda x: f"{x:.2f}")
                 
                 st.dataframe(comparison_data, use_container_width=True)
+            
+            with trend_tabs[4]:
+                # Game-level trends from the box score table
+                game_log = player_game_log(games, selected_player_trend)
+                
+                if game_log.empty:
+                    st.info("No box scores for this player yet. Import them with `python game_stats.py import <file>`.")
+                else:
+                    game_log['Game'] = "S" + game_log['Season'].astype(str) + " W" + game_log['Week'].astype(str)
+                    fig = make_subplots(
+                        rows=1, cols=3,
+                        subplot_titles=('Total Yards', 'Touchdowns', 'Tackles'),
+                        specs=[[{"secondary_y": False}, {"secondary_y": False}, {"secondary_y": False}]]
+                    )
+                    
+                    for i, stat in enumerate(['Total Yards', 'Touchdowns', 'Tackles']):
+                        fig.add_trace(
+                            go.Scatter(
+                                x=game_log['Game'],
+                                y=game_log[stat],
+                                mode='lines+markers',
+                                name=stat,
+                                text=game_log['Opponent'],
+                                line=dict(width=3)
+                            ),
+                            row=1, col=i + 1
+                        )
+                    
+                    fig.update_layout(
+                        title=f"Game by Game Performance for {selected_player_trend}",
+                        plot_bgcolor='rgba(0,0,0,0)',
+                        paper_bgcolor='rgba(0,0,0,0)',
+                        font=dict(color='#fafafa'),
+                        height=400
+                    )
+                    
+                    fig.update_xaxes(gridcolor='#464646')
+                    fig.update_yaxes(gridcolor='#464646')
+                    
+                    st.plotly_chart(fig, use_container_width=True)
+                    st.dataframe(game_log[['Game', 'Game Date', 'Opponent', 'Passing Yards', 'Rushing Yards',
+                                           'Receiving Yards', 'Touchdowns', 'Tackles', 'Sacks', 'Interceptions']],
+                                 use_container_width=True)
 
     # Team vs Team Comparison
     st.header("🏆 Team Comparison")
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+CJFL Bootstrap Intervals
+Confidence intervals for team totals and per-game metrics, so a small gap between
+two teams or players isn't read as a real difference.
+
+Each group (a team, or one player's box scores) is resampled with replacement
+thousands of times. A resample is just a row of counts (how often each unit was
+drawn), so every resample of a group is one (resamples x units) count matrix drawn
+at once. The resampled totals of every statistic are then a single matrix product
+with the group's (units x stats) values. Per-game metrics are ratios of two such
+totals. Intervals are the percentiles of the resampled values.
+
+Team intervals resample the team's player rows: how much a number rests on a few
+players. Player intervals resample the player's games from the box scores.
+
+    python bootstrap.py --teams "Calgary Colts" "Regina Thunder"
+    python bootstrap.py --players "Jordan Smith" --confidence 0.95
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_RESAMPLES = 2000
+DEFAULT_CONFIDENCE = 0.9
+TOTAL_STATS = ['Total Yards', 'Passing Yards', 'Rushing Yards', 'Receiving Yards', 'Touchdowns', 'Tackles', 'Sacks',
+               'Interceptions']
+PER_GAME_STATS = {
+    'Yards per Game': 'Total Yards',
+    'Touchdowns per Game': 'Touchdowns',
+    'Tackles per Game': 'Tackles',
+    'Sacks per Game': 'Sacks'
+}
+INTERVAL_COLUMNS = ['Stat', 'Value', 'Lower', 'Upper']
+
+def with_total_yards(data):
+    """Shallow copy with a 'Total Yards' column (box scores have none)"""
+    if 'Total Yards' in data.columns:
+        return data
+    return data.assign(**{'Total Yards': data['Passing Yards'] + data['Rushing Yards'] + data['Receiving Yards']})
+
+def resample_counts(n_units, n_resamples, rng):
+    """(resamples x units) matrix; each row says how many times each unit was drawn"""
+    return rng.multinomial(n_units, np.full(n_units, 1 / n_units), size=n_resamples).astype('float64')
+
+def bootstrap_sums(values, n_resamples=DEFAULT_RESAMPLES, rng=None):
+    """Column sums of `values` (units x stats) over n_resamples resamples of its rows: (resamples x stats)"""
+    rng = rng if rng is not None else np.random.default_rng()
+    return resample_counts(len(values), n_resamples, rng) @ values
+
+def percentile_interval(samples, confidence=DEFAULT_CONFIDENCE):
+    """(lower, upper) percentile bounds of each column of samples"""
+    tail = (1 - confidence) / 2
+    return np.quantile(samples, tail, axis=0), np.quantile(samples, 1 - tail, axis=0)
+
+def group_intervals(data, key, per_game_denominator, n_resamples=DEFAULT_RESAMPLES,
+                    confidence=DEFAULT_CONFIDENCE, seed=0):
+    """
+    Intervals for every group in data (grouped by `key`): the totals in TOTAL_STATS and
+    the PER_GAME_STATS rates, where per_game_denominator is the column counting games
+    (None when every row is one game). One row per group and stat: key, Stat, Value,
+    Lower, Upper. A fixed seed gives the same intervals on every call.
+    """
+    keys = [key] if isinstance(key, str) else list(key)
+    if data.empty:
+        return pd.DataFrame(columns=keys + INTERVAL_COLUMNS)
+    data = with_total_yards(data)
+    games = data[per_game_denominator] if per_game_denominator else pd.Series(1, index=data.index)
+    values = np.column_stack([data[TOTAL_STATS].to_numpy(dtype='float64'), games.to_numpy(dtype='float64')])
+    rates = [TOTAL_STATS.index(stat) for stat in PER_GAME_STATS.values()]
+
+    rng = np.random.default_rng(seed)
+    frames = []
+    for group, rows in data.groupby(keys, sort=True).indices.items():
+        group_values = values[rows]
+        sums = bootstrap_sums(group_values, n_resamples, rng)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            samples = np.column_stack([sums[:, :-1], sums[:, rates] / sums[:, [-1]]])
+            observed = group_values.sum(axis=0)
+            point = np.concatenate([observed[:-1], observed[rates] / observed[-1]])
+        lower, upper = percentile_interval(samples, confidence)
+        frame = pd.DataFrame({'Stat': TOTAL_STATS + list(PER_GAME_STATS), 'Value': point, 'Lower': lower,
+                              'Upper': upper})
+        for name, value in zip(keys, group if isinstance(group, tuple) else (group,)):
+            frame.insert(keys.index(name), name, value)
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
+
+def team_intervals(data, teams=None, n_resamples=DEFAULT_RESAMPLES, confidence=DEFAULT_CONFIDENCE, seed=0):
+    """Team totals and per-game rates (per player-game) with intervals from resampling each roster"""
+    if teams is not None:
+        data = data[data['Team'].isin(teams)]
+    return group_intervals(data, 'Team', 'Games Played', n_resamples, confidence, seed)
+
+def player_intervals(games, players=None, n_resamples=DEFAULT_RESAMPLES, confidence=DEFAULT_CONFIDENCE, seed=0):
+    """Season totals and per-game rates per player with intervals from resampling their box scores"""
+    if players is not None:
+        games = games[games['Player Name'].isin(players)]
+    return group_intervals(games, ['Player Name', 'Team', 'Season'], None, n_resamples, confidence, seed)
+
+def error_bars(intervals, stats):
+    """Plotly error_y for bars of the given stats, from one group's rows of an intervals table"""
+    table = intervals.set_index('Stat').reindex(stats)
+    return dict(type='data', symmetric=False, array=(table['Upper'] - table['Value']).fillna(0).to_numpy(),
+                arrayminus=(table['Value'] - table['Lower']).fillna(0).to_numpy(), color='#fafafa', thickness=1.5)
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Bootstrap confidence intervals for team and player stats")
+    parser.add_argument("--teams", nargs="*", help="Teams to show (default: all)")
+    parser.add_argument("--players", nargs="*", help="Players to show, from the box scores")
+    parser.add_argument("--resamples", type=int, default=DEFAULT_RESAMPLES,
+                        help=f"Bootstrap resamples (default: {DEFAULT_RESAMPLES})")
+    parser.add_argument("--confidence", type=float, default=DEFAULT_CONFIDENCE,
+                        help=f"Interval coverage (default: {DEFAULT_CONFIDENCE})")
+    args = parser.parse_args()
+
+    print("🏈 CJFL BOOTSTRAP INTERVALS")
+    print("=" * 50)
+
+    if args.players is not None:
+        from game_stats import GameStatsStore
+        intervals = player_intervals(GameStatsStore().load_games(), args.players or None, args.resamples,
+                                     args.confidence)
+        if intervals.empty:
+            print("No box scores for those players. Import them with: python game_stats.py import <file>")
+            return
+        groups = intervals.groupby(['Player Name', 'Team', 'Season'], sort=False)
+    else:
+        from utils import load_data
+        intervals = team_intervals(load_data(), args.teams or None, args.resamples, args.confidence)
+        groups = intervals.groupby('Team', sort=False)
+
+    for group, rows in groups:
+        name = " ".join(str(part) for part in group) if isinstance(group, tuple) else group
+        print(f"\n📊 {name} ({args.confidence:.0%} intervals):")
+        for _, row in rows.iterrows():
+            print(f"   {row['Stat']:<22} {row['Value']:10.2f}   [{row['Lower']:10.2f}, {row['Upper']:10.2f}]")
+
+if __name__ == "__main__":
+    main()
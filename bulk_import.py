@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+CJFL Bulk Roster Import
+Imports whole roster spreadsheets (CSV or Excel) sent by team staff.
+
+Files are streamed in chunks and validated column-wise (positions, non-negative
+whole-number stats, position/stat plausibility). Valid rows are deduplicated
+against the existing dataset by player identity and written in a single atomic
+replace of data/cjfl_stats.csv; rejected rows go to a reject report. Every writer of
+the dataset (imports, game rollups, collectors) holds dataset_lock() from reading the
+file to replacing it, so concurrent processes cannot lose each other's rows.
+
+    python bulk_import.py rosters/colts_2024.xlsx --team "Calgary Colts"
+    python bulk_import.py league_export.csv --dry-run
+"""
+
+import argparse
+import os
+from contextlib import contextmanager
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from player_identity import canonical_names, load_identity_map
+from utils import POSITIONS, STAT_COLUMNS, MAX_GAMES_PER_SEASON, POSITION_STAT_LIMITS, atomic_path, player_key
+
+try:
+    import openpyxl
+except ImportError:  # Excel support is optional, CSV always works
+    openpyxl = None
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, each write is still atomic
+    fcntl = None
+
+DATA_FILE = "data/cjfl_stats.csv"
+DEFAULT_CHUNK_SIZE = 5000
+DEFAULT_SEASON = 2024
+
+OUTPUT_COLUMNS = ['Player Name', 'Team', 'Position', 'Season'] + STAT_COLUMNS
+
+# Spreadsheet headers we accept for each dataset column (compared lower-case, punctuation ignored)
+COLUMN_ALIASES = {
+    'Player Name': ['player name', 'player', 'name', 'full name'],
+    'Team': ['team', 'club'],
+    'Position': ['position', 'pos'],
+    'Season': ['season', 'year'],
+    'Games Played': ['games played', 'gp', 'games'],
+    'Passing Yards': ['passing yards', 'pass yds', 'pass yards', 'passing'],
+    'Rushing Yards': ['rushing yards', 'rush yds', 'rush yards', 'rushing'],
+    'Receiving Yards': ['receiving yards', 'rec yds', 'rec yards', 'receiving'],
+    'Touchdowns': ['touchdowns', 'td', 'tds'],
+    'Tackles': ['tackles', 'tkl', 'tot tackles'],
+    'Sacks': ['sacks', 'sk'],
+    'Interceptions': ['interceptions', 'int', 'ints']
+}
+
+POSITION_ALIASES = {'CB': 'DB', 'S': 'DB', 'FS': 'DB', 'SS': 'DB', 'DE': 'DL', 'DT': 'DL', 'NT': 'DL',
+                    'ILB': 'LB', 'OLB': 'LB', 'MLB': 'LB', 'SB': 'WR', 'HB': 'RB', 'FB': 'RB',
+                    'OT': 'OL', 'OG': 'OL', 'C': 'OL', 'PK': 'K'}
+
+def canonical_columns(columns):
+    """Map spreadsheet headers to dataset column names; unknown headers are kept as-is"""
+    lookup = {alias: column for column, aliases in COLUMN_ALIASES.items() for alias in aliases}
+    mapping = {}
+    for column in columns:
+        key = " ".join(str(column).lower().replace("_", " ").replace(".", " ").split())
+        mapping[column] = lookup.get(key, column)
+    return mapping
+
+def read_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield the file as DataFrames of at most chunk_size rows, all values as strings"""
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension in ('.xlsx', '.xlsm'):
+        if openpyxl is None:
+            raise ImportError("openpyxl is required to import Excel files (pip install openpyxl)")
+        workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = [str(value) if value is not None else "" for value in next(rows, [])]
+            batch = []
+            for row in rows:
+                if all(value is None for value in row):
+                    continue
+                batch.append(["" if value is None else str(value) for value in row])
+                if len(batch) == chunk_size:
+                    yield pd.DataFrame(batch, columns=header)
+                    batch = []
+            if batch:
+                yield pd.DataFrame(batch, columns=header)
+        finally:
+            workbook.close()
+    else:
+        yield from pd.read_csv(path, dtype=str, keep_default_na=False, chunksize=chunk_size,
+                               skipinitialspace=True)
+
+def validate_chunk(chunk, team=None, season=None):
+    """
+    Validate one chunk with column-wise checks.
+    Returns (valid rows in dataset layout, rejected rows with a 'Reason' column).
+    """
+    chunk = chunk.rename(columns=canonical_columns(chunk.columns))
+    reasons = pd.Series("", index=chunk.index)
+
+    def reject(mask, message):
+        nonlocal reasons
+        reasons = reasons.where(~mask, reasons + np.where(reasons == "", "", "; ") + message)
+
+    rows = pd.DataFrame(index=chunk.index)
+    rows['Player Name'] = chunk.get('Player Name', pd.Series("", index=chunk.index)).astype(str).str.strip()
+    rows['Team'] = chunk['Team'].astype(str).str.strip() if 'Team' in chunk else ""
+    if team:
+        rows['Team'] = rows['Team'].where(rows['Team'] != "", team)
+    positions = chunk.get('Position', pd.Series("", index=chunk.index)).astype(str).str.strip().str.upper()
+    rows['Position'] = positions.replace(POSITION_ALIASES)
+
+    reject(rows['Player Name'] == "", "missing player name")
+    reject(rows['Team'] == "", "missing team")
+    reject(~rows['Position'].isin(POSITIONS), "unknown position")
+    if team:
+        reject(rows['Team'] != team, f"team is not {team}")
+
+    season_values = chunk['Season'] if 'Season' in chunk else pd.Series("", index=chunk.index)
+    season_values = season_values.astype(str).str.strip().replace("", str(season or DEFAULT_SEASON))
+    rows['Season'] = pd.to_numeric(season_values, errors='coerce')
+    reject(rows['Season'].isna() | (rows['Season'] % 1 != 0), "invalid season")
+
+    for stat in STAT_COLUMNS:
+        raw = chunk[stat].astype(str).str.strip().str.replace(",", "", regex=False) if stat in chunk \
+            else pd.Series("", index=chunk.index)
+        values = pd.to_numeric(raw.replace("", "0"), errors='coerce')
+        reject(values.isna(), f"{stat} is not a number")
+        reject(values < 0, f"{stat} is negative")
+        reject(values % 1 > 0, f"{stat} is not a whole number")
+        rows[stat] = values
+
+    reject(rows['Games Played'] > MAX_GAMES_PER_SEASON, f"Games Played above {MAX_GAMES_PER_SEASON}")
+    for stat in STAT_COLUMNS[1:]:
+        limits = rows['Position'].map({position: limits[stat] for position, limits in POSITION_STAT_LIMITS.items()})
+        reject(rows[stat] > limits, f"{stat} implausible for position")
+    reject((rows['Games Played'] == 0) & (rows[STAT_COLUMNS[1:]].sum(axis=1) > 0), "stats recorded with 0 games played")
+
+    valid_mask = reasons == ""
+    valid = rows[valid_mask].copy()
+    for column in ['Season'] + STAT_COLUMNS:
+        valid[column] = valid[column].astype('int64')
+
+    rejected = chunk[~valid_mask].copy()
+    rejected.insert(0, 'Reason', reasons[~valid_mask])
+    return valid, rejected
+
+def identity_key(data, mapping=None):
+    """Deduplication key: the player's canonical name (when a mapping is given), team and season"""
+    return player_key(data.assign(**{'Player Name': canonical_names(data, mapping)}))
+
+def merge_rows(existing, incoming, on_duplicate='update', mapping=None):
+    """
+    Combine incoming rows with the existing dataset.
+    Duplicates inside the file keep the last row; duplicates of existing players either
+    replace the stored row ('update') or are ignored ('skip'). With an identity mapping,
+    spelling variants of one player count as duplicates.
+    Returns (merged frame, added rows, updated count, skipped count).
+    """
+    incoming = incoming.assign(_key=identity_key(incoming, mapping)).drop_duplicates('_key', keep='last')
+    existing_keys = identity_key(existing, mapping) if not existing.empty else pd.Series(dtype=str)
+
+    is_duplicate = incoming['_key'].isin(set(existing_keys))
+    added = incoming[~is_duplicate]
+    duplicates = incoming[is_duplicate]
+
+    if on_duplicate == 'update' and not duplicates.empty:
+        # Replace the stored rows in place so the file keeps its order
+        replacement = duplicates.set_index('_key')[OUTPUT_COLUMNS]
+        keep = existing[~existing_keys.isin(replacement.index).to_numpy()]
+        replaced = existing[existing_keys.isin(replacement.index).to_numpy()]
+        updated_rows = replacement.loc[identity_key(replaced, mapping)].reset_index(drop=True)
+        updated_rows.index = replaced.index
+        existing = pd.concat([keep, updated_rows]).sort_index()
+        updated, skipped = len(duplicates), 0
+    else:
+        updated, skipped = 0, len(duplicates)
+
+    merged = pd.concat([existing, added[OUTPUT_COLUMNS]], ignore_index=True)
+    return merged, added[OUTPUT_COLUMNS], updated, skipped
+
+def write_atomic(data, path):
+    """Write a CSV via a temp file and rename, so readers never see a half-written dataset"""
+    with atomic_path(path) as tmp_path:
+        data.to_csv(tmp_path, index=False)
+
+@contextmanager
+def dataset_lock(path=DATA_FILE):
+    """
+    Exclusive inter-process lock on a dataset file. Hold it from reading the file to replacing
+    it; flock also excludes other threads of this process that open the lock file separately.
+    """
+    if fcntl is None:
+        yield
+        return
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(f"{path}.lock", 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def import_file(path, data_file=DATA_FILE, team=None, season=None, on_duplicate='update',
+                reject_file=None, chunk_size=DEFAULT_CHUNK_SIZE, dry_run=False):
+    """
+    Validate and import a roster file. Nothing is written unless the whole file was read;
+    the dataset is replaced in one step at the end.
+    """
+    valid_chunks = []
+    rejected_chunks = []
+    rows_read = 0
+
+    for chunk in read_chunks(path, chunk_size):
+        chunk.index = range(rows_read + 2, rows_read + 2 + len(chunk))  # spreadsheet row numbers (header is row 1)
+        rows_read += len(chunk)
+        valid, rejected = validate_chunk(chunk, team, season)
+        valid_chunks.append(valid)
+        rejected_chunks.append(rejected)
+
+    incoming = pd.concat(valid_chunks) if valid_chunks else pd.DataFrame(columns=OUTPUT_COLUMNS)
+    rejected = pd.concat(rejected_chunks) if rejected_chunks else pd.DataFrame(columns=['Reason'])
+
+    with dataset_lock(data_file):
+        existing = pd.read_csv(data_file) if os.path.exists(data_file) else pd.DataFrame(columns=OUTPUT_COLUMNS)
+        merged, added_rows, updated, skipped = merge_rows(existing, incoming, on_duplicate, load_identity_map())
+        if not dry_run and (len(added_rows) or updated):
+            write_atomic(merged, data_file)
+
+    result = {
+        "rows_read": rows_read,
+        "accepted": len(incoming),
+        "rejected": len(rejected),
+        "added": len(added_rows),
+        "updated": updated,
+        "skipped": skipped,
+        "players_by_team": incoming['Team'].value_counts().to_dict(),
+        "added_by_team": added_rows['Team'].value_counts().to_dict(),
+        "reject_file": None
+    }
+
+    if not rejected.empty:
+        reject_file = reject_file or f"{os.path.splitext(path)[0]}_rejects.csv"
+        rejected.rename_axis('Row').to_csv(reject_file)
+        result["reject_file"] = reject_file
+
+    return result
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Bulk import CJFL roster spreadsheets (CSV or Excel)")
+    parser.add_argument("files", nargs="+", help="CSV or XLSX files to import")
+    parser.add_argument("--team", help="Team for rows without one; rows for other teams are rejected")
+    parser.add_argument("--season", type=int, help=f"Season for rows without one (default: {DEFAULT_SEASON})")
+    parser.add_argument("--on-duplicate", choices=["update", "skip"], default="update",
+                        help="What to do with players already in the dataset (default: update)")
+    parser.add_argument("--data-file", default=DATA_FILE, help=f"Dataset to import into (default: {DATA_FILE})")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Rows per chunk")
+    parser.add_argument("--dry-run", action="store_true", help="Validate only, do not write the dataset")
+    args = parser.parse_args()
+
+    print("🏈 CJFL BULK ROSTER IMPORT")
+    print("=" * 50)
+
+    for path in args.files:
+        print(f"\n📄 {path}")
+        try:
+            result = import_file(path, args.data_file, args.team, args.season, args.on_duplicate,
+                                 chunk_size=args.chunk_size, dry_run=args.dry_run)
+        except (OSError, ImportError, ValueError) as e:
+            print(f"❌ Import failed: {e}")
+            continue
+
+        print(f"   Rows read: {result['rows_read']}")
+        print(f"   ✅ Accepted: {result['accepted']} (added {result['added']}, updated {result['updated']}, "
+              f"skipped {result['skipped']})")
+        if result['rejected']:
+            print(f"   ❌ Rejected: {result['rejected']} (see {result['reject_file']})")
+        for team_name, count in sorted(result['players_by_team'].items()):
+            print(f"   🏈 {team_name}: {count} players")
+
+        if args.dry_run:
+            print("   🔍 Dry run, dataset not changed")
+        elif result['added']:
+            from manual_data_entry import ManualDataEntry
+            entry_tool = ManualDataEntry()
+            for team_name, count in result['added_by_team'].items():
+                entry_tool.update_progress(team_name, count)
+
+    print(f"\n🕐 Finished at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+if __name__ == "__main__":
+    main()
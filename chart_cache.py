@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+CJFL Static Chart Cache
+Content-addressed cache of pre-rendered PNG/SVG charts plus an offline
+pre-render pipeline that renders the standard chart set for every team and season
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from utils import (load_data, filter_data, add_derived_columns, atomic_path, create_leaderboard_chart,
+                   create_team_comparison, render_static_chart)
+
+CHART_CACHE_DIR = "data/chart_cache"
+CACHE_VERSION = 1
+
+IMAGE_WIDTH = 900
+IMAGE_HEIGHT = 500
+
+# Leaderboards rendered for every team and season (same set as the dashboard tabs)
+LEADERBOARD_STATS = [
+    "Passing Yards", "Rushing Yards", "Receiving Yards", "Total Yards", "Total Offensive Yards",
+    "Touchdowns", "Touchdowns per Game", "Tackles", "Tackles per Game", "Sacks", "Sacks per Game",
+    "Yards per Game", "Games Played"
+]
+
+LEAGUE_SCOPE = "League"
+
+def chart_key(fig, image_format, width=IMAGE_WIDTH, height=IMAGE_HEIGHT):
+    """Content address of a chart: hash of the full figure spec and render settings"""
+    digest = hashlib.sha256()
+    digest.update(f"v{CACHE_VERSION}|{image_format}|{width}x{height}|".encode())
+    digest.update(fig.to_json().encode())
+    return digest.hexdigest()
+
+class ChartCache:
+    """Content-addressed image store on disk"""
+
+    def __init__(self, cache_dir=CHART_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.manifest_file = os.path.join(cache_dir, "manifest.json")
+
+    def path_for(self, key, image_format):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.{image_format}")
+
+    def get(self, key, image_format):
+        """Cached image bytes for a key, or None"""
+        path = self.path_for(key, image_format)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def put(self, key, image_format, image):
+        """Store image bytes atomically under a key"""
+        path = self.path_for(key, image_format)
+        with atomic_path(path) as tmp_path, open(tmp_path, 'wb') as f:
+            f.write(image)
+        return path
+
+    def lookup(self, fig, image_format='png'):
+        """Cached image for a figure, without rendering"""
+        return self.get(chart_key(fig, image_format), image_format)
+
+    def render(self, fig, image_format='png'):
+        """Cached image for a figure, rendering and storing it on a miss"""
+        key = chart_key(fig, image_format)
+        image = self.get(key, image_format)
+        if image is None:
+            image = render_static_chart(fig, image_format, IMAGE_WIDTH, IMAGE_HEIGHT)
+            if image is not None:
+                self.put(key, image_format, image)
+        return image
+
+    def load_manifest(self):
+        if os.path.exists(self.manifest_file):
+            with open(self.manifest_file, 'r') as f:
+                return json.load(f)
+        return {}
+
+    def save_manifest(self, manifest):
+        with atomic_path(self.manifest_file) as tmp_path, open(tmp_path, 'w') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+
+def standard_chart_set(season_data, team=None):
+    """
+    Figures for one team (or the whole league when team is None) in one season.
+    season_data must already be restricted to a single season.
+    """
+    scoped = season_data if team is None else season_data[season_data['Team'] == team]
+    charts = {}
+
+    for stat in LEADERBOARD_STATS:
+        if scoped[stat].notna().any():
+            charts[f"leaderboard_{stat}"] = create_leaderboard_chart(scoped, stat, 10, f"Top 10 Players by {stat}")
+
+    if team is not None:
+        for other in sorted(season_data['Team'].unique()):
+            if other != team:
+                charts[f"comparison_{other}"] = create_team_comparison(season_data, team, other)
+
+    return charts
+
+# Dataset shared by all tasks in a worker process (set by the pool initializer)
+_WORKER_DATA = None
+
+def _init_worker(data):
+    global _WORKER_DATA
+    _WORKER_DATA = data
+
+def _prerender_scope(season, team, image_formats, cache_dir):
+    """Render every missing chart for one season/team scope in a worker"""
+    cache = ChartCache(cache_dir)
+    season_data = add_derived_columns(filter_data(_WORKER_DATA, [season], [], [], ""))
+    entries, rendered, cached, failed = {}, 0, 0, 0
+
+    for name, fig in standard_chart_set(season_data, team).items():
+        entries[name] = {}
+        for image_format in image_formats:
+            key = chart_key(fig, image_format)
+            if os.path.exists(cache.path_for(key, image_format)):
+                cached += 1
+            else:
+                image = render_static_chart(fig, image_format, IMAGE_WIDTH, IMAGE_HEIGHT)
+                if image is None:
+                    failed += 1
+                    continue
+                cache.put(key, image_format, image)
+                rendered += 1
+            entries[name][image_format] = key
+
+    return season, team or LEAGUE_SCOPE, entries, (rendered, cached, failed)
+
+def prerender_charts(data=None, seasons=None, image_formats=('png', 'svg'), cache_dir=CHART_CACHE_DIR, max_workers=None):
+    """
+    Pre-render the standard chart set for every team and season across a worker pool.
+    Returns (rendered, already_cached, failed) counts.
+    """
+    if data is None:
+        data = load_data()
+    seasons = seasons or sorted(int(season) for season in data['Season'].unique())
+
+    scopes = []
+    for season in seasons:
+        season_teams = sorted(data.loc[data['Season'] == season, 'Team'].unique())
+        scopes += [(season, None)] + [(season, team) for team in season_teams]
+
+    cache = ChartCache(cache_dir)
+    manifest = cache.load_manifest()
+    totals = [0, 0, 0]
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(data,)) as pool:
+        futures = [pool.submit(_prerender_scope, season, team, tuple(image_formats), cache_dir) for season, team in scopes]
+        for future in as_completed(futures):
+            season, scope, entries, counts = future.result()
+            manifest.setdefault(str(season), {})[scope] = entries
+            totals = [total + count for total, count in zip(totals, counts)]
+
+    cache.save_manifest(manifest)
+    return tuple(totals)
+
+def main():
+    """Command line entry point for the offline pre-render pipeline"""
+    parser = argparse.ArgumentParser(description="Pre-render CJFL charts into the static image cache")
+    parser.add_argument("--season", type=int, action="append", help="Season to render (repeatable)")
+    parser.add_argument("--format", choices=["png", "svg", "both"], default="both", help="Image format")
+    parser.add_argument("--cache-dir", default=CHART_CACHE_DIR, help="Cache directory")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    image_formats = ('png', 'svg') if args.format == "both" else (args.format,)
+
+    print("🖼️  CJFL CHART PRE-RENDER")
+    print("=" * 50)
+
+    start = time.perf_counter()
+    rendered, cached, failed = prerender_charts(
+        seasons=args.season, image_formats=image_formats, cache_dir=args.cache_dir, max_workers=args.workers
+    )
+
+    print(f"✅ Rendered: {rendered}")
+    print(f"♻️  Already cached: {cached}")
+    if failed:
+        print(f"❌ Failed: {failed} (static export needs the kaleido package and a Chrome install)")
+    print(f"⏱️  Finished in {time.perf_counter() - start:.1f}s")
+
+if __name__ == "__main__":
+    main()
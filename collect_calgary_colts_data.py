@@ -5,24 +5,23 @@ Helps collect real CJFL statistics from Calgary Colts sources
 """
 
 import requests
-import pandas as pd
-import json
-import os
-from datetime import datetime
-from bs4 import BeautifulSoup
-import time
 
-class CalgaryColtsCollector:
-    def __init__(self):
-        self.team_name = "Calgary Colts"
-        self.website = "https://calgarycolts.com/"
-        self.social_media = {
-            "facebook": "https://www.facebook.com/calgarycolts",
-            "twitter": "https://twitter.com/calgarycolts"
-        }
-        self.contact_email = "info@calgarycolts.com"
-        self.data_file = "data/cjfl_stats.csv"
-        self.template_file = "data/cjfl_real_data_template.csv"
+from keyword_scanner import PLAYER_KEYWORDS, scan_html
+from progress_store import PROGRESS_DB
+from team_collectors import TeamCollector, register_collector
+
+CALGARY_COLTS = {
+    "website": "https://calgarycolts.com/",
+    "social_media": ["https://www.facebook.com/calgarycolts", "https://twitter.com/calgarycolts"],
+    "contact": "info@calgarycolts.com"
+}
+
+@register_collector("Calgary Colts")
+class CalgaryColtsCollector(TeamCollector):
+    """Calgary Colts adapter: the shared collector plus a step-by-step manual collection guide"""
+
+    def __init__(self, team_name="Calgary Colts", info=None, **kwargs):
+        super().__init__(team_name, info or CALGARY_COLTS, **kwargs)
         
     def check_website_sections(self):
         """Check what sections are available on the Calgary Colts website"""
@@ -30,36 +29,19 @@ class CalgaryColtsCollector:
         print("=" * 50)
         
         try:
-            response = requests.get(self.website, timeout=10)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Look for navigation menu
-                nav_links = soup.find_all('a', href=True)
-                print("📋 Found website sections:")
-                
-                sections = []
-                for link in nav_links:
-                    href = link.get('href', '').lower()
-                    text = link.get_text(strip=True)
-                    
-                    if any(keyword in href or keyword in text.lower() for keyword in 
-                          ['roster', 'players', 'team', 'stats', 'statistics', 'schedule', 'news']):
-                        sections.append(f"- {text}: {href}")
-                
-                if sections:
-                    for section in sections:
-                        print(section)
-                else:
-                    print("- No specific roster/players sections found")
-                    print("- Will need to explore the website manually")
-                
-                return True
+            sections = self.find_sections(self.fetch(self.website))
+            print("📋 Found website sections:")
+            
+            if sections:
+                for text, href in sections:
+                    print(f"- {text}: {href}")
             else:
-                print(f"❌ Website returned status {response.status_code}")
-                return False
+                print("- No specific roster/players sections found")
+                print("- Will need to explore the website manually")
+            
+            return True
                 
-        except Exception as e:
+        except requests.RequestException as e:
             print(f"❌ Error accessing website: {str(e)}")
             return False
     
@@ -69,33 +51,25 @@ class CalgaryColtsCollector:
         print("=" * 40)
         
         try:
-            response = requests.get(self.website, timeout=10)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Look for player-related content
-                player_keywords = ['player', 'roster', 'team', 'stats', 'statistics']
-                found_content = []
-                
-                for keyword in player_keywords:
-                    elements = soup.find_all(text=lambda text: text and keyword.lower() in text.lower())
-                    for element in elements[:5]:  # Limit to first 5 matches
-                        found_content.append(f"- Found '{keyword}' in: {element.strip()[:100]}...")
-                
-                if found_content:
-                    print("📋 Found potential player-related content:")
-                    for content in found_content:
-                        print(content)
-                else:
-                    print("❌ No obvious player data found on main page")
-                    print("💡 Need to explore deeper or contact team directly")
-                
-                return True
+            # One pass over the page for all keywords, best matches first
+            scan = scan_html(self.fetch(self.website), PLAYER_KEYWORDS)
+            found_content = []
+            
+            for keyword, hits in scan["hits"].items():
+                for hit in hits[:5]:  # Top 5 matches per keyword
+                    found_content.append(f"- Found '{keyword}' in: {hit['context'][:100]}...")
+            
+            if found_content:
+                print("📋 Found potential player-related content:")
+                for content in found_content:
+                    print(content)
             else:
-                print(f"❌ Website returned status {response.status_code}")
-                return False
+                print("❌ No obvious player data found on main page")
+                print("💡 Need to explore deeper or contact team directly")
+            
+            return True
                 
-        except Exception as e:
+        except requests.RequestException as e:
             print(f"❌ Error searching website: {str(e)}")
             return False
     
@@ -122,8 +96,8 @@ class CalgaryColtsCollector:
    - Search for: 2024 season information
 
 2. SOCIAL MEDIA:
-   - Facebook: {self.social_media['facebook']}
-   - Twitter: {self.social_media['twitter']}
+   - Facebook: {self.social_link('facebook')}
+   - Twitter: {self.social_link('twitter')}
    - Look for: Game updates, player highlights, roster announcements
 
 3. DIRECT CONTACT:
@@ -172,66 +146,6 @@ class CalgaryColtsCollector:
         print(plan)
         return plan
     
-    def update_progress(self, status="in_progress", players_collected=0, notes=""):
-        """Update the progress tracking for Calgary Colts"""
-        progress_file = "data/collection_progress.json"
-        
-        if os.path.exists(progress_file):
-            with open(progress_file, 'r') as f:
-                progress = json.load(f)
-        else:
-            progress = {
-                "start_date": datetime.now().isoformat(),
-                "teams": {},
-                "total_players_collected": 0,
-                "total_teams_completed": 0,
-                "last_updated": datetime.now().isoformat()
-            }
-        
-        if self.team_name not in progress["teams"]:
-            progress["teams"][self.team_name] = {
-                "status": "not_started",
-                "players_collected": 0,
-                "data_sources_checked": [],
-                "notes": "",
-                "last_updated": datetime.now().isoformat()
-            }
-        
-        progress["teams"][self.team_name]["status"] = status
-        progress["teams"][self.team_name]["players_collected"] += players_collected
-        progress["teams"][self.team_name]["notes"] = notes
-        progress["teams"][self.team_name]["last_updated"] = datetime.now().isoformat()
-        progress["total_players_collected"] += players_collected
-        progress["last_updated"] = datetime.now().isoformat()
-        
-        os.makedirs("data", exist_ok=True)
-        with open(progress_file, 'w') as f:
-            json.dump(progress, f, indent=2)
-        
-        print(f"✅ Progress updated: {self.team_name} - {status}")
-    
-    def add_player_data(self, player_data):
-        """Add collected player data to the CSV file"""
-        try:
-            # Load existing data
-            if os.path.exists(self.data_file):
-                df = pd.read_csv(self.data_file)
-            else:
-                # Use template structure
-                df = pd.read_csv(self.template_file)
-                df = df[df['Team'] != self.team_name]  # Remove template entries for this team
-            
-            # Add new player data
-            new_row = pd.DataFrame([player_data])
-            df = pd.concat([df, new_row], ignore_index=True)
-            
-            # Save updated data
-            df.to_csv(self.data_file, index=False)
-            print(f"✅ Added player data: {player_data['Player Name']}")
-            
-        except Exception as e:
-            print(f"❌ Error adding player data: {str(e)}")
-    
     def manual_data_entry_guide(self):
         """Provide guide for manual data entry"""
         print("\n📝 MANUAL DATA ENTRY GUIDE")
@@ -246,8 +160,8 @@ class CalgaryColtsCollector:
    - Look for roster, players, or team information
 
 2. CHECK SOCIAL MEDIA:
-   - Facebook: {self.social_media['facebook']}
-   - Twitter: {self.social_media['twitter']}
+   - Facebook: {self.social_link('facebook')}
+   - Twitter: {self.social_link('twitter')}
    - Look for recent posts about players or games
 
 3. CONTACT TEAM:
@@ -320,7 +234,7 @@ def main():
     print("3. Contact the team via email")
     print("4. Document any data found")
     print("5. Update progress when done")
-    print(f"\n📁 Progress tracking: data/collection_progress.json")
+    print(f"\n📁 Progress tracking: {PROGRESS_DB}")
     print(f"📊 Data file: {collector.data_file}")
 
 if __name__ == "__main__":
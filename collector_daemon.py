@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+CJFL Collector Daemon
+Long-running, scheduled data collection for all teams in the collection plan.
+
+Team websites are crawled from an async priority queue seeded with the priority of
+each team in data_collection_plan.TEAMS (priority 1 first). Requests to the same host
+are spaced out by a per-host rate limiter, failed fetches are retried with
+exponential backoff, and the queue is checkpointed after every page so a restarted
+daemon resumes mid-crawl. Stats tables found on roster/stats pages are validated and
+merged into data/cjfl_stats.csv with the bulk import helpers, every page checked is
+recorded in the progress store, and the raw HTML is kept in the page archive.
+
+    python collector_daemon.py                  # crawl now, then every 24 hours
+    python collector_daemon.py --once --workers 2
+    python collector_daemon.py --team "Calgary Colts" --reset
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+from datetime import datetime, timedelta
+from urllib.parse import urljoin, urlparse
+
+import pandas as pd
+import requests
+from bs4 import BeautifulSoup
+
+from bulk_import import (DATA_FILE, OUTPUT_COLUMNS, DEFAULT_SEASON, canonical_columns, dataset_lock, validate_chunk,
+                         merge_rows, write_atomic)
+from player_identity import load_identity_map
+from page_archive import PageArchive
+from progress_store import ProgressStore
+from utils import atomic_path
+
+CHECKPOINT_FILE = "data/collector_checkpoint.json"
+DEFAULT_WORKERS = 4
+DEFAULT_HOST_DELAY = 2.0       # seconds between two requests to the same host
+DEFAULT_INTERVAL_HOURS = 24
+DEFAULT_MAX_DEPTH = 1          # follow roster/stats links found on the team home page
+MAX_ATTEMPTS = 4
+BACKOFF_BASE = 5.0             # seconds; doubles on every attempt
+BACKOFF_MAX = 300.0
+REQUEST_TIMEOUT = 15
+USER_AGENT = "CJFL-Analytics-Collector/1.0"
+RETRY_STATUS = {408, 429, 500, 502, 503, 504}
+LINK_KEYWORDS = ['roster', 'players', 'stats', 'statistics', 'leaders']
+
+def fetch_page(url):
+    """Blocking HTTP GET; returns (status code, body text, headers)"""
+    response = requests.get(url, timeout=REQUEST_TIMEOUT, headers={"User-Agent": USER_AGENT})
+    return response.status_code, response.text, dict(response.headers)
+
+def extract_tables(html):
+    """Player stats tables on a page, with headers mapped to dataset column names"""
+    soup = BeautifulSoup(html, 'html.parser')
+    tables = []
+    for table in soup.find_all('table'):
+        rows = [[cell.get_text(" ", strip=True) for cell in row.find_all(['th', 'td'])] for row in table.find_all('tr')]
+        rows = [row for row in rows if row]
+        if len(rows) < 2:
+            continue
+        header, body = rows[0], [row for row in rows[1:] if len(row) == len(rows[0])]
+        frame = pd.DataFrame(body, columns=header)
+        frame = frame.rename(columns=canonical_columns(frame.columns))
+        if 'Player Name' in frame.columns and body:
+            tables.append(frame)
+    return tables
+
+def extract_links(html, base_url):
+    """Same-host links whose address or text mentions rosters or stats"""
+    soup = BeautifulSoup(html, 'html.parser')
+    host = urlparse(base_url).netloc
+    links = []
+    for anchor in soup.find_all('a', href=True):
+        url = urljoin(base_url, anchor['href']).split('#')[0]
+        text = f"{url} {anchor.get_text(strip=True)}".lower()
+        if urlparse(url).netloc == host and any(keyword in text for keyword in LINK_KEYWORDS) and url not in links:
+            links.append(url)
+    return links
+
+def backoff_delay(attempts, base=BACKOFF_BASE):
+    """Exponential backoff with full jitter"""
+    return random.uniform(0, min(BACKOFF_MAX, base * 2 ** (attempts - 1)))
+
+def seed_jobs(teams, only_team=None):
+    """One job per team website, ordered by the collection plan priority"""
+    return [{"priority": info.get("priority", 3), "url": info["website"], "team": team_name, "depth": 0, "attempts": 0}
+            for team_name, info in teams.items()
+            if info.get("website") and (only_team is None or team_name == only_team)]
+
+class HostRateLimiter:
+    """Keeps requests to the same host at least `delay` seconds apart; hosts don't wait on each other"""
+
+    def __init__(self, delay=DEFAULT_HOST_DELAY):
+        self.delay = delay
+        self.next_slot = {}
+        self.locks = {}
+
+    async def wait(self, url):
+        host = urlparse(url).netloc
+        lock = self.locks.setdefault(host, asyncio.Lock())
+        async with lock:
+            now = asyncio.get_running_loop().time()
+            start = max(now, self.next_slot.get(host, now))
+            self.next_slot[host] = start + self.delay
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    def defer(self, url, seconds):
+        """Push the host's next slot back (e.g. after a 429 with Retry-After)"""
+        host = urlparse(url).netloc
+        now = asyncio.get_running_loop().time()
+        self.next_slot[host] = max(self.next_slot.get(host, now), now + seconds)
+
+class CollectorDaemon:
+    """Crawls team websites from a checkpointed priority queue and stores what it finds"""
+
+    def __init__(self, teams=None, data_file=DATA_FILE, checkpoint_file=CHECKPOINT_FILE,
+                 progress_store=None, fetch=fetch_page, workers=DEFAULT_WORKERS, host_delay=DEFAULT_HOST_DELAY,
+                 max_depth=DEFAULT_MAX_DEPTH, max_attempts=MAX_ATTEMPTS, backoff_base=BACKOFF_BASE,
+                 season=DEFAULT_SEASON, archive=None):
+        if teams is None:
+            from data_collection_plan import TEAMS
+            teams = TEAMS
+        self.teams = teams
+        self.data_file = data_file
+        self.checkpoint_file = checkpoint_file
+        self.progress_store = progress_store or ProgressStore()
+        self.fetch = fetch
+        self.workers = workers
+        self.limiter = HostRateLimiter(host_delay)
+        self.max_depth = max_depth
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.season = season
+        self.archive = archive
+        self.pending = {}   # url -> job, for queued, waiting-to-retry and in-flight jobs
+        self.seen = set()
+        self.stats = {"pages": 0, "failed": 0, "retries": 0, "players_added": 0, "players_updated": 0}
+        self.last_completed = None
+
+    # Checkpointing
+
+    def load_checkpoint(self):
+        """Restore an unfinished crawl; returns True if there is one to resume"""
+        if not os.path.exists(self.checkpoint_file):
+            return False
+        with open(self.checkpoint_file, 'r') as f:
+            checkpoint = json.load(f)
+        self.pending = {job["url"]: job for job in checkpoint.get("pending", [])}
+        self.seen = set(checkpoint.get("seen", []))
+        self.stats.update(checkpoint.get("stats", {}))
+        self.last_completed = checkpoint.get("last_completed")
+        return bool(self.pending)
+
+    def save_checkpoint(self):
+        """Write the queue atomically, so a crash never leaves a half-written checkpoint"""
+        checkpoint = {
+            "saved_at": datetime.now().isoformat(),
+            "last_completed": self.last_completed,
+            "pending": sorted(self.pending.values(), key=lambda job: (job["priority"], job["depth"])),
+            "seen": sorted(self.seen),
+            "stats": self.stats
+        }
+        with atomic_path(self.checkpoint_file) as tmp_path, open(tmp_path, 'w') as f:
+            json.dump(checkpoint, f, indent=2)
+
+    # Crawling
+
+    def enqueue(self, job):
+        self.seen.add(job["url"])
+        self.pending[job["url"]] = job
+        self._sequence += 1
+        self.queue.put_nowait((job["priority"], job["depth"], self._sequence, job))
+
+    async def run_pass(self, jobs=None):
+        """Crawl until the queue (including scheduled retries) is empty"""
+        self.queue = asyncio.PriorityQueue()
+        self._sequence = 0
+        self.write_lock = asyncio.Lock()
+
+        resumed = list(self.pending.values())
+        self.pending = {}
+        if not resumed:
+            self.seen = set()
+            self.stats = dict.fromkeys(self.stats, 0)
+        for job in resumed or jobs or []:
+            self.enqueue(job)
+        self.save_checkpoint()
+
+        workers = [asyncio.create_task(self.worker()) for _ in range(self.workers)]
+        try:
+            await self.queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        self.last_completed = datetime.now().isoformat()
+        self.save_checkpoint()
+        return self.stats
+
+    async def worker(self):
+        while True:
+            _, _, _, job = await self.queue.get()
+            try:
+                retry = await self.process(job)
+            except Exception as e:
+                print(f"❌ {job['url']}: {e}")
+                retry = False
+            if retry:
+                # The job stays unfinished until it is back in the queue, so run_pass keeps waiting for it
+                asyncio.create_task(self.retry_later(job, retry))
+            else:
+                self.pending.pop(job["url"], None)
+                self.save_checkpoint()
+                self.queue.task_done()
+
+    async def retry_later(self, job, delay):
+        await asyncio.sleep(delay)
+        self._sequence += 1
+        self.queue.put_nowait((job["priority"], job["depth"], self._sequence, job))
+        self.queue.task_done()
+
+    async def process(self, job):
+        """Fetch and store one page. Returns a retry delay in seconds, or False when the job is finished"""
+        url = job["url"]
+        await self.limiter.wait(url)
+        job["attempts"] += 1
+
+        try:
+            status, html, headers = await asyncio.to_thread(self.fetch, url)
+            error = None if status not in RETRY_STATUS else f"HTTP {status}"
+        except requests.RequestException as e:
+            status, html, headers, error = None, "", {}, str(e)
+
+        if error:
+            if job["attempts"] < self.max_attempts:
+                delay = backoff_delay(job["attempts"], self.backoff_base)
+                retry_after = str(headers.get("Retry-After", ""))
+                if retry_after.isdigit():
+                    delay = max(delay, float(retry_after))
+                    self.limiter.defer(url, delay)
+                self.stats["retries"] += 1
+                self.save_checkpoint()
+                print(f"🔁 {url}: {error}, retry {job['attempts']}/{self.max_attempts - 1} in {delay:.0f}s")
+                return delay
+            self.stats["failed"] += 1
+            print(f"❌ {url}: {error}, giving up after {job['attempts']} attempts")
+            return False
+
+        if status != 200:
+            self.stats["failed"] += 1
+            print(f"❌ {url}: HTTP {status}")
+            return False
+
+        self.stats["pages"] += 1
+        if self.archive is not None:
+            await asyncio.to_thread(self.archive.store, url, html, job["team"], status)
+        added, updated = await self.store_tables(job, extract_tables(html))
+        await asyncio.to_thread(self.progress_store.update_team, job["team"], add_players=added, data_source=url,
+                                default_status="in_progress", actor="collector_daemon")
+        print(f"✅ {job['team']}: {url} ({added} added, {updated} updated)")
+
+        if job["depth"] < self.max_depth:
+            for link in extract_links(html, url):
+                if link in self.seen:
+                    continue
+                self.enqueue({"priority": job["priority"], "url": link, "team": job["team"],
+                              "depth": job["depth"] + 1, "attempts": 0})
+        return False
+
+    async def store_tables(self, job, tables):
+        """Validate scraped tables and merge them into the stats file; returns (added, updated)"""
+        valid = [validate_chunk(table, team=job["team"], season=self.season)[0] for table in tables]
+        incoming = pd.concat(valid) if valid else pd.DataFrame(columns=OUTPUT_COLUMNS)
+        if incoming.empty:
+            return 0, 0
+
+        # One writer at a time: read, merge and replace the file as a unit (dataset_lock also keeps out
+        # bulk imports, game rollups and team collectors running in other processes)
+        async with self.write_lock:
+            return await asyncio.to_thread(self._merge_into_dataset, incoming)
+
+    def _merge_into_dataset(self, incoming):
+        with dataset_lock(self.data_file):
+            existing = pd.read_csv(self.data_file) if os.path.exists(self.data_file) \
+                else pd.DataFrame(columns=OUTPUT_COLUMNS)
+            merged, added_rows, updated, _ = merge_rows(existing, incoming, mapping=load_identity_map())
+            if len(added_rows) or updated:
+                write_atomic(merged, self.data_file)
+        self.stats["players_added"] += len(added_rows)
+        self.stats["players_updated"] += updated
+        return len(added_rows), updated
+
+    async def run_forever(self, interval_hours=DEFAULT_INTERVAL_HOURS, only_team=None):
+        """Resume an unfinished crawl, then crawl again every interval_hours"""
+        interval = timedelta(hours=interval_hours)
+        while True:
+            if not self.pending and self.last_completed:
+                next_run = datetime.fromisoformat(self.last_completed) + interval
+                wait = (next_run - datetime.now()).total_seconds()
+                if wait > 0:
+                    print(f"💤 Next crawl at {next_run.strftime('%Y-%m-%d %H:%M')}")
+                    await asyncio.sleep(wait)
+            stats = await self.run_pass(seed_jobs(self.teams, only_team))
+            print_stats(stats)
+
+def print_stats(stats):
+    print(f"\n📊 Pages: {stats['pages']}  Failed: {stats['failed']}  Retries: {stats['retries']}  "
+          f"Players added: {stats['players_added']}  Updated: {stats['players_updated']}")
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Scheduled, rate-limited CJFL data collector")
+    parser.add_argument("--once", action="store_true", help="Run a single crawl and exit")
+    parser.add_argument("--team", help="Only crawl this team")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Concurrent fetches (default: 4)")
+    parser.add_argument("--host-delay", type=float, default=DEFAULT_HOST_DELAY,
+                        help="Seconds between requests to the same host (default: 2)")
+    parser.add_argument("--interval-hours", type=float, default=DEFAULT_INTERVAL_HOURS,
+                        help="Hours between crawls (default: 24)")
+    parser.add_argument("--max-depth", type=int, default=DEFAULT_MAX_DEPTH, help="Link depth to follow (default: 1)")
+    parser.add_argument("--checkpoint", default=CHECKPOINT_FILE, help=f"Checkpoint file (default: {CHECKPOINT_FILE})")
+    parser.add_argument("--data-file", default=DATA_FILE, help=f"Dataset to update (default: {DATA_FILE})")
+    parser.add_argument("--reset", action="store_true", help="Ignore the checkpoint and start a fresh crawl")
+    parser.add_argument("--no-archive", action="store_true", help="Don't keep the fetched pages in the page archive")
+    args = parser.parse_args()
+
+    print("🏈 CJFL COLLECTOR DAEMON")
+    print("=" * 50)
+
+    daemon = CollectorDaemon(data_file=args.data_file, checkpoint_file=args.checkpoint, workers=args.workers,
+                             host_delay=args.host_delay, max_depth=args.max_depth,
+                             archive=None if args.no_archive else PageArchive())
+    if not args.reset and daemon.load_checkpoint():
+        print(f"⏯️  Resuming crawl with {len(daemon.pending)} pages left")
+    elif args.reset:
+        daemon.pending, daemon.last_completed = {}, None
+
+    try:
+        if args.once:
+            print_stats(asyncio.run(daemon.run_pass(seed_jobs(daemon.teams, args.team))))
+        else:
+            asyncio.run(daemon.run_forever(args.interval_hours, args.team))
+    except KeyboardInterrupt:
+        print(f"\n👋 Stopped; progress saved to {args.checkpoint}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+CJFL Custom Metrics
+User-defined stats written as formulas over the stat columns, for example
+
+    Yards per Touchdown = total_yards / touchdowns
+    Defensive Impact    = tackles + 5 * sacks + 8 * interceptions
+
+Columns are written in snake_case (total_yards) or in backticks (`Total Yards`).
+Allowed are numbers, + - * / ** and parentheses, and the functions abs, sqrt,
+log (natural log of 1 + x), min and max. Anything else (attribute access, names
+that are not columns, keyword arguments...) is rejected when the formula is parsed.
+Each formula is compiled once into a chain of NumPy operations over whole columns.
+Division by zero gives an empty value instead of infinity. Saved metrics show up in
+the dashboard leaderboards, player profiles and CSV exports.
+
+    python custom_metrics.py list
+    python custom_metrics.py add "Defensive Impact" "tackles + 5 * sacks + 8 * interceptions"
+    python custom_metrics.py remove "Defensive Impact"
+"""
+
+import argparse
+import ast
+import json
+import os
+import re
+import threading
+
+import numpy as np
+import pandas as pd
+
+from utils import STAT_COLUMNS, add_derived_columns, atomic_path, load_data
+
+METRICS_FILE = "data/custom_metrics.json"
+MAX_EXPRESSION_LENGTH = 200
+NAME_MARKUP_CHARACTERS = "<>&`"  # names are shown in dashboard HTML and markdown
+
+METRIC_COLUMNS = STAT_COLUMNS + ['Total Yards', 'Total Offensive Yards', 'Yards per Game', 'Touchdowns per Game',
+                                 'Tackles per Game', 'Sacks per Game']
+COLUMN_NAMES = {column.lower().replace(' ', '_'): column for column in METRIC_COLUMNS}
+
+DEFAULT_METRICS = [
+    {"name": "Yards per Touchdown", "expression": "total_yards / touchdowns"},
+    {"name": "Defensive Impact", "expression": "tackles + 5 * sacks + 8 * interceptions"}
+]
+
+def safe_divide(numerator, denominator):
+    numerator, denominator = np.broadcast_arrays(np.asarray(numerator, dtype='float64'),
+                                                 np.asarray(denominator, dtype='float64'))
+    return np.divide(numerator, denominator, out=np.full(numerator.shape, np.nan), where=denominator != 0)
+
+BINARY_OPERATORS = {ast.Add: np.add, ast.Sub: np.subtract, ast.Mult: np.multiply, ast.Div: safe_divide,
+                    ast.Pow: np.power}
+UNARY_OPERATORS = {ast.USub: np.negative, ast.UAdd: np.positive}
+FUNCTIONS = {'abs': (1, np.abs), 'sqrt': (1, np.sqrt), 'log': (1, np.log1p), 'min': (2, np.minimum),
+             'max': (2, np.maximum)}
+
+def compile_expression(expression):
+    """
+    Parse a formula and return (evaluate(columns) -> array, referenced column names).
+    evaluate takes a dict of column name -> float array. Raises ValueError for invalid formulas.
+    """
+    if len(expression) > MAX_EXPRESSION_LENGTH:
+        raise ValueError(f"Formula is longer than {MAX_EXPRESSION_LENGTH} characters")
+
+    # `Column Name` -> placeholder identifier, so the formula parses as Python
+    quoted = {}
+    def quote(match):
+        column = match.group(1).strip()
+        if column not in METRIC_COLUMNS:
+            raise ValueError(f"Unknown column: {column}")
+        placeholder = f"_column{len(quoted)}"
+        quoted[placeholder] = column
+        return placeholder
+    source = re.sub(r"`([^`]*)`", quote, expression)
+
+    try:
+        tree = ast.parse(source.strip(), mode='eval')
+    except SyntaxError:
+        raise ValueError(f"Invalid formula: {expression}") from None
+
+    columns = set()
+
+    def build(node):
+        if isinstance(node, ast.BinOp) and type(node.op) in BINARY_OPERATORS:
+            operator, left, right = BINARY_OPERATORS[type(node.op)], build(node.left), build(node.right)
+            return lambda env: operator(left(env), right(env))
+        if isinstance(node, ast.UnaryOp) and type(node.op) in UNARY_OPERATORS:
+            operator, operand = UNARY_OPERATORS[type(node.op)], build(node.operand)
+            return lambda env: operator(operand(env))
+        if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+            value = float(node.value)
+            return lambda env: value
+        if isinstance(node, ast.Name):
+            column = quoted.get(node.id) or COLUMN_NAMES.get(node.id.lower())
+            if column is None:
+                raise ValueError(f"Unknown column: {node.id}")
+            columns.add(column)
+            return lambda env: env[column]
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in FUNCTIONS:
+            arity, function = FUNCTIONS[node.func.id]
+            if node.keywords or len(node.args) != arity:
+                raise ValueError(f"{node.func.id}() takes {arity} argument{'s' if arity > 1 else ''}")
+            arguments = [build(argument) for argument in node.args]
+            return lambda env: function(*(argument(env) for argument in arguments))
+        raise ValueError(f"Not allowed in a formula: {ast.unparse(node)}")
+
+    evaluate = build(tree.body)
+    if not columns:
+        raise ValueError("A formula must use at least one stat column")
+    return evaluate, sorted(columns)
+
+def compile_metric(name, expression):
+    """Checked metric definition: {'name', 'expression', 'evaluate', 'columns'}"""
+    name = name.strip()
+    if not name:
+        raise ValueError("A metric needs a name")
+    if any(char in name for char in NAME_MARKUP_CHARACTERS):
+        raise ValueError(f"A metric name can't contain {' '.join(NAME_MARKUP_CHARACTERS)}")
+    if name in METRIC_COLUMNS or name in ('Player Name', 'Team', 'Position', 'Season', 'Player ID'):
+        raise ValueError(f"'{name}' is already a column")
+    evaluate, columns = compile_expression(expression)
+    return {"name": name, "expression": expression, "evaluate": evaluate, "columns": columns}
+
+def load_metrics(path=METRICS_FILE):
+    """Saved metric definitions ({name, expression} dicts); the defaults when nothing is saved"""
+    if not os.path.exists(path):
+        return [dict(metric) for metric in DEFAULT_METRICS]
+    with open(path, 'r') as f:
+        return json.load(f)
+
+def save_metrics(definitions, path=METRICS_FILE):
+    """Write the definitions atomically"""
+    with atomic_path(path) as tmp_path, open(tmp_path, 'w') as f:
+        json.dump(definitions, f, indent=2)
+
+def add_metric(name, expression, path=METRICS_FILE):
+    """Check and save a metric, replacing one with the same name. Raises ValueError for bad formulas"""
+    metric = compile_metric(name, expression)
+    definitions = [d for d in load_metrics(path) if d["name"] != metric["name"]]
+    definitions.append({"name": metric["name"], "expression": expression.strip()})
+    save_metrics(definitions, path)
+    return metric
+
+def remove_metric(name, path=METRICS_FILE):
+    """Delete a saved metric; returns False if there was none with that name"""
+    definitions = load_metrics(path)
+    remaining = [d for d in definitions if d["name"] != name]
+    if len(remaining) == len(definitions):
+        return False
+    save_metrics(remaining, path)
+    return True
+
+class MetricEngine:
+    """Compiled custom metrics; their columns are computed once per data version"""
+
+    def __init__(self, definitions=None):
+        self.metrics = []
+        self.errors = {}
+        for definition in DEFAULT_METRICS if definitions is None else definitions:
+            try:
+                self.metrics.append(compile_metric(definition["name"], definition["expression"]))
+            except ValueError as e:
+                # A hand-edited file should not take the dashboards down; report and skip the metric
+                self.errors[definition["name"]] = str(e)
+        self.version = None
+        self.values = None
+        self.lock = threading.Lock()  # one engine is shared by every dashboard session
+
+    @property
+    def names(self):
+        return [metric["name"] for metric in self.metrics]
+
+    def evaluate(self, data):
+        """All metric columns for a frame, as a DataFrame on the same index"""
+        data = add_derived_columns(data)
+        needed = {column for metric in self.metrics for column in metric["columns"]}
+        env = {column: data[column].to_numpy(dtype='float64', na_value=np.nan) for column in needed}
+        values = {}
+        with np.errstate(all='ignore'):
+            for metric in self.metrics:
+                result = np.broadcast_to(metric["evaluate"](env), (len(data),)).astype('float64')
+                result[~np.isfinite(result)] = np.nan
+                values[metric["name"]] = result
+        return pd.DataFrame(values, index=data.index, columns=self.names)
+
+    def apply(self, data, version=None):
+        """
+        The data with the metric columns added (shallow copy). Calling again with the same
+        version reuses the columns computed last time.
+        """
+        with self.lock:
+            if version is None or version != self.version or len(self.values) != len(data):
+                self.values = self.evaluate(data)
+                self.version = version
+            values = self.values
+        data = data.copy(deep=False)
+        for name in self.names:
+            data[name] = values[name].to_numpy()
+        return data
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Manage user-defined stat formulas")
+    parser.add_argument("command", choices=["list", "add", "remove"])
+    parser.add_argument("name", nargs="?", help="Metric name")
+    parser.add_argument("expression", nargs="?", help="Formula, e.g. \"tackles + 5 * sacks\"")
+    parser.add_argument("--top", type=int, default=5, help="Leaders to show per metric with 'list' (default: 5)")
+    args = parser.parse_args()
+
+    print("🏈 CJFL CUSTOM METRICS")
+    print("=" * 50)
+
+    if args.command == "add":
+        if not args.name or not args.expression:
+            parser.error("add needs a name and a formula")
+        try:
+            metric = add_metric(args.name, args.expression)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return
+        print(f"✅ Saved '{metric['name']}' (uses {', '.join(metric['columns'])})")
+    elif args.command == "remove":
+        if not args.name:
+            parser.error("remove needs a metric name")
+        print(f"🗑️  Removed '{args.name}'" if remove_metric(args.name) else f"❌ No metric named '{args.name}'")
+    else:
+        engine = MetricEngine(load_metrics())
+        data = engine.apply(load_data())
+        for metric in engine.metrics:
+            print(f"\n📐 {metric['name']} = {metric['expression']}")
+            for _, row in data.nlargest(args.top, metric['name']).iterrows():
+                print(f"   {row['Player Name']:<25} {row['Team']:<22} {row['Season']}  {row[metric['name']]:.2f}")
+        for name, error in engine.errors.items():
+            print(f"\n⚠️  {name}: {error}")
+
+if __name__ == "__main__":
+    main()
@@ -4,245 +4,234 @@ CJFL Data Collection Plan and Progress Tracker
 Detailed plan for collecting real CJFL statistics from specific teams
 """
 
+import copy
+
 import pandas as pd
-import json
-import os
 import requests
 from datetime import datetime
 
+from progress_store import ProgressStore
+
+# Every CJFL team with its collection plan details (read-only; collectors work on a copy)
+TEAMS = {
+    # Prairie Football Conference (PFC)
+    "Calgary Colts": {
+        "website": "https://calgarycolts.com/",
+        "social_media": ["https://www.facebook.com/calgarycolts", "https://twitter.com/calgarycolts"],
+        "contact": "info@calgarycolts.com",
+        "priority": 1,
+        "status": "not_started",
+        "data_sources": ["website", "social_media", "direct_contact"],
+        "notes": "Active website, good social media presence",
+        "conference": "PFC"
+    },
+    "Edmonton Huskies": {
+        "website": "https://edmontonhuskies.com/",
+        "social_media": ["https://www.facebook.com/edmontonhuskies", "https://twitter.com/edmontonhuskies"],
+        "contact": "info@edmontonhuskies.com",
+        "priority": 2,
+        "status": "not_started",
+        "data_sources": ["website", "social_media", "direct_contact"],
+        "notes": "Rival to Wildcats",
+        "conference": "PFC"
+    },
+    "Edmonton Wildcats": {
+        "website": "https://edmontonwildcats.com/",
+        "social_media": ["https://www.facebook.com/edmontonwildcats", "https://twitter.com/edmontonwildcats"],
+        "contact": "info@edmontonwildcats.com",
+        "priority": 1,
+        "status": "not_started",
+        "data_sources": ["website", "social_media", "direct_contact"],
+        "notes": "Active website, strong local presence",
+        "conference": "PFC"
+    },
+    "Regina Thunder": {
+        "website": "https://reginathunder.com/",
+        "social_media": ["https://www.facebook.com/reginathunder", "https://twitter.com/reginathunder"],
+        "contact": "info@reginathunder.com",
+        "priority": 2,
+        "status": "not_started",
+        "data_sources": ["website", "social_media", "direct_contact"],
+        "notes": "Strong program, good website",
+        "conference": "PFC"
+    },
+    "Saskatoon Hilltops": {
+        "website": "https://saskatoonhilltops.com/",
+        "social_media": ["https://www.facebook.com/saskatoonhilltops", "https://twitter.com/saskatoonhilltops"],
+        "contact": "info@saskatoonhilltops.com",
+        "priority": 1,
+        "status": "not_started",
+        "data_sources": ["website", "social_media", "direct_contact"],
+        "notes": "Multiple championships, good record keeping",
+        "conference": "PFC"
+    },
+    "Winnipeg Rifles": {
+        "website": "https://winnipegrifles.com/",
+        "social_media": ["https://www.facebook.com/winnipegrifles", "https://twitter.com/winnipegrifles"],
+        "contact": "info@winnipegrifles.com",
+        "priority": 2,
+        "status": "not_started",
+        "data_sources": ["website", "social_media", "direct_contact"],
+        "notes": "Established program",
+        "conference": "PFC"
+    },
+    
+    # British Columbia Football Conference (BCFC)
+    "Kamloops Broncos": {
+        "website": "https://kamloopsbroncos.com/",
+        "social_media": ["https://www.facebook.com/kamloopsbroncos", "https://twitter.com/kamloopsbroncos"],
+        "contact": "info@kamloopsbroncos.com",
+        "priority": 3,
+        "status": "not_started",
+        "data_sources": ["website", "social_media", "direct_contact"],
+        "notes": "BCFC team",
+        "conference": "BCFC"
+    },
+    "Langley Rams": {
+        "website": "https://langleyrams.com/",
+        "social_media": ["https://www.facebook.com/langleyrams", "https://twitter.com/langleyrams"],
+        "contact": "info@langleyrams.com",
+        "priority": 3,
+        "status": "not_started",
+        "data_sources": ["website", "social_media", "direct_contact"],
+        "notes": "BCFC team",
+        "conference": "BCFC"
+    },
+    "Okanagan Sun": {
+        "website": "https://okanagansun.com/",
+        "social_media": ["https://www.facebook.com/okanagansun", "https://twitter.com/okanagansun"],
+        "contact": "info@okanagansun.com",
+        "priority": 2,
+        "status": "not_started",
+        "data_sources": ["website", "social_media", "direct_contact"],
+        "notes": "Strong BC program",
+        "conference": "BCFC"
+    },
+    "Prince George Kodiaks": {
+        "website": "https://pgkodiaks.com/",
+        "social_media": ["https://www.facebook.com/pgkodiaks", "https://twitter.com/pgkodiaks"],
+        "contact": "info@pgkodiaks.com",
+        "priority": 3,
+        "status": "not_started",
+        "data_sources": ["website", "social_media", "direct_contact"],
+        "notes": "BCFC team",
+        "conference": "BCFC"
+    },
+    "Valley Huskers": {
+        "website": "https://valleyhuskers.com/",
+        "social_media": ["https://www.facebook.com/valleyhuskers", "https://twitter.com/valleyhuskers"],
+        "contact": "info@valleyhuskers.com",
+        "priority": 3,
+        "status": "not_started",
+        "data_sources": ["website", "social_media", "direct_contact"],
+        "notes": "BCFC team",
+        "conference": "BCFC"
+    },
+    "Vancouver Island Raiders": {
+        "website": "https://viraiders.com/",
+        "social_media": ["https://www.facebook.com/viraiders", "https://twitter.com/viraiders"],
+        "contact": "info@viraiders.com",
+        "priority": 2,
+        "status": "not_started",
+        "data_sources": ["website", "social_media", "direct_contact"],
+        "notes": "BCFC powerhouse",
+        "conference": "BCFC"
+    },
+    "Westshore Rebels": {
+        "website": "https://westshorerebels.com/",
+        "social_media": ["https://www.facebook.com/westshorerebels", "https://twitter.com/westshorerebels"],
+        "contact": "info@westshorerebels.com",
+        "priority": 3,
+        "status": "not_started",
+        "data_sources": ["website", "social_media", "direct_contact"],
+        "notes": "BCFC team",
+        "conference": "BCFC"
+    },
+    
+    # Ontario Football Conference (OFC)
+    "Hamilton Hurricanes": {
+        "website": "https://hamiltonhurricanes.com/",
+        "social_media": ["https://www.facebook.com/hamiltonhurricanes", "https://twitter.com/hamiltonhurricanes"],
+        "contact": "info@hamiltonhurricanes.com",
+        "priority": 3,
+        "status": "not_started",
+        "data_sources": ["website", "social_media", "direct_contact"],
+        "notes": "OFC team",
+        "conference": "OFC"
+    },
+    "London Beefeaters": {
+        "website": "https://londonbeefeaters.com/",
+        "social_media": ["https://www.facebook.com/londonbeefeaters", "https://twitter.com/londonbeefeaters"],
+        "contact": "info@londonbeefeaters.com",
+        "priority": 3,
+        "status": "not_started",
+        "data_sources": ["website", "social_media", "direct_contact"],
+        "notes": "OFC team",
+        "conference": "OFC"
+    },
+    "Ottawa Sooners": {
+        "website": "https://ottawasooners.com/",
+        "social_media": ["https://www.facebook.com/ottawasooners", "https://twitter.com/ottawasooners"],
+        "contact": "info@ottawasooners.com",
+        "priority": 3,
+        "status": "not_started",
+        "data_sources": ["website", "social_media", "direct_contact"],
+        "notes": "OFC team",
+        "conference": "OFC"
+    },
+    "Quinte Skyhawks": {
+        "website": "https://quinteskyhawks.com/",
+        "social_media": ["https://www.facebook.com/quinteskyhawks", "https://twitter.com/quinteskyhawks"],
+        "contact": "info@quinteskyhawks.com",
+        "priority": 3,
+        "status": "not_started",
+        "data_sources": ["website", "social_media", "direct_contact"],
+        "notes": "OFC team",
+        "conference": "OFC"
+    },
+    "St. Clair Saints": {
+        "website": "https://stclairsaints.com/",
+        "social_media": ["https://www.facebook.com/stclairsaints", "https://twitter.com/stclairsaints"],
+        "contact": "info@stclairsaints.com",
+        "priority": 3,
+        "status": "not_started",
+        "data_sources": ["website", "social_media", "direct_contact"],
+        "notes": "OFC team",
+        "conference": "OFC"
+    },
+    "GTA Grizzlies": {
+        "website": "https://gtagrizzlies.com/",
+        "social_media": ["https://www.facebook.com/gtagrizzlies", "https://twitter.com/gtagrizzlies"],
+        "contact": "info@gtagrizzlies.com",
+        "priority": 3,
+        "status": "not_started",
+        "data_sources": ["website", "social_media", "direct_contact"],
+        "notes": "OFC team",
+        "conference": "OFC"
+    },
+    "Sault Ste. Marie Cougars": {
+        "website": "https://saultcougars.com/",
+        "social_media": ["https://www.facebook.com/saultcougars", "https://twitter.com/saultcougars"],
+        "contact": "info@saultcougars.com",
+        "priority": 3,
+        "status": "not_started",
+        "data_sources": ["website", "social_media", "direct_contact"],
+        "notes": "OFC team",
+        "conference": "OFC"
+    }
+}
+
 class CJFLDataCollector:
     def __init__(self):
-        self.teams = {
-            # Prairie Football Conference (PFC)
-            "Calgary Colts": {
-                "website": "https://calgarycolts.com/",
-                "social_media": ["https://www.facebook.com/calgarycolts", "https://twitter.com/calgarycolts"],
-                "contact": "info@calgarycolts.com",
-                "priority": 1,
-                "status": "not_started",
-                "data_sources": ["website", "social_media", "direct_contact"],
-                "notes": "Active website, good social media presence",
-                "conference": "PFC"
-            },
-            "Edmonton Huskies": {
-                "website": "https://edmontonhuskies.com/",
-                "social_media": ["https://www.facebook.com/edmontonhuskies", "https://twitter.com/edmontonhuskies"],
-                "contact": "info@edmontonhuskies.com",
-                "priority": 2,
-                "status": "not_started",
-                "data_sources": ["website", "social_media", "direct_contact"],
-                "notes": "Rival to Wildcats",
-                "conference": "PFC"
-            },
-            "Edmonton Wildcats": {
-                "website": "https://edmontonwildcats.com/",
-                "social_media": ["https://www.facebook.com/edmontonwildcats", "https://twitter.com/edmontonwildcats"],
-                "contact": "info@edmontonwildcats.com",
-                "priority": 1,
-                "status": "not_started",
-                "data_sources": ["website", "social_media", "direct_contact"],
-                "notes": "Active website, strong local presence",
-                "conference": "PFC"
-            },
-            "Regina Thunder": {
-                "website": "https://reginathunder.com/",
-                "social_media": ["https://www.facebook.com/reginathunder", "https://twitter.com/reginathunder"],
-                "contact": "info@reginathunder.com",
-                "priority": 2,
-                "status": "not_started",
-                "data_sources": ["website", "social_media", "direct_contact"],
-                "notes": "Strong program, good website",
-                "conference": "PFC"
-            },
-            "Saskatoon Hilltops": {
-                "website": "https://saskatoonhilltops.com/",
-                "social_media": ["https://www.facebook.com/saskatoonhilltops", "https://twitter.com/saskatoonhilltops"],
-                "contact": "info@saskatoonhilltops.com",
-                "priority": 1,
-                "status": "not_started",
-                "data_sources": ["website", "social_media", "direct_contact"],
-                "notes": "Multiple championships, good record keeping",
-                "conference": "PFC"
-            },
-            "Winnipeg Rifles": {
-                "website": "https://winnipegrifles.com/",
-                "social_media": ["https://www.facebook.com/winnipegrifles", "https://twitter.com/winnipegrifles"],
-                "contact": "info@winnipegrifles.com",
-                "priority": 2,
-                "status": "not_started",
-                "data_sources": ["website", "social_media", "direct_contact"],
-                "notes": "Established program",
-                "conference": "PFC"
-            },
-            
-            # British Columbia Football Conference (BCFC)
-            "Kamloops Broncos": {
-                "website": "https://kamloopsbroncos.com/",
-                "social_media": ["https://www.facebook.com/kamloopsbroncos", "https://twitter.com/kamloopsbroncos"],
-                "contact": "info@kamloopsbroncos.com",
-                "priority": 3,
-                "status": "not_started",
-                "data_sources": ["website", "social_media", "direct_contact"],
-                "notes": "BCFC team",
-                "conference": "BCFC"
-            },
-            "Langley Rams": {
-                "website": "https://langleyrams.com/",
-                "social_media": ["https://www.facebook.com/langleyrams", "https://twitter.com/langleyrams"],
-                "contact": "info@langleyrams.com",
-                "priority": 3,
-                "status": "not_started",
-                "data_sources": ["website", "social_media", "direct_contact"],
-                "notes": "BCFC team",
-                "conference": "BCFC"
-            },
-            "Okanagan Sun": {
-                "website": "https://okanagansun.com/",
-                "social_media": ["https://www.facebook.com/okanagansun", "https://twitter.com/okanagansun"],
-                "contact": "info@okanagansun.com",
-                "priority": 2,
-                "status": "not_started",
-                "data_sources": ["website", "social_media", "direct_contact"],
-                "notes": "Strong BC program",
-                "conference": "BCFC"
-            },
-            "Prince George Kodiaks": {
-                "website": "https://pgkodiaks.com/",
-                "social_media": ["https://www.facebook.com/pgkodiaks", "https://twitter.com/pgkodiaks"],
-                "contact": "info@pgkodiaks.com",
-                "priority": 3,
-                "status": "not_started",
-                "data_sources": ["website", "social_media", "direct_contact"],
-                "notes": "BCFC team",
-                "conference": "BCFC"
-            },
-            "Valley Huskers": {
-                "website": "https://valleyhuskers.com/",
-                "social_media": ["https://www.facebook.com/valleyhuskers", "https://twitter.com/valleyhuskers"],
-                "contact": "info@valleyhuskers.com",
-                "priority": 3,
-                "status": "not_started",
-                "data_sources": ["website", "social_media", "direct_contact"],
-                "notes": "BCFC team",
-                "conference": "BCFC"
-            },
-            "Vancouver Island Raiders": {
-                "website": "https://viraiders.com/",
-                "social_media": ["https://www.facebook.com/viraiders", "https://twitter.com/viraiders"],
-                "contact": "info@viraiders.com",
-                "priority": 2,
-                "status": "not_started",
-                "data_sources": ["website", "social_media", "direct_contact"],
-                "notes": "BCFC powerhouse",
-                "conference": "BCFC"
-            },
-            "Westshore Rebels": {
-                "website": "https://westshorerebels.com/",
-                "social_media": ["https://www.facebook.com/westshorerebels", "https://twitter.com/westshorerebels"],
-                "contact": "info@westshorerebels.com",
-                "priority": 3,
-                "status": "not_started",
-                "data_sources": ["website", "social_media", "direct_contact"],
-                "notes": "BCFC team",
-                "conference": "BCFC"
-            },
-            
-            # Ontario Football Conference (OFC)
-            "Hamilton Hurricanes": {
-                "website": "https://hamiltonhurricanes.com/",
-                "social_media": ["https://www.facebook.com/hamiltonhurricanes", "https://twitter.com/hamiltonhurricanes"],
-                "contact": "info@hamiltonhurricanes.com",
-                "priority": 3,
-                "status": "not_started",
-                "data_sources": ["website", "social_media", "direct_contact"],
-                "notes": "OFC team",
-                "conference": "OFC"
-            },
-            "London Beefeaters": {
-                "website": "https://londonbeefeaters.com/",
-                "social_media": ["https://www.facebook.com/londonbeefeaters", "https://twitter.com/londonbeefeaters"],
-                "contact": "info@londonbeefeaters.com",
-                "priority": 3,
-                "status": "not_started",
-                "data_sources": ["website", "social_media", "direct_contact"],
-                "notes": "OFC team",
-                "conference": "OFC"
-            },
-            "Ottawa Sooners": {
-                "website": "https://ottawasooners.com/",
-                "social_media": ["https://www.facebook.com/ottawasooners", "https://twitter.com/ottawasooners"],
-                "contact": "info@ottawasooners.com",
-                "priority": 3,
-                "status": "not_started",
-                "data_sources": ["website", "social_media", "direct_contact"],
-                "notes": "OFC team",
-                "conference": "OFC"
-            },
-            "Quinte Skyhawks": {
-                "website": "https://quinteskyhawks.com/",
-                "social_media": ["https://www.facebook.com/quinteskyhawks", "https://twitter.com/quinteskyhawks"],
-                "contact": "info@quinteskyhawks.com",
-                "priority": 3,
-                "status": "not_started",
-                "data_sources": ["website", "social_media", "direct_contact"],
-                "notes": "OFC team",
-                "conference": "OFC"
-            },
-            "St. Clair Saints": {
-                "website": "https://stclairsaints.com/",
-                "social_media": ["https://www.facebook.com/stclairsaints", "https://twitter.com/stclairsaints"],
-                "contact": "info@stclairsaints.com",
-                "priority": 3,
-                "status": "not_started",
-                "data_sources": ["website", "social_media", "direct_contact"],
-                "notes": "OFC team",
-                "conference": "OFC"
-            },
-            "GTA Grizzlies": {
-                "website": "https://gtagrizzlies.com/",
-                "social_media": ["https://www.facebook.com/gtagrizzlies", "https://twitter.com/gtagrizzlies"],
-                "contact": "info@gtagrizzlies.com",
-                "priority": 3,
-                "status": "not_started",
-                "data_sources": ["website", "social_media", "direct_contact"],
-                "notes": "OFC team",
-                "conference": "OFC"
-            },
-            "Sault Ste. Marie Cougars": {
-                "website": "https://saultcougars.com/",
-                "social_media": ["https://www.facebook.com/saultcougars", "https://twitter.com/saultcougars"],
-                "contact": "info@saultcougars.com",
-                "priority": 3,
-                "status": "not_started",
-                "data_sources": ["website", "social_media", "direct_contact"],
-                "notes": "OFC team",
-                "conference": "OFC"
-            }
-        }
+        self.teams = copy.deepcopy(TEAMS)
         
-        self.progress_file = "data/collection_progress.json"
+        self.progress_store = ProgressStore()
+        self.progress_file = self.progress_store.db_path
         self.load_progress()
     
     def load_progress(self):
-        """Load existing progress data"""
-        if os.path.exists(self.progress_file):
-            with open(self.progress_file, 'r') as f:
-                self.progress = json.load(f)
-        else:
-            self.progress = {
-                "start_date": datetime.now().isoformat(),
-                "teams": {},
-                "total_players_collected": 0,
-                "total_teams_completed": 0,
-                "last_updated": datetime.now().isoformat()
-            }
-    
-    def save_progress(self):
-        """Save progress data"""
-        self.progress["last_updated"] = datetime.now().isoformat()
-        os.makedirs("data", exist_ok=True)
-        with open(self.progress_file, 'w') as f:
-            json.dump(self.progress, f, indent=2)
+        """Load a consistent snapshot of the progress data"""
+        self.progress = self.progress_store.snapshot()
     
     def check_team_availability(self, team_name):
         """Check if a team's website is accessible"""
@@ -294,34 +283,13 @@ class CJFLDataCollector:
     
     def update_team_status(self, team_name, status, notes=""):
         """Update the status of a team's data collection"""
-        if team_name not in self.progress["teams"]:
-            self.progress["teams"][team_name] = {
-                "status": "not_started",
-                "players_collected": 0,
-                "data_sources_checked": [],
-                "notes": "",
-                "last_updated": datetime.now().isoformat()
-            }
-        
-        self.progress["teams"][team_name]["status"] = status
-        self.progress["teams"][team_name]["notes"] = notes
-        self.progress["teams"][team_name]["last_updated"] = datetime.now().isoformat()
-        self.save_progress()
+        self.progress_store.update_team(team_name, status=status, notes=notes)
+        self.load_progress()
     
     def add_players_to_team(self, team_name, player_count):
         """Add collected players to team progress"""
-        if team_name not in self.progress["teams"]:
-            self.progress["teams"][team_name] = {
-                "status": "in_progress",
-                "players_collected": 0,
-                "data_sources_checked": [],
-                "notes": "",
-                "last_updated": datetime.now().isoformat()
-            }
-        
-        self.progress["teams"][team_name]["players_collected"] += player_count
-        self.progress["total_players_collected"] += player_count
-        self.save_progress()
+        self.progress_store.update_team(team_name, add_players=player_count, default_status="in_progress")
+        self.load_progress()
     
     def get_priority_teams(self):
         """Get teams sorted by priority"""
@@ -363,19 +331,20 @@ class CJFLDataCollector:
         print("\n📊 COLLECTION PROGRESS SUMMARY")
         print("=" * 40)
         
+        summary = self.progress_store.summary()
         total_teams = len(self.teams)
-        completed_teams = sum(1 for team in self.progress["teams"].values() if team["status"] == "completed")
-        in_progress_teams = sum(1 for team in self.progress["teams"].values() if team["status"] == "in_progress")
+        completed_teams = summary["status_counts"]["completed"]
+        in_progress_teams = summary["status_counts"]["in_progress"]
         not_started_teams = total_teams - completed_teams - in_progress_teams
         
         print(f"Total Teams: {total_teams}")
         print(f"Completed: {completed_teams}")
         print(f"In Progress: {in_progress_teams}")
         print(f"Not Started: {not_started_teams}")
-        print(f"Total Players Collected: {self.progress['total_players_collected']}")
+        print(f"Total Players Collected: {summary['total_players_collected']}")
         
-        if self.progress["start_date"]:
-            start_date = datetime.fromisoformat(self.progress["start_date"])
+        if summary["start_date"]:
+            start_date = datetime.fromisoformat(summary["start_date"])
             days_elapsed = (datetime.now() - start_date).days
             print(f"Days Elapsed: {days_elapsed}")
     
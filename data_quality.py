@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+CJFL Data Quality Engine
+Declarative quality rules for the player statistics, evaluated column-wise.
+
+Each rule is a dict with a name, severity, description and a vectorized check that
+returns a boolean Series (True = violation). Row rules only look at the row itself;
+group rules (duplicates, per-game outliers) compare a row with the other rows in its
+group. The engine remembers results by row content hash, so after an edit only the
+changed rows - and, for group rules, the groups they belong to - are checked again.
+
+    python data_quality.py
+"""
+
+import pandas as pd
+
+from utils import POSITIONS, STAT_COLUMNS, MAX_GAMES_PER_SEASON, POSITION_STAT_LIMITS, player_key
+
+REQUIRED_COLUMNS = ['Player Name', 'Team', 'Position', 'Season']
+CHECK_COLUMNS = REQUIRED_COLUMNS + STAT_COLUMNS
+OUTLIER_Z_SCORE = 4.0
+OUTLIER_MIN_SPREAD = 0.25
+
+def _stat_values(data):
+    return data[STAT_COLUMNS].apply(pd.to_numeric, errors='coerce')
+
+def _missing_required(data):
+    values = data[REQUIRED_COLUMNS]
+    return values.isna().any(axis=1) | values.astype(str).apply(lambda column: column.str.strip() == "").any(axis=1)
+
+def _negative_stats(data):
+    return (_stat_values(data) < 0).any(axis=1)
+
+def _games_played_bounds(data):
+    games = pd.to_numeric(data['Games Played'], errors='coerce')
+    other_stats = _stat_values(data)[STAT_COLUMNS[1:]].sum(axis=1)
+    return (games < 0) | (games > MAX_GAMES_PER_SEASON) | ((games == 0) & (other_stats > 0))
+
+def _position_stat_consistency(data):
+    """A stat above the plausible maximum for the position (e.g. an OL with passing yards)"""
+    limits = pd.DataFrame.from_dict(POSITION_STAT_LIMITS, orient='index')[STAT_COLUMNS[1:]]
+    row_limits = limits.reindex(data['Position']).to_numpy()
+    return pd.Series((_stat_values(data)[STAT_COLUMNS[1:]].to_numpy() > row_limits).any(axis=1), index=data.index)
+
+def _per_game_outlier(data):
+    """Per-game production far above the position's norm (robust z-score on median / MAD)"""
+    stats = _stat_values(data)
+    games = stats['Games Played'].where(stats['Games Played'] > 0)
+    rates = pd.DataFrame({
+        'yards': (stats['Passing Yards'] + stats['Rushing Yards'] + stats['Receiving Yards']) / games,
+        'touchdowns': stats['Touchdowns'] / games,
+        'tackles': stats['Tackles'] / games,
+        'sacks': stats['Sacks'] / games
+    }, index=data.index)
+
+    median = rates.groupby(data['Position']).transform('median')
+    mad = (rates - median).abs().groupby(data['Position']).transform('median')
+    # Floor the spread at a share of the median so tightly clustered groups don't flag normal variation
+    scale = (1.4826 * mad).where(1.4826 * mad > OUTLIER_MIN_SPREAD * median, OUTLIER_MIN_SPREAD * median)
+    z_scores = (rates - median) / scale.where(scale > 0)
+    return (z_scores > OUTLIER_Z_SCORE).any(axis=1)
+
+def _duplicate_player(data):
+    return player_key(data).duplicated(keep=False)
+
+QUALITY_RULES = [
+    {"name": "missing_required", "severity": "error", "group_by": None,
+     "description": "Player name, team, position or season is missing", "check": _missing_required},
+    {"name": "unknown_position", "severity": "error", "group_by": None,
+     "description": "Position is not one of " + ", ".join(POSITIONS),
+     "check": lambda data: ~data['Position'].isin(POSITIONS)},
+    {"name": "negative_stats", "severity": "error", "group_by": None,
+     "description": "A statistic is negative", "check": _negative_stats},
+    {"name": "games_played_bounds", "severity": "error", "group_by": None,
+     "description": f"Games played outside 0-{MAX_GAMES_PER_SEASON}, or stats with 0 games", "check": _games_played_bounds},
+    {"name": "position_stat_consistency", "severity": "warning", "group_by": None,
+     "description": "Statistic implausible for the position", "check": _position_stat_consistency},
+    {"name": "per_game_outlier", "severity": "warning", "group_by": lambda data: data['Position'],
+     "description": "Per-game production is far above the norm for the position", "check": _per_game_outlier},
+    {"name": "duplicate_player", "severity": "warning", "group_by": player_key,
+     "description": "Same player listed more than once for a team and season", "check": _duplicate_player},
+]
+
+class DataQualityEngine:
+    """Runs QUALITY_RULES and re-validates only what changed since the previous run"""
+
+    def __init__(self, rules=None):
+        self.rules = rules or QUALITY_RULES
+        self.results = {rule["name"]: pd.Series(dtype=bool) for rule in self.rules}
+        self.groups = {rule["name"]: pd.Series(dtype=object) for rule in self.rules if rule["group_by"]}
+        self.version = None
+        self.report = None
+
+    def validate(self, data, version=None):
+        """
+        Check the dataset and return a report. Calling again with the same version returns the
+        cached report; with new data, unchanged rows reuse their previous results.
+        """
+        if version is not None and version == self.version:
+            return self.report
+
+        hashes = pd.Series(pd.util.hash_pandas_object(data[CHECK_COLUMNS], index=False).to_numpy(), index=data.index)
+        known = self.results[self.rules[0]["name"]].index
+        changed = ~hashes.isin(known)
+        removed = known.difference(pd.Index(hashes))
+
+        for rule in self.rules:
+            name = rule["name"]
+            if rule["group_by"] is None:
+                subset = data[changed]
+            else:
+                groups = pd.Series(rule["group_by"](data).to_numpy(), index=data.index)
+                # A changed or removed row can change the verdict for every row in its group
+                affected = set(groups[changed]) | set(self.groups[name].reindex(removed).dropna())
+                subset = data[groups.isin(affected)]
+                self.groups[name] = self._merge(self.groups[name], groups, hashes)
+
+            if not subset.empty:
+                verdicts = pd.Series(rule["check"](subset).fillna(False).astype(bool).to_numpy(), index=subset.index)
+                self.results[name] = self._merge(self.results[name], verdicts, hashes[subset.index])
+            self.results[name] = self.results[name][self.results[name].index.isin(hashes)]
+            if rule["group_by"] is not None:
+                self.groups[name] = self.groups[name][self.groups[name].index.isin(hashes)]
+
+        self.report = self._build_report(data, hashes, int(changed.sum()))
+        self.version = version
+        return self.report
+
+    @staticmethod
+    def _merge(previous, values, hashes):
+        """Replace entries for the given row hashes (identical rows share one entry)"""
+        update = pd.Series(values.to_numpy(), index=hashes.reindex(values.index).to_numpy())
+        update = update[~update.index.duplicated(keep='last')]
+        return pd.concat([previous[~previous.index.isin(update.index)], update])
+
+    def _build_report(self, data, hashes, rows_revalidated):
+        flags = pd.DataFrame({rule["name"]: hashes.map(self.results[rule["name"]]).fillna(False).astype(bool)
+                              for rule in self.rules}, index=data.index)
+
+        violations = flags.stack()
+        violations = violations[violations].reset_index()
+        violations.columns = ['Row', 'Rule', 'Failed']
+        rule_info = {rule["name"]: rule for rule in self.rules}
+        violations['Severity'] = violations['Rule'].map(lambda name: rule_info[name]["severity"])
+        violations['Description'] = violations['Rule'].map(lambda name: rule_info[name]["description"])
+        details = data.loc[violations['Row'], ['Player Name', 'Team', 'Position']].reset_index(drop=True)
+        violations = pd.concat([violations.drop(columns='Failed'), details], axis=1)
+
+        total_cells = data.size
+        rows_with_errors = flags[[rule["name"] for rule in self.rules if rule["severity"] == "error"]].any(axis=1)
+        return {
+            "rows": len(data),
+            "rows_revalidated": rows_revalidated,
+            "rule_counts": flags.sum().astype(int).to_dict(),
+            "violations": violations,
+            "rows_with_issues": int(flags.any(axis=1).sum()),
+            "rows_with_errors": int(rows_with_errors.sum()),
+            "quality_score": 100.0 * (1 - flags.any(axis=1).mean()) if len(data) else 100.0,
+            "completeness": 100.0 * data.count().sum() / total_cells if total_cells else 100.0
+        }
+
+def main():
+    """Command line entry point"""
+    from utils import load_data
+
+    print("🏈 CJFL DATA QUALITY REPORT")
+    print("=" * 50)
+
+    data = load_data()
+    report = DataQualityEngine().validate(data)
+
+    print(f"Rows checked: {report['rows']}")
+    print(f"Completeness: {report['completeness']:.1f}%")
+    print(f"Quality score: {report['quality_score']:.1f}% of rows without issues")
+    print("\n📋 RULES:")
+    for rule in QUALITY_RULES:
+        count = report['rule_counts'][rule['name']]
+        marker = "✅" if count == 0 else ("❌" if rule['severity'] == "error" else "⚠️ ")
+        print(f"{marker} {rule['name']:<28} {count:>4}  {rule['description']}")
+
+    if not report['violations'].empty:
+        print("\n🔍 ISSUES:")
+        for _, issue in report['violations'].iterrows():
+            print(f"   Row {issue['Row']}: {issue['Player Name']} ({issue['Team']}, {issue['Position']}) - {issue['Description']}")
+
+if __name__ == "__main__":
+    main()
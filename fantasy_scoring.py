@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+CJFL Fantasy Scoring
+Scores every player-season (or player-game) for the league fantasy contest.
+
+Scoring rules are plain data: points per unit of each stat, plus an optional
+multiplier per position. The league office can change them in
+data/fantasy_rules.json without touching code. Scoring is one matrix product of
+the stat columns with the points vector, so a whole season or every box score is
+scored in one pass. Results are cached per rules version (a hash of the rules)
+and data version.
+
+    python fantasy_scoring.py                   # season leaderboard with the current rules
+    python fantasy_scoring.py --games --top 10  # best single-game scores from the box scores
+    python fantasy_scoring.py --show-rules
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+
+import pandas as pd
+
+from utils import POSITIONS, STAT_COLUMNS
+
+RULES_FILE = "data/fantasy_rules.json"
+FANTASY_STATS = STAT_COLUMNS[1:]  # everything but Games Played; box scores have no such column
+POINTS_COLUMN = 'Fantasy Points'
+
+DEFAULT_RULES = {
+    "name": "CJFL Standard",
+    "points": {
+        "Passing Yards": 0.04,    # 1 point per 25 yards
+        "Rushing Yards": 0.1,     # 1 point per 10 yards
+        "Receiving Yards": 0.1,
+        "Touchdowns": 6,
+        "Tackles": 1,
+        "Sacks": 2,
+        "Interceptions": 3
+    },
+    "position_multipliers": {}
+}
+
+def validate_rules(rules):
+    """Raise ValueError unless the rules name known stats and positions with numeric values"""
+    if not isinstance(rules.get("points"), dict) or not rules["points"]:
+        raise ValueError("Rules need a 'points' table")
+    for stat, points in rules["points"].items():
+        if stat not in FANTASY_STATS:
+            raise ValueError(f"Unknown stat in scoring rules: {stat}")
+        if not isinstance(points, (int, float)) or isinstance(points, bool):
+            raise ValueError(f"Points for {stat} must be a number")
+    for position, multiplier in rules.get("position_multipliers", {}).items():
+        if position not in POSITIONS:
+            raise ValueError(f"Unknown position in scoring rules: {position}")
+        if not isinstance(multiplier, (int, float)) or isinstance(multiplier, bool) or multiplier < 0:
+            raise ValueError(f"Multiplier for {position} must be a non-negative number")
+    return rules
+
+def load_rules(path=RULES_FILE):
+    """Rules from the rules file, or the default rules when there is none"""
+    if not os.path.exists(path):
+        return DEFAULT_RULES
+    with open(path, 'r') as f:
+        return validate_rules(json.load(f))
+
+def rules_version(rules):
+    """Short hash of the rules; any change to points or multipliers gives a new version"""
+    canonical = json.dumps({"points": rules["points"], "position_multipliers": rules.get("position_multipliers", {})},
+                           sort_keys=True)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:12]
+
+def scoring_arrays(data, rules):
+    """(stat matrix, points vector, per-row position multiplier); stats missing from data count as 0"""
+    weights = pd.Series(rules["points"], dtype='float64')
+    stats = data.reindex(columns=weights.index, fill_value=0).to_numpy(dtype='float64', na_value=0.0)
+    multipliers = data['Position'].map(rules.get("position_multipliers", {})).fillna(1.0).to_numpy(dtype='float64')
+    return stats, weights, multipliers
+
+def score(data, rules):
+    """Fantasy points for every row (player-season or player-game) in one matrix product"""
+    stats, weights, multipliers = scoring_arrays(data, rules)
+    return pd.Series(stats @ weights.to_numpy() * multipliers, index=data.index, name=POINTS_COLUMN)
+
+def score_breakdown(data, rules):
+    """Points from each stat (position multiplier applied) as '<stat> Pts' columns, plus the total"""
+    stats, weights, multipliers = scoring_arrays(data, rules)
+    points = stats * weights.to_numpy() * multipliers[:, None]
+    breakdown = pd.DataFrame(points, index=data.index, columns=[f"{stat} Pts" for stat in weights.index])
+    breakdown[POINTS_COLUMN] = points.sum(axis=1)
+    return breakdown
+
+def weekly_scores(games, rules):
+    """Fantasy points per player and week from the box scores, best first"""
+    scored = games.assign(**{POINTS_COLUMN: score(games, rules)})
+    weekly = scored.groupby(['Season', 'Week', 'Player Name', 'Team', 'Position'], as_index=False)[POINTS_COLUMN].sum()
+    return weekly.sort_values(POINTS_COLUMN, ascending=False, kind='stable').reset_index(drop=True)
+
+class FantasyScorer:
+    """Scores for one rule set, cached per data version"""
+
+    MAX_CACHED = 4
+
+    def __init__(self, rules=None):
+        self.rules = validate_rules(rules or DEFAULT_RULES)
+        self.version = rules_version(self.rules)
+        self.cache = {}
+        self.lock = threading.Lock()  # one scorer is shared by every dashboard session
+
+    def points(self, data, data_version=None):
+        """Fantasy points per row; reused while (rules version, data version) stays the same"""
+        if data_version is None:
+            return score(data, self.rules)
+        key = (self.version, data_version, len(data))
+        with self.lock:
+            if key not in self.cache:
+                if len(self.cache) >= self.MAX_CACHED:
+                    self.cache.pop(next(iter(self.cache)))
+                self.cache[key] = score(data, self.rules)
+            return self.cache[key]
+
+    def apply(self, data, data_version=None):
+        """The data with a 'Fantasy Points' column added (shallow copy)"""
+        data = data.copy(deep=False)
+        data[POINTS_COLUMN] = self.points(data, data_version).to_numpy()
+        return data
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Score the fantasy contest")
+    parser.add_argument("--rules", default=RULES_FILE, help=f"Scoring rules (default: {RULES_FILE})")
+    parser.add_argument("--season", type=int, help="Only this season")
+    parser.add_argument("--games", action="store_true", help="Score single games from the box scores")
+    parser.add_argument("--top", type=int, default=20, help="Players to show (default: 20)")
+    parser.add_argument("--show-rules", action="store_true", help="Print the scoring rules")
+    args = parser.parse_args()
+
+    print("🏈 CJFL FANTASY SCORING")
+    print("=" * 50)
+
+    try:
+        rules = load_rules(args.rules)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+    print(f"Rules: {rules.get('name', 'Custom')} (version {rules_version(rules)})")
+    if args.show_rules:
+        for stat, points in rules["points"].items():
+            print(f"   {stat}: {points:g} points")
+        for position, multiplier in rules.get("position_multipliers", {}).items():
+            print(f"   {position} multiplier: x{multiplier:g}")
+
+    if args.games:
+        from game_stats import GameStatsStore
+        scored = weekly_scores(GameStatsStore().load_games(), rules)
+        if args.season:
+            scored = scored[scored['Season'] == args.season]
+        print(f"\n🔥 Top {args.top} single-week scores:")
+        for _, row in scored.head(args.top).iterrows():
+            print(f"   {row['Season']} W{row['Week']:<3} {row['Player Name']:<25} {row['Team']:<22} "
+                  f"{row[POINTS_COLUMN]:7.1f}")
+        return
+
+    from utils import load_data
+    data = load_data()
+    if args.season:
+        data = data[data['Season'] == args.season]
+    leaders = data.assign(**{POINTS_COLUMN: score(data, rules)}).nlargest(args.top, POINTS_COLUMN)
+    print(f"\n🏆 Top {len(leaders)} fantasy scorers:")
+    for rank, (_, row) in enumerate(leaders.iterrows(), 1):
+        print(f"{rank:>3}. {row['Player Name']:<25} {row['Team']:<22} {row['Position']:<3} {row['Season']}  "
+              f"{row[POINTS_COLUMN]:7.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+CJFL Form Metrics
+Recent form for every player: averages over the last N games and an exponentially
+weighted per-game average (EWMA), computed from the box scores in game_stats.py.
+
+All players are computed at once with grouped window operations. The tracker also keeps
+just enough state to fold in new games without recomputing any window: the last N
+games per player, plus the decayed EWMA numerator and weight. Each new game multiplies
+those by the decay and adds itself. New games are read from the end of the game file,
+as game_stats.py does for the season rollup; a replaced game file, or a backfilled game
+that sorts before a player's latest one, makes the tracker start over from every game.
+
+    python form_metrics.py                      # refresh, then top 15 by total yards form
+    python form_metrics.py --stat Tackles --window 5 --halflife 4
+    python form_metrics.py --rebuild            # recompute from every game
+"""
+
+import argparse
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from game_stats import GameStatsStore, read_fingerprint
+from utils import atomic_path
+
+FORM_STATE_FILE = "data/form_state.json"
+DEFAULT_WINDOW = 3        # games
+DEFAULT_HALFLIFE = 3.0    # games until a game counts half as much in the EWMA
+
+FORM_KEY = ['Player Name', 'Team', 'Season']
+GAME_ORDER = ['Season', 'Week', 'Game Date', 'Game ID']
+GAME_COLUMNS = FORM_KEY + ['Week', 'Game Date', 'Game ID']
+FORM_STATS = ['Total Yards', 'Touchdowns', 'Tackles', 'Sacks', 'Interceptions']
+
+def last_column(stat, window=DEFAULT_WINDOW):
+    return f"{stat} (Last {window})"
+
+def form_column(stat):
+    return f"{stat} (Form)"
+
+def game_values(games):
+    """Per-game form stats in game order (order within a player is what the windows run over)"""
+    values = games.assign(**{'Total Yards': games['Passing Yards'] + games['Rushing Yards'] + games['Receiving Yards'],
+                             'Game ID': games['Game ID'].astype(str), 'Game Date': games['Game Date'].astype(str)})
+    return values.sort_values(GAME_ORDER, kind='stable')[GAME_COLUMNS + FORM_STATS].reset_index(drop=True)
+
+def form_series(games, window=DEFAULT_WINDOW, halflife=DEFAULT_HALFLIFE):
+    """Every game with the player's rolling and EWMA averages up to and including it"""
+    values = game_values(games)
+    grouped = values.groupby(FORM_KEY, sort=False)[FORM_STATS]
+    rolling = grouped.rolling(window, min_periods=1).mean().reset_index(level=FORM_KEY, drop=True)
+    ewm = grouped.ewm(halflife=halflife).mean().reset_index(level=FORM_KEY, drop=True)
+    return values.join(rolling.rename(columns=lambda stat: last_column(stat, window))) \
+                 .join(ewm.rename(columns=form_column))
+
+def current_form(games, window=DEFAULT_WINDOW, halflife=DEFAULT_HALFLIFE):
+    """Latest form per player, computed from scratch"""
+    series = form_series(games, window, halflife)
+    latest = series.groupby(FORM_KEY, sort=False).tail(1).set_index(FORM_KEY)
+    latest.insert(0, 'Form Games', series.groupby(FORM_KEY, sort=False).size())
+    columns = [column for stat in FORM_STATS for column in (last_column(stat, window), form_column(stat))]
+    return latest[['Form Games'] + columns].reset_index()
+
+class FormTracker:
+    """Incrementally maintained last-N and EWMA form for every player"""
+
+    def __init__(self, window=DEFAULT_WINDOW, halflife=DEFAULT_HALFLIFE):
+        self.window = window
+        self.halflife = halflife
+        self.decay = 0.5 ** (1 / halflife)
+        self.offset = 0
+        self.fingerprint = None
+        self.recent = pd.DataFrame(columns=GAME_COLUMNS + FORM_STATS)
+        self.ewm = pd.DataFrame(columns=FORM_STATS + ['Weight', 'Form Games'],
+                                index=pd.MultiIndex.from_arrays([[], [], []], names=FORM_KEY), dtype='float64')
+
+    def backfilled(self, games):
+        """Whether any of these games sorts at or before the latest game already seen for its player"""
+        if games.empty or self.recent.empty:
+            return False
+        latest = self.recent.groupby(FORM_KEY, sort=False).tail(1)[GAME_COLUMNS]
+        both = game_values(games)[GAME_COLUMNS].merge(latest, on=FORM_KEY, suffixes=('', ' Seen'))
+        earlier = pd.Series(True, index=both.index)  # equal on every order column: the same game again
+        for column in reversed(GAME_ORDER[1:]):
+            new, seen = both[column], both[f"{column} Seen"].astype(both[column].dtype)
+            earlier = (new < seen) | ((new == seen) & earlier)
+        return bool(earlier.any())
+
+    def update(self, games):
+        """Fold in new games (later than every game already seen); returns the players that changed"""
+        if games.empty:
+            return self.ewm.index[:0]
+        if self.backfilled(games):
+            raise ValueError("games predate ones already folded in; rebuild from every game instead")
+        values = game_values(games)
+        keys = [values[column] for column in FORM_KEY]
+
+        # Last-N: keep only each player's newest `window` games
+        recent = pd.concat([self.recent, values], ignore_index=True) if not self.recent.empty else values
+        self.recent = recent.groupby(FORM_KEY, sort=False).tail(self.window).reset_index(drop=True)
+
+        # EWMA: the j-th of k new games enters with weight decay^(k-1-j); old sums decay by decay^k
+        weights = self.decay ** values.groupby(FORM_KEY, sort=False).cumcount(ascending=False)
+        batch = values[FORM_STATS].mul(weights, axis=0).groupby(keys, sort=False).sum()
+        batch['Weight'] = weights.groupby(keys, sort=False).sum()
+        batch['Form Games'] = values.groupby(FORM_KEY, sort=False).size()
+        carried = self.decay ** batch['Form Games']
+
+        ewm = self.ewm.reindex(self.ewm.index.union(batch.index, sort=False), fill_value=0.0)
+        previous = ewm.loc[batch.index]
+        scaled = previous[FORM_STATS + ['Weight']].mul(carried, axis=0)
+        ewm.loc[batch.index, FORM_STATS + ['Weight']] = scaled + batch[FORM_STATS + ['Weight']]
+        ewm.loc[batch.index, 'Form Games'] = previous['Form Games'] + batch['Form Games']
+        self.ewm = ewm
+        return batch.index
+
+    def table(self):
+        """Current form per player: games seen, last-N average and EWMA for every form stat"""
+        last_n = self.recent.groupby(FORM_KEY, sort=False)[FORM_STATS].mean() if not self.recent.empty \
+            else pd.DataFrame(columns=FORM_STATS, dtype='float64')
+        form = self.ewm[FORM_STATS].div(self.ewm['Weight'], axis=0)
+        result = pd.DataFrame({'Form Games': self.ewm['Form Games'].astype('int64')}, index=self.ewm.index)
+        for stat in FORM_STATS:
+            result[last_column(stat, self.window)] = last_n[stat].reindex(result.index)
+            result[form_column(stat)] = form[stat]
+        return result.reset_index()
+
+    def refresh(self, store):
+        """Read the games appended to the store's game file since the last refresh"""
+        if not os.path.exists(store.game_file):
+            return 0
+        if os.path.getsize(store.game_file) < self.offset or (
+                self.offset and self.fingerprint != read_fingerprint(store.game_file, self.offset)):
+            # The game file was replaced, rewritten or truncated; the stored offset means nothing any more
+            return self.rebuild(store)
+        new_rows, offset = store.read_since(self.offset)
+        if self.backfilled(new_rows):
+            # A late box score changes every window after it; only a full recompute gets the order right
+            return self.rebuild(store)
+        self.update(new_rows)
+        self.offset = offset
+        self.fingerprint = read_fingerprint(store.game_file, offset) if offset else None
+        return len(new_rows)
+
+    def rebuild(self, store):
+        """Start over from every game in the store"""
+        self.__init__(self.window, self.halflife)
+        return self.refresh(store)
+
+    def save(self, path=FORM_STATE_FILE):
+        """Write the window state atomically"""
+        state = {"window": self.window, "halflife": self.halflife, "offset": self.offset,
+                 "fingerprint": self.fingerprint,
+                 "recent": self.recent.to_dict(orient='split', index=False),
+                 "ewm": self.ewm.reset_index().to_dict(orient='split', index=False)}
+        with atomic_path(path) as tmp_path, open(tmp_path, 'w') as f:
+            json.dump(state, f, default=lambda value: value.item() if isinstance(value, np.generic) else str(value))
+
+    @classmethod
+    def load(cls, path=FORM_STATE_FILE, window=DEFAULT_WINDOW, halflife=DEFAULT_HALFLIFE):
+        """Saved state, or an empty tracker if there is none or it used other window settings"""
+        tracker = cls(window, halflife)
+        if not os.path.exists(path):
+            return tracker
+        with open(path, 'r') as f:
+            state = json.load(f)
+        if state["window"] != window or state["halflife"] != halflife:
+            return tracker
+        tracker.offset = state["offset"]
+        tracker.fingerprint = state.get("fingerprint")
+        if state["recent"]["data"]:
+            tracker.recent = pd.DataFrame(state["recent"]["data"], columns=state["recent"]["columns"])
+        if state["ewm"]["data"]:
+            tracker.ewm = pd.DataFrame(state["ewm"]["data"], columns=state["ewm"]["columns"]).set_index(FORM_KEY)
+        return tracker
+
+def load_form(store=None, path=FORM_STATE_FILE, window=DEFAULT_WINDOW, halflife=DEFAULT_HALFLIFE):
+    """Form table after folding in any new games; the state is saved only when something changed"""
+    tracker = FormTracker.load(path, window, halflife)
+    if tracker.refresh(store or GameStatsStore()):
+        tracker.save(path)
+    return tracker.table()
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Last-N and exponentially weighted player form")
+    parser.add_argument("--window", type=int, default=DEFAULT_WINDOW, help="Games in the rolling window (default: 3)")
+    parser.add_argument("--halflife", type=float, default=DEFAULT_HALFLIFE, help="EWMA half-life in games (default: 3)")
+    parser.add_argument("--stat", default="Total Yards", choices=FORM_STATS, help="Stat to rank by")
+    parser.add_argument("--top", type=int, default=15, help="Players to show (default: 15)")
+    parser.add_argument("--rebuild", action="store_true", help="Recompute the windows from every game")
+    args = parser.parse_args()
+
+    print("🏈 CJFL FORM METRICS")
+    print("=" * 50)
+
+    store = GameStatsStore()
+    tracker = FormTracker.load(window=args.window, halflife=args.halflife)
+    new_rows = tracker.rebuild(store) if args.rebuild else tracker.refresh(store)
+    tracker.save()
+    print(f"🔄 {new_rows} new box score rows folded in")
+
+    form = tracker.table()
+    if form.empty:
+        print("No box scores yet. Import them with: python game_stats.py import <file>")
+        return
+    leaders = form.nlargest(args.top, form_column(args.stat))
+    print(f"\n📈 Top {len(leaders)} by {args.stat} form (half-life {args.halflife:g} games):")
+    for _, row in leaders.iterrows():
+        print(f"{row['Player Name']:<25} {row['Team']:<22} {int(row['Form Games']):>3} games  "
+              f"last {args.window}: {row[last_column(args.stat, args.window)]:7.1f}  "
+              f"form: {row[form_column(args.stat)]:7.1f}")
+
+if __name__ == "__main__":
+    main()
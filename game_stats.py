@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+CJFL Game Stats
+Per-game player box scores, with season totals kept as an incremental rollup.
+
+Box scores live in data/cjfl_game_stats.csv, one row per player per game, and the
+file is only ever appended to. Season totals are the rollup of that table, using
+the existing season schema: games played is the number of games, every other stat
+is summed. The rollup is kept up to date incrementally. Each refresh reads only the
+rows appended since the previous one (tracked by byte offset), adds them to the
+stored totals, and merges just the players it touched into data/cjfl_stats.csv.
+The state also keeps a fingerprint of the bytes already read, so a game file that
+was replaced, rewritten or truncated is rolled up again from scratch.
+Every dashboard that reads season totals keeps working unchanged, and players
+without box scores keep their manually entered totals.
+
+    python game_stats.py import week5_box_scores.csv
+    python game_stats.py refresh     # pick up rows appended by other tools
+    python game_stats.py rebuild     # recompute the rollup from every game
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from utils import POSITIONS, STAT_COLUMNS, atomic_path
+from bulk_import import (DATA_FILE, OUTPUT_COLUMNS, POSITION_ALIASES, canonical_columns, dataset_lock, merge_rows,
+                         write_atomic)
+from player_identity import load_identity_map
+
+GAME_FILE = "data/cjfl_game_stats.csv"
+ROLLUP_FILE = "data/cjfl_game_rollup.csv"
+ROLLUP_STATE_FILE = "data/cjfl_game_rollup.json"
+
+FINGERPRINT_BYTES = 4096
+
+GAME_STAT_COLUMNS = STAT_COLUMNS[1:]  # a box score has no Games Played; each row is one game
+PLAYER_KEY = ['Player Name', 'Team', 'Position', 'Season']
+GAME_COLUMNS = ['Game ID', 'Game Date', 'Week', 'Player Name', 'Team', 'Opponent', 'Position', 'Season'] \
+    + GAME_STAT_COLUMNS
+
+def validate_games(games):
+    """
+    Column-wise checks for box score rows.
+    Returns (valid rows in GAME_COLUMNS layout, rejected rows with a 'Reason' column).
+    """
+    games = games.rename(columns=canonical_columns(games.columns))
+    rows = pd.DataFrame(index=games.index)
+    for column in ['Game ID', 'Game Date', 'Player Name', 'Team', 'Opponent']:
+        rows[column] = games[column].astype(str).str.strip() if column in games else ""
+    rows['Position'] = (games['Position'].astype(str).str.strip().str.upper().replace(POSITION_ALIASES)
+                        if 'Position' in games else "")
+    rows['Week'] = pd.to_numeric(games.get('Week', pd.Series(0, index=games.index)), errors='coerce')
+    rows['Season'] = pd.to_numeric(games.get('Season', pd.Series(np.nan, index=games.index)), errors='coerce')
+    for stat in GAME_STAT_COLUMNS:
+        raw = games[stat].astype(str).str.replace(",", "", regex=False).replace("", "0") if stat in games else "0"
+        rows[stat] = pd.to_numeric(raw, errors='coerce')
+
+    numeric = rows[['Week', 'Season'] + GAME_STAT_COLUMNS]
+    problems = {
+        "missing game, player or team": (rows[['Game ID', 'Player Name', 'Team']] == "").any(axis=1),
+        "unknown position": ~rows['Position'].isin(POSITIONS),
+        "invalid season or week": rows['Season'].isna() | rows['Week'].isna(),
+        "stat is not a whole, non-negative number": (numeric.isna() | (numeric < 0) | (numeric % 1 > 0))[GAME_STAT_COLUMNS].any(axis=1)
+    }
+    reasons = pd.Series("", index=rows.index)
+    for message, mask in problems.items():
+        reasons = reasons.where(~mask, reasons + np.where(reasons == "", "", "; ") + message)
+
+    valid = rows[reasons == ""].copy()
+    for column in ['Week', 'Season'] + GAME_STAT_COLUMNS:
+        valid[column] = valid[column].astype('int64')
+    rejected = games[reasons != ""].copy()
+    rejected.insert(0, 'Reason', reasons[reasons != ""])
+    return valid[GAME_COLUMNS], rejected
+
+def read_csv_since(path, offset, columns):
+    """
+    Rows of an append-only CSV added after byte offset (complete lines only) and the
+    offset to resume from. Only the new bytes are read; the header comes from the first line.
+    """
+    with open(path, 'rb') as f:
+        header = f.readline()
+        f.seek(max(offset, len(header)))
+        chunk = f.read()
+    complete = chunk[:chunk.rfind(b"\n") + 1]
+    new_offset = max(offset, len(header)) + len(complete)
+    if not complete.strip():
+        return pd.DataFrame(columns=columns), new_offset
+    return pd.read_csv(io.BytesIO(header + complete), dtype={'Game ID': str}), new_offset
+
+def read_fingerprint(path, offset):
+    """
+    Identity of the bytes already read from an append-only file: its inode and a digest of the
+    first and last FINGERPRINT_BYTES before offset. Changes when the file is replaced or rewritten.
+    """
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        digest.update(f.read(min(offset, FINGERPRINT_BYTES)))
+        f.seek(max(0, offset - FINGERPRINT_BYTES))
+        digest.update(f.read(min(offset, FINGERPRINT_BYTES)))
+        inode = os.fstat(f.fileno()).st_ino
+    return {"inode": inode, "digest": digest.hexdigest()}
+
+def season_rollup(games):
+    """Season totals in the cjfl_stats.csv layout: one row per player, team, position and season"""
+    if games.empty:
+        return pd.DataFrame(columns=OUTPUT_COLUMNS)
+    grouped = games.groupby(PLAYER_KEY, sort=False)
+    totals = grouped[GAME_STAT_COLUMNS].sum()
+    totals.insert(0, 'Games Played', grouped['Game ID'].nunique())
+    return totals.reset_index()[OUTPUT_COLUMNS]
+
+class GameStatsStore:
+    """Append-only box score table with an incrementally maintained season rollup"""
+
+    def __init__(self, game_file=GAME_FILE, data_file=DATA_FILE, rollup_file=ROLLUP_FILE, state_file=ROLLUP_STATE_FILE):
+        self.game_file = game_file
+        self.data_file = data_file
+        self.rollup_file = rollup_file
+        self.state_file = state_file
+
+    def load_games(self):
+        """Every box score row"""
+        if not os.path.exists(self.game_file):
+            return pd.DataFrame(columns=GAME_COLUMNS)
+        return pd.read_csv(self.game_file, dtype={'Game ID': str})
+
+    def load_rollup(self):
+        if not os.path.exists(self.rollup_file):
+            return pd.DataFrame(columns=OUTPUT_COLUMNS)
+        return pd.read_csv(self.rollup_file)
+
+    def _load_state(self):
+        if not os.path.exists(self.state_file):
+            return {"offset": 0}
+        with open(self.state_file, 'r') as f:
+            return json.load(f)
+
+    def _save_state(self, state):
+        with atomic_path(self.state_file) as tmp_path, open(tmp_path, 'w') as f:
+            json.dump(state, f)
+
+    def add_games(self, games):
+        """
+        Validate box score rows and append the new ones; rows for a player and game that are
+        already stored are skipped. Then refresh the rollup. Returns a result dict.
+        """
+        valid, rejected = validate_games(games)
+        stored = self.load_games()[['Game ID', 'Player Name', 'Team']] if os.path.exists(self.game_file) else None
+        keys = valid['Game ID'] + "|" + valid['Player Name'] + "|" + valid['Team']
+        duplicate = keys.duplicated()
+        if stored is not None:
+            duplicate |= keys.isin(set(stored['Game ID'] + "|" + stored['Player Name'] + "|" + stored['Team']))
+        new_games = valid[~duplicate]
+
+        if not new_games.empty:
+            os.makedirs(os.path.dirname(self.game_file) or ".", exist_ok=True)
+            write_header = not os.path.exists(self.game_file) or os.path.getsize(self.game_file) == 0
+            new_games.to_csv(self.game_file, mode='a', header=write_header, index=False)
+
+        result = self.refresh()
+        result.update({"added": len(new_games), "duplicates": int(duplicate.sum()), "rejected": len(rejected),
+                       "rejected_rows": rejected})
+        return result
+
+    def read_since(self, offset):
+        """Box score rows appended after byte offset, and the offset to resume from"""
+        return read_csv_since(self.game_file, offset, GAME_COLUMNS)
+
+    def refresh(self):
+        """Fold rows appended since the last refresh into the rollup and the season stats file"""
+        state = self._load_state()
+        if not os.path.exists(self.game_file):
+            return {"new_rows": 0, "players_updated": 0}
+        if os.path.getsize(self.game_file) < state["offset"] or (
+                state["offset"] and state.get("fingerprint") != read_fingerprint(self.game_file, state["offset"])):
+            # The game file was replaced, rewritten or truncated; the stored offset means nothing any more
+            return self.rebuild()
+
+        new_rows, offset = self.read_since(state["offset"])
+        if new_rows.empty:
+            return {"new_rows": 0, "players_updated": 0}
+
+        increment = season_rollup(new_rows).set_index(PLAYER_KEY)
+        rollup = self.load_rollup().set_index(PLAYER_KEY)
+        rollup = rollup.add(increment, fill_value=0).astype('int64')
+        changed = rollup.loc[increment.index].reset_index()[OUTPUT_COLUMNS]
+
+        write_atomic(rollup.reset_index()[OUTPUT_COLUMNS], self.rollup_file)
+        self._apply_to_season_stats(changed)
+        self._save_state({"offset": offset, "fingerprint": read_fingerprint(self.game_file, offset)})
+        return {"new_rows": len(new_rows), "players_updated": len(changed)}
+
+    def rebuild(self):
+        """Recompute the rollup from the whole game table"""
+        games = self.load_games()
+        rollup = season_rollup(games)
+        write_atomic(rollup, self.rollup_file)
+        self._apply_to_season_stats(rollup)
+        offset = os.path.getsize(self.game_file) if os.path.exists(self.game_file) else 0
+        self._save_state({"offset": offset, "fingerprint": read_fingerprint(self.game_file, offset) if offset else None})
+        return {"new_rows": len(games), "players_updated": len(rollup)}
+
+    def _apply_to_season_stats(self, totals):
+        """Replace (or add) the season rows of the given players in the season stats file"""
+        if totals.empty:
+            return
+        with dataset_lock(self.data_file):
+            existing = pd.read_csv(self.data_file) if os.path.exists(self.data_file) \
+                else pd.DataFrame(columns=OUTPUT_COLUMNS)
+            merged, _, _, _ = merge_rows(existing, totals, on_duplicate='update', mapping=load_identity_map())
+            write_atomic(merged, self.data_file)
+
+def player_game_log(games, player_name, season=None):
+    """One player's games in order, with total yards per game added"""
+    log = games[games['Player Name'] == player_name]
+    if season is not None:
+        log = log[log['Season'] == season]
+    log = log.sort_values(['Season', 'Week', 'Game Date']).copy()
+    log['Total Yards'] = log['Passing Yards'] + log['Rushing Yards'] + log['Receiving Yards']
+    return log
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Per-game box scores and season rollups")
+    parser.add_argument("command", choices=["import", "refresh", "rebuild", "status"])
+    parser.add_argument("files", nargs="*", help="Box score CSV files (for import)")
+    args = parser.parse_args()
+
+    print("🏈 CJFL GAME STATS")
+    print("=" * 50)
+
+    store = GameStatsStore()
+    if args.command == "import":
+        for path in args.files:
+            result = store.add_games(pd.read_csv(path, dtype=str, keep_default_na=False))
+            print(f"📄 {path}: {result['added']} rows added, {result['duplicates']} already stored, "
+                  f"{result['rejected']} rejected")
+            for _, row in result["rejected_rows"].head(5).iterrows():
+                print(f"   ❌ {row.get('Player Name', '')}: {row['Reason']}")
+            print(f"   🔄 {result['players_updated']} season totals updated")
+    elif args.command == "refresh":
+        result = store.refresh()
+        print(f"🔄 {result['new_rows']} new box score rows, {result['players_updated']} season totals updated")
+    elif args.command == "rebuild":
+        result = store.rebuild()
+        print(f"🔁 Rebuilt {result['players_updated']} season totals from {result['new_rows']} box score rows")
+    else:
+        games = store.load_games()
+        print(f"Box score rows: {len(games)}")
+        print(f"Games: {games['Game ID'].nunique()}  Players: {games['Player Name'].nunique()}")
+        print(f"Season totals in rollup: {len(store.load_rollup())}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+CJFL Batch Report Generator
+Builds per-team and per-position reports (Markdown + HTML) for every CJFL team
+using a process pool, so a full weekly report run finishes in seconds
+"""
+
+import argparse
+import html
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+import plotly.express as px
+
+from utils import load_data, create_leaderboard_chart
+from chart_cache import ChartCache
+
+REPORTS_DIR = "reports"
+
+STAT_COLUMNS = ['Passing Yards', 'Rushing Yards', 'Receiving Yards', 'Touchdowns', 'Tackles', 'Sacks', 'Interceptions']
+SUMMARY_COLUMNS = ['Players', 'Pass Yds', 'Rush Yds', 'Rec Yds', 'TDs', 'Tackles', 'Sacks', 'INTs']
+LEADER_STATS = ['Passing Yards', 'Rushing Yards', 'Receiving Yards', 'Touchdowns', 'Tackles', 'Sacks']
+
+HTML_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ background-color: #0e1117; color: #fafafa; font-family: sans-serif; margin: 2rem; }}
+table {{ border-collapse: collapse; margin: 1rem 0; }}
+th, td {{ border: 1px solid #464646; padding: 0.3rem 0.6rem; text-align: right; }}
+th {{ background-color: #262730; }}
+td:first-child, th:first-child {{ text-align: left; }}
+.chart {{ margin: 1rem 0; }}
+</style>
+</head>
+<body>
+{body}
+</body>
+</html>
+"""
+
+# Read-only dataset shared by every task in a worker process.
+# It is sent once per worker through the pool initializer instead of once per task.
+_WORKER_DATA = None
+
+def _init_worker(data):
+    """Store the shared dataset in the worker process"""
+    global _WORKER_DATA
+    _WORKER_DATA = data
+
+def get_report_teams(data):
+    """All CJFL teams from the collection plan plus any extra teams found in the data"""
+    try:
+        from data_collection_plan import TEAMS
+        plan_teams = list(TEAMS)
+    except ImportError:
+        plan_teams = []
+
+    extra_teams = [team for team in sorted(data['Team'].unique()) if team not in plan_teams]
+    return plan_teams + extra_teams
+
+def slugify(name):
+    """Filesystem-safe name for a team or position"""
+    return re.sub(r'[^a-z0-9]+', '_', name.lower()).strip('_')
+
+def summarize(data, group_column):
+    """Aggregate totals for a grouping column (same layout as show_cjfl_stats)"""
+    summary = data.groupby(group_column).agg({
+        'Player Name': 'count',
+        'Passing Yards': 'sum',
+        'Rushing Yards': 'sum',
+        'Receiving Yards': 'sum',
+        'Touchdowns': 'sum',
+        'Tackles': 'sum',
+        'Sacks': 'sum',
+        'Interceptions': 'sum'
+    })
+    summary.columns = SUMMARY_COLUMNS
+    summary['Total Yards'] = summary['Pass Yds'] + summary['Rush Yds'] + summary['Rec Yds']
+    return summary
+
+def top_players_table(data, stat_column, top_n=5):
+    """Top players for one statistic, skipping players with no production"""
+    leaders = data[data[stat_column] > 0].nlargest(top_n, stat_column)
+    return leaders[['Player Name', 'Team', 'Position', 'Games Played', stat_column]]
+
+def create_position_chart(summary, title):
+    """Bar chart of total yards and touchdowns by position"""
+    chart_data = summary.reset_index()
+    fig = px.bar(
+        chart_data,
+        x='Position',
+        y=['Total Yards', 'TDs', 'Tackles'],
+        barmode='group',
+        title=title,
+        color_discrete_sequence=px.colors.qualitative.Set3
+    )
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#fafafa'),
+        xaxis=dict(gridcolor='#464646'),
+        yaxis=dict(gridcolor='#464646')
+    )
+    return fig
+
+def frame_to_markdown(frame, index=True):
+    """Render a DataFrame as a Markdown table without extra dependencies"""
+    if index:
+        frame = frame.reset_index()
+    header = "| " + " | ".join(str(col) for col in frame.columns) + " |"
+    divider = "| " + " | ".join("---" for _ in frame.columns) + " |"
+    rows = ["| " + " | ".join(f"{value:,}" if isinstance(value, int) else str(value) for value in row) + " |"
+            for row in frame.itertuples(index=False)]
+    return "\n".join([header, divider] + rows)
+
+class ReportBuilder:
+    """Collects report sections and writes them as Markdown and HTML"""
+
+    def __init__(self, title, output_dir, slug, image_format='svg', render_charts=True):
+        self.title = title
+        self.output_dir = output_dir
+        self.slug = slug
+        self.image_format = image_format
+        self.render_charts = render_charts
+        self.markdown = [f"# {title}", "", f"*Generated {datetime.now().strftime('%Y-%m-%d %H:%M')}*", ""]
+        self.html = [f"<h1>{html.escape(title)}</h1>",
+                     f"<p><em>Generated {datetime.now().strftime('%Y-%m-%d %H:%M')}</em></p>"]
+        self.charts_written = 0
+
+    def heading(self, text):
+        self.markdown += [f"## {text}", ""]
+        self.html.append(f"<h2>{html.escape(text)}</h2>")
+
+    def subheading(self, text):
+        self.markdown += [f"### {text}", ""]
+        self.html.append(f"<h3>{html.escape(text)}</h3>")
+
+    def paragraph(self, text):
+        self.markdown += [text, ""]
+        self.html.append(f"<p>{html.escape(text)}</p>")
+
+    def table(self, frame, index=True):
+        if frame.empty:
+            self.paragraph("No data available.")
+            return
+        self.markdown += [frame_to_markdown(frame, index=index), ""]
+        self.html.append(frame.to_html(index=index, border=0))
+
+    def chart(self, fig, name):
+        """Embed a static chart; skipped when static export is unavailable"""
+        if not self.render_charts:
+            return
+        image = ChartCache().render(fig, self.image_format)
+        if image is None:
+            return
+
+        chart_dir = os.path.join(self.output_dir, "charts")
+        os.makedirs(chart_dir, exist_ok=True)
+        file_name = f"{self.slug}_{name}.{self.image_format}"
+        with open(os.path.join(chart_dir, file_name), 'wb') as f:
+            f.write(image)
+
+        self.markdown += [f"![{name}](charts/{file_name})", ""]
+        if self.image_format == 'svg':
+            self.html.append(f'<div class="chart">{image.decode("utf-8")}</div>')
+        else:
+            self.html.append(f'<div class="chart"><img src="charts/{file_name}" alt="{html.escape(name)}"></div>')
+        self.charts_written += 1
+
+    def write(self, formats):
+        os.makedirs(self.output_dir, exist_ok=True)
+        written = []
+        if 'md' in formats:
+            path = os.path.join(self.output_dir, f"{self.slug}.md")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write("\n".join(self.markdown))
+            written.append(path)
+        if 'html' in formats:
+            path = os.path.join(self.output_dir, f"{self.slug}.html")
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(HTML_TEMPLATE.format(title=html.escape(self.title), body="\n".join(self.html)))
+            written.append(path)
+        return written
+
+def build_team_report(team, output_dir, formats=('md', 'html'), image_format='svg', render_charts=True):
+    """Build the report for a single team from the shared worker dataset"""
+    data = _WORKER_DATA
+    team_data = data[data['Team'] == team]
+    report = ReportBuilder(f"{team} Report", output_dir, slugify(team), image_format, render_charts)
+
+    if team_data.empty:
+        report.paragraph("No player data has been collected for this team yet.")
+        return team, report.write(formats)
+
+    report.heading("Team Statistics")
+    team_summary = summarize(team_data, 'Team').reset_index(drop=True)
+    league_summary = summarize(data, 'Team')
+    rank = int(league_summary['Total Yards'].rank(ascending=False, method='min')[team])
+    report.table(team_summary, index=False)
+    report.paragraph(f"League rank by total yards: {rank} of {len(league_summary)}")
+
+    report.heading("Top Players")
+    for stat in LEADER_STATS:
+        leaders = top_players_table(team_data, stat)
+        if leaders.empty:
+            continue
+        report.subheading(stat)
+        report.table(leaders, index=False)
+
+    team_with_totals = team_data.assign(**{
+        'Total Yards': team_data['Passing Yards'] + team_data['Rushing Yards'] + team_data['Receiving Yards']
+    })
+    report.chart(create_leaderboard_chart(team_with_totals, 'Total Yards', 10, f"{team}: Top 10 by Total Yards"), 'total_yards')
+
+    report.heading("Position Breakdown")
+    position_summary = summarize(team_data, 'Position')
+    report.table(position_summary)
+    report.chart(create_position_chart(position_summary, f"{team}: Production by Position"), 'positions')
+
+    return team, report.write(formats)
+
+def build_position_report(position, output_dir, formats=('md', 'html'), image_format='svg', render_charts=True):
+    """Build the league-wide report for a single position from the shared worker dataset"""
+    data = _WORKER_DATA
+    position_data = data[data['Position'] == position]
+    report = ReportBuilder(f"{position} Report", output_dir, slugify(position), image_format, render_charts)
+
+    report.heading("Teams")
+    report.table(summarize(position_data, 'Team').sort_values('Total Yards', ascending=False))
+
+    report.heading("Top Players")
+    for stat in STAT_COLUMNS:
+        leaders = top_players_table(position_data, stat, top_n=10)
+        if leaders.empty:
+            continue
+        report.subheading(stat)
+        report.table(leaders, index=False)
+        report.chart(create_leaderboard_chart(leaders, stat, 10, f"{position}: Top 10 by {stat}"), slugify(stat))
+
+    return position, report.write(formats)
+
+def write_index(output_dir, team_paths, position_paths):
+    """Write a Markdown index linking every generated report"""
+    lines = ["# CJFL Reports", "", f"*Generated {datetime.now().strftime('%Y-%m-%d %H:%M')}*", "", "## Teams", ""]
+    for team, paths in team_paths:
+        lines.append(f"- [{team}]({os.path.relpath(paths[0], output_dir)})")
+    lines += ["", "## Positions", ""]
+    for position, paths in position_paths:
+        lines.append(f"- [{position}]({os.path.relpath(paths[0], output_dir)})")
+
+    index_path = os.path.join(output_dir, "index.md")
+    with open(index_path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
+    return index_path
+
+def generate_reports(data=None, output_dir=REPORTS_DIR, seasons=None, formats=('md', 'html'),
+                     image_format='svg', render_charts=True, max_workers=None):
+    """
+    Generate every team and position report in parallel.
+    Returns a dict with the generated report paths.
+    """
+    if data is None:
+        data = load_data()
+    if seasons:
+        data = data[data['Season'].isin(seasons)]
+
+    teams = get_report_teams(data)
+    positions = sorted(data['Position'].unique())
+    team_dir = os.path.join(output_dir, "teams")
+    position_dir = os.path.join(output_dir, "positions")
+    options = dict(formats=formats, image_format=image_format, render_charts=render_charts)
+
+    team_paths, position_paths = [], []
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(data,)) as pool:
+        futures = {pool.submit(build_team_report, team, team_dir, **options): 'team' for team in teams}
+        futures.update({pool.submit(build_position_report, position, position_dir, **options): 'position'
+                        for position in positions})
+
+        for future in as_completed(futures):
+            name, paths = future.result()
+            (team_paths if futures[future] == 'team' else position_paths).append((name, paths))
+
+    team_paths.sort(key=lambda item: teams.index(item[0]))
+    position_paths.sort()
+    index_path = write_index(output_dir, team_paths, position_paths)
+
+    return {"teams": dict(team_paths), "positions": dict(position_paths), "index": index_path}
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Generate CJFL team and position reports")
+    parser.add_argument("--output", default=REPORTS_DIR, help="Output directory (default: reports)")
+    parser.add_argument("--season", type=int, action="append", help="Season to include (repeatable)")
+    parser.add_argument("--format", choices=["md", "html", "both"], default="both", help="Report format")
+    parser.add_argument("--image-format", choices=["svg", "png"], default="svg", help="Static chart format")
+    parser.add_argument("--no-charts", action="store_true", help="Skip static chart rendering")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    formats = ('md', 'html') if args.format == "both" else (args.format,)
+
+    print("🏈 CJFL BATCH REPORT GENERATOR")
+    print("=" * 50)
+
+    start = time.perf_counter()
+    result = generate_reports(
+        output_dir=args.output,
+        seasons=args.season,
+        formats=formats,
+        image_format=args.image_format,
+        render_charts=not args.no_charts,
+        max_workers=args.workers
+    )
+    elapsed = time.perf_counter() - start
+
+    print(f"✅ Team reports: {len(result['teams'])}")
+    print(f"✅ Position reports: {len(result['positions'])}")
+    print(f"📁 Index: {result['index']}")
+    print(f"⏱️  Finished in {elapsed:.1f}s")
+
+if __name__ == "__main__":
+    main()
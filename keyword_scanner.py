@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+CJFL Keyword Scanner
+Finds many keywords in a web page in a single pass.
+
+The keywords are compiled into an Aho-Corasick automaton, so each text node is
+lower-cased once and walked once no matter how many keywords there are. The page is
+fed to an incremental HTML parser, which means it can be scanned straight from a
+streamed response without ever holding the whole document. The scan returns ranked
+hits per keyword (with surrounding text) and the links whose address or text
+mention a keyword.
+
+    python keyword_scanner.py https://calgarycolts.com/
+    python keyword_scanner.py https://calgarycolts.com/ --keyword roster --keyword stats
+"""
+
+import argparse
+import heapq
+from collections import deque
+from html.parser import HTMLParser
+
+import requests
+
+PLAYER_KEYWORDS = ['player', 'roster', 'team', 'stats', 'statistics']
+CONTEXT_CHARS = 50
+MAX_HITS_PER_KEYWORD = 25
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Text in these tags is ranked above body text; script and style content is ignored
+TAG_WEIGHTS = {'title': 4, 'h1': 3, 'h2': 3, 'h3': 2, 'h4': 2, 'a': 2, 'th': 1, 'li': 1}
+SKIPPED_TAGS = {'script', 'style', 'noscript'}
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton over lower-case keywords"""
+
+    def __init__(self, keywords):
+        self.keywords = list(dict.fromkeys(keyword.lower() for keyword in keywords if keyword))
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+
+        for keyword in self.keywords:
+            node = 0
+            for char in keyword:
+                child = self.goto[node].get(char)
+                if child is None:
+                    child = len(self.goto)
+                    self.goto[node][char] = child
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                node = child
+            self.output[node].append(keyword)
+
+        # Breadth-first, so a node's failure link is always final before its children use it
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self.goto[node].items():
+                queue.append(child)
+                state = self.fail[node]
+                while state and char not in self.goto[state]:
+                    state = self.fail[state]
+                self.fail[child] = self.goto[state].get(char, 0)
+                self.output[child] = self.output[child] + self.output[self.fail[child]]
+
+    def search(self, text):
+        """Yield (start, keyword) for every occurrence in text, which must already be lower-case"""
+        goto, fail, output = self.goto, self.fail, self.output
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for keyword in output[state]:
+                yield index + 1 - len(keyword), keyword
+
+class PageScanner(HTMLParser):
+    """Incremental HTML scanner: call feed() with chunks as they arrive, then result()"""
+
+    def __init__(self, keywords=PLAYER_KEYWORDS, context=CONTEXT_CHARS, max_hits=MAX_HITS_PER_KEYWORD):
+        super().__init__(convert_charrefs=True)
+        self.automaton = keywords if isinstance(keywords, KeywordAutomaton) else KeywordAutomaton(keywords)
+        self.context = context
+        self.max_hits = max_hits
+        self.counts = dict.fromkeys(self.automaton.keywords, 0)
+        self.top_hits = {keyword: [] for keyword in self.automaton.keywords}
+        self.links = []
+        self.open_tags = []
+        self.link = None
+        self.offset = 0
+        self.text = []
+
+    def handle_starttag(self, tag, attrs):
+        self.flush_text()
+        if tag in VOID_TAGS:
+            return
+        self.open_tags.append(tag)
+        if tag == 'a':
+            self.link = {"href": dict(attrs).get('href') or "", "text": []}
+
+    def handle_endtag(self, tag):
+        self.flush_text()
+        if tag in self.open_tags:
+            # Pop up to the matching tag, which also closes tags the page never closed
+            while self.open_tags.pop() != tag:
+                pass
+        if tag == 'a' and self.link is not None:
+            text = " ".join(" ".join(self.link["text"]).split())
+            found = {keyword for _, keyword in self.automaton.search(f"{self.link['href']} {text}".lower())}
+            if found:
+                self.links.append({"text": text, "href": self.link["href"], "keywords": sorted(found)})
+            self.link = None
+
+    def handle_data(self, data):
+        # A chunk boundary can split a text node; buffer it until the next tag
+        self.text.append(data)
+
+    def handle_comment(self, data):
+        self.flush_text()
+
+    def flush_text(self):
+        if not self.text:
+            return
+        data = "".join(self.text)
+        self.text = []
+        if SKIPPED_TAGS.intersection(self.open_tags):
+            self.offset += len(data)
+            return
+        if self.link is not None:
+            self.link["text"].append(data)
+
+        matches = list(self.automaton.search(data.lower()))
+        if matches:
+            tag = self.open_tags[-1] if self.open_tags else ""
+            # Nodes packed with keywords, and headings/links, rank first
+            score = len(matches) + TAG_WEIGHTS.get(tag, 0)
+            for start, keyword in matches:
+                self.counts[keyword] += 1
+                end = start + len(keyword)
+                hit = {"position": self.offset + start, "tag": tag, "score": score,
+                       "context": " ".join(data[max(0, start - self.context):end + self.context].split())}
+                # Bounded min-heap: keep the best max_hits per keyword, earlier hits win ties
+                entry = (score, -hit["position"], hit)
+                heap = self.top_hits[keyword]
+                if len(heap) < self.max_hits:
+                    heapq.heappush(heap, entry)
+                elif entry[:2] > heap[0][:2]:
+                    heapq.heapreplace(heap, entry)
+        self.offset += len(data)
+
+    def result(self):
+        """Finish the scan; returns {'hits': {keyword: ranked hits}, 'counts': {...}, 'links': [...]}"""
+        self.close()
+        self.flush_text()
+        hits = {keyword: [entry[2] for entry in sorted(heap, key=lambda entry: entry[:2], reverse=True)]
+                for keyword, heap in self.top_hits.items()}
+        return {"hits": hits, "counts": self.counts, "links": self.links}
+
+def scan_stream(chunks, keywords=PLAYER_KEYWORDS, **options):
+    """Scan HTML arriving in text chunks"""
+    scanner = PageScanner(keywords, **options)
+    for chunk in chunks:
+        scanner.feed(chunk)
+    return scanner.result()
+
+def scan_html(html, keywords=PLAYER_KEYWORDS, **options):
+    """Scan a page that is already in memory"""
+    return scan_stream([html], keywords, **options)
+
+def scan_url(url, keywords=PLAYER_KEYWORDS, session=None, timeout=15, **options):
+    """Stream a page from the network into the scanner, one chunk at a time"""
+    with (session or requests).get(url, timeout=timeout, stream=True) as response:
+        response.raise_for_status()
+        response.encoding = response.encoding or 'utf-8'
+        return scan_stream(response.iter_content(STREAM_CHUNK_SIZE, decode_unicode=True), keywords, **options)
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Scan a web page for player and roster keywords")
+    parser.add_argument("url", help="Page to scan")
+    parser.add_argument("--keyword", action="append", help="Keyword to look for (repeatable, default: player keywords)")
+    parser.add_argument("--top", type=int, default=5, help="Hits to show per keyword (default: 5)")
+    args = parser.parse_args()
+
+    print("🏈 CJFL KEYWORD SCANNER")
+    print("=" * 50)
+
+    try:
+        result = scan_url(args.url, args.keyword or PLAYER_KEYWORDS)
+    except requests.RequestException as e:
+        print(f"❌ Error accessing {args.url}: {e}")
+        return
+
+    for keyword, hits in result["hits"].items():
+        print(f"\n🔍 '{keyword}': {result['counts'][keyword]} matches")
+        for hit in hits[:args.top]:
+            print(f"   [{hit['tag'] or '-'}] {hit['context'][:100]}")
+
+    print(f"\n📋 Matching links: {len(result['links'])}")
+    for link in result["links"]:
+        print(f"- {link['text'] or '(no text)'}: {link['href']} ({', '.join(link['keywords'])})")
+
+if __name__ == "__main__":
+    main()
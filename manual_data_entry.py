@@ -5,15 +5,16 @@ Helps enter player data as it's collected from teams
 """
 
 import pandas as pd
-import json
 import os
-from datetime import datetime
+
+from bulk_import import dataset_lock, write_atomic
+from progress_store import ProgressStore
 
 class ManualDataEntry:
     def __init__(self):
         self.data_file = "data/cjfl_stats.csv"
         self.template_file = "data/cjfl_real_data_template.csv"
-        self.progress_file = "data/collection_progress.json"
+        self.progress_store = ProgressStore()
         
     def add_player(self, team_name):
         """Add a new player to the dataset"""
@@ -82,55 +83,29 @@ class ManualDataEntry:
     def add_player_to_dataset(self, player_data):
         """Add player data to the CSV file"""
         try:
-            # Load existing data
-            if os.path.exists(self.data_file):
-                df = pd.read_csv(self.data_file)
-            else:
-                # Use template structure
-                df = pd.read_csv(self.template_file)
-                df = df[df['Team'] != player_data['Team']]  # Remove template entries for this team
-            
-            # Add new player data
-            new_row = pd.DataFrame([player_data])
-            df = pd.concat([df, new_row], ignore_index=True)
-            
-            # Save updated data
-            df.to_csv(self.data_file, index=False)
+            # Hold the dataset lock so collectors and imports running meanwhile don't lose rows
+            with dataset_lock(self.data_file):
+                # Load existing data
+                if os.path.exists(self.data_file):
+                    df = pd.read_csv(self.data_file)
+                else:
+                    # Use template structure
+                    df = pd.read_csv(self.template_file)
+                    df = df[df['Team'] != player_data['Team']]  # Remove template entries for this team
+                
+                # Add new player data
+                new_row = pd.DataFrame([player_data])
+                df = pd.concat([df, new_row], ignore_index=True)
+                
+                # Save updated data
+                write_atomic(df, self.data_file)
             
         except Exception as e:
             print(f"❌ Error adding player data: {str(e)}")
     
     def update_progress(self, team_name, players_added):
         """Update progress tracking"""
-        if os.path.exists(self.progress_file):
-            with open(self.progress_file, 'r') as f:
-                progress = json.load(f)
-        else:
-            progress = {
-                "start_date": datetime.now().isoformat(),
-                "teams": {},
-                "total_players_collected": 0,
-                "total_teams_completed": 0,
-                "last_updated": datetime.now().isoformat()
-            }
-        
-        if team_name not in progress["teams"]:
-            progress["teams"][team_name] = {
-                "status": "in_progress",
-                "players_collected": 0,
-                "data_sources_checked": [],
-                "notes": "",
-                "last_updated": datetime.now().isoformat()
-            }
-        
-        progress["teams"][team_name]["players_collected"] += players_added
-        progress["teams"][team_name]["last_updated"] = datetime.now().isoformat()
-        progress["total_players_collected"] += players_added
-        progress["last_updated"] = datetime.now().isoformat()
-        
-        os.makedirs("data", exist_ok=True)
-        with open(self.progress_file, 'w') as f:
-            json.dump(progress, f, indent=2)
+        self.progress_store.update_team(team_name, add_players=players_added, default_status="in_progress")
     
     def view_current_data(self, team_name=None):
         """View current data for a team or all teams"""
@@ -167,37 +142,7 @@ class ManualDataEntry:
     
     def mark_team_complete(self, team_name):
         """Mark a team as complete in progress tracking"""
-        if os.path.exists(self.progress_file):
-            with open(self.progress_file, 'r') as f:
-                progress = json.load(f)
-        else:
-            progress = {
-                "start_date": datetime.now().isoformat(),
-                "teams": {},
-                "total_players_collected": 0,
-                "total_teams_completed": 0,
-                "last_updated": datetime.now().isoformat()
-            }
-        
-        if team_name not in progress["teams"]:
-            progress["teams"][team_name] = {
-                "status": "completed",
-                "players_collected": 0,
-                "data_sources_checked": [],
-                "notes": "Marked complete manually",
-                "last_updated": datetime.now().isoformat()
-            }
-        else:
-            progress["teams"][team_name]["status"] = "completed"
-            progress["teams"][team_name]["notes"] = "Marked complete manually"
-            progress["teams"][team_name]["last_updated"] = datetime.now().isoformat()
-        
-        progress["total_teams_completed"] += 1
-        progress["last_updated"] = datetime.now().isoformat()
-        
-        os.makedirs("data", exist_ok=True)
-        with open(self.progress_file, 'w') as f:
-            json.dump(progress, f, indent=2)
+        self.progress_store.update_team(team_name, status="completed", notes="Marked complete manually")
         
         print(f"✅ Marked {team_name} as complete")
     
@@ -242,20 +187,18 @@ def main():
         elif choice == "4":
             print("\n📊 PROGRESS SUMMARY:")
             print("=" * 30)
-            if os.path.exists(entry_tool.progress_file):
-                with open(entry_tool.progress_file, 'r') as f:
-                    progress = json.load(f)
-                
-                total_teams = len(progress["teams"])
-                completed = sum(1 for team in progress["teams"].values() if team["status"] == "completed")
-                in_progress = sum(1 for team in progress["teams"].values() if team["status"] == "in_progress")
+            progress = entry_tool.progress_store.summary()
+            if progress["total_teams"]:
+                total_teams = progress["total_teams"]
+                completed = progress["status_counts"]["completed"]
+                in_progress = progress["status_counts"]["in_progress"]
                 not_started = total_teams - completed - in_progress
                 
                 print(f"Total Teams: {total_teams}")
                 print(f"Completed: {completed}")
                 print(f"In Progress: {in_progress}")
                 print(f"Not Started: {not_started}")
-                print(f"Total Players: {progress.get('total_players_collected', 0)}")
+                print(f"Total Players: {progress['total_players_collected']}")
             else:
                 print("No progress data found")
         
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+CJFL Page Archive
+Content-addressed storage for every page the collectors fetch.
+
+Each page body is stored once under its SHA-256 (zstd-compressed when the optional
+zstandard package is installed, gzip otherwise), so identical pages fetched again
+in later runs cost no extra space. A small SQLite index records every fetch by team,
+URL and fetch time. Because the raw HTML is kept, improved extractors can be re-run
+over the archive - in parallel and without network access - instead of re-crawling.
+
+    python page_archive.py                         # archive summary
+    python page_archive.py --list --team "Calgary Colts"
+    python page_archive.py --reextract --workers 4 # re-run the table extractor offline
+    python page_archive.py --reextract --write     # ...and merge the players into the dataset
+"""
+
+import argparse
+import gzip
+import hashlib
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import pandas as pd
+
+from utils import atomic_path
+
+try:
+    import zstandard
+except ImportError:  # gzip is always available
+    zstandard = None
+
+ARCHIVE_DIR = "data/page_archive"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS fetches (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    team TEXT,
+    url TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    sha256 TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS fetches_team ON fetches (team, fetched_at);
+CREATE INDEX IF NOT EXISTS fetches_url ON fetches (url, fetched_at);
+CREATE TABLE IF NOT EXISTS blobs (
+    sha256 TEXT PRIMARY KEY,
+    codec TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL
+);
+"""
+
+def compress(data, codec):
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    return gzip.compress(data, compresslevel=9)
+
+def decompress(data, codec):
+    if codec == "zstd":
+        if zstandard is None:
+            raise ImportError("zstandard is required to read this archive (pip install zstandard)")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+class PageArchive:
+    """Deduplicated, compressed page bodies plus a fetch index (team, url, time)"""
+
+    def __init__(self, root=ARCHIVE_DIR, codec=None):
+        self.root = root
+        self.codec = codec or ("zstd" if zstandard is not None else "gzip")
+        os.makedirs(os.path.join(root, "objects"), exist_ok=True)
+        self.db_path = os.path.join(root, "index.db")
+        conn = self.connect()
+        try:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.executescript(SCHEMA)
+        finally:
+            conn.close()
+
+    def connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def blob_path(self, sha256, codec):
+        return os.path.join(self.root, "objects", sha256[:2], f"{sha256[2:]}.{'zst' if codec == 'zstd' else 'gz'}")
+
+    def store(self, url, body, team=None, status=200, fetched_at=None):
+        """Record one fetch; the body is written only if this content is not archived yet. Returns its hash"""
+        data = body.encode('utf-8') if isinstance(body, str) else body
+        sha256 = hashlib.sha256(data).hexdigest()
+        fetched_at = fetched_at or datetime.now().isoformat()
+
+        conn = self.connect()
+        try:
+            with conn:
+                known = conn.execute("SELECT 1 FROM blobs WHERE sha256 = ?", (sha256,)).fetchone()
+            if not known:
+                path = self.blob_path(sha256, self.codec)
+                stored = compress(data, self.codec)
+                with atomic_path(path) as tmp_path, open(tmp_path, 'wb') as f:
+                    f.write(stored)
+            with conn:
+                if not known:
+                    conn.execute("INSERT OR IGNORE INTO blobs (sha256, codec, size, stored_size) VALUES (?, ?, ?, ?)",
+                                 (sha256, self.codec, len(data), len(stored)))
+                conn.execute("INSERT INTO fetches (team, url, fetched_at, status, sha256) VALUES (?, ?, ?, ?, ?)",
+                             (team, url, fetched_at, status, sha256))
+        finally:
+            conn.close()
+        return sha256
+
+    def read(self, sha256):
+        """Page body for a content hash"""
+        conn = self.connect()
+        try:
+            row = conn.execute("SELECT codec FROM blobs WHERE sha256 = ?", (sha256,)).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            raise KeyError(sha256)
+        with open(self.blob_path(sha256, row["codec"]), 'rb') as f:
+            return decompress(f.read(), row["codec"]).decode('utf-8')
+
+    def fetches(self, team=None, url=None, since=None, until=None, latest=False):
+        """
+        Fetch records as a DataFrame (team, url, fetched_at, status, sha256), oldest first.
+        latest=True keeps only the most recent fetch of each url.
+        """
+        query = "SELECT id, team, url, fetched_at, status, sha256 FROM fetches WHERE 1 = 1"
+        params = []
+        for column, operator, value in [("team", "=", team), ("url", "=", url),
+                                        ("fetched_at", ">=", since), ("fetched_at", "<=", until)]:
+            if value is not None:
+                query += f" AND {column} {operator} ?"
+                params.append(value)
+        conn = self.connect()
+        try:
+            records = pd.read_sql_query(query + " ORDER BY fetched_at, id", conn, params=params)
+        finally:
+            conn.close()
+        if latest:
+            records = records.drop_duplicates('url', keep='last')
+        return records.reset_index(drop=True)
+
+    def summary(self):
+        conn = self.connect()
+        try:
+            fetch_count, url_count, team_count = conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT url), COUNT(DISTINCT team) FROM fetches").fetchone()
+            blob_count, size, stored_size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(stored_size), 0) FROM blobs").fetchone()
+        finally:
+            conn.close()
+        return {"fetches": fetch_count, "urls": url_count, "teams": team_count, "unique_pages": blob_count,
+                "bytes": size, "stored_bytes": stored_size}
+
+def _extract_page(root, sha256, team, url, season):
+    """Worker: run the table extractor on one archived page (module level so it can be pickled)"""
+    from bulk_import import validate_chunk
+    from collector_daemon import extract_tables
+
+    valid_frames, rejected = [], 0
+    for table in extract_tables(PageArchive(root).read(sha256)):
+        valid, bad = validate_chunk(table, team=team, season=season)
+        valid_frames.append(valid.assign(Source=url))
+        rejected += len(bad)
+    return valid_frames, rejected
+
+def reextract(archive, team=None, workers=None, season=None):
+    """
+    Re-run the extractor over the latest archived version of every page, in parallel.
+    Returns (validated players with a Source column, rejected row count).
+    """
+    from bulk_import import OUTPUT_COLUMNS, DEFAULT_SEASON
+
+    pages = archive.fetches(team=team, latest=True)
+    pages = pages[pages['status'] == 200]
+    frames, rejected = [], 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_extract_page, archive.root, page.sha256, page.team, page.url, season or DEFAULT_SEASON)
+                   for page in pages.itertuples()]
+        for future in futures:
+            page_frames, page_rejected = future.result()
+            frames.extend(page_frames)
+            rejected += page_rejected
+    players = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=OUTPUT_COLUMNS + ['Source'])
+    return players, rejected
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Inspect and re-extract the archive of scraped pages")
+    parser.add_argument("--root", default=ARCHIVE_DIR, help=f"Archive directory (default: {ARCHIVE_DIR})")
+    parser.add_argument("--team", help="Only this team")
+    parser.add_argument("--list", action="store_true", help="List archived fetches")
+    parser.add_argument("--reextract", action="store_true", help="Re-run the table extractor over the archive")
+    parser.add_argument("--workers", type=int, help="Parallel extractor processes (default: one per CPU)")
+    parser.add_argument("--write", action="store_true", help="With --reextract: merge the players into the dataset")
+    args = parser.parse_args()
+
+    print("🏈 CJFL PAGE ARCHIVE")
+    print("=" * 50)
+
+    archive = PageArchive(args.root)
+    summary = archive.summary()
+    saved = 100 * (1 - summary['stored_bytes'] / summary['bytes']) if summary['bytes'] else 0
+    print(f"Fetches: {summary['fetches']} of {summary['urls']} urls from {summary['teams']} teams")
+    print(f"Unique pages: {summary['unique_pages']} ({summary['bytes'] / 1e6:.1f} MB, "
+          f"{summary['stored_bytes'] / 1e6:.1f} MB on disk, {saved:.0f}% saved)")
+
+    if args.list:
+        print("\n📋 FETCHES:")
+        for fetch in archive.fetches(team=args.team).itertuples():
+            print(f"{fetch.fetched_at[:19]}  {fetch.status}  {fetch.team or '-'}  {fetch.url}  {fetch.sha256[:12]}")
+
+    if args.reextract:
+        players, rejected = reextract(archive, team=args.team, workers=args.workers)
+        print(f"\n🔍 Extracted {len(players)} players ({rejected} rows rejected)")
+        for team_name, count in players['Team'].value_counts().sort_index().items():
+            print(f"   🏈 {team_name}: {count} players")
+        if args.write and not players.empty:
+            from team_collectors import store_players
+            added_rows, updated = store_players(players.drop(columns='Source'))
+            print(f"✅ {len(added_rows)} players added, {updated} updated")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+CJFL Player Identity Resolution
+Finds duplicate player records entered under different spellings
+("J. Beaulieu", "Julien Beaulieu", "Julien Béaulieu") and writes a canonical
+player-ID mapping that load_data() applies to every dashboard and tool.
+
+Records are only compared inside blocks of the same team, position and phonetic
+(Soundex) surname key, so the number of comparisons stays close to linear in the
+number of players. Matching pairs are merged with union-find: full names first,
+then a bare initial ("J. Beaulieu") joins the one full-name player it fits, and
+stays on its own when it fits two ("Julien" and "Jacques").
+
+    python player_identity.py            # resolve and write data/player_identity.csv
+    python player_identity.py --dry-run  # show the clusters only
+"""
+
+import argparse
+import hashlib
+import os
+from collections import defaultdict
+
+import pandas as pd
+
+from utils import normalize_player_name, normalize_player_names
+
+IDENTITY_FILE = "data/player_identity.csv"
+DATA_FILE = "data/cjfl_stats.csv"
+DEFAULT_THRESHOLD = 0.92
+IDENTITY_COLUMNS = ['Player Name', 'Team', 'Position', 'Player ID', 'Canonical Name']
+
+SOUNDEX_CODES = {letter: str(code) for code, letters in
+                 enumerate(["aeiouyhw", "bfpv", "cgjkqsxz", "dt", "l", "mn", "r"]) for letter in letters}
+
+def soundex(word):
+    """Four-character Soundex code ('beaulieu' -> 'B440'); empty string for empty input"""
+    word = "".join(char for char in word.lower() if char.isalpha())
+    if not word:
+        return ""
+
+    code = word[0].upper()
+    previous = SOUNDEX_CODES.get(word[0], "")
+    for char in word[1:]:
+        digit = SOUNDEX_CODES.get(char, "")
+        if digit != "0" and digit != previous:
+            code += digit
+        if char not in "hw":  # h and w do not separate letters with the same code
+            previous = digit
+        if len(code) == 4:
+            break
+    return code.ljust(4, "0")
+
+def jaro_winkler(first, second, prefix_scale=0.1):
+    """Jaro-Winkler similarity between two strings, from 0.0 to 1.0"""
+    if first == second:
+        return 1.0
+    if not first or not second:
+        return 0.0
+
+    window = max(len(first), len(second)) // 2 - 1
+    first_matched = [False] * len(first)
+    second_matched = [False] * len(second)
+    matches = 0
+    for i, char in enumerate(first):
+        for j in range(max(0, i - window), min(len(second), i + window + 1)):
+            if not second_matched[j] and second[j] == char:
+                first_matched[i] = second_matched[j] = True
+                matches += 1
+                break
+    if matches == 0:
+        return 0.0
+
+    first_chars = [char for char, matched in zip(first, first_matched) if matched]
+    second_chars = [char for char, matched in zip(second, second_matched) if matched]
+    transpositions = sum(a != b for a, b in zip(first_chars, second_chars)) / 2
+
+    jaro = (matches / len(first) + matches / len(second) + (matches - transpositions) / matches) / 3
+    prefix = 0
+    for a, b in zip(first[:4], second[:4]):
+        if a != b:
+            break
+        prefix += 1
+    return jaro + prefix * prefix_scale * (1 - jaro)
+
+def split_name(normalized):
+    """(given names, surname) of a normalized name"""
+    parts = normalized.split()
+    if len(parts) < 2:
+        return "", normalized
+    return " ".join(parts[:-1]), parts[-1]
+
+def names_match(first, second, threshold=DEFAULT_THRESHOLD):
+    """
+    True when two normalized names belong to the same player: similar surnames and either
+    similar given names or a given-name initial that agrees ("j beaulieu" / "julien beaulieu").
+    """
+    if first == second:
+        return True
+    given1, surname1 = split_name(first)
+    given2, surname2 = split_name(second)
+    if jaro_winkler(surname1, surname2) < threshold:
+        return False
+    if not given1 or not given2:
+        return False
+    if len(given1) == 1 or len(given2) == 1:
+        return given1[0] == given2[0]
+    return jaro_winkler(given1, given2) >= threshold
+
+def is_initial(normalized):
+    """True when the given name of a normalized name is a single letter ("j beaulieu")"""
+    return len(split_name(normalized)[0]) == 1
+
+class UnionFind:
+    """Disjoint sets over integer ids with path compression"""
+
+    def __init__(self, size):
+        self.parent = list(range(size))
+
+    def find(self, item):
+        while self.parent[item] != item:
+            self.parent[item] = self.parent[self.parent[item]]
+            item = self.parent[item]
+        return item
+
+    def union(self, first, second):
+        root1, root2 = self.find(first), self.find(second)
+        if root1 != root2:
+            self.parent[max(root1, root2)] = min(root1, root2)
+
+def player_id(canonical_name, team, position):
+    """Stable id for a resolved player"""
+    key = f"{normalize_player_name(canonical_name)}|{team}|{position}"
+    return "P" + hashlib.sha1(key.encode('utf-8')).hexdigest()[:10]
+
+def resolve_identities(data, threshold=DEFAULT_THRESHOLD):
+    """
+    Cluster player records that refer to the same person.
+    Returns one row per distinct (Player Name, Team, Position) with its Player ID and Canonical Name.
+    """
+    records = data[['Player Name', 'Team', 'Position']].dropna().drop_duplicates().reset_index(drop=True)
+    counts = data.groupby(['Player Name', 'Team', 'Position']).size()
+    normalized = normalize_player_names(records['Player Name'])
+
+    blocks = defaultdict(list)
+    for index, name, team, position in zip(records.index, normalized, records['Team'], records['Position']):
+        blocks[(team, position, soundex(split_name(name)[1]))].append(index)
+
+    clusters = UnionFind(len(records))
+    for members in blocks.values():
+        initials = [index for index in members if is_initial(normalized[index])]
+        full = [index for index in members if not is_initial(normalized[index])]
+        for group in (full, initials):
+            for i, first in enumerate(group):
+                for second in group[i + 1:]:
+                    if names_match(normalized[first], normalized[second], threshold):
+                        clusters.union(first, second)
+
+        # An initial only joins a player when it can't belong to anyone else in the block
+        for initial in initials:
+            candidates = {clusters.find(index) for index in full
+                          if names_match(normalized[initial], normalized[index], threshold)}
+            if len(candidates) == 1:
+                clusters.union(initial, candidates.pop())
+
+    records['Cluster'] = [clusters.find(index) for index in records.index]
+
+    # Canonical spelling: the most common variant, then the longest (full name over initial), then accented
+    records['Rows'] = [counts.get((name, team, position), 0) for name, team, position in
+                       zip(records['Player Name'], records['Team'], records['Position'])]
+    records['Length'] = records['Player Name'].str.len()
+    ranked = records.sort_values(['Cluster', 'Rows', 'Length', 'Player Name'], ascending=[True, False, False, False])
+    canonical = ranked.groupby('Cluster')['Player Name'].first()
+
+    records['Canonical Name'] = records['Cluster'].map(canonical)
+    records['Player ID'] = [player_id(name, team, position) for name, team, position in
+                            zip(records['Canonical Name'], records['Team'], records['Position'])]
+    return records[IDENTITY_COLUMNS]
+
+def load_identity_map(path=IDENTITY_FILE):
+    """Saved identity mapping, or None when the resolver has not been run"""
+    if not os.path.exists(path):
+        return None
+    return pd.read_csv(path)
+
+def canonical_names(data, mapping=None):
+    """Each row's player name as spelled in the mapping; names the mapping doesn't cover are kept"""
+    if mapping is None or data.empty:
+        return data['Player Name']
+    keys = ['Player Name', 'Team', 'Position']
+    lookup = mapping[keys + ['Canonical Name']].drop_duplicates(keys)
+    names = data[keys].merge(lookup, on=keys, how='left')['Canonical Name']
+    return pd.Series(names.fillna(data['Player Name'].reset_index(drop=True)).to_numpy(), index=data.index)
+
+def apply_player_identity(data, mapping=None):
+    """
+    Rename duplicate spellings to their canonical name, add a 'Player ID' column and collapse
+    rows that now describe the same player in the same season (keeping the most complete row).
+    Records added since the mapping was written get an id from their own name.
+    """
+    if mapping is None:
+        mapping = load_identity_map()
+    if mapping is None or data.empty:
+        return data
+
+    keys = ['Player Name', 'Team', 'Position']
+    merged = data.merge(mapping, on=keys, how='left')
+    unmapped = merged['Player ID'].isna()
+    if unmapped.any():
+        merged.loc[unmapped, 'Canonical Name'] = merged.loc[unmapped, 'Player Name']
+        merged.loc[unmapped, 'Player ID'] = [player_id(name, team, position) for name, team, position in
+                                             merged.loc[unmapped, keys].itertuples(index=False)]
+    merged['Player Name'] = merged['Canonical Name']
+    merged = merged.drop(columns='Canonical Name')
+
+    numeric = merged.select_dtypes('number').columns.drop('Season', errors='ignore')
+    completeness = merged[numeric].sum(axis=1)
+    order = completeness.sort_values(ascending=False, kind='stable').index
+    deduped = merged.loc[order].drop_duplicates(['Player ID', 'Season'], keep='first').sort_index()
+    return deduped.reset_index(drop=True)
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Resolve duplicate CJFL player records")
+    parser.add_argument("--data-file", default=DATA_FILE, help=f"Player statistics (default: {DATA_FILE})")
+    parser.add_argument("--output", default=IDENTITY_FILE, help=f"Mapping file (default: {IDENTITY_FILE})")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Jaro-Winkler threshold for names (default: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--dry-run", action="store_true", help="Print clusters without writing the mapping")
+    args = parser.parse_args()
+
+    print("🏈 CJFL PLAYER IDENTITY RESOLUTION")
+    print("=" * 50)
+
+    data = pd.read_csv(args.data_file)
+    mapping = resolve_identities(data, args.threshold)
+    duplicates = mapping[mapping['Player Name'] != mapping['Canonical Name']]
+
+    print(f"📊 {len(mapping)} name variants → {mapping['Player ID'].nunique()} players")
+    for (canonical, team), group in duplicates.groupby(['Canonical Name', 'Team']):
+        print(f"   🔗 {canonical} ({team}): {', '.join(group['Player Name'])}")
+
+    if args.dry_run:
+        print("\n🔍 Dry run, mapping not written")
+        return
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    mapping.to_csv(args.output, index=False)
+    print(f"\n💾 Mapping saved to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -6,28 +6,108 @@ Shows progress of real data collection and works with partial data
 
 import streamlit as st
 import pandas as pd
-import json
-import os
 from datetime import datetime
 import plotly.express as px
 import plotly.graph_objects as go
 
-def load_progress_data():
-    """Load progress data from JSON file"""
-    progress_file = "data/collection_progress.json"
-    if os.path.exists(progress_file):
-        with open(progress_file, 'r') as f:
-            return json.load(f)
+from progress_store import ProgressStore
+from data_quality import DataQualityEngine
+from player_identity import IDENTITY_FILE
+from utils import file_signature, read_player_stats
+
+STATS_FILE = "data/cjfl_stats.csv"
+DEFAULT_REFRESH_SECONDS = 10
+
+@st.cache_resource
+def get_progress_store():
+    """One store per server process; opening it runs schema checks we only need once"""
+    return ProgressStore()
+
+@st.cache_data(max_entries=4)
+def load_progress_data(version):
+    """Load a consistent snapshot from the progress store (never blocks collectors), cached per version"""
+    store = get_progress_store()
+    if store.exists():
+        return store.snapshot()
     return None
 
-def load_cjfl_data():
-    """Load CJFL data (real or partial)"""
+@st.cache_data(max_entries=4)
+def load_progress_summary(version):
+    """Status counts and totals from the store's materialized views, cached per version"""
+    return get_progress_store().summary()
+
+def stats_signature():
+    """Signatures of the stats file and the identity mapping applied to it"""
+    return file_signature(STATS_FILE), file_signature(IDENTITY_FILE)
+
+@st.cache_data(max_entries=2)
+def load_cjfl_data(signature):
+    """Load CJFL data (real or partial); only re-parsed when the stats or identity file changes"""
+    if signature[0] is None:
+        return None
     try:
-        data = pd.read_csv('data/cjfl_stats.csv')
-        return data
+        return read_player_stats(STATS_FILE)
     except FileNotFoundError:
         return None
 
+@st.cache_resource
+def get_quality_engine():
+    """Shared engine, so a changed stats file only re-validates the rows that changed"""
+    return DataQualityEngine()
+
+@st.cache_data(max_entries=2)
+def run_quality_checks(signature):
+    """Quality report for the stats file, cached per stats_signature()"""
+    data = load_cjfl_data(signature)
+    if data is None:
+        return None
+    return get_quality_engine().validate(data, version=signature)
+
+STATUS_STYLES = {
+    "completed": "background-color: #00ff00; color: black",
+    "in_progress": "background-color: #ffff00; color: black"
+}
+DEFAULT_STATUS_STYLE = "background-color: #ff0000; color: white"
+
+def build_team_status_table(teams):
+    """Team status table built column-wise from the progress snapshot's teams mapping"""
+    team_df = pd.DataFrame.from_dict(teams, orient='index')
+    team_df = team_df.reindex(columns=['status', 'players_collected', 'last_updated', 'notes'])
+    team_df = team_df.fillna({'players_collected': 0, 'last_updated': "Never", 'notes': ""})
+    team_df['players_collected'] = team_df['players_collected'].astype('int64')
+    team_df = team_df.rename_axis('Team').reset_index()
+    team_df.columns = ["Team", "Status", "Players Collected", "Last Updated", "Notes"]
+    return team_df
+
+def style_team_status(team_df):
+    """Color-code the Status column with one vectorized style map per column (not one callback per cell)"""
+    return team_df.style.apply(
+        lambda column: column.map(STATUS_STYLES).fillna(DEFAULT_STATUS_STYLE), subset=['Status']
+    )
+
+def top_players_markdown(data, categories, top_n=5):
+    """Top players for every category as a single markdown block"""
+    sections = []
+    for category in categories:
+        if category not in data.columns or data[category].isna().all():
+            continue
+        top_players = data.nlargest(top_n, category)
+        name, team, position = (top_players[column].fillna("").astype(str)
+                                for column in ['Player Name', 'Team', 'Position'])
+        lines = "- " + name + " (" + team + ", " + position + "): " + top_players[category].map("{:,}".format)
+        sections.append(f"**{category}:**\n\n" + "\n".join(lines) + "\n\n---")
+    return "\n\n".join(sections)
+
+def refresh_every(seconds):
+    """
+    Decorator that reruns a section every few seconds (st.fragment). Without a
+    fragment-capable Streamlit, or with seconds=None, the section renders once.
+    """
+    fragment = getattr(st, "fragment", None)
+    if fragment is None or not seconds:
+        return lambda func: func
+    return fragment(run_every=seconds)
+
 def create_progress_dashboard():
     """Create the main progress dashboard"""
     st.set_page_config(
@@ -62,9 +142,40 @@ def create_progress_dashboard():
     st.title("📊 CJFL Data Collection Progress Dashboard")
     st.markdown("**Track the progress of collecting real CJFL statistics**")
     
+    # Refresh controls
+    st.sidebar.header("🔄 Live Updates")
+    auto_refresh = st.sidebar.toggle("Auto refresh", value=True)
+    interval = st.sidebar.slider("Check for changes every (seconds)", 5, 120, DEFAULT_REFRESH_SECONDS, step=5)
+    
+    # Progress sections rerun on their own timer; unchanged data comes from the cache
+    live_sections = refresh_every(interval if auto_refresh else None)(render_progress_sections)
+    live_sections()
+    
+    # Data Collection Tips
+    st.header("💡 Data Collection Tips")
+    
+    tips = [
+        "Start with Priority 1 teams (Calgary Colts, Edmonton Wildcats, Saskatoon Hilltops)",
+        "Check team websites for roster pages and statistics sections",
+        "Use social media to find game reports and player highlights",
+        "Contact teams directly via email for official statistics",
+        "Focus on 2024 season data only",
+        "Include all players, not just starters",
+        "Use the template file for consistent data entry"
+    ]
+    
+    for tip in tips:
+        st.write(f"• {tip}")
+
+def render_progress_sections():
+    """Progress overview, team table and data analysis (reruns on its own when auto refresh is on)"""
     # Load data
-    progress_data = load_progress_data()
-    cjfl_data = load_cjfl_data()
+    progress_version = get_progress_store().version()
+    progress_data = load_progress_data(progress_version)
+    progress_summary = load_progress_summary(progress_version)
+    cjfl_data = load_cjfl_data(stats_signature())
+    
+    st.caption(f"🔄 Last checked {datetime.now().strftime('%H:%M:%S')} · progress version {progress_version}")
     
     if not progress_data:
         st.error("No progress data found. Run the data collection plan first.")
@@ -73,9 +184,9 @@ def create_progress_dashboard():
     # Progress Overview
     col1, col2, col3, col4 = st.columns(4)
     
-    total_teams = len(progress_data.get("teams", {}))
-    completed_teams = sum(1 for team in progress_data["teams"].values() if team["status"] == "completed")
-    in_progress_teams = sum(1 for team in progress_data["teams"].values() if team["status"] == "in_progress")
+    total_teams = progress_summary["total_teams"]
+    completed_teams = progress_summary["status_counts"]["completed"]
+    in_progress_teams = progress_summary["status_counts"]["in_progress"]
     not_started_teams = total_teams - completed_teams - in_progress_teams
     
     with col1:
@@ -88,7 +199,7 @@ def create_progress_dashboard():
         st.metric("In Progress", in_progress_teams)
     
     with col4:
-        st.metric("Total Players", progress_data.get("total_players_collected", 0))
+        st.metric("Total Players", progress_summary["total_players_collected"])
     
     # Progress Chart
     st.header("📈 Collection Progress")
@@ -123,29 +234,8 @@ def create_progress_dashboard():
     st.header("🏈 Team Collection Status")
     
     if progress_data.get("teams"):
-        team_data = []
-        for team_name, team_info in progress_data["teams"].items():
-            team_data.append({
-                "Team": team_name,
-                "Status": team_info["status"],
-                "Players Collected": team_info.get("players_collected", 0),
-                "Last Updated": team_info.get("last_updated", "Never"),
-                "Notes": team_info.get("notes", "")
-            })
-        
-        team_df = pd.DataFrame(team_data)
-        
-        # Color code the status
-        def color_status(val):
-            if val == "completed":
-                return "background-color: #00ff00; color: black"
-            elif val == "in_progress":
-                return "background-color: #ffff00; color: black"
-            else:
-                return "background-color: #ff0000; color: white"
-        
-        styled_df = team_df.style.applymap(color_status, subset=['Status'])
-        st.dataframe(styled_df, use_container_width=True)
+        team_df = build_team_status_table(progress_data["teams"])
+        st.dataframe(style_team_status(team_df), use_container_width=True)
     
     # Real Data Analysis (if available)
     if cjfl_data is not None:
@@ -155,9 +245,11 @@ def create_progress_dashboard():
         
         with col1:
             st.subheader("Data Overview")
-            st.write(f"**Total Players:** {len(cjfl_data)}")
-            st.write(f"**Total Teams:** {len(cjfl_data['Team'].unique())}")
-            st.write(f"**Positions:** {', '.join(sorted(cjfl_data['Position'].unique()))}")
+            st.markdown(
+                f"**Total Players:** {len(cjfl_data)}  \n"
+                f"**Total Teams:** {cjfl_data['Team'].nunique()}  \n"
+                f"**Positions:** {', '.join(sorted(cjfl_data['Position'].unique()))}"
+            )
         
         with col2:
             st.subheader("Top Teams by Players")
@@ -181,37 +273,43 @@ def create_progress_dashboard():
         st.subheader("🏆 Top Players (Real Data)")
         
         categories = ['Passing Yards', 'Rushing Yards', 'Receiving Yards', 'Touchdowns', 'Tackles']
-        
-        for category in categories:
-            if category in cjfl_data.columns:
-                top_players = cjfl_data.nlargest(5, category)[['Player Name', 'Team', 'Position', category]]
-                st.write(f"**{category}:**")
-                for _, player in top_players.iterrows():
-                    st.write(f"- {player['Player Name']} ({player['Team']}, {player['Position']}): {player[category]:,}")
-                st.write("---")
+        st.markdown(top_players_markdown(cjfl_data, categories))
     
     # Data Quality Metrics
     st.header("🔍 Data Quality Metrics")
     
-    if cjfl_data is not None:
-        col1, col2, col3 = st.columns(3)
+    quality_report = run_quality_checks(stats_signature())
+    if cjfl_data is not None and quality_report is not None:
+        col1, col2, col3, col4, col5 = st.columns(5)
         
         with col1:
-            # Completeness
-            total_cells = len(cjfl_data) * len(cjfl_data.columns)
-            non_null_cells = cjfl_data.count().sum()
-            completeness = (non_null_cells / total_cells) * 100
-            st.metric("Data Completeness", f"{completeness:.1f}%")
+            st.metric("Data Completeness", f"{quality_report['completeness']:.1f}%")
         
         with col2:
+            st.metric("Quality Score", f"{quality_report['quality_score']:.1f}%")
+        
+        with col3:
+            st.metric("Rows with Issues", quality_report['rows_with_issues'],
+                      help=f"{quality_report['rows_with_errors']} with errors")
+        
+        with col4:
             # Teams with data
             teams_with_data = len(cjfl_data['Team'].unique())
             st.metric("Teams with Data", teams_with_data)
         
-        with col3:
+        with col5:
             # Average players per team
             avg_players = len(cjfl_data) / len(cjfl_data['Team'].unique())
             st.metric("Avg Players/Team", f"{avg_players:.1f}")
+        
+        rules_df = pd.DataFrame(get_quality_engine().rules)[['name', 'severity', 'description']]
+        rules_df['violations'] = rules_df['name'].map(quality_report['rule_counts'])
+        rules_df.columns = ["Rule", "Severity", "Description", "Violations"]
+        st.dataframe(rules_df, use_container_width=True, hide_index=True)
+        
+        if not quality_report['violations'].empty:
+            with st.expander(f"⚠️ {len(quality_report['violations'])} issues found"):
+                st.dataframe(quality_report['violations'], use_container_width=True, hide_index=True)
     
     # Next Steps
     st.header("🎯 Next Steps")
@@ -220,31 +318,14 @@ def create_progress_dashboard():
         not_started = [team for team, info in progress_data["teams"].items() if info["status"] == "not_started"]
         in_progress = [team for team, info in progress_data["teams"].items() if info["status"] == "in_progress"]
         
+        next_steps = []
         if not_started:
-            st.write("**Teams to Start:**")
-            for team in not_started[:3]:  # Show next 3
-                st.write(f"- {team}")
-        
+            next_steps.append("**Teams to Start:**\n\n" + "\n".join(f"- {team}" for team in not_started[:3]))  # Show next 3
         if in_progress:
-            st.write("**Teams in Progress:**")
-            for team in in_progress:
-                st.write(f"- {team}")
+            next_steps.append("**Teams in Progress:**\n\n" + "\n".join(f"- {team}" for team in in_progress))
+        if next_steps:
+            st.markdown("\n\n".join(next_steps))
     
-    # Data Collection Tips
-    st.header("💡 Data Collection Tips")
-    
-    tips = [
-        "Start with Priority 1 teams (Calgary Colts, Edmonton Wildcats, Saskatoon Hilltops)",
-        "Check team websites for roster pages and statistics sections",
-        "Use social media to find game reports and player highlights",
-        "Contact teams directly via email for official statistics",
-        "Focus on 2024 season data only",
-        "Include all players, not just starters",
-        "Use the template file for consistent data entry"
-    ]
-    
-    for tip in tips:
-        st.write(f"• {tip}")
 
 def main():
     """Main function"""
@@ -0,0 +1,420 @@
+#!/usr/bin/env python3
+"""
+CJFL Progress Store
+Transactional, event-sourced storage for data collection progress, replacing the
+read-modify-write cycle on data/collection_progress.json.
+
+Every collection action (status change, players added, notes, sources checked) is
+appended to an events table. The same transaction updates small materialized views:
+one row per team (players, status, last updated), one row per status with its team
+count, and the league totals. Summary reads touch only those few rows, so they cost
+the same no matter how long the history grows, and the full history can be replayed
+to audit the state at any point in time.
+
+The database runs in WAL mode: writers take the lock with BEGIN IMMEDIATE and never
+overwrite each other's updates, while readers (like the progress dashboard) get a
+consistent snapshot without blocking them. An existing collection_progress.json is
+imported the first time the store is opened.
+
+    python progress_store.py                     # show the current progress
+    python progress_store.py --history "Calgary Colts"
+    python progress_store.py --as-of 2025-08-01  # replay the log up to a date
+    python progress_store.py --rebuild           # recompute the views from the log
+    python progress_store.py --export            # write a JSON snapshot to collection_progress.json
+"""
+
+import argparse
+import copy
+import json
+import os
+import sqlite3
+import sys
+from contextlib import contextmanager
+from datetime import datetime
+
+from utils import atomic_path
+
+PROGRESS_DB = "data/collection_progress.db"
+PROGRESS_JSON = "data/collection_progress.json"
+
+STATUSES = ["not_started", "in_progress", "completed", "no_data_available"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    team TEXT,
+    event_type TEXT NOT NULL,
+    data TEXT NOT NULL DEFAULT '{}',
+    actor TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS events_team ON events (team, id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS teams (
+    team TEXT PRIMARY KEY,
+    status TEXT NOT NULL DEFAULT 'not_started',
+    players_collected INTEGER NOT NULL DEFAULT 0,
+    data_sources_checked TEXT NOT NULL DEFAULT '[]',
+    notes TEXT NOT NULL DEFAULT '',
+    last_updated TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS status_counts (
+    status TEXT PRIMARY KEY,
+    teams INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+def empty_state():
+    return {"start_date": None, "teams": {}, "last_updated": None}
+
+def new_team(status="not_started", timestamp=None):
+    return {"status": status, "players_collected": 0, "data_sources_checked": [], "notes": "",
+            "last_updated": timestamp}
+
+def apply_event(state, event):
+    """
+    Apply one event to an in-memory progress state. This is the single definition of what
+    each event means; the views and replays are both built from it.
+    """
+    event_type, team_name, data, timestamp = event["event_type"], event["team"], event["data"], event["timestamp"]
+
+    if event_type == "started":
+        state["start_date"] = data["start_date"]
+        state["last_updated"] = state["last_updated"] or data["start_date"]
+        return state
+
+    if event_type == "team_imported":
+        state["teams"][team_name] = {**new_team(), **copy.deepcopy(data)}
+        state["last_updated"] = max(state["last_updated"] or "", data["last_updated"])
+        return state
+
+    team = state["teams"].setdefault(team_name, new_team(data.get("default_status", "not_started"), timestamp))
+    if event_type == "status_changed":
+        team["status"] = data["status"]
+    elif event_type == "players_added":
+        team["players_collected"] += data["count"]
+    elif event_type == "players_set":
+        team["players_collected"] = data["count"]
+    elif event_type == "notes_updated":
+        team["notes"] = data["notes"]
+    elif event_type == "source_checked":
+        if data["source"] not in team["data_sources_checked"]:
+            team["data_sources_checked"].append(data["source"])
+    team["last_updated"] = timestamp
+    state["last_updated"] = timestamp
+    return state
+
+class ProgressStore:
+    """Collection progress as an append-only event log with materialized views (SQLite, WAL)"""
+
+    def __init__(self, db_path=PROGRESS_DB, json_path=PROGRESS_JSON):
+        self.db_path = db_path
+        self.json_path = json_path
+        os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        self._initialize()
+
+    def connect(self):
+        """New connection; autocommit mode so transactions are explicit"""
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA busy_timeout = 30000")
+        return conn
+
+    @contextmanager
+    def transaction(self, immediate=True):
+        """
+        Run statements in one transaction. BEGIN IMMEDIATE takes the write lock up front,
+        so concurrent writers queue instead of failing half way.
+        """
+        conn = self.connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+            yield conn
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+
+    def _initialize(self):
+        conn = self.connect()
+        try:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.executescript(SCHEMA)
+        finally:
+            conn.close()
+
+        with self.transaction() as conn:
+            if conn.execute("SELECT 1 FROM events LIMIT 1").fetchone():
+                return
+            # Stores created before the event log keep their team rows as the starting point
+            existing = conn.execute("SELECT * FROM teams ORDER BY rowid").fetchall()
+            meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+            if existing:
+                self._import_state(conn, meta.get("start_date"), {row["team"]: self._team_row(row) for row in existing})
+            else:
+                self._import_json(conn)
+            self._write_views(conn, self._replay(conn))
+
+    def _import_json(self, conn):
+        """One-time migration of the legacy JSON document"""
+        legacy = {}
+        if self.json_path and os.path.exists(self.json_path):
+            with open(self.json_path, 'r') as f:
+                legacy = json.load(f)
+        self._import_state(conn, legacy.get("start_date"), legacy.get("teams", {}))
+
+    def _import_state(self, conn, start_date, teams):
+        now = datetime.now().isoformat()
+        self._append(conn, None, "started", {"start_date": start_date or now}, now)
+        for team_name, info in teams.items():
+            data = {
+                "status": info.get("status", "not_started"),
+                "players_collected": int(info.get("players_collected", 0)),
+                "data_sources_checked": list(info.get("data_sources_checked", [])),
+                "notes": info.get("notes", ""),
+                "last_updated": info.get("last_updated") or now
+            }
+            self._append(conn, team_name, "team_imported", data, now)
+
+    @staticmethod
+    def _team_row(row):
+        return {
+            "status": row["status"],
+            "players_collected": row["players_collected"],
+            "data_sources_checked": json.loads(row["data_sources_checked"]),
+            "notes": row["notes"],
+            "last_updated": row["last_updated"]
+        }
+
+    @staticmethod
+    def _append(conn, team_name, event_type, data, timestamp, actor=None):
+        actor = actor if actor is not None else os.path.basename(sys.argv[0] or "")
+        conn.execute(
+            "INSERT INTO events (timestamp, team, event_type, data, actor) VALUES (?, ?, ?, ?, ?)",
+            (timestamp, team_name, event_type, json.dumps(data), actor)
+        )
+        return {"event_type": event_type, "team": team_name, "data": data, "timestamp": timestamp}
+
+    # Writes
+
+    def update_team(self, team_name, status=None, notes=None, players_collected=None, add_players=0,
+                    data_source=None, default_status="not_started", actor=None):
+        """
+        Record the changes for one team as events and update the views in the same transaction.
+        players_collected sets the count, add_players increments it; fields left as None are unchanged.
+        New teams start with default_status unless a status is given.
+        """
+        if status is not None and status not in STATUSES:
+            raise ValueError(f"Unknown status: {status}")
+        now = datetime.now().isoformat()
+
+        with self.transaction() as conn:
+            row = conn.execute("SELECT * FROM teams WHERE team = ?", (team_name,)).fetchone()
+            before = self._team_row(row) if row else None
+            state = {"start_date": None, "last_updated": None, "teams": {team_name: copy.deepcopy(before)} if before else {}}
+
+            events = []
+            if before is None:
+                events.append(("team_added", {"default_status": status or default_status}))
+            if status is not None and (before is None or status != before["status"]):
+                events.append(("status_changed", {"status": status}))
+            if players_collected is not None:
+                events.append(("players_set", {"count": int(players_collected)}))
+            if add_players:
+                events.append(("players_added", {"count": int(add_players)}))
+            if notes is not None:
+                events.append(("notes_updated", {"notes": notes}))
+            if data_source:
+                events.append(("source_checked", {"source": data_source}))
+            if not events:
+                events.append(("touched", {}))
+
+            for event_type, data in events:
+                apply_event(state, self._append(conn, team_name, event_type, data, now, actor))
+            self._update_views(conn, team_name, before, state["teams"][team_name], now)
+
+    def _update_views(self, conn, team_name, before, after, timestamp):
+        """Incremental view maintenance for one changed team"""
+        conn.execute(
+            "INSERT OR REPLACE INTO teams VALUES (?, ?, ?, ?, ?, ?)",
+            (team_name, after["status"], after["players_collected"], json.dumps(after["data_sources_checked"]),
+             after["notes"], after["last_updated"])
+        )
+        if before is None or before["status"] != after["status"]:
+            if before is not None:
+                conn.execute("UPDATE status_counts SET teams = teams - 1 WHERE status = ?", (before["status"],))
+            conn.execute("INSERT INTO status_counts VALUES (?, 1) ON CONFLICT(status) DO UPDATE SET teams = teams + 1",
+                         (after["status"],))
+
+        player_delta = after["players_collected"] - (before["players_collected"] if before else 0)
+        conn.execute("UPDATE meta SET value = CAST(value AS INTEGER) + ? WHERE key = 'total_players'", (player_delta,))
+        conn.execute("UPDATE meta SET value = CAST(value AS INTEGER) + ? WHERE key = 'total_teams'",
+                     (0 if before else 1,))
+        conn.execute("INSERT OR REPLACE INTO meta VALUES ('last_updated', ?)", (timestamp,))
+
+    def _write_views(self, conn, state):
+        """Replace all views with a fully replayed state"""
+        conn.execute("DELETE FROM teams")
+        conn.execute("DELETE FROM status_counts")
+        conn.execute("DELETE FROM meta WHERE key != 'rebuilds'")
+        for team_name, team in state["teams"].items():
+            conn.execute(
+                "INSERT INTO teams VALUES (?, ?, ?, ?, ?, ?)",
+                (team_name, team["status"], team["players_collected"], json.dumps(team["data_sources_checked"]),
+                 team["notes"], team["last_updated"] or state["last_updated"])
+            )
+            conn.execute("INSERT INTO status_counts VALUES (?, 1) ON CONFLICT(status) DO UPDATE SET teams = teams + 1",
+                         (team["status"],))
+        conn.executemany("INSERT INTO meta VALUES (?, ?)", [
+            ("start_date", state["start_date"] or ""),
+            ("last_updated", state["last_updated"] or state["start_date"] or ""),
+            ("total_players", str(sum(team["players_collected"] for team in state["teams"].values()))),
+            ("total_teams", str(len(state["teams"])))
+        ])
+
+    def rebuild_views(self):
+        """Recompute every view from the event log (e.g. after a manual fix to the log)"""
+        with self.transaction() as conn:
+            self._write_views(conn, self._replay(conn))
+            # Counted so version() moves even though no event was appended
+            conn.execute("INSERT INTO meta VALUES ('rebuilds', '1') "
+                         "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1")
+
+    # Reads
+
+    def exists(self):
+        """True once any team progress has been recorded"""
+        return self.summary()["total_teams"] > 0
+
+    def version(self):
+        """
+        Id of the newest event plus the number of view rebuilds: grows whenever progress or the
+        views change, so pollers can skip re-reading unchanged state. Two single-row lookups,
+        cheap enough to call every few seconds.
+        """
+        with self.transaction(immediate=False) as conn:
+            row = conn.execute(
+                "SELECT (SELECT seq FROM sqlite_sequence WHERE name = 'events'), "
+                "(SELECT CAST(value AS INTEGER) FROM meta WHERE key = 'rebuilds')").fetchone()
+        return (row[0] or 0) + (row[1] or 0)
+
+    def summary(self):
+        """
+        League totals read straight from the materialized views (a handful of rows,
+        independent of the number of teams or events).
+        """
+        with self.transaction(immediate=False) as conn:
+            meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+            counts = dict(conn.execute("SELECT status, teams FROM status_counts").fetchall())
+
+        status_counts = {status: counts.get(status, 0) for status in STATUSES}
+        status_counts.update({status: count for status, count in counts.items() if status not in status_counts})
+        return {
+            "start_date": meta.get("start_date") or None,
+            "last_updated": meta.get("last_updated") or None,
+            "total_teams": int(meta.get("total_teams", 0)),
+            "total_players_collected": int(meta.get("total_players", 0)),
+            "total_teams_completed": status_counts["completed"],
+            "status_counts": status_counts
+        }
+
+    def snapshot(self):
+        """
+        Consistent copy of all progress in the legacy JSON layout. Reads run in their own
+        WAL snapshot, so they never wait for (or see half of) a concurrent update.
+        """
+        with self.transaction(immediate=False) as conn:
+            rows = conn.execute("SELECT * FROM teams ORDER BY rowid").fetchall()
+            meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+            completed = conn.execute("SELECT teams FROM status_counts WHERE status = 'completed'").fetchone()
+
+        return {
+            "start_date": meta.get("start_date") or None,
+            "teams": {row["team"]: self._team_row(row) for row in rows},
+            "total_players_collected": int(meta.get("total_players", 0)),
+            "total_teams_completed": completed[0] if completed else 0,
+            "last_updated": meta.get("last_updated") or None
+        }
+
+    def history(self, team_name=None):
+        """Events in the order they were recorded, optionally for one team"""
+        with self.transaction(immediate=False) as conn:
+            if team_name:
+                rows = conn.execute("SELECT * FROM events WHERE team = ? ORDER BY id", (team_name,)).fetchall()
+            else:
+                rows = conn.execute("SELECT * FROM events ORDER BY id").fetchall()
+        return [{**dict(row), "data": json.loads(row["data"])} for row in rows]
+
+    def _replay(self, conn, until=None):
+        state = empty_state()
+        # Ids give the order events were applied in; timestamps need not follow it (imports carry
+        # their own), so the cutoff filters events instead of stopping at the first later one
+        if until:
+            rows = conn.execute("SELECT * FROM events WHERE timestamp <= ? ORDER BY id", (until,))
+        else:
+            rows = conn.execute("SELECT * FROM events ORDER BY id")
+        for row in rows:
+            apply_event(state, {**dict(row), "data": json.loads(row["data"])})
+        return state
+
+    def replay(self, until=None):
+        """
+        Rebuild the progress state from the event log, optionally only up to an ISO timestamp,
+        for audits ("what did we know on August 1st?").
+        """
+        with self.transaction(immediate=False) as conn:
+            state = self._replay(conn, until)
+        state["total_players_collected"] = sum(team["players_collected"] for team in state["teams"].values())
+        state["total_teams_completed"] = sum(team["status"] == "completed" for team in state["teams"].values())
+        return state
+
+    def export_json(self, path=None):
+        """Write a snapshot in the legacy JSON format (atomic rename)"""
+        path = path or self.json_path
+        with atomic_path(path) as tmp_path, open(tmp_path, 'w') as f:
+            json.dump(self.snapshot(), f, indent=2)
+        return path
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Inspect the CJFL collection progress store")
+    parser.add_argument("--history", nargs="?", const="", metavar="TEAM", help="Show the event log (optionally for one team)")
+    parser.add_argument("--as-of", metavar="TIMESTAMP", help="Replay the log up to an ISO date/time")
+    parser.add_argument("--rebuild", action="store_true", help="Recompute the views from the event log")
+    parser.add_argument("--export", action="store_true", help=f"Write a JSON snapshot to {PROGRESS_JSON}")
+    args = parser.parse_args()
+
+    store = ProgressStore()
+
+    print("🏈 CJFL PROGRESS STORE")
+    print("=" * 50)
+
+    if args.rebuild:
+        store.rebuild_views()
+        print("🔄 Views rebuilt from the event log")
+
+    if args.history is not None:
+        for event in store.history(args.history or None):
+            details = ", ".join(f"{key}={value}" for key, value in event["data"].items())
+            print(f"{event['timestamp'][:19]}  {event['team'] or '-':<26} {event['event_type']:<16} {details}")
+        return
+
+    progress = store.replay(args.as_of) if args.as_of else store.snapshot()
+    if args.as_of:
+        print(f"🕐 State as of {args.as_of}")
+    for team_name, info in progress["teams"].items():
+        print(f"{team_name:<28} {info['status']:<18} {info['players_collected']} players")
+    print(f"\nTotal Players: {progress['total_players_collected']}")
+    print(f"Teams Completed: {progress['total_teams_completed']}")
+
+    if args.export:
+        print(f"\n💾 Snapshot written to {store.export_json()}")
+
+if __name__ == "__main__":
+    main()
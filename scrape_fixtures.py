@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+CJFL Scrape Fixtures
+Record real HTTP responses once, then replay them offline.
+
+Recording wraps requests (every requests.get and Session.get goes through
+requests.Session.request), so any collector script can be recorded unchanged. The
+responses are stored in a gzip-compressed JSON archive. Replaying starts a local
+stand-in HTTP server that serves the archive, with optional latency and injected
+errors, and routes every request to it. Crawls and parsers can then be tested and
+benchmarked deterministically without network access.
+
+    python scrape_fixtures.py record -- collect_real_cjfl_data
+    python scrape_fixtures.py record -- team_collectors --dry-run
+    python scrape_fixtures.py replay --latency 0.05 --error-rate 0.1 -- team_collectors --dry-run
+    python scrape_fixtures.py bench --latency 0.05 --workers 8
+    python scrape_fixtures.py serve --port 8765
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import runpy
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote, unquote
+
+import requests
+
+from utils import atomic_path
+
+FIXTURE_FILE = "data/fixtures/scrape_fixtures.json.gz"
+KEPT_HEADERS = ['Content-Type', 'Retry-After', 'Last-Modified', 'ETag']
+
+def load_archive(path=FIXTURE_FILE):
+    """Recorded responses by url ({} when there is no archive yet)"""
+    if not os.path.exists(path):
+        return {}
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        return json.load(f)["responses"]
+
+def save_archive(responses, path=FIXTURE_FILE):
+    """Write the archive atomically"""
+    with atomic_path(path) as tmp_path, gzip.open(tmp_path, 'wt', encoding='utf-8') as f:
+        json.dump({"recorded_at": datetime.now().isoformat(), "responses": responses}, f)
+
+@contextmanager
+def patched_requests(handler):
+    """Route every requests call through handler(original_request, session, method, url, **kwargs)"""
+    original = requests.Session.request
+
+    def request(session, method, url, *args, **kwargs):
+        return handler(original, session, method, url, *args, **kwargs)
+
+    requests.Session.request = request
+    try:
+        yield
+    finally:
+        requests.Session.request = original
+
+@contextmanager
+def recording(path=FIXTURE_FILE):
+    """Perform real requests and add every GET response to the archive"""
+    responses = load_archive(path)
+    lock = threading.Lock()
+
+    def record(original, session, method, url, *args, **kwargs):
+        response = original(session, method, url, *args, **kwargs)
+        if method.upper() == "GET":
+            with lock:
+                responses[url] = {
+                    "status": response.status_code,
+                    "headers": {name: response.headers[name] for name in KEPT_HEADERS if name in response.headers},
+                    "body": response.text,
+                    "elapsed": response.elapsed.total_seconds()
+                }
+        return response
+
+    try:
+        with patched_requests(record):
+            yield responses
+    finally:
+        save_archive(responses, path)
+        print(f"💾 {len(responses)} responses saved to {path}")
+
+class FixtureServer:
+    """
+    Local stand-in server for recorded responses. The original url is the request
+    path (percent-encoded); unknown urls get a 404. latency (plus up to jitter) is
+    added to every response and error_rate of them fail with a 503, both drawn from
+    a seeded random generator so runs are repeatable.
+    """
+
+    def __init__(self, responses, host="127.0.0.1", port=0, latency=0.0, jitter=0.0, error_rate=0.0, seed=0):
+        self.responses = responses
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+        self.random_lock = threading.Lock()
+        self.hits = 0
+        self.server = ThreadingHTTPServer((host, port), self._handler_class())
+        self.server.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def local_url(self, url):
+        return self.base_url + quote(url, safe='')
+
+    def _handler_class(self):
+        fixture_server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                fixture_server.respond(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def respond(self, handler):
+        with self.random_lock:
+            self.hits += 1
+            delay = self.latency + self.random.uniform(0, self.jitter)
+            fail = self.random.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+
+        recorded = self.responses.get(unquote(handler.path.lstrip('/')))
+        if fail:
+            status, headers, body = 503, {"Retry-After": "1"}, "Injected error"
+        elif recorded is None:
+            status, headers, body = 404, {}, "Not recorded"
+        else:
+            status, headers, body = recorded["status"], recorded.get("headers", {}), recorded["body"]
+
+        payload = body.encode('utf-8')
+        handler.send_response(status)
+        handler.send_header("Content-Type", headers.get("Content-Type", "text/html; charset=utf-8"))
+        for name, value in headers.items():
+            if name != "Content-Type":
+                handler.send_header(name, value)
+        handler.send_header("Content-Length", str(len(payload)))
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+@contextmanager
+def replaying(path=FIXTURE_FILE, responses=None, **server_options):
+    """Serve recorded responses from a local FixtureServer and send every request there"""
+    server = FixtureServer(load_archive(path) if responses is None else responses, **server_options).start()
+
+    def replay(original, session, method, url, *args, **kwargs):
+        if not url.startswith(server.base_url):
+            url = server.local_url(url)
+            kwargs["proxies"] = {"http": None, "https": None}
+        return original(session, method, url, *args, **kwargs)
+
+    try:
+        with patched_requests(replay):
+            yield server
+    finally:
+        server.stop()
+
+def run_module(module, args):
+    """Run a collector script's main() as if it had been started from the command line"""
+    saved_argv = sys.argv
+    sys.argv = [module] + list(args)
+    try:
+        runpy.run_module(module, run_name="__main__", alter_sys=True)
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            raise
+    finally:
+        sys.argv = saved_argv
+
+def benchmark(path=FIXTURE_FILE, latency=0.0, error_rate=0.0, workers=8, parser_rounds=20):
+    """Crawl throughput against the stand-in server, and table parser speed on the recorded pages"""
+    from collector_daemon import extract_tables
+    from team_collectors import run_collectors
+
+    responses = load_archive(path)
+    with replaying(responses=responses, latency=latency, error_rate=error_rate) as server:
+        start = time.perf_counter()
+        results, _ = run_collectors(max_workers=workers, dry_run=True)
+        crawl_seconds = time.perf_counter() - start
+
+    pages = [recorded["body"] for recorded in responses.values() if recorded["status"] == 200]
+    total_bytes = sum(len(body.encode('utf-8')) for body in pages)
+    start = time.perf_counter()
+    for _ in range(parser_rounds):
+        for body in pages:
+            extract_tables(body)
+    parse_seconds = time.perf_counter() - start
+
+    return {
+        "requests": server.hits,
+        "pages": sum(len(result["pages"]) for result in results),
+        "crawl_seconds": crawl_seconds,
+        "pages_per_second": server.hits / crawl_seconds if crawl_seconds else 0.0,
+        "parsed_pages": len(pages) * parser_rounds,
+        "parse_seconds": parse_seconds,
+        "parse_mb_per_second": total_bytes * parser_rounds / 1e6 / parse_seconds if parse_seconds else 0.0
+    }
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Record and replay HTTP fixtures for the collectors")
+    parser.add_argument("command", choices=["record", "replay", "serve", "bench"])
+    parser.add_argument("module", nargs="*", help="Collector module and its arguments (after --)")
+    parser.add_argument("--archive", default=FIXTURE_FILE, help=f"Fixture archive (default: {FIXTURE_FILE})")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every replayed response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency, up to this many seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of replayed responses that fail with 503")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for latency and errors")
+    parser.add_argument("--port", type=int, default=8765, help="Port for 'serve' (default: 8765)")
+    parser.add_argument("--workers", type=int, default=8, help="Parallel collectors for 'bench' (default: 8)")
+    args = parser.parse_args()
+
+    print("🏈 CJFL SCRAPE FIXTURES")
+    print("=" * 50)
+    options = {"latency": args.latency, "jitter": args.jitter, "error_rate": args.error_rate, "seed": args.seed}
+
+    if args.command in ("record", "replay") and not args.module:
+        parser.error(f"{args.command} needs a collector module, e.g. -- team_collectors --dry-run")
+
+    if args.command == "record":
+        with recording(args.archive):
+            run_module(args.module[0], args.module[1:])
+    elif args.command == "replay":
+        with replaying(args.archive, **options) as server:
+            run_module(args.module[0], args.module[1:])
+        print(f"\n🔁 Served {server.hits} requests from {args.archive}")
+    elif args.command == "serve":
+        server = FixtureServer(load_archive(args.archive), port=args.port, **options)
+        print(f"🌐 Serving {len(server.responses)} recorded responses at {server.base_url}<percent-encoded url>")
+        try:
+            server.server.serve_forever()
+        except KeyboardInterrupt:
+            print("\n👋 Stopped")
+    else:
+        result = benchmark(args.archive, args.latency, args.error_rate, args.workers)
+        print(f"Crawl: {result['requests']} requests in {result['crawl_seconds']:.2f}s "
+              f"({result['pages_per_second']:.1f} requests/s)")
+        print(f"Parser: {result['parsed_pages']} pages in {result['parse_seconds']:.2f}s "
+              f"({result['parse_mb_per_second']:.1f} MB/s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+CJFL Season Simulator
+Playoff and championship odds from the remaining schedule and current Elo ratings.
+
+The schedule lives in data/cjfl_schedule.csv, one row per game with the home and
+away team. A game is still to be played when its Game ID is not in the results
+file. Every simulation plays the rest of the season at the Elo win probabilities.
+The top teams in each conference (PFC, BCFC, OFC) make the playoffs. The seeds
+then play a single-elimination bracket with the higher seed hosting. The
+conference champions meet in the national bracket. The PFC and BCFC champions play
+the western semifinal and the winner meets the OFC champion.
+
+Simulations are vectorized with NumPy: one random matrix per chunk decides every
+remaining game in every simulation at once. Chunks can run in a process pool.
+Each chunk gets its own seed spawned from the run's seed, so a seeded run gives the
+same odds whatever the number of workers.
+
+    python season_simulator.py import schedule_2024.csv
+    python season_simulator.py odds --sims 50000 --workers 4 --seed 7
+"""
+
+import argparse
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from team_ratings import (ELO_HOME_ADVANTAGE, ELO_INITIAL, RESULTS_FILE, elo_win_probability, load_elo, load_results,
+                          validate_game_table)
+
+SCHEDULE_FILE = "data/cjfl_schedule.csv"
+SCHEDULE_COLUMNS = ['Game ID', 'Season', 'Week', 'Game Date', 'Home Team', 'Away Team']
+CONFERENCES = ["PFC", "BCFC", "OFC"]
+NATIONAL_SEEDING = ["OFC", "PFC", "BCFC"]  # OFC champion has the bye while PFC and BCFC play the western semifinal
+PLAYOFF_SPOTS = 4
+DEFAULT_SIMULATIONS = 20000
+CHUNK_SIZE = 5000
+
+def team_conferences():
+    """Conference of every team in the collection plan"""
+    from data_collection_plan import TEAMS
+    return {team: info["conference"] for team, info in TEAMS.items()}
+
+def validate_schedule(schedule):
+    """Returns (valid games in SCHEDULE_COLUMNS layout, rejected rows with a 'Reason' column)"""
+    return validate_game_table(schedule, ['Season', 'Week'], SCHEDULE_COLUMNS)
+
+def load_schedule(path=SCHEDULE_FILE):
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=SCHEDULE_COLUMNS)
+    return pd.read_csv(path, dtype={'Game ID': str})
+
+def add_schedule(schedule, path=SCHEDULE_FILE):
+    """Validate and append scheduled games; games already stored (same Game ID) are skipped"""
+    valid, rejected = validate_schedule(schedule)
+    duplicate = valid['Game ID'].duplicated() | valid['Game ID'].isin(set(load_schedule(path)['Game ID']))
+    new_games = valid[~duplicate]
+    if not new_games.empty:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        write_header = not os.path.exists(path) or os.path.getsize(path) == 0
+        new_games.to_csv(path, mode='a', header=write_header, index=False)
+    return {"added": len(new_games), "duplicates": int(duplicate.sum()), "rejected": len(rejected),
+            "rejected_rows": rejected}
+
+def prepare_season(results, schedule, elo, conferences, season=None, home_advantage=ELO_HOME_ADVANTAGE,
+                   playoff_spots=PLAYOFF_SPOTS):
+    """
+    Arrays for one season's simulation: teams, their conference, standings points so far
+    (a tie is half a win), ratings and the home/away team of every game still to play.
+    Teams outside the three conferences play their games but can't make the playoffs.
+    """
+    if season is None:
+        season = pd.concat([results['Season'], schedule['Season']]).max()
+    played = results[results['Season'] == season]
+    remaining = schedule[(schedule['Season'] == season) & ~schedule['Game ID'].isin(set(results['Game ID']))]
+
+    season_teams = set(played['Home Team']) | set(played['Away Team'])
+    season_teams |= set(remaining['Home Team']) | set(remaining['Away Team'])
+    teams = pd.Index(sorted(season_teams))
+    conference = np.array([CONFERENCES.index(conferences[team]) if conferences.get(team) in CONFERENCES else -1
+                           for team in teams], dtype='int64')
+    ratings = teams.map(elo.set_index('Team')['Elo']).to_numpy(dtype='float64', na_value=ELO_INITIAL)
+
+    home = teams.get_indexer(played['Home Team'])
+    away = teams.get_indexer(played['Away Team'])
+    margin = (played['Home Score'] - played['Away Score']).to_numpy(dtype='float64')
+    wins = np.bincount(home[margin > 0], minlength=len(teams)) + np.bincount(away[margin < 0], minlength=len(teams))
+    ties = np.bincount(home[margin == 0], minlength=len(teams)) + np.bincount(away[margin == 0], minlength=len(teams))
+    games = np.bincount(home, minlength=len(teams)) + np.bincount(away, minlength=len(teams))
+
+    return {"season": int(season), "teams": teams, "conference": conference, "ratings": ratings,
+            "wins": wins, "losses": games - wins - ties, "ties": ties,
+            "standing": wins + 0.5 * ties, "home": teams.get_indexer(remaining['Home Team']),
+            "away": teams.get_indexer(remaining['Away Team']), "home_advantage": home_advantage,
+            "playoff_spots": playoff_spots}
+
+def play_games(home, away, ratings, home_advantage, rng):
+    """Winner of each game (arrays of team indices, any shape) at the Elo win probability"""
+    home_wins = rng.random(home.shape) < elo_win_probability(ratings[home], ratings[away], home_advantage)
+    return np.where(home_wins, home, away)
+
+def play_bracket(seeds, ratings, home_advantage, rng):
+    """
+    Champion of a single-elimination bracket in every simulation. seeds is (simulations x
+    teams), best seed first. Top seeds get byes when the field isn't a power of two. The
+    best remaining seed hosts the worst, and a winner takes the slot of the seed it beat.
+    """
+    while seeds.shape[1] > 1:
+        byes = 2 ** math.ceil(math.log2(seeds.shape[1])) - seeds.shape[1]
+        playing = seeds[:, byes:]
+        half = playing.shape[1] // 2
+        winners = play_games(playing[:, :half], playing[:, ::-1][:, :half], ratings, home_advantage, rng)
+        seeds = np.concatenate([seeds[:, :byes], winners], axis=1)
+    return seeds[:, 0]
+
+def simulate_chunk(league, n_sims, seed):
+    """Counts of playoff spots, conference titles and championships per team over n_sims seasons"""
+    rng = np.random.default_rng(seed)
+    n_teams = len(league["teams"])
+    ratings = league["ratings"]
+
+    # Every remaining game in every simulation from one matrix of uniforms
+    probability = elo_win_probability(ratings[league["home"]], ratings[league["away"]], league["home_advantage"])
+    home_wins = (rng.random((n_sims, len(probability))) < probability).astype('float64')
+    home_teams = np.zeros((len(probability), n_teams))
+    home_teams[np.arange(len(probability)), league["home"]] = 1
+    away_teams = np.zeros((len(probability), n_teams))
+    away_teams[np.arange(len(probability)), league["away"]] = 1
+    wins = home_wins @ home_teams + (1 - home_wins) @ away_teams
+
+    # Standings ties are broken at random
+    standing = league["standing"] + wins + rng.random((n_sims, n_teams)) * 1e-3
+    playoffs = np.zeros((n_sims, n_teams), dtype=bool)
+    conference_titles = np.zeros((n_sims, n_teams), dtype=bool)
+    champions = []
+    rows = np.arange(n_sims)[:, None]
+    for code in NATIONAL_SEEDING:
+        members = np.flatnonzero(league["conference"] == CONFERENCES.index(code))
+        if len(members) == 0:
+            continue
+        order = np.argsort(-standing[:, members], axis=1)[:, :league["playoff_spots"]]
+        seeds = members[order]
+        playoffs[rows, seeds] = True
+        champion = play_bracket(seeds, ratings, league["home_advantage"], rng)
+        conference_titles[np.arange(n_sims), champion] = True
+        champions.append(champion)
+
+    national = np.zeros(n_teams, dtype='int64')
+    if champions:
+        winner = play_bracket(np.stack(champions, axis=1), ratings, 0.0, rng)  # national games are at neutral sites
+        national = np.bincount(winner, minlength=n_teams)
+    return {"wins": wins.sum(axis=0), "playoffs": playoffs.sum(axis=0),
+            "conference_titles": conference_titles.sum(axis=0), "championships": national}
+
+def simulate_season(league, n_sims=DEFAULT_SIMULATIONS, seed=None, workers=1, chunk_size=CHUNK_SIZE):
+    """
+    Playoff odds per team. The simulations run in chunks, each with a seed spawned from
+    `seed`, so the result depends only on seed and chunk size, not on `workers`.
+    """
+    if n_sims < 1 or chunk_size < 1:
+        raise ValueError("n_sims and chunk_size must be at least 1")
+    sizes = [min(chunk_size, n_sims - start) for start in range(0, n_sims, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    if workers > 1 and len(sizes) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = list(pool.map(simulate_chunk, [league] * len(sizes), sizes, seeds))
+    else:
+        chunks = [simulate_chunk(league, size, chunk_seed) for size, chunk_seed in zip(sizes, seeds)]
+    totals = {key: sum(chunk[key] for chunk in chunks) for key in chunks[0]}
+
+    codes = np.array(CONFERENCES + [""], dtype=object)
+    odds = pd.DataFrame({'Team': league["teams"], 'Conference': codes[league["conference"]],
+                         'Wins': league["wins"], 'Losses': league["losses"], 'Ties': league["ties"],
+                         'Elo': league["ratings"],
+                         'Remaining': np.bincount(np.concatenate([league["home"], league["away"]]),
+                                                  minlength=len(league["teams"])),
+                         'Projected Wins': league["wins"] + totals["wins"] / n_sims,
+                         'Playoff %': 100 * totals["playoffs"] / n_sims,
+                         'Conference Title %': 100 * totals["conference_titles"] / n_sims,
+                         'Championship %': 100 * totals["championships"] / n_sims})
+    odds['Conference'] = pd.Categorical(odds['Conference'], CONFERENCES + [""], ordered=True)
+    odds = odds.sort_values(['Conference', 'Championship %', 'Playoff %', 'Projected Wins'],
+                            ascending=[True, False, False, False], kind='stable')
+    odds['Conference'] = odds['Conference'].astype(str)
+    return odds.reset_index(drop=True)
+
+def playoff_odds(season=None, n_sims=DEFAULT_SIMULATIONS, seed=None, workers=1, results_file=RESULTS_FILE,
+                 schedule_file=SCHEDULE_FILE):
+    """Odds for a season (the latest by default) from the stored results, schedule and Elo ratings"""
+    results, schedule = load_results(results_file), load_schedule(schedule_file)
+    if results.empty and schedule.empty:
+        return pd.DataFrame(columns=['Team', 'Conference', 'Playoff %', 'Conference Title %', 'Championship %'])
+    league = prepare_season(results, schedule, load_elo(results_file), team_conferences(), season)
+    return simulate_season(league, n_sims, seed, workers)
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Simulate the rest of the season for playoff odds")
+    parser.add_argument("command", choices=["import", "odds"])
+    parser.add_argument("files", nargs="*", help="Schedule CSV files (for import)")
+    parser.add_argument("--season", type=int, help="Season to simulate (default: latest)")
+    parser.add_argument("--sims", type=int, default=DEFAULT_SIMULATIONS,
+                        help=f"Number of simulated seasons (default: {DEFAULT_SIMULATIONS})")
+    parser.add_argument("--workers", type=int, default=1, help="Processes to simulate in (default: 1)")
+    parser.add_argument("--seed", type=int, help="Random seed, for repeatable odds")
+    args = parser.parse_args()
+    if args.sims < 1:
+        parser.error("--sims must be at least 1")
+
+    print("🏈 CJFL SEASON SIMULATOR")
+    print("=" * 50)
+
+    if args.command == "import":
+        for path in args.files:
+            result = add_schedule(pd.read_csv(path, dtype=str, keep_default_na=False))
+            print(f"📄 {path}: {result['added']} games added, {result['duplicates']} already stored, "
+                  f"{result['rejected']} rejected")
+            for _, row in result["rejected_rows"].head(5).iterrows():
+                print(f"   ❌ {row.get('Game ID', '')}: {row['Reason']}")
+        return
+
+    odds = playoff_odds(args.season, args.sims, args.seed, args.workers)
+    if odds.empty:
+        print("No schedule or results yet. Import them with: python season_simulator.py import <file>")
+        return
+    print(f"🎲 {args.sims} simulated seasons")
+    for conference, teams in odds.groupby('Conference', sort=False):
+        print(f"\n📋 {conference or 'Other'}:")
+        for _, row in teams.iterrows():
+            record = f"{row['Wins']}-{row['Losses']}" + (f"-{row['Ties']}" if row['Ties'] else "")
+            print(f"   {row['Team']:<25} {record:<7} proj {row['Projected Wins']:4.1f} W  "
+                  f"playoffs {row['Playoff %']:5.1f}%  conf {row['Conference Title %']:5.1f}%  "
+                  f"title {row['Championship %']:5.1f}%")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+CJFL Shared Dataset
+Materializes the typed stats frame (including derived columns) into a
+memory-mapped Arrow file that every Streamlit worker process attaches to zero-copy
+
+Enable it for all loaders with:
+    CJFL_SHARED_DATASET=1 streamlit run streamlit_app.py
+or point it at a specific file:
+    CJFL_SHARED_DATASET=/dev/shm/cjfl_stats.arrow streamlit run streamlit_app.py
+"""
+
+import json
+import os
+from contextlib import contextmanager
+
+import pandas as pd
+
+from utils import add_derived_columns, atomic_path, file_signature
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+except ImportError:  # pyarrow ships with streamlit, but keep plain CSV loading working without it
+    pa = None
+    ipc = None
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, materialization is still atomic
+    fcntl = None
+
+SHARED_DATASET_ENV = "CJFL_SHARED_DATASET"
+SHARED_DATASET_FILE = "data/cjfl_stats.arrow"
+SOURCE_FILES = ["data/cjfl_stats.csv", "data/player_identity.csv"]
+SIGNATURE_KEY = b"cjfl_source_signature"
+
+STRING_COLUMNS = ['Player Name', 'Team', 'Position', 'Player ID']
+INTEGER_COLUMNS = ['Season', 'Games Played', 'Passing Yards', 'Rushing Yards', 'Receiving Yards',
+                   'Touchdowns', 'Tackles', 'Sacks', 'Interceptions', 'Total Yards', 'Total Offensive Yards']
+FLOAT_COLUMNS = ['Yards per Game', 'Touchdowns per Game', 'Tackles per Game', 'Sacks per Game']
+
+def shared_dataset_enabled():
+    """True when the loader should use the shared Arrow dataset"""
+    value = os.environ.get(SHARED_DATASET_ENV, "").strip()
+    return value.lower() not in ("", "0", "false", "no", "off")
+
+def shared_dataset_path():
+    """Arrow file path: the env value when it looks like a path, otherwise the default"""
+    value = os.environ.get(SHARED_DATASET_ENV, "").strip()
+    if value.endswith(".arrow"):
+        return value
+    return SHARED_DATASET_FILE
+
+def source_signature(source_files=None):
+    """utils.file_signature of every existing source file the dataset was built from (JSON-ready lists)"""
+    signatures = {path: file_signature(path) for path in source_files or SOURCE_FILES}
+    return {path: list(signature) for path, signature in signatures.items() if signature is not None}
+
+def _string_dtype():
+    """pandas string dtype that can wrap Arrow buffers without copying (pandas 3 default 'str')"""
+    dtype = pd.Series(["x"]).dtype
+    if isinstance(dtype, pd.StringDtype) and dtype.storage == "pyarrow":
+        return dtype
+    return None
+
+def _schema(data):
+    """Explicit Arrow types for the stats columns; other columns are typed from their pandas dtype"""
+    fields = []
+    for column in data.columns:
+        dtype = data[column].dtype
+        if column in STRING_COLUMNS or dtype == object or isinstance(dtype, pd.StringDtype):
+            fields.append(pa.field(column, pa.large_string()))
+        elif column in INTEGER_COLUMNS or pd.api.types.is_integer_dtype(dtype):
+            fields.append(pa.field(column, pa.int64()))
+        else:
+            fields.append(pa.field(column, pa.float64()))
+    return pa.schema(fields)
+
+def materialize_shared_dataset(data, path=None, signature=None):
+    """
+    Write the typed frame plus derived columns to an uncompressed Arrow IPC file.
+    The file is written to a temp name and renamed, so attached readers never see a partial file.
+    """
+    if pa is None:
+        raise ImportError("pyarrow is required for the shared dataset mode")
+
+    path = path or shared_dataset_path()
+    data = add_derived_columns(data)
+    schema = _schema(data).with_metadata({SIGNATURE_KEY: json.dumps(signature or source_signature()).encode()})
+    table = pa.Table.from_pandas(data, schema=schema, preserve_index=False)
+
+    with atomic_path(path) as tmp_path:
+        with pa.OSFile(tmp_path, 'wb') as sink:
+            with ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    return path
+
+def attach_shared_dataset(path=None):
+    """
+    Memory-map the Arrow file and wrap its buffers in a DataFrame without copying.
+    Numeric columns are read-only views of the mapped pages; string columns stay Arrow-backed.
+    """
+    if pa is None:
+        raise ImportError("pyarrow is required for the shared dataset mode")
+
+    path = path or shared_dataset_path()
+    table = ipc.open_file(pa.memory_map(path, 'r')).read_all()
+    string_dtype = _string_dtype()
+    types_mapper = {pa.large_string(): string_dtype, pa.string(): string_dtype}.get if string_dtype is not None else None
+    return table.to_pandas(split_blocks=True, types_mapper=types_mapper)
+
+def stored_signature(path=None):
+    """Source signature recorded in an existing Arrow file, or None"""
+    path = path or shared_dataset_path()
+    if pa is None or not os.path.exists(path):
+        return None
+    try:
+        metadata = ipc.open_file(pa.memory_map(path, 'r')).schema.metadata or {}
+        return json.loads(metadata.get(SIGNATURE_KEY, b"null"))
+    except (pa.ArrowInvalid, ValueError):
+        return None
+
+@contextmanager
+def _materialize_lock(path):
+    """Exclusive lock so only one process rebuilds the Arrow file"""
+    if fcntl is None:
+        yield
+        return
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(f"{path}.lock", 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def load_shared_dataset(loader, path=None, source_files=None):
+    """
+    Attach to the shared Arrow dataset, materializing it first with loader() when it is
+    missing or older than its source files. Only one process rebuilds; the rest wait and attach.
+    """
+    path = path or shared_dataset_path()
+    signature = source_signature(source_files)
+
+    if stored_signature(path) != signature:
+        with _materialize_lock(path):
+            # Another worker may have rebuilt it while we waited for the lock
+            if stored_signature(path) != signature:
+                data = loader()
+                materialize_shared_dataset(data, path, source_signature(source_files))
+
+    return attach_shared_dataset(path)
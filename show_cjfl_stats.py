@@ -7,11 +7,12 @@ Shows accurate Canadian Junior Football League statistics
 import pandas as pd
 import numpy as np
 
+from utils import read_player_stats
+
 def load_cjfl_data():
     """Load CJFL statistics data"""
     try:
-        data = pd.read_csv('data/cjfl_stats.csv')
-        return data
+        return read_player_stats('data/cjfl_stats.csv')
     except FileNotFoundError:
         print("Error: CJFL stats file not found!")
         return None
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+CJFL Rate Shrinkage
+Empirical-Bayes adjusted per-game rates, so a hot two-game stretch doesn't top a
+leaderboard over a full season of production.
+
+For each per-game rate and position, the spread of raw rates across players is
+split into real differences between players (tau^2) and game-to-game noise
+(sigma^2 / games). Both come from one weighted least-squares fit of each player's
+squared distance from the position mean against 1 / games. A player's adjusted rate
+is then
+
+    (total + k * position mean) / (games + k),    k = sigma^2 / tau^2
+
+which is the raw rate pulled toward the position mean by k games' worth of prior,
+capped at the position's median games played. Positions with too few players use
+the league-wide fit. Everything is a handful of grouped sums per stat, and the
+adjusted columns are cached per data version.
+
+    python shrinkage.py                   # priors per stat and position
+    python shrinkage.py --min-games 4     # leaders by adjusted rate
+"""
+
+import argparse
+import threading
+
+import numpy as np
+import pandas as pd
+
+from utils import add_derived_columns
+
+RATE_STATS = {
+    'Yards per Game': 'Total Yards',
+    'Touchdowns per Game': 'Touchdowns',
+    'Tackles per Game': 'Tackles',
+    'Sacks per Game': 'Sacks'
+}
+DEFAULT_MIN_GAMES = 3
+MIN_GROUP_PLAYERS = 5
+MIN_SPREAD_SHARE = 0.05  # never treat players as identical: tau^2 is at least 5% of the observed spread
+
+def adjusted_column(rate):
+    """Name of the shrunk column for a per-game rate"""
+    return f"{rate} (Adjusted)"
+
+def shrinkage_priors(data, stat, group='Position'):
+    """
+    Prior for one stat's per-game rate in each group: Players, Prior Mean, Spread (tau^2),
+    Noise (sigma^2 per game) and Shrinkage Games (k). Players without games are ignored.
+    """
+    games = data['Games Played'].to_numpy(dtype='float64')
+    played = games > 0
+    frame = pd.DataFrame({'Group': data[group].to_numpy()[played] if group else "All",
+                          'total': data[stat].to_numpy(dtype='float64')[played], 'games': games[played]})
+    frame['rate'] = frame['total'] / frame['games']
+    frame['inverse'] = 1 / frame['games']
+    frame['players'] = 1.0
+
+    grouped = frame.groupby('Group', sort=True)
+    mean = grouped['total'].sum() / grouped['games'].sum()
+    frame['squared'] = (frame['rate'] - frame['Group'].map(mean)) ** 2
+    frame['weighted_squared'] = frame['games'] * frame['squared']
+    sums = frame.groupby('Group', sort=True)[['games', 'players', 'inverse', 'squared', 'weighted_squared']].sum()
+
+    # Weighted (by games) regression of squared deviation on 1 / games: intercept tau^2, slope sigma^2.
+    # With weights w = games the sums simplify: sum(w / games) is the player count, sum(w / games^2) is
+    # sum(1 / games) and sum(w * squared / games) is sum(squared).
+    inverse_mean = sums['players'] / sums['games']
+    squared_mean = sums['weighted_squared'] / sums['games']
+    inverse_spread = sums['inverse'] - sums['games'] * inverse_mean ** 2
+    covariance = sums['squared'] - sums['games'] * inverse_mean * squared_mean
+    with np.errstate(divide='ignore', invalid='ignore'):
+        noise = (covariance / inverse_spread).where(inverse_spread > 1e-12, 0.0).clip(lower=0)
+        spread = np.maximum(squared_mean - noise * inverse_mean, MIN_SPREAD_SHARE * squared_mean)
+        shrinkage_games = (noise / spread).where(spread > 0, 0.0)
+    # When games played barely vary the slope is poorly determined; the prior never outweighs a typical season
+    shrinkage_games = shrinkage_games.clip(upper=grouped['games'].median())
+
+    return pd.DataFrame({'Players': sums['players'].astype('int64'), 'Prior Mean': mean, 'Spread': spread,
+                         'Noise': noise, 'Shrinkage Games': shrinkage_games})
+
+def shrink_rates(data, group='Position'):
+    """Adjusted per-game rates (one '<rate> (Adjusted)' column per RATE_STATS entry) for every row"""
+    data = add_derived_columns(data)
+    games = data['Games Played'].to_numpy(dtype='float64')
+    adjusted = pd.DataFrame(index=data.index)
+    for rate, stat in RATE_STATS.items():
+        priors = shrinkage_priors(data, stat, group)
+        league = shrinkage_priors(data, stat, None).reindex(["All"]).iloc[0]
+        small = priors['Players'] < MIN_GROUP_PLAYERS
+        priors.loc[small, ['Prior Mean', 'Shrinkage Games']] = league[['Prior Mean', 'Shrinkage Games']].to_numpy()
+
+        prior_mean = data[group].map(priors['Prior Mean']).fillna(league['Prior Mean']).to_numpy(dtype='float64')
+        k = data[group].map(priors['Shrinkage Games']).fillna(league['Shrinkage Games']).to_numpy(dtype='float64')
+        with np.errstate(divide='ignore', invalid='ignore'):
+            values = (data[stat].to_numpy(dtype='float64') + k * prior_mean) / (games + k)
+        adjusted[adjusted_column(rate)] = np.where(games > 0, values, np.nan)
+    return adjusted
+
+class RateShrinker:
+    """Adjusted rate columns, computed once per data version and shared by every dashboard session"""
+
+    def __init__(self, group='Position'):
+        self.group = group
+        self.version = None
+        self.values = None
+        self.lock = threading.Lock()
+
+    def apply(self, data, version=None):
+        """The data with the adjusted rate columns added (shallow copy)"""
+        with self.lock:
+            if version is None or version != self.version or self.values is None or len(self.values) != len(data):
+                self.values = shrink_rates(data, self.group)
+                self.version = version
+            values = self.values
+        data = data.copy(deep=False)
+        for column in values.columns:
+            data[column] = values[column].to_numpy()
+        return data
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Empirical-Bayes adjusted per-game rates")
+    parser.add_argument("--min-games", type=int, help="Show leaders with at least this many games")
+    parser.add_argument("--top", type=int, default=10, help="Players per leaderboard (default: 10)")
+    args = parser.parse_args()
+
+    print("🏈 CJFL RATE SHRINKAGE")
+    print("=" * 50)
+
+    from utils import load_data
+    data = add_derived_columns(load_data())
+    if args.min_games is None:
+        for rate, stat in RATE_STATS.items():
+            print(f"\n📐 {rate}:")
+            for position, row in shrinkage_priors(data, stat).iterrows():
+                print(f"   {position:<3} {int(row['Players']):>4} players  mean {row['Prior Mean']:7.2f}  "
+                      f"prior worth {row['Shrinkage Games']:5.1f} games")
+        return
+
+    data = RateShrinker().apply(data)
+    qualified = data[data['Games Played'] >= args.min_games]
+    for rate in RATE_STATS:
+        print(f"\n🏆 {rate} (adjusted, {args.min_games}+ games):")
+        for _, row in qualified.nlargest(args.top, adjusted_column(rate)).iterrows():
+            print(f"   {row['Player Name']:<25} {row['Position']:<3} {row['Games Played']:>3} GP  "
+                  f"raw {row[rate]:6.2f}  adjusted {row[adjusted_column(rate)]:6.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+CJFL Site Crawler
+Explores every team website a few clicks deep, looking for roster and stats pages.
+
+Crawling is breadth-first from the team websites in get_team_websites(). Links are
+followed only when their address or text mentions a roster/stats/schedule keyword,
+best-scoring links first, up to a maximum depth and a per-site page budget. URLs are
+normalized (case, default ports, fragments, tracking parameters, query order) and
+deduplicated with a compact Bloom filter shared by the whole crawl. Sites are crawled
+in parallel; pages on one site are fetched one after another.
+
+    python site_crawler.py                            # all 20 team sites
+    python site_crawler.py --team "Calgary Colts" --max-pages 30 --max-depth 3
+"""
+
+import argparse
+import hashlib
+import math
+import posixpath
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+import requests
+
+from collector_daemon import REQUEST_TIMEOUT, extract_tables
+from keyword_scanner import KeywordAutomaton, scan_html
+
+DEFAULT_MAX_PAGES = 15      # per site
+DEFAULT_MAX_DEPTH = 2
+DEFAULT_WORKERS = 8
+DEFAULT_PAGE_DELAY = 1.0    # seconds between pages on the same site
+
+# Link score: sum of the weights of the keywords in the link's address and text
+KEYWORD_WEIGHTS = {'roster': 5, 'stats': 5, 'statistics': 5, 'leaders': 4, 'players': 3, 'player': 3,
+                   'schedule': 2, 'team': 1}
+LINK_SCANNER = KeywordAutomaton(KEYWORD_WEIGHTS)
+TRACKING_PARAMETERS = ('utm_', 'fbclid', 'gclid', 'mc_cid', 'mc_eid')
+SKIPPED_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.svg', '.webp', '.mp4', '.mov', '.zip', '.css', '.js', '.ico')
+
+def normalize_url(url, base_url=None):
+    """
+    Canonical form of a URL, or None for links the crawler never follows
+    (mailto:, javascript:, media files). Relative links are resolved against base_url.
+    """
+    url = urljoin(base_url, url.strip()) if base_url else url.strip()
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in ('http', 'https'):
+        return None
+
+    host = (parts.hostname or "").lower()
+    if not host:
+        return None
+    port = parts.port
+    netloc = host if port is None or (scheme, port) in (('http', 80), ('https', 443)) else f"{host}:{port}"
+
+    path = parts.path or "/"
+    normalized_path = posixpath.normpath(path.replace("//", "/"))
+    if path.endswith("/") and normalized_path != "/":
+        normalized_path += "/"
+    if normalized_path.lower().endswith(SKIPPED_EXTENSIONS):
+        return None
+
+    query = sorted((key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+                   if not key.lower().startswith(TRACKING_PARAMETERS))
+    return urlunsplit((scheme, netloc, normalized_path, urlencode(query), ""))
+
+def same_site(url, site_url):
+    """True when both URLs are on the same host, ignoring a leading 'www.'"""
+    def host(value):
+        name = urlsplit(value).hostname or ""
+        return name[4:] if name.startswith("www.") else name
+    return host(url) == host(site_url)
+
+class BloomFilter:
+    """
+    Fixed-size set membership with a small false-positive rate and no false negatives.
+    Sized for `capacity` items at `error_rate`; about 1.8 bytes per URL at 0.1%.
+    """
+
+    def __init__(self, capacity=100000, error_rate=0.001):
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def _positions(self, item):
+        # Double hashing: k positions from two 64-bit halves of one digest
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+        return [(first + i * second) % self.size for i in range(self.hash_count)]
+
+    def __contains__(self, item):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def add(self, item):
+        """Add an item; returns False if it was (probably) already present"""
+        positions = self._positions(item)
+        with self.lock:
+            if all(self.bits[position >> 3] & (1 << (position & 7)) for position in positions):
+                return False
+            for position in positions:
+                self.bits[position >> 3] |= 1 << (position & 7)
+            self.count += 1
+            return True
+
+class SiteCrawler:
+    """Bounded, keyword-guided breadth-first crawl of team websites"""
+
+    def __init__(self, session=None, max_pages=DEFAULT_MAX_PAGES, max_depth=DEFAULT_MAX_DEPTH,
+                 page_delay=DEFAULT_PAGE_DELAY, archive=None, seen=None):
+        if session is None:
+            from team_collectors import create_session
+            session = create_session(DEFAULT_WORKERS)
+        self.session = session
+        self.max_pages = max_pages
+        self.max_depth = max_depth
+        self.page_delay = page_delay
+        self.archive = archive
+        self.seen = seen or BloomFilter()
+
+    def fetch(self, url):
+        response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+        return response.status_code, response.text
+
+    def crawl_site(self, team, start_url):
+        """Crawl one site; returns {'team', 'start_url', 'pages': [...], 'errors': [...], 'over_budget': n}"""
+        result = {"team": team, "start_url": start_url, "pages": [], "errors": [], "over_budget": 0}
+        start_url = normalize_url(start_url)
+        if start_url is None:
+            result["errors"].append("invalid start url")
+            return result
+
+        self.seen.add(start_url)
+        level = [(start_url, 0)]  # (url, score) pairs for the current depth
+        for depth in range(self.max_depth + 1):
+            next_level = []
+            for url, score in sorted(level, key=lambda item: -item[1]):
+                if len(result["pages"]) >= self.max_pages:
+                    result["over_budget"] += 1
+                    continue
+                if result["pages"] and self.page_delay:
+                    time.sleep(self.page_delay)
+                try:
+                    status, html = self.fetch(url)
+                except requests.RequestException as e:
+                    result["errors"].append(f"{url}: {e}")
+                    continue
+
+                page = {"url": url, "depth": depth, "score": score, "status": status, "tables": 0}
+                result["pages"].append(page)
+                if status != 200:
+                    continue
+                if self.archive is not None:
+                    self.archive.store(url, html, team=team, status=status)
+                page["tables"] = len(extract_tables(html))
+
+                if depth < self.max_depth:
+                    # Only links mentioning a keyword come back from the scan
+                    for link in scan_html(html, LINK_SCANNER)["links"]:
+                        link_url = normalize_url(link["href"], url)
+                        if link_url is not None and same_site(link_url, start_url) and self.seen.add(link_url):
+                            next_level.append((link_url, sum(KEYWORD_WEIGHTS[keyword] for keyword in link["keywords"])))
+            level = next_level
+            if not level:
+                break
+        return result
+
+    def crawl(self, sites, workers=DEFAULT_WORKERS):
+        """Crawl {team: url} sites in parallel; results are returned in the order given"""
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(self.crawl_site, team, url) for team, url in sites.items()]
+            return [future.result() for future in futures]
+
+def main():
+    """Command line entry point"""
+    from collect_real_cjfl_data import get_team_websites
+    from page_archive import PageArchive
+
+    parser = argparse.ArgumentParser(description="Explore team websites for roster and stats pages")
+    parser.add_argument("--team", action="append", help="Only crawl this team (repeatable)")
+    parser.add_argument("--max-pages", type=int, default=DEFAULT_MAX_PAGES, help="Page budget per site (default: 15)")
+    parser.add_argument("--max-depth", type=int, default=DEFAULT_MAX_DEPTH, help="Clicks from the homepage (default: 2)")
+    parser.add_argument("--delay", type=float, default=DEFAULT_PAGE_DELAY, help="Seconds between pages on one site")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Sites crawled in parallel (default: 8)")
+    parser.add_argument("--no-archive", action="store_true", help="Don't keep the fetched pages in the page archive")
+    args = parser.parse_args()
+
+    print("🏈 CJFL SITE CRAWLER")
+    print("=" * 50)
+
+    sites = {team: url for team, url in get_team_websites().items() if not args.team or team in args.team}
+    crawler = SiteCrawler(max_pages=args.max_pages, max_depth=args.max_depth, page_delay=args.delay,
+                          archive=None if args.no_archive else PageArchive())
+    start = time.perf_counter()
+    results = crawler.crawl(sites, workers=args.workers)
+
+    for result in results:
+        pages = [page for page in result["pages"] if page["status"] == 200]
+        marker = "✅" if pages else "❌"
+        print(f"\n{marker} {result['team']}: {len(pages)} pages"
+              + (f" ({result['over_budget']} links over budget)" if result["over_budget"] else ""))
+        for page in sorted(pages, key=lambda page: (-page["tables"], -page["score"]))[:5]:
+            if page["depth"] or page["tables"]:
+                print(f"   {'📊' if page['tables'] else '🔗'} {page['url']} (depth {page['depth']}, "
+                      f"score {page['score']}, {page['tables']} tables)")
+        for error in result["errors"][:3]:
+            print(f"   ⚠️  {error}")
+
+    print(f"\n📊 {sum(len(result['pages']) for result in results)} pages from {len(results)} sites "
+          f"in {time.perf_counter() - start:.1f}s ({crawler.seen.count} unique urls, "
+          f"{len(crawler.seen.bits) / 1024:.0f} KB filter)")
+    print(f"🕐 Finished at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+if __name__ == "__main__":
+    main()
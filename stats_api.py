@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+CJFL Stats API
+Read-only JSON API over the same functions the dashboards use (filter_data,
+leaderboards, team comparison). Plain ASGI app plus a small asyncio HTTP server,
+so it runs locally with no extra dependencies:
+
+    python stats_api.py --port 8000
+    uvicorn stats_api:app          # any ASGI server also works
+
+Endpoints (all GET):
+    /health
+    /players?season=2024&team=Calgary+Colts&position=QB&search=smith&page=1&page_size=50
+    /leaderboard?stat=Rushing+Yards&top=10&season=2024
+    /teams
+    /teams/compare?team1=Calgary+Colts&team2=Edmonton+Wildcats&season=2024
+"""
+
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import math
+import threading
+from collections import OrderedDict
+from urllib.parse import parse_qs
+
+import numpy as np
+
+from utils import (load_data, filter_data, add_derived_columns, get_top_players,
+                   calculate_team_stats, calculate_team_per_game)
+from shared_dataset import source_signature
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+MIN_COMPRESS_BYTES = 1024
+RESULT_CACHE_SIZE = 256
+
+STATUS_TEXT = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}
+
+class APIError(Exception):
+    """Error returned to the client as a JSON body"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+def _json_default(value):
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, np.floating):
+        return None if not math.isfinite(value) else float(value)
+    if isinstance(value, np.bool_):
+        return bool(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+def _records(frame):
+    """DataFrame rows as JSON-safe dicts (NaN/inf become null)"""
+    records = frame.to_dict(orient='records')
+    for record in records:
+        for key, value in record.items():
+            if isinstance(value, float) and not math.isfinite(value):
+                record[key] = None
+    return records
+
+def _accepts_gzip(accept_encoding):
+    """Whether an Accept-Encoding header allows gzip (q=0 refuses it, as does '*;q=0' without gzip listed)"""
+    qualities = {}
+    for part in accept_encoding.split(","):
+        coding, *parameters = [item.strip() for item in part.split(";")]
+        quality = 1.0
+        for parameter in parameters:
+            name, _, value = parameter.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding:
+            qualities[coding.lower()] = quality
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+def _ints(values, name):
+    try:
+        return [int(value) for value in values]
+    except ValueError:
+        raise APIError(400, f"'{name}' must be an integer")
+
+class StatsAPI:
+    """ASGI application serving the stats engine as JSON"""
+
+    def __init__(self, loader=load_data, source_files=None, cache_size=RESULT_CACHE_SIZE):
+        self.loader = loader
+        self.source_files = source_files
+        self.cache_size = cache_size
+        self.data = None
+        self.data_version = None
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()  # requests run in worker threads; data and cache are shared
+        self.routes = {
+            "/health": self.health,
+            "/players": self.players,
+            "/leaderboard": self.leaderboard,
+            "/teams": self.teams,
+            "/teams/compare": self.compare_teams
+        }
+
+    # Data and cache
+
+    def refresh_data(self):
+        """Reload the dataset when its source files change; clears the result cache"""
+        signature = json.dumps(source_signature(self.source_files), sort_keys=True)
+        if self.data is None or signature != self.data_version:
+            self.data = add_derived_columns(self.loader())
+            self.data_version = signature
+            self.cache.clear()
+        return self.data
+
+    def cached_response(self, path, params):
+        """Serialized body and ETag for a query, from the in-process LRU cache"""
+        key = (path, tuple(sorted((name, tuple(values)) for name, values in params.items())))
+        entry = self.cache.get(key)
+        if entry is not None:
+            self.cache.move_to_end(key)
+            return entry
+
+        payload = self.routes[path](params)
+        body = json.dumps(payload, default=_json_default, separators=(',', ':')).encode('utf-8')
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        entry = {"body": body, "etag": etag, "gzip": None}
+
+        self.cache[key] = entry
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return entry
+
+    # Query helpers
+
+    def filtered(self, params):
+        """Apply the dashboard filters (season/team/position/search) from query params"""
+        seasons = _ints(params.get("season", []), "season")
+        return filter_data(self.data, seasons, params.get("team", []), params.get("position", []),
+                           params.get("search", [""])[0])
+
+    @staticmethod
+    def paginate(frame, params):
+        page = _ints(params.get("page", ["1"]), "page")[0]
+        page_size = _ints(params.get("page_size", [str(DEFAULT_PAGE_SIZE)]), "page_size")[0]
+        if page < 1 or page_size < 1:
+            raise APIError(400, "'page' and 'page_size' must be positive")
+        page_size = min(page_size, MAX_PAGE_SIZE)
+
+        total = len(frame)
+        start = (page - 1) * page_size
+        return {
+            "page": page,
+            "page_size": page_size,
+            "total": total,
+            "pages": max(1, math.ceil(total / page_size)),
+            "data": _records(frame.iloc[start:start + page_size])
+        }
+
+    # Endpoints
+
+    def health(self, params):
+        return {"status": "ok", "rows": len(self.data)}
+
+    def players(self, params):
+        frame = self.filtered(params).sort_values(['Team', 'Player Name'], kind='stable')
+        return self.paginate(frame, params)
+
+    def leaderboard(self, params):
+        stat = params.get("stat", [None])[0]
+        if stat not in self.data.columns or self.data[stat].dtype.kind not in "iuf":
+            raise APIError(400, f"Unknown statistic: {stat}")
+        top_n = _ints(params.get("top", ["10"]), "top")[0]
+        if top_n < 1:
+            raise APIError(400, "'top' must be positive")
+        top_n = min(top_n, MAX_PAGE_SIZE)
+
+        leaders = get_top_players(self.filtered(params), stat, top_n)
+        columns = ['Player Name', 'Team', 'Position', 'Season', 'Games Played', stat]
+        return {"stat": stat, "data": _records(leaders[columns])}
+
+    def teams(self, params):
+        frame = self.filtered(params)
+        return {"data": sorted(frame['Team'].unique().tolist())}
+
+    def compare_teams(self, params):
+        team1 = params.get("team1", [None])[0]
+        team2 = params.get("team2", [None])[0]
+        if not team1 or not team2:
+            raise APIError(400, "'team1' and 'team2' are required")
+
+        frame = self.filtered({name: values for name, values in params.items() if name != "team"})
+        result = {}
+        for team in (team1, team2):
+            if team not in set(frame['Team']):
+                raise APIError(404, f"Unknown team: {team}")
+            totals = calculate_team_stats(frame, team)
+            result[team] = {"totals": totals, "per_game": calculate_team_per_game(totals)}
+        return {"teams": result}
+
+    # ASGI
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+        headers = {name.decode('latin-1').lower(): value.decode('latin-1') for name, value in scope.get("headers", [])}
+        # Loading, filtering and serializing are synchronous; keep them off the event loop
+        status, response_headers, body = await asyncio.to_thread(
+            self.handle, scope["method"], scope["path"], scope.get("query_string", b"").decode('latin-1'), headers
+        )
+
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(name.encode('latin-1'), value.encode('latin-1')) for name, value in response_headers]
+        })
+        await send({"type": "http.response.body", "body": body if scope["method"] != "HEAD" else b""})
+
+    def handle(self, method, path, query_string, headers):
+        """Build (status, headers, body) for one request"""
+        path = path.rstrip("/") or "/"
+        if method not in ("GET", "HEAD"):
+            return self.error(405, "Only GET is supported")
+        if path not in self.routes:
+            return self.error(404, f"Unknown endpoint: {path}")
+
+        try:
+            with self.lock:
+                self.refresh_data()
+                entry = self.cached_response(path, parse_qs(query_string))
+        except APIError as e:
+            return self.error(e.status, e.message)
+
+        response_headers = [
+            ("content-type", "application/json"),
+            ("etag", entry["etag"]),
+            ("cache-control", "no-cache"),
+            ("vary", "Accept-Encoding")
+        ]
+
+        if_none_match = headers.get("if-none-match", "")
+        if entry["etag"] in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*":
+            return 304, response_headers, b""
+
+        body = entry["body"]
+        if _accepts_gzip(headers.get("accept-encoding", "")) and len(body) >= MIN_COMPRESS_BYTES:
+            if entry["gzip"] is None:
+                entry["gzip"] = gzip.compress(body, compresslevel=6)
+            body = entry["gzip"]
+            response_headers.append(("content-encoding", "gzip"))
+
+        response_headers.append(("content-length", str(len(body))))
+        return 200, response_headers, body
+
+    @staticmethod
+    def error(status, message):
+        body = json.dumps({"error": message}).encode('utf-8')
+        return status, [("content-type", "application/json"), ("content-length", str(len(body)))], body
+
+app = StatsAPI()
+
+async def _handle_connection(asgi_app, reader, writer):
+    """Minimal HTTP/1.1 handling (GET/HEAD only, keep-alive) for the ASGI app"""
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            try:
+                method, target, version = request_line.decode('latin-1').strip().split(" ", 2)
+            except ValueError:
+                break
+
+            raw_headers = []
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode('latin-1').partition(":")
+                raw_headers.append((name.strip().lower().encode('latin-1'), value.strip().encode('latin-1')))
+
+            path, _, query = target.partition("?")
+            scope = {
+                "type": "http", "asgi": {"version": "3.0"}, "http_version": version.split("/")[-1],
+                "method": method.upper(), "path": path, "query_string": query.encode('latin-1'),
+                "headers": raw_headers
+            }
+            response = {}
+
+            async def receive():
+                return {"type": "http.request", "body": b"", "more_body": False}
+
+            async def send(message):
+                if message["type"] == "http.response.start":
+                    response.update(message)
+                else:
+                    response["body"] = response.get("body", b"") + message.get("body", b"")
+
+            await asgi_app(scope, receive, send)
+
+            status = response["status"]
+            keep_alive = dict(raw_headers).get(b"connection", b"").lower() != b"close" and version == "HTTP/1.1"
+            head = [f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}"]
+            head += [f"{name.decode('latin-1')}: {value.decode('latin-1')}" for name, value in response["headers"]]
+            if status == 304 or not any(name == b"content-length" for name, _ in response["headers"]):
+                head.append(f"content-length: {len(response.get('body', b''))}")
+            head.append(f"connection: {'keep-alive' if keep_alive else 'close'}")
+            writer.write(("\r\n".join(head) + "\r\n\r\n").encode('latin-1') + response.get("body", b""))
+            await writer.drain()
+
+            if not keep_alive:
+                break
+    except (ConnectionResetError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+async def serve(asgi_app=app, host="127.0.0.1", port=8000):
+    """Serve the ASGI app with the standard library asyncio server"""
+    server = await asyncio.start_server(lambda r, w: _handle_connection(asgi_app, r, w), host, port)
+    async with server:
+        await server.serve_forever()
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Serve the CJFL stats JSON API")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="Port (default: 8000)")
+    args = parser.parse_args()
+
+    print("🏈 CJFL STATS API")
+    print("=" * 50)
+    print(f"🌐 Listening on http://{args.host}:{args.port}")
+    print("⏹️  Press Ctrl+C to stop")
+
+    try:
+        asyncio.run(serve(app, args.host, args.port))
+    except KeyboardInterrupt:
+        print("\n👋 Goodbye!")
+
+if __name__ == "__main__":
+    main()
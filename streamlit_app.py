@@ -3,8 +3,22 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+import html
+import json
 import numpy as np
-from utils import load_data, filter_data, create_player_profile, create_team_comparison
+from shared_dataset import shared_dataset_enabled
+from utils import (load_data, filter_data, add_derived_columns, create_player_profile, create_team_comparison,
+                   create_leaderboard_chart, calculate_team_stats, calculate_team_per_game, file_signature)
+from chart_cache import ChartCache, chart_key
+from form_metrics import DEFAULT_WINDOW, FORM_STATS, form_column, last_column, load_form
+from game_stats import GAME_FILE, GameStatsStore
+from custom_metrics import METRICS_FILE, MetricEngine, add_metric, load_metrics, remove_metric
+from shared_dataset import source_signature
+from team_ratings import RESULTS_FILE, elo_win_probability, load_elo, load_results, power_rankings
+from fantasy_scoring import POINTS_COLUMN, RULES_FILE, FantasyScorer, load_rules, score_breakdown, weekly_scores
+from season_simulator import DEFAULT_SIMULATIONS, PLAYOFF_SPOTS, SCHEDULE_FILE, playoff_odds
+from shrinkage import DEFAULT_MIN_GAMES, RATE_STATS, RateShrinker, adjusted_column
+from bootstrap import DEFAULT_CONFIDENCE, PER_GAME_STATS, TOTAL_STATS, error_bars, player_intervals, team_intervals
 
 # Initialize chart counter for unique keys
 if 'chart_counter' not in st.session_state:
@@ -16,6 +30,29 @@ def get_next_chart_key():
     st.session_state.chart_counter += 1
     return key
 
+chart_cache = ChartCache()
+
+def chart_export_button(fig, file_stem):
+    """
+    Offer a PNG of a chart from the static image cache. Filtered or adjusted charts are rarely
+    pre-rendered, so a miss offers to render this exact figure once; later reruns hit the cache.
+    """
+    key = chart_key(fig, 'png')
+    image = chart_cache.lookup(fig, 'png')
+    if image is None and st.button("Render Chart as PNG", key=f"render_{file_stem}_{key[:16]}"):
+        with st.spinner("Rendering chart..."):
+            image = chart_cache.render(fig, 'png')
+        if image is None:
+            st.caption("Static export needs kaleido and Chrome installed.")
+    if image is not None:
+        st.download_button(
+            label="Export Chart as PNG",
+            data=image,
+            file_name=f"{file_stem}.png",
+            mime="image/png",
+            key=f"export_{get_next_chart_key()}"
+        )
+
 # Import new functions with fallback for deployment environments
 try:
     from utils import create_multi_player_profile, create_stat_comparison_chart
@@ -88,12 +125,73 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Load data
-@st.cache_data
 def load_cached_data():
     return load_data()
 
+# In shared dataset mode every session reuses the same memory-mapped frame;
+# st.cache_data would hand each session its own deserialized copy
+if shared_dataset_enabled():
+    load_cached_data = st.cache_resource(load_cached_data)
+else:
+    load_cached_data = st.cache_data(load_cached_data)
+
 data = load_cached_data()
 
+@st.cache_data
+def load_cached_form(game_file_signature):
+    # The signature (game file size and mtime) makes new box scores invalidate the cache
+    return load_form()
+
+@st.cache_resource
+def get_metric_engine(metrics_file_signature):
+    # Formulas are compiled once per version of the metrics file and shared by all sessions
+    return MetricEngine(load_metrics())
+
+@st.cache_resource
+def get_fantasy_scorer(rules_file_signature):
+    # Returns (scorer, error); a broken rules file falls back to the default rules
+    try:
+        return FantasyScorer(load_rules()), None
+    except ValueError as e:
+        return FantasyScorer(), str(e)
+
+@st.cache_resource
+def get_rate_shrinker():
+    # Shrinkage priors are fitted on the full league once per data version, not on the filtered view
+    return RateShrinker()
+
+@st.cache_data
+def load_cached_team_intervals(filter_signature, teams, _data):
+    # Resampled once per filter signature and team pair; the fixed seed keeps intervals stable across reruns
+    return team_intervals(_data, list(teams))
+
+@st.cache_data
+def load_cached_player_intervals(game_file_signature, players):
+    return player_intervals(GameStatsStore().load_games(), list(players))
+
+@st.cache_data
+def load_cached_weekly_scores(game_file_signature, rules_version, _rules):
+    return weekly_scores(GameStatsStore().load_games(), _rules)
+
+@st.cache_data
+def load_cached_power_rankings(results_file_signature, season):
+    # Elo picks up newly appended results; SRS is re-solved only when the results file changes
+    return power_rankings(load_results(), load_elo(), season)
+
+@st.cache_data
+def load_cached_playoff_odds(results_file_signature, schedule_file_signature, season):
+    # Re-simulated only when a result or scheduled game is added; the fixed seed keeps reruns identical
+    return playoff_odds(season, seed=0)
+
+# Custom metric and fantasy columns are computed once per data version, not on every rerun
+data_version = json.dumps(source_signature(), sort_keys=True)
+metric_engine = get_metric_engine(file_signature(METRICS_FILE))
+data = metric_engine.apply(data, version=data_version)
+custom_metric_names = metric_engine.names
+fantasy_scorer, fantasy_rules_error = get_fantasy_scorer(file_signature(RULES_FILE))
+data = fantasy_scorer.apply(data, data_version)
+data = get_rate_shrinker().apply(data, data_version)
+
 # Header
 st.title("🏈 CJFL Analytics Dashboard")
 st.markdown("**Canadian Junior Football League Player Statistics (2024 Season)**")
@@ -137,8 +235,43 @@ selected_positions = st.sidebar.multiselect(
 # Player search
 player_search = st.sidebar.text_input("Search Player", "")
 
+# Qualification for the per-game leaderboards
+min_games = st.sidebar.number_input(
+    "Minimum Games for Per-Game Leaders",
+    min_value=1,
+    value=DEFAULT_MIN_GAMES,
+    step=1,
+    help="Per-game leaderboards rank adjusted rates: each player's rate is pulled toward their position's "
+         "average, more strongly the fewer games they played."
+)
+
+# Custom metrics editor
+with st.sidebar.expander("📐 Custom Metrics"):
+    for metric in metric_engine.metrics:
+        st.caption(f"**{metric['name']}** = `{metric['expression']}`")
+    for name, error in metric_engine.errors.items():
+        st.warning(f"{name}: {error}")
+    
+    with st.form("add_custom_metric", clear_on_submit=True):
+        metric_name = st.text_input("Metric Name", placeholder="Defensive Impact")
+        metric_expression = st.text_input("Formula", placeholder="tackles + 5 * sacks + 8 * interceptions")
+        if st.form_submit_button("Add Metric"):
+            try:
+                add_metric(metric_name, metric_expression)
+                st.rerun()
+            except ValueError as e:
+                st.error(str(e))
+    
+    if custom_metric_names:
+        metric_to_remove = st.selectbox("Remove Metric", options=custom_metric_names)
+        if st.button("Remove"):
+            remove_metric(metric_to_remove)
+            st.rerun()
+
 # Filter data based on selections
 filtered_data = filter_data(data, selected_seasons, selected_teams, selected_positions, player_search)
+filter_signature = (data_version, tuple(selected_seasons), tuple(selected_teams), tuple(selected_positions),
+                    player_search)
 
 # Main content
 if filtered_data.empty:
@@ -163,19 +296,14 @@ else:
     st.header("🏆 Top 10 Players by Category")
     
     # Calculate additional statistics
-    filtered_data['Total Yards'] = filtered_data['Passing Yards'] + filtered_data['Rushing Yards'] + filtered_data['Receiving Yards']
-    filtered_data['Total Offensive Yards'] = filtered_data['Rushing Yards'] + filtered_data['Receiving Yards']
-    filtered_data['Yards per Game'] = filtered_data['Total Yards'] / filtered_data['Games Played']
-    filtered_data['Touchdowns per Game'] = filtered_data['Touchdowns'] / filtered_data['Games Played']
-    filtered_data['Tackles per Game'] = filtered_data['Tackles'] / filtered_data['Games Played']
-    filtered_data['Sacks per Game'] = filtered_data['Sacks'] / filtered_data['Games Played']
+    filtered_data = add_derived_columns(filtered_data)
     
     # Create tabs for all stat categories
     stat_tabs = st.tabs([
         "Passing Yards", "Rushing Yards", "Receiving Yards", "Total Yards", "Total Offensive Yards",
         "Touchdowns", "Touchdowns per Game", "Tackles", "Tackles per Game", "Sacks", "Sacks per Game",
         "Yards per Game", "Games Played"
-    ])
+    ] + custom_metric_names)
     
     stat_columns = {
         "Passing Yards": "Passing Yards",
@@ -192,49 +320,48 @@ else:
         "Yards per Game": "Yards per Game",
         "Games Played": "Games Played"
     }
+    stat_columns.update({name: name for name in custom_metric_names})
     
     for tab, (tab_name, column) in zip(stat_tabs, stat_columns.items()):
         with tab:
-            # Handle per-game stats that might have NaN values
-            if 'per Game' in column:
+            # Per-game stats rank qualified players by adjusted rate, with the raw rate alongside
+            if column in RATE_STATS:
+                valid_data = filtered_data[(filtered_data['Games Played'] >= min_games)
+                                           & filtered_data[adjusted_column(column)].notna()]
+                top_players = valid_data.nlargest(10, adjusted_column(column))[
+                    ['Player Name', 'Team', 'Position', 'Games Played', column, adjusted_column(column)]]
+            # Handle custom stats that might have NaN values
+            elif column in custom_metric_names:
                 valid_data = filtered_data[filtered_data[column].notna()]
                 top_players = valid_data.nlargest(10, column)[['Player Name', 'Team', 'Position', column]]
             else:
+                valid_data = filtered_data
                 top_players = filtered_data.nlargest(10, column)[['Player Name', 'Team', 'Position', column]]
             
             if not top_players.empty:
-                fig = px.bar(
-                    top_players,
-                    x=column,
-                    y='Player Name',
-                    color='Team',
-                    orientation='h',
-                    title=f"Top 10 Players by {tab_name}",
-                    labels={column: tab_name, 'Player Name': 'Player'},
-                    color_discrete_sequence=px.colors.qualitative.Set3
-                )
-                
-                fig.update_layout(
-                    plot_bgcolor='rgba(0,0,0,0)',
-                    paper_bgcolor='rgba(0,0,0,0)',
-                    font=dict(color='#fafafa'),
-                    xaxis=dict(gridcolor='#464646'),
-                    yaxis=dict(gridcolor='#464646')
-                )
+                chart_column = adjusted_column(column) if column in RATE_STATS else column
+                fig = create_leaderboard_chart(valid_data, chart_column, 10, f"Top 10 Players by {tab_name}")
                 
                 st.plotly_chart(fig, use_container_width=True, key=get_next_chart_key())
+                chart_export_button(fig, f"top_10_{column.lower().replace(' ', '_')}")
                 
                 # Display detailed table
                 st.subheader("📋 Detailed Rankings")
                 display_data = top_players.copy()
                 if column in ['Passing Yards', 'Rushing Yards', 'Receiving Yards', 'Total Yards', 'Total Offensive Yards']:
                     display_data[column] = display_data[column].apply(lambda x: f"{int(x):,}")
-                elif 'per Game' in column:
+                elif column in RATE_STATS:
+                    for col in [column, adjusted_column(column)]:
+                        display_data[col] = display_data[col].apply(lambda x: f"{x:.2f}")
+                elif column in custom_metric_names:
                     display_data[column] = display_data[column].apply(lambda x: f"{x:.2f}")
                 else:
                     display_data[column] = display_data[column].apply(lambda x: f"{int(x)}")
                 
                 st.dataframe(display_data, use_container_width=True)
+                if column in RATE_STATS:
+                    st.caption(f"Ranked by the adjusted rate (players with {min_games}+ games): the raw rate shrunk "
+                               "toward the position average, so short samples don't dominate.")
             else:
                 st.info(f"No valid data available for {tab_name}")
 
@@ -282,6 +409,15 @@ else:
                 st.metric("Sacks", int(player_info['Sacks']))
                 st.metric("Sacks per Game", f"{sacks_per_game:.2f}")
             
+            # Per-game ranges from resampling the player's box scores, when there are any
+            player_ranges = load_cached_player_intervals(file_signature(GAME_FILE), (selected_player_analysis,))
+            player_ranges = player_ranges[(player_ranges['Team'] == player_info['Team'])
+                                          & (player_ranges['Season'] == player_info['Season'])
+                                          & player_ranges['Stat'].isin(list(PER_GAME_STATS))]
+            if not player_ranges.empty:
+                st.caption(f"{DEFAULT_CONFIDENCE:.0%} bootstrap intervals from the box scores: " + " · ".join(
+                    f"{row['Stat']} {row['Lower']:.2f}–{row['Upper']:.2f}" for _, row in player_ranges.iterrows()))
+            
             # Create subplot for comprehensive stats
             fig = make_subplots(
                 rows=3, cols=3,
@@ -386,6 +522,97 @@ else:
                     st.write(f"{key}: {value}")
 
     # Team vs Team Comparison
+    st.header("📊 League Power Rankings")
+    
+    rankings = load_cached_power_rankings(file_signature(RESULTS_FILE), max(selected_seasons))
+    team_ratings = rankings.set_index('Team')
+    
+    if rankings.empty:
+        st.info("No game results yet. Import them with `python team_ratings.py import <file>` to rank teams by Elo and SRS.")
+    else:
+        col1, col2 = st.columns([3, 2])
+        
+        with col1:
+            fig = px.bar(
+                rankings.sort_values('Elo'),
+                x='Elo',
+                y='Team',
+                color='SRS',
+                orientation='h',
+                title=f"Team Elo Ratings ({max(selected_seasons)} Season)",
+                color_continuous_scale='RdYlGn'
+            )
+            
+            fig.update_layout(
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(color='#fafafa'),
+                xaxis=dict(gridcolor='#464646', range=[rankings['Elo'].min() - 50, rankings['Elo'].max() + 25]),
+                yaxis=dict(gridcolor='#464646')
+            )
+            
+            st.plotly_chart(fig, use_container_width=True, key=get_next_chart_key())
+        
+        with col2:
+            display_data = rankings[['Rank', 'Team', 'Wins', 'Losses', 'Elo', 'SRS', 'MOV', 'SOS']].copy()
+            display_data['Elo'] = display_data['Elo'].apply(lambda x: f"{x:.0f}")
+            for col in ['SRS', 'MOV', 'SOS']:
+                display_data[col] = display_data[col].apply(lambda x: f"{x:+.1f}")
+            st.dataframe(display_data, use_container_width=True, hide_index=True)
+        
+        st.caption("Elo is updated after every game (home edge and margin of victory included). "
+                   "SRS is the average points margin adjusted for strength of schedule (SOS).")
+    
+    odds = load_cached_playoff_odds(file_signature(RESULTS_FILE), file_signature(SCHEDULE_FILE), max(selected_seasons))
+    
+    if 'Remaining' in odds.columns and odds['Remaining'].sum() > 0:
+        st.subheader("🎲 Playoff Odds")
+        
+        col1, col2 = st.columns([3, 2])
+        
+        with col1:
+            chart_data = odds.melt(
+                id_vars=['Team', 'Conference'],
+                value_vars=['Playoff %', 'Conference Title %', 'Championship %'],
+                var_name='Outcome',
+                value_name='Probability'
+            )
+            fig = px.bar(
+                chart_data,
+                x='Probability',
+                y='Team',
+                color='Outcome',
+                barmode='group',
+                orientation='h',
+                facet_row='Conference',
+                title="Simulated Playoff and Championship Odds",
+                color_discrete_sequence=['#1f77b4', '#ff7f0e', '#2ca02c']
+            )
+            
+            fig.update_yaxes(matches=None, autorange='reversed')
+            fig.update_layout(
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(color='#fafafa'),
+                height=250 + 45 * len(odds),
+                xaxis=dict(gridcolor='#464646', range=[0, 100])
+            )
+            
+            st.plotly_chart(fig, use_container_width=True, key=get_next_chart_key())
+        
+        with col2:
+            display_data = odds[['Conference', 'Team', 'Wins', 'Losses', 'Projected Wins', 'Playoff %',
+                                 'Conference Title %', 'Championship %']].copy()
+            display_data['Projected Wins'] = display_data['Projected Wins'].apply(lambda x: f"{x:.1f}")
+            for col in ['Playoff %', 'Conference Title %', 'Championship %']:
+                display_data[col] = display_data[col].apply(lambda x: f"{x:.1f}%")
+            st.dataframe(display_data, use_container_width=True, hide_index=True)
+        
+        st.caption(f"{odds['Remaining'].sum() // 2} remaining games simulated {DEFAULT_SIMULATIONS:,} times at Elo "
+                   f"win probabilities. The top {PLAYOFF_SPOTS} in each conference make the playoffs; the PFC and "
+                   "BCFC champions meet in the western semifinal for a place in the Canadian Bowl against the "
+                   "OFC champion.")
+
     st.header("🏆 Team Comparison")
     
     col1, col2 = st.columns(2)
@@ -402,49 +629,17 @@ else:
         team2_data = filtered_data[filtered_data['Team'] == team2]
         
         # Calculate team statistics
-        team1_stats = {
-            'Total Yards': team1_data[['Passing Yards', 'Rushing Yards', 'Receiving Yards']].sum().sum(),
-            'Passing Yards': team1_data['Passing Yards'].sum(),
-            'Rushing Yards': team1_data['Rushing Yards'].sum(),
-            'Receiving Yards': team1_data['Receiving Yards'].sum(),
-            'Touchdowns': team1_data['Touchdowns'].sum(),
-            'Tackles': team1_data['Tackles'].sum(),
-            'Sacks': team1_data['Sacks'].sum(),
-            'Interceptions': team1_data['Interceptions'].sum(),
-            'Games Played': team1_data['Games Played'].sum(),
-            'Players': len(team1_data)
-        }
-        
-        team2_stats = {
-            'Total Yards': team2_data[['Passing Yards', 'Rushing Yards', 'Receiving Yards']].sum().sum(),
-            'Passing Yards': team2_data['Passing Yards'].sum(),
-            'Rushing Yards': team2_data['Rushing Yards'].sum(),
-            'Receiving Yards': team2_data['Receiving Yards'].sum(),
-            'Touchdowns': team2_data['Touchdowns'].sum(),
-            'Tackles': team2_data['Tackles'].sum(),
-            'Sacks': team2_data['Sacks'].sum(),
-            'Interceptions': team2_data['Interceptions'].sum(),
-            'Games Played': team2_data['Games Played'].sum(),
-            'Players': len(team2_data)
-        }
+        team1_stats = calculate_team_stats(filtered_data, team1)
+        team2_stats = calculate_team_stats(filtered_data, team2)
         
         # Calculate per-game averages
-        team1_games = team1_stats['Games Played']
-        team2_games = team2_stats['Games Played']
-        
-        team1_per_game = {
-            'Yards per Game': team1_stats['Total Yards'] / team1_games if team1_games > 0 else 0,
-            'Touchdowns per Game': team1_stats['Touchdowns'] / team1_games if team1_games > 0 else 0,
-            'Tackles per Game': team1_stats['Tackles'] / team1_games if team1_games > 0 else 0,
-            'Sacks per Game': team1_stats['Sacks'] / team1_games if team1_games > 0 else 0
-        }
-        
-        team2_per_game = {
-            'Yards per Game': team2_stats['Total Yards'] / team2_games if team2_games > 0 else 0,
-            'Touchdowns per Game': team2_stats['Touchdowns'] / team2_games if team2_games > 0 else 0,
-            'Tackles per Game': team2_stats['Tackles'] / team2_games if team2_games > 0 else 0,
-            'Sacks per Game': team2_stats['Sacks'] / team2_games if team2_games > 0 else 0
-        }
+        team1_per_game = calculate_team_per_game(team1_stats)
+        team2_per_game = calculate_team_per_game(team2_stats)
+        
+        # Bootstrap intervals (resampling each roster) for the chart error bars
+        team_ranges = load_cached_team_intervals(filter_signature, (team1, team2), filtered_data)
+        team1_ranges = team_ranges[team_ranges['Team'] == team1]
+        team2_ranges = team_ranges[team_ranges['Team'] == team2]
         
         # Display team comparison metrics
         st.subheader("📊 Team Performance Metrics")
@@ -467,6 +662,29 @@ else:
             st.metric(f"{team1} Sacks", int(team1_stats['Sacks']))
             st.metric(f"{team2} Sacks", int(team2_stats['Sacks']))
         
+        # Team strength from game results
+        if team1 in team_ratings.index and team2 in team_ratings.index:
+            rating1, rating2 = team_ratings.loc[team1], team_ratings.loc[team2]
+            
+            col1, col2, col3, col4 = st.columns(4)
+            
+            with col1:
+                st.metric(f"{team1} Elo", f"{rating1['Elo']:.0f}", f"#{rating1['Rank']} in league", delta_color="off")
+                st.metric(f"{team2} Elo", f"{rating2['Elo']:.0f}", f"#{rating2['Rank']} in league", delta_color="off")
+            
+            with col2:
+                st.metric(f"{team1} SRS", f"{rating1['SRS']:+.1f}")
+                st.metric(f"{team2} SRS", f"{rating2['SRS']:+.1f}")
+            
+            with col3:
+                st.metric(f"{team1} Record", f"{rating1['Wins']}-{rating1['Losses']}")
+                st.metric(f"{team2} Record", f"{rating2['Wins']}-{rating2['Losses']}")
+            
+            with col4:
+                win_probability = elo_win_probability(rating1['Elo'], rating2['Elo'])
+                st.metric(f"{team1} Win Chance", f"{win_probability:.0%}")
+                st.metric(f"{team2} Win Chance", f"{1 - win_probability:.0%}")
+        
         # Create comprehensive comparison charts
         comparison_tabs = st.tabs(["Total Stats", "Per Game Stats", "Offensive Breakdown", "Defensive Breakdown"])
         
@@ -477,8 +695,10 @@ else:
             team2_values = [team2_stats[cat] for cat in categories]
             
             fig = go.Figure()
-            fig.add_trace(go.Bar(name=team1, x=categories, y=team1_values, marker_color='rgb(55, 83, 109)'))
-            fig.add_trace(go.Bar(name=team2, x=categories, y=team2_values, marker_color='rgb(26, 118, 255)'))
+            fig.add_trace(go.Bar(name=team1, x=categories, y=team1_values, marker_color='rgb(55, 83, 109)',
+                                 error_y=error_bars(team1_ranges, categories)))
+            fig.add_trace(go.Bar(name=team2, x=categories, y=team2_values, marker_color='rgb(26, 118, 255)',
+                                 error_y=error_bars(team2_ranges, categories)))
             
             fig.update_layout(
                 title=f"Total Statistics Comparison: {team1} vs {team2}",
@@ -499,8 +719,10 @@ else:
             team2_per_game_values = [team2_per_game[cat] for cat in per_game_categories]
             
             fig = go.Figure()
-            fig.add_trace(go.Bar(name=team1, x=per_game_categories, y=team1_per_game_values, marker_color='rgb(55, 83, 109)'))
-            fig.add_trace(go.Bar(name=team2, x=per_game_categories, y=team2_per_game_values, marker_color='rgb(26, 118, 255)'))
+            fig.add_trace(go.Bar(name=team1, x=per_game_categories, y=team1_per_game_values, marker_color='rgb(55, 83, 109)',
+                                 error_y=error_bars(team1_ranges, per_game_categories)))
+            fig.add_trace(go.Bar(name=team2, x=per_game_categories, y=team2_per_game_values, marker_color='rgb(26, 118, 255)',
+                                 error_y=error_bars(team2_ranges, per_game_categories)))
             
             fig.update_layout(
                 title=f"Per Game Statistics Comparison: {team1} vs {team2}",
@@ -521,8 +743,10 @@ else:
             team2_offensive = [team2_stats[cat] for cat in offensive_categories]
             
             fig = go.Figure()
-            fig.add_trace(go.Bar(name=team1, x=offensive_categories, y=team1_offensive, marker_color='rgb(55, 83, 109)'))
-            fig.add_trace(go.Bar(name=team2, x=offensive_categories, y=team2_offensive, marker_color='rgb(26, 118, 255)'))
+            fig.add_trace(go.Bar(name=team1, x=offensive_categories, y=team1_offensive, marker_color='rgb(55, 83, 109)',
+                                 error_y=error_bars(team1_ranges, offensive_categories)))
+            fig.add_trace(go.Bar(name=team2, x=offensive_categories, y=team2_offensive, marker_color='rgb(26, 118, 255)',
+                                 error_y=error_bars(team2_ranges, offensive_categories)))
             
             fig.update_layout(
                 title=f"Offensive Statistics Comparison: {team1} vs {team2}",
@@ -543,8 +767,10 @@ else:
             team2_defensive = [team2_stats[cat] for cat in defensive_categories]
             
             fig = go.Figure()
-            fig.add_trace(go.Bar(name=team1, x=defensive_categories, y=team1_defensive, marker_color='rgb(55, 83, 109)'))
-            fig.add_trace(go.Bar(name=team2, x=defensive_categories, y=team2_defensive, marker_color='rgb(26, 118, 255)'))
+            fig.add_trace(go.Bar(name=team1, x=defensive_categories, y=team1_defensive, marker_color='rgb(55, 83, 109)',
+                                 error_y=error_bars(team1_ranges, defensive_categories)))
+            fig.add_trace(go.Bar(name=team2, x=defensive_categories, y=team2_defensive, marker_color='rgb(26, 118, 255)',
+                                 error_y=error_bars(team2_ranges, defensive_categories)))
             
             fig.update_layout(
                 title=f"Defensive Statistics Comparison: {team1} vs {team2}",
@@ -557,7 +783,16 @@ else:
             )
             
             st.plotly_chart(fig, use_container_width=True, key=get_next_chart_key())
+
+        st.caption(f"Error bars: {DEFAULT_CONFIDENCE:.0%} bootstrap intervals from resampling each team's roster. "
+                   "Overlapping bars mean the gap could come down to a player or two.")
         
+        # Static export of the standard team comparison chart
+        chart_export_button(
+            create_team_comparison(filtered_data, team1, team2),
+            f"team_comparison_{team1.lower().replace(' ', '_')}_vs_{team2.lower().replace(' ', '_')}"
+        )
+
         # Team roster comparison
         st.subheader("👥 Team Roster Comparison")
         
@@ -597,9 +832,9 @@ else:
                 with col1:
                     st.markdown(f"""
                     <div class="player-card player-card-1">
-                        <h3>{player_info['Player Name']}</h3>
-                        <p><strong>Team:</strong> {player_info['Team']}</p>
-                        <p><strong>Position:</strong> {player_info['Position']}</p>
+                        <h3>{html.escape(str(player_info['Player Name']))}</h3>
+                        <p><strong>Team:</strong> {html.escape(str(player_info['Team']))}</p>
+                        <p><strong>Position:</strong> {html.escape(str(player_info['Position']))}</p>
                         <p><strong>Games Played:</strong> {player_info['Games Played']}</p>
                     </div>
                     """, unsafe_allow_html=True)
@@ -620,6 +855,8 @@ else:
                         <p><strong>Touchdowns:</strong> {int(player_info['Touchdowns'])}</p>
                         <p><strong>Tackles:</strong> {int(player_info['Tackles'])}</p>
                         <p><strong>Sacks:</strong> {int(player_info['Sacks'])}</p>
+                        {"".join(f"<p><strong>{html.escape(name)}:</strong> {player_info[name]:.2f}</p>"
+                                 for name in custom_metric_names if pd.notna(player_info[name]))}
                     </div>
                     """, unsafe_allow_html=True)
         
@@ -641,11 +878,13 @@ else:
                 # Prepare comparison table
                 comparison_table = comparison_data[['Player Name', 'Team', 'Position', 'Games Played', 
                                                  'Passing Yards', 'Rushing Yards', 'Receiving Yards', 
-                                                 'Touchdowns', 'Tackles', 'Sacks']].copy()
+                                                 'Touchdowns', 'Tackles', 'Sacks'] + custom_metric_names].copy()
                 
                 # Format numbers for better display
                 for col in ['Passing Yards', 'Rushing Yards', 'Receiving Yards']:
                     comparison_table[col] = comparison_table[col].apply(lambda x: f"{int(x):,}")
+                for col in custom_metric_names:
+                    comparison_table[col] = comparison_table[col].apply(lambda x: f"{x:.2f}" if pd.notna(x) else "-")
                 
                 st.dataframe(comparison_table, use_container_width=True)
                 
@@ -653,12 +892,30 @@ else:
                 st.subheader("📈 Performance Comparison")
                 
                 # Select stat to compare
-                stat_options = ['Passing Yards', 'Rushing Yards', 'Receiving Yards', 'Touchdowns', 'Tackles', 'Sacks']
+                stat_options = ['Passing Yards', 'Rushing Yards', 'Receiving Yards', 'Touchdowns', 'Tackles', 'Sacks'] + custom_metric_names
                 selected_stat = st.selectbox("Select Statistic to Compare", options=stat_options)
                 
                 if selected_stat:
-                    comparison_chart = create_stat_comparison_chart(comparison_data, selected_stat)
+                    # Error bars from each player's box scores, for the stats the box scores carry. Only drawn
+                    # when the box scores add up to the season total on the bar (and the player has one bar);
+                    # otherwise the interval would sit around a different number.
+                    player_errors = {}
+                    if selected_stat in TOTAL_STATS:
+                        player_ranges = load_cached_player_intervals(file_signature(GAME_FILE),
+                                                                     tuple(selected_players_profile))
+                        single_bar = comparison_data[~comparison_data['Player Name'].duplicated(keep=False)]
+                        player_ranges = player_ranges[player_ranges['Stat'] == selected_stat].merge(
+                            single_bar[['Player Name', 'Team', 'Season', selected_stat]],
+                            on=['Player Name', 'Team', 'Season'])
+                        player_ranges = player_ranges[np.isclose(player_ranges['Value'].astype(float),
+                                                                 player_ranges[selected_stat].astype(float))]
+                        player_errors = {name: error_bars(rows, [selected_stat])
+                                         for name, rows in player_ranges.groupby('Player Name')}
+                    comparison_chart = create_stat_comparison_chart(comparison_data, selected_stat, player_errors)
                     st.plotly_chart(comparison_chart, use_container_width=True, key=get_next_chart_key())
+                    if player_errors:
+                        st.caption(f"Error bars: {DEFAULT_CONFIDENCE:.0%} bootstrap intervals from resampling each "
+                                   "player's games.")
                 
                 # Individual player cards
                 st.subheader("👤 Individual Player Details")
@@ -677,9 +934,9 @@ else:
                             card_class = f"player-card player-card-{i+1}"
                             st.markdown(f"""
                             <div class="{card_class}">
-                                <h4>{player_info['Player Name']}</h4>
-                                <p><strong>Team:</strong> {player_info['Team']}</p>
-                                <p><strong>Position:</strong> {player_info['Position']}</p>
+                                <h4>{html.escape(str(player_info['Player Name']))}</h4>
+                                <p><strong>Team:</strong> {html.escape(str(player_info['Team']))}</p>
+                                <p><strong>Position:</strong> {html.escape(str(player_info['Position']))}</p>
                                 <p><strong>Games:</strong> {player_info['Games Played']}</p>
                                 <p><strong>Passing:</strong> {int(player_info['Passing Yards']):,}</p>
                                 <p><strong>Rushing:</strong> {int(player_info['Rushing Yards']):,}</p>
@@ -693,18 +950,10 @@ else:
     # Top Performers Section
     st.header("🏆 Top Performers (2024 Season)")
     
-    # Calculate additional statistics for top performers
-    filtered_data['Total Yards'] = filtered_data['Passing Yards'] + filtered_data['Rushing Yards'] + filtered_data['Receiving Yards']
-    filtered_data['Total Offensive Yards'] = filtered_data['Rushing Yards'] + filtered_data['Receiving Yards']
-    filtered_data['Yards per Game'] = filtered_data['Total Yards'] / filtered_data['Games Played']
-    filtered_data['Touchdowns per Game'] = filtered_data['Touchdowns'] / filtered_data['Games Played']
-    filtered_data['Tackles per Game'] = filtered_data['Tackles'] / filtered_data['Games Played']
-    filtered_data['Sacks per Game'] = filtered_data['Sacks'] / filtered_data['Games Played']
-    
     # Create comprehensive top performers analysis
     top_performers_tabs = st.tabs([
         "Total Yards", "Passing Leaders", "Rushing Leaders", "Receiving Leaders",
-        "Touchdown Leaders", "Tackle Leaders", "Sack Leaders", "Per Game Leaders"
+        "Touchdown Leaders", "Tackle Leaders", "Sack Leaders", "Per Game Leaders", "Current Form", "Fantasy Leaders"
     ])
     
     with top_performers_tabs[0]:
@@ -933,21 +1182,25 @@ else:
         # Per Game Leaders
         st.subheader("📊 Per Game Performance Leaders")
         
+        qualified_data = filtered_data[filtered_data['Games Played'] >= min_games]
+        yards_column, tds_column = adjusted_column('Yards per Game'), adjusted_column('Touchdowns per Game')
+        
         col1, col2 = st.columns(2)
         
         with col1:
             # Yards per Game Leaders
-            top_yards_per_game = filtered_data[filtered_data['Yards per Game'].notna()].nlargest(10, 'Yards per Game')
+            top_yards_per_game = qualified_data[qualified_data[yards_column].notna()].nlargest(10, yards_column)
             
             if not top_yards_per_game.empty:
                 fig = px.bar(
                     top_yards_per_game,
-                    x='Yards per Game',
+                    x=yards_column,
                     y='Player Name',
                     color='Team',
                     orientation='h',
                     title="Top 10 Players by Yards per Game",
-                    labels={'Yards per Game': 'Yards per Game', 'Player Name': 'Player'},
+                    hover_data=['Games Played', 'Yards per Game'],
+                    labels={yards_column: 'Yards per Game (Adjusted)', 'Player Name': 'Player'},
                     color_discrete_sequence=px.colors.qualitative.Set3
                 )
                 
@@ -963,17 +1216,18 @@ else:
         
         with col2:
             # Touchdowns per Game Leaders
-            top_tds_per_game = filtered_data[filtered_data['Touchdowns per Game'].notna()].nlargest(10, 'Touchdowns per Game')
+            top_tds_per_game = qualified_data[qualified_data[tds_column].notna()].nlargest(10, tds_column)
             
             if not top_tds_per_game.empty:
                 fig = px.bar(
                     top_tds_per_game,
-                    x='Touchdowns per Game',
+                    x=tds_column,
                     y='Player Name',
                     color='Team',
                     orientation='h',
                     title="Top 10 Players by Touchdowns per Game",
-                    labels={'Touchdowns per Game': 'Touchdowns per Game', 'Player Name': 'Player'},
+                    hover_data=['Games Played', 'Touchdowns per Game'],
+                    labels={tds_column: 'Touchdowns per Game (Adjusted)', 'Player Name': 'Player'},
                     color_discrete_sequence=px.colors.qualitative.Set3
                 )
                 
@@ -994,15 +1248,94 @@ else:
         
         with col1:
             st.write("**Top 10 Yards per Game**")
-            yards_per_game_data = filtered_data[filtered_data['Yards per Game'].notna()].nlargest(10, 'Yards per Game')[['Player Name', 'Team', 'Position', 'Games Played', 'Yards per Game']].copy()
-            yards_per_game_data['Yards per Game'] = yards_per_game_data['Yards per Game'].apply(lambda x: f"{x:.1f}")
+            yards_per_game_data = top_yards_per_game[['Player Name', 'Team', 'Position', 'Games Played', 'Yards per Game', yards_column]].copy()
+            for col in ['Yards per Game', yards_column]:
+                yards_per_game_data[col] = yards_per_game_data[col].apply(lambda x: f"{x:.1f}")
             st.dataframe(yards_per_game_data, use_container_width=True)
         
         with col2:
             st.write("**Top 10 Touchdowns per Game**")
-            tds_per_game_data = filtered_data[filtered_data['Touchdowns per Game'].notna()].nlargest(10, 'Touchdowns per Game')[['Player Name', 'Team', 'Position', 'Games Played', 'Touchdowns per Game']].copy()
-            tds_per_game_data['Touchdowns per Game'] = tds_per_game_data['Touchdowns per Game'].apply(lambda x: f"{x:.2f}")
+            tds_per_game_data = top_tds_per_game[['Player Name', 'Team', 'Position', 'Games Played', 'Touchdowns per Game', tds_column]].copy()
+            for col in ['Touchdowns per Game', tds_column]:
+                tds_per_game_data[col] = tds_per_game_data[col].apply(lambda x: f"{x:.2f}")
             st.dataframe(tds_per_game_data, use_container_width=True)
+        
+        st.caption(f"Players with {min_games}+ games, ranked by adjusted rate: each raw rate is shrunk toward the "
+                   "position average by an empirical-Bayes prior, so a few big games can't outrank a full season.")
+    
+    with top_performers_tabs[8]:
+        # Recent form from the box scores, next to the season per-game averages
+        st.subheader(f"🔥 Current Form (last {DEFAULT_WINDOW} games and weighted form)")
+        form = load_cached_form(file_signature(GAME_FILE))
+        
+        if form.empty:
+            st.info("No box scores yet. Import them with `python game_stats.py import <file>` to see recent form.")
+        else:
+            form_stat = st.selectbox("Form Stat", options=FORM_STATS, key="form_stat")
+            season_column = {'Total Yards': 'Yards per Game', 'Touchdowns': 'Touchdowns per Game',
+                             'Tackles': 'Tackles per Game', 'Sacks': 'Sacks per Game'}.get(form_stat)
+            form_data = filtered_data.merge(form, on=['Player Name', 'Team', 'Season'], how='inner')
+            
+            if form_data.empty:
+                st.info("No box scores for the players in the current filters.")
+            else:
+                columns = ['Player Name', 'Team', 'Position', 'Games Played', 'Form Games']
+                columns += [season_column] if season_column else []
+                columns += [last_column(form_stat, DEFAULT_WINDOW), form_column(form_stat)]
+                form_leaders = form_data.nlargest(15, form_column(form_stat))[columns].copy()
+                for column in columns[5:]:
+                    form_leaders[column] = form_leaders[column].apply(lambda x: f"{x:.2f}")
+                st.dataframe(form_leaders, use_container_width=True)
+    
+    with top_performers_tabs[9]:
+        # Fantasy contest scoring
+        rules = fantasy_scorer.rules
+        st.caption(f"Scoring: {rules.get('name', 'Custom rules')} (version {fantasy_scorer.version}) · "
+                   + ", ".join(f"{points:g} per {stat.lower().rstrip('s')}" for stat, points in rules['points'].items()))
+        if fantasy_rules_error:
+            st.warning(f"Could not use {RULES_FILE} ({fantasy_rules_error}); showing the default scoring.")
+        
+        top_fantasy = filtered_data.nlargest(15, POINTS_COLUMN)
+        
+        if not top_fantasy.empty:
+            fig = px.bar(
+                top_fantasy,
+                x=POINTS_COLUMN,
+                y='Player Name',
+                color='Team',
+                orientation='h',
+                title="Top 15 Fantasy Scorers (2024 Season)",
+                labels={POINTS_COLUMN: 'Fantasy Points', 'Player Name': 'Player'},
+                color_discrete_sequence=px.colors.qualitative.Set3
+            )
+            
+            fig.update_layout(
+                plot_bgcolor='rgba(0,0,0,0)',
+                paper_bgcolor='rgba(0,0,0,0)',
+                font=dict(color='#fafafa'),
+                xaxis=dict(gridcolor='#464646'),
+                yaxis=dict(gridcolor='#464646')
+            )
+            
+            st.plotly_chart(fig, use_container_width=True, key=get_next_chart_key())
+            
+            # Detailed table with the points from each stat
+            st.subheader("📋 Top 15 Fantasy Leaders")
+            breakdown = score_breakdown(top_fantasy, rules).drop(columns=POINTS_COLUMN)
+            display_data = top_fantasy[['Player Name', 'Team', 'Position', 'Games Played', POINTS_COLUMN]].join(breakdown)
+            games_played = display_data['Games Played'].where(display_data['Games Played'] > 0)
+            display_data.insert(5, 'Points per Game', display_data[POINTS_COLUMN] / games_played)
+            for column in display_data.columns[4:]:
+                display_data[column] = display_data[column].apply(lambda x: f"{x:.1f}" if pd.notna(x) else "")
+            st.dataframe(display_data, use_container_width=True)
+        
+        weekly = load_cached_weekly_scores(file_signature(GAME_FILE), fantasy_scorer.version, rules)
+        weekly = filter_data(weekly, selected_seasons, selected_teams, selected_positions, player_search)
+        if not weekly.empty:
+            st.subheader("🔥 Best Single-Week Scores")
+            display_data = weekly.head(10).copy()
+            display_data[POINTS_COLUMN] = display_data[POINTS_COLUMN].apply(lambda x: f"{x:.1f}")
+            st.dataframe(display_data, use_container_width=True)
 
     # Download filtered data
     st.header("📥 Download Data")
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+CJFL Team Collectors
+One collector framework for every team in the collection plan.
+
+TeamCollector holds the shared fetch, parse, validation and write paths; a team with
+site-specific quirks gets an adapter subclass registered with @register_collector,
+everything else uses TeamCollector as-is. All collectors share one HTTP session
+(connection pool) and one page cache, and run_collectors() runs them concurrently,
+then merges everything they found into data/cjfl_stats.csv in a single write. The
+command line runner keeps every fetched page in the page archive (page_archive.py).
+
+    python team_collectors.py                       # all teams, in parallel
+    python team_collectors.py --team "Calgary Colts" --dry-run
+"""
+
+import argparse
+import importlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+import pandas as pd
+import requests
+
+from bulk_import import DATA_FILE, OUTPUT_COLUMNS, DEFAULT_SEASON, dataset_lock, validate_chunk, merge_rows, write_atomic
+from player_identity import load_identity_map
+from collector_daemon import REQUEST_TIMEOUT, USER_AGENT, extract_tables, extract_links
+from keyword_scanner import KeywordAutomaton, scan_html
+from page_archive import PageArchive
+from progress_store import ProgressStore
+
+DEFAULT_WORKERS = 8
+SECTION_KEYWORDS = ['roster', 'players', 'team', 'stats', 'statistics', 'schedule', 'news']
+SECTION_SCANNER = KeywordAutomaton(SECTION_KEYWORDS)
+
+# Modules that define team adapters; imported on first use so they can register themselves
+ADAPTER_MODULES = ["collect_calgary_colts_data"]
+
+COLLECTORS = {}
+
+def register_collector(team_name):
+    """Class decorator registering an adapter for one team"""
+    def decorator(cls):
+        COLLECTORS[team_name] = cls
+        return cls
+    return decorator
+
+class PageCache:
+    """Thread-safe page cache shared by all collectors in a run (each url is fetched once)"""
+
+    def __init__(self):
+        self.pages = {}
+        self.lock = threading.Lock()
+        self.url_locks = {}
+
+    def get(self, url, fetch):
+        with self.lock:
+            if url in self.pages:
+                return self.pages[url]
+            url_lock = self.url_locks.setdefault(url, threading.Lock())
+        with url_lock:
+            if url not in self.pages:
+                self.pages[url] = fetch(url)
+            return self.pages[url]
+
+def create_session(pool_size=DEFAULT_WORKERS):
+    """HTTP session with a connection pool large enough for the runner's threads"""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+class TeamCollector:
+    """Default collector: team website plus the roster/stats pages it links to"""
+
+    max_depth = 1
+
+    def __init__(self, team_name, info=None, session=None, cache=None, season=DEFAULT_SEASON, archive=None):
+        info = info or {}
+        self.team_name = team_name
+        self.info = info
+        self.website = info.get("website", "")
+        self.social_media = info.get("social_media", [])
+        self.contact_email = info.get("contact", "")
+        self.data_file = DATA_FILE
+        self.template_file = "data/cjfl_real_data_template.csv"
+        self.session = session or create_session(1)
+        self.cache = cache or PageCache()
+        self.season = season
+        self.archive = archive
+
+    def social_link(self, network):
+        """First social media address for a network (e.g. 'facebook'), or an empty string"""
+        return next((url for url in self.social_media if network in url), "")
+
+    # Shared fetch path
+
+    def _get(self, url):
+        response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return response.text
+
+    def fetch(self, url):
+        """Page HTML, fetched at most once per run"""
+        return self.cache.get(url, self._get)
+
+    # Adapter hooks
+
+    def start_urls(self):
+        """Pages to start from; adapters add known roster/stats addresses"""
+        return [self.website] if self.website else []
+
+    def find_links(self, html, url):
+        """Pages worth following from a fetched page"""
+        return extract_links(html, url)
+
+    def parse_tables(self, html, url):
+        """Raw player tables on a page (dataset column names, values as text)"""
+        return extract_tables(html)
+
+    # Shared parse / validation path
+
+    def find_sections(self, html):
+        """Navigation links that look like roster, stats or news sections, as (text, href)"""
+        return [(link["text"], link["href"]) for link in scan_html(html, SECTION_SCANNER)["links"]]
+
+    def collect(self):
+        """
+        Crawl this team's pages and validate every player table found.
+        Returns a result dict; nothing is written here so the runner can merge all teams at once.
+        """
+        result = {"team": self.team_name, "pages": [], "errors": [], "players": None, "rejected": 0}
+        queue = [(url, 0) for url in self.start_urls()]
+        visited = set()
+        valid_frames = []
+
+        while queue:
+            url, depth = queue.pop(0)
+            if url in visited:
+                continue
+            visited.add(url)
+            try:
+                html = self.fetch(url)
+            except requests.RequestException as e:
+                result["errors"].append(f"{url}: {e}")
+                continue
+            result["pages"].append(url)
+            if self.archive is not None:
+                self.archive.store(url, html, team=self.team_name)
+
+            for table in self.parse_tables(html, url):
+                valid, rejected = validate_chunk(table, team=self.team_name, season=self.season)
+                valid_frames.append(valid)
+                result["rejected"] += len(rejected)
+            if depth < self.max_depth:
+                queue.extend((link, depth + 1) for link in self.find_links(html, url) if link not in visited)
+
+        result["players"] = pd.concat(valid_frames) if valid_frames else pd.DataFrame(columns=OUTPUT_COLUMNS)
+        return result
+
+    # Shared write path
+
+    def update_progress(self, status="in_progress", players_collected=0, notes="", data_source=None):
+        """Record collection progress for this team"""
+        ProgressStore().update_team(self.team_name, status=status, notes=notes, add_players=players_collected,
+                                    data_source=data_source)
+        print(f"✅ Progress updated: {self.team_name} - {status}")
+
+    def add_player_data(self, player_data):
+        """Validate one player record and merge it into the dataset"""
+        valid, rejected = validate_chunk(pd.DataFrame([player_data]), team=self.team_name, season=self.season)
+        if not rejected.empty:
+            print(f"❌ Rejected {player_data.get('Player Name', '')}: {rejected['Reason'].iloc[0]}")
+            return False
+        store_players(valid, self.data_file)
+        print(f"✅ Added player data: {player_data['Player Name']}")
+        return True
+
+def load_adapters():
+    """Import the adapter modules so their @register_collector decorators run"""
+    for module in ADAPTER_MODULES:
+        importlib.import_module(module)
+
+def get_collector(team_name, info=None, **kwargs):
+    """Registered adapter for the team, or the default TeamCollector"""
+    load_adapters()
+    return COLLECTORS.get(team_name, TeamCollector)(team_name, info, **kwargs)
+
+def store_players(players, data_file=DATA_FILE):
+    """Merge validated players into the dataset in one atomic write; returns (added rows, updated count)"""
+    with dataset_lock(data_file):
+        existing = pd.read_csv(data_file) if os.path.exists(data_file) else pd.DataFrame(columns=OUTPUT_COLUMNS)
+        merged, added_rows, updated, _ = merge_rows(existing, players, mapping=load_identity_map())
+        if len(added_rows) or updated:
+            write_atomic(merged, data_file)
+    return added_rows, updated
+
+def run_collectors(teams=None, only_teams=None, max_workers=DEFAULT_WORKERS, data_file=DATA_FILE,
+                   progress_store=None, dry_run=False, session=None, archive=None):
+    """
+    Run every team's collector concurrently with a shared session and page cache,
+    then write all players found in one merge and record progress per team.
+    """
+    if teams is None:
+        from data_collection_plan import TEAMS
+        teams = TEAMS
+    selected = {name: info for name, info in teams.items() if not only_teams or name in only_teams}
+
+    session = session or create_session(max_workers)
+    cache = PageCache()
+    collectors = [get_collector(name, info, session=session, cache=cache, archive=archive)
+                  for name, info in selected.items()]
+
+    results = []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(collector.collect): collector for collector in collectors}
+        for future in as_completed(futures):
+            results.append(future.result())
+
+    found = [result["players"] for result in results if not result["players"].empty]
+    players = pd.concat(found) if found else pd.DataFrame(columns=OUTPUT_COLUMNS)
+    added_by_team, updated = {}, 0
+    if not dry_run and not players.empty:
+        added_rows, updated = store_players(players, data_file)
+        added_by_team = added_rows['Team'].value_counts().to_dict()
+
+    if not dry_run:
+        store = progress_store or ProgressStore()
+        for result in results:
+            added = added_by_team.get(result["team"], 0)
+            for index, url in enumerate(result["pages"] or [None]):
+                store.update_team(result["team"], add_players=added if index == 0 else 0, data_source=url,
+                                  default_status="in_progress", actor="team_collectors")
+
+    for result in results:
+        result["added"] = added_by_team.get(result["team"], 0)
+    return sorted(results, key=lambda result: result["team"]), updated
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Collect player stats from all team websites in parallel")
+    parser.add_argument("--team", action="append", help="Only collect this team (can be repeated)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Parallel collectors (default: 8)")
+    parser.add_argument("--data-file", default=DATA_FILE, help=f"Dataset to update (default: {DATA_FILE})")
+    parser.add_argument("--dry-run", action="store_true", help="Collect and validate only, do not write")
+    parser.add_argument("--no-archive", action="store_true", help="Don't keep the fetched pages in the page archive")
+    args = parser.parse_args()
+
+    print("🏈 CJFL TEAM COLLECTORS")
+    print("=" * 50)
+
+    start = time.perf_counter()
+    results, updated = run_collectors(only_teams=args.team, max_workers=args.workers, data_file=args.data_file,
+                                      dry_run=args.dry_run, archive=None if args.no_archive else PageArchive())
+
+    for result in results:
+        marker = "✅" if result["pages"] else "❌"
+        print(f"{marker} {result['team']}: {len(result['pages'])} pages, {len(result['players'])} players "
+              f"({result['added']} new, {result['rejected']} rejected)")
+        for error in result["errors"]:
+            print(f"   ⚠️  {error}")
+
+    print(f"\n📊 {sum(result['added'] for result in results)} players added, {updated} updated "
+          f"in {time.perf_counter() - start:.1f}s")
+    print(f"🕐 Finished at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+if __name__ == "__main__":
+    main()
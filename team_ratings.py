@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+CJFL Team Ratings
+Team strength from game results: Elo ratings updated game by game, and the Simple
+Rating System (SRS) solved once per season.
+
+Results are appended to data/cjfl_game_results.csv, one row per game with the home
+and away score. Elo is incremental. The ratings are saved together with how far into
+the results file they got, so each refresh only plays the games added since, in date
+order. A replaced results file, or a result dated before the last game played (an
+older season imported late, say), makes the tracker replay every game. Ratings regress a third of the way to the league average between seasons. SRS
+rates every team by points margin adjusted for opponents. It is one sparse linear
+least-squares system per season: rating(home) - rating(away) + home edge = margin for
+every game, with the ratings summing to zero. scipy's sparse solver is used when
+installed, NumPy's dense solver otherwise (a season is only ~20 teams).
+
+    python team_ratings.py import week5_results.csv
+    python team_ratings.py rankings --season 2024
+    python team_ratings.py rebuild
+"""
+
+import argparse
+import json
+import math
+import os
+
+import numpy as np
+import pandas as pd
+
+try:
+    from scipy import sparse
+    from scipy.sparse.linalg import lsqr
+except ImportError:  # numpy's dense least squares handles league-sized systems
+    sparse = None
+
+from game_stats import read_csv_since, read_fingerprint
+from utils import atomic_path
+
+RESULTS_FILE = "data/cjfl_game_results.csv"
+ELO_STATE_FILE = "data/elo_state.json"
+RESULT_COLUMNS = ['Game ID', 'Season', 'Week', 'Game Date', 'Home Team', 'Away Team', 'Home Score', 'Away Score']
+GAME_ORDER = ['Season', 'Week', 'Game Date', 'Game ID']
+
+ELO_INITIAL = 1500.0
+ELO_K = 20.0
+ELO_HOME_ADVANTAGE = 50.0   # Elo points added to the home team when predicting
+ELO_SEASON_CARRYOVER = 2 / 3  # share of a team's distance from the mean kept into the next season
+
+def validate_game_table(table, number_columns, columns):
+    """
+    Column-wise checks shared by game results and schedules: a game id and two different teams,
+    and whole, non-negative number_columns. Returns (valid rows in `columns` layout, rejected rows
+    with a 'Reason' column).
+    """
+    rows = pd.DataFrame(index=table.index)
+    for column in ['Game ID', 'Game Date', 'Home Team', 'Away Team']:
+        rows[column] = table[column].astype(str).str.strip() if column in table else ""
+    for column in number_columns:
+        rows[column] = pd.to_numeric(table[column], errors='coerce') if column in table else np.nan
+
+    numbers = rows[number_columns]
+    names = [column.lower() for column in number_columns]
+    problems = {
+        "missing game id or team": (rows[['Game ID', 'Home Team', 'Away Team']] == "").any(axis=1),
+        "team plays itself": rows['Home Team'] == rows['Away Team'],
+        f"{', '.join(names[:-1])} or {names[-1]} is not a whole, non-negative number": (
+            numbers.isna() | (numbers < 0) | (numbers % 1 > 0)).any(axis=1)
+    }
+    reasons = pd.Series("", index=rows.index)
+    for message, mask in problems.items():
+        reasons = reasons.where(~mask, reasons + np.where(reasons == "", "", "; ") + message)
+
+    valid = rows[reasons == ""].copy()
+    for column in number_columns:
+        valid[column] = valid[column].astype('int64')
+    rejected = table[reasons != ""].copy()
+    rejected.insert(0, 'Reason', reasons[reasons != ""])
+    return valid[columns], rejected
+
+def validate_results(results):
+    """Returns (valid results in RESULT_COLUMNS layout, rejected rows with a 'Reason' column)"""
+    return validate_game_table(results, ['Season', 'Week', 'Home Score', 'Away Score'], RESULT_COLUMNS)
+
+def load_results(path=RESULTS_FILE):
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+    return pd.read_csv(path, dtype={'Game ID': str})
+
+def add_results(results, path=RESULTS_FILE):
+    """Validate and append game results; games already stored (same Game ID) are skipped"""
+    valid, rejected = validate_results(results)
+    duplicate = valid['Game ID'].duplicated() | valid['Game ID'].isin(set(load_results(path)['Game ID']))
+    new_results = valid[~duplicate]
+    if not new_results.empty:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        write_header = not os.path.exists(path) or os.path.getsize(path) == 0
+        new_results.to_csv(path, mode='a', header=write_header, index=False)
+    return {"added": len(new_results), "duplicates": int(duplicate.sum()), "rejected": len(rejected),
+            "rejected_rows": rejected}
+
+def game_order_key(game):
+    """(season, week, date, game id) of one result row, comparable across saved state and new rows"""
+    return int(game['Season']), int(game['Week']), str(game['Game Date']), str(game['Game ID'])
+
+def elo_win_probability(rating, opponent_rating, home_advantage=0.0):
+    """Chance that a team rated `rating` beats one rated `opponent_rating`"""
+    return 1 / (1 + 10 ** (-(rating + home_advantage - opponent_rating) / 400))
+
+class EloTracker:
+    """Elo ratings, updated one game at a time as results are appended"""
+
+    def __init__(self, k=ELO_K, home_advantage=ELO_HOME_ADVANTAGE, carryover=ELO_SEASON_CARRYOVER):
+        self.k = k
+        self.home_advantage = home_advantage
+        self.carryover = carryover
+        self.ratings = {}
+        self.games = {}
+        self.season = None
+        self.last_game = None
+        self.offset = 0
+        self.fingerprint = None
+
+    def start_season(self, season):
+        """Regress every rating part of the way back to the league mean"""
+        if self.ratings:
+            mean = sum(self.ratings.values()) / len(self.ratings)
+            self.ratings = {team: mean + (rating - mean) * self.carryover for team, rating in self.ratings.items()}
+        self.season = season
+
+    def play(self, home, away, home_score, away_score):
+        """Update both teams for one result; returns the home team's rating change"""
+        home_rating = self.ratings.setdefault(home, ELO_INITIAL)
+        away_rating = self.ratings.setdefault(away, ELO_INITIAL)
+        expected = elo_win_probability(home_rating, away_rating, self.home_advantage)
+        margin = home_score - away_score
+        actual = 1.0 if margin > 0 else 0.0 if margin < 0 else 0.5
+
+        # Margin-of-victory multiplier; damped when the favourite wins, so ratings don't run away
+        winner_edge = (home_rating + self.home_advantage - away_rating) * (1 if margin >= 0 else -1)
+        multiplier = math.log(abs(margin) + 1) * 2.2 / (winner_edge * 0.001 + 2.2) if margin else 1.0
+        change = self.k * multiplier * (actual - expected)
+
+        self.ratings[home] = home_rating + change
+        self.ratings[away] = away_rating - change
+        self.games[home] = self.games.get(home, 0) + 1
+        self.games[away] = self.games.get(away, 0) + 1
+        return change
+
+    def predates(self, results):
+        """Whether any of these results sorts at or before the last game already played"""
+        if results.empty or self.last_game is None:
+            return False
+        first = results.sort_values(GAME_ORDER, kind='stable').iloc[0]
+        return game_order_key(first) <= tuple(self.last_game)
+
+    def update(self, results):
+        """Play new results in date order (they must come after every game already played)"""
+        if self.predates(results):
+            raise ValueError("results predate games already played; rebuild from every result instead")
+        ordered = results.sort_values(GAME_ORDER, kind='stable')
+        for season, home, away, home_score, away_score in ordered[['Season', 'Home Team', 'Away Team', 'Home Score',
+                                                                   'Away Score']].itertuples(index=False):
+            if int(season) != self.season:
+                self.start_season(int(season))
+            self.play(home, away, int(home_score), int(away_score))
+        if not ordered.empty:
+            self.last_game = list(game_order_key(ordered.iloc[-1]))
+        return len(results)
+
+    def refresh(self, path=RESULTS_FILE):
+        """Play the results appended since the last refresh"""
+        if not os.path.exists(path):
+            return 0
+        if os.path.getsize(path) < self.offset or (
+                self.offset and self.fingerprint != read_fingerprint(path, self.offset)):
+            # The results file was replaced, rewritten or truncated; the stored offset means nothing any more
+            return self.rebuild(path)
+        new_results, offset = read_csv_since(path, self.offset, RESULT_COLUMNS)
+        if self.predates(new_results):
+            # Season regression and every later rating depend on game order; replay everything
+            return self.rebuild(path)
+        played = self.update(new_results)
+        self.offset = offset
+        self.fingerprint = read_fingerprint(path, offset) if offset else None
+        return played
+
+    def rebuild(self, path=RESULTS_FILE):
+        self.__init__(self.k, self.home_advantage, self.carryover)
+        return self.refresh(path)
+
+    def table(self):
+        """Current rating per team, best first"""
+        table = pd.DataFrame({'Team': list(self.ratings), 'Elo': list(self.ratings.values())})
+        table['Elo Games'] = table['Team'].map(self.games).fillna(0).astype('int64')
+        return table.sort_values('Elo', ascending=False).reset_index(drop=True)
+
+    def save(self, path=ELO_STATE_FILE):
+        state = {"k": self.k, "home_advantage": self.home_advantage, "carryover": self.carryover,
+                 "ratings": self.ratings, "games": self.games, "season": self.season, "last_game": self.last_game,
+                 "offset": self.offset, "fingerprint": self.fingerprint}
+        with atomic_path(path) as tmp_path, open(tmp_path, 'w') as f:
+            json.dump(state, f)
+
+    @classmethod
+    def load(cls, path=ELO_STATE_FILE):
+        tracker = cls()
+        if os.path.exists(path):
+            with open(path, 'r') as f:
+                state = json.load(f)
+            if (state["k"], state["home_advantage"], state["carryover"]) == (tracker.k, tracker.home_advantage,
+                                                                             tracker.carryover):
+                tracker.ratings, tracker.games = state["ratings"], state["games"]
+                tracker.season, tracker.offset = state["season"], state["offset"]
+                tracker.last_game, tracker.fingerprint = state.get("last_game"), state.get("fingerprint")
+        return tracker
+
+def load_elo(results_file=RESULTS_FILE, state_file=ELO_STATE_FILE):
+    """Elo table after playing any new results; the state is saved only when something changed"""
+    tracker = EloTracker.load(state_file)
+    if tracker.refresh(results_file):
+        tracker.save(state_file)
+    return tracker.table()
+
+def solve_srs(results, home_field=True):
+    """
+    SRS for one season's results. Returns (table with Team, Games, Wins, Losses, Ties, MOV,
+    SOS and SRS, best first; the fitted home-field edge in points).
+    """
+    if results.empty:
+        return pd.DataFrame(columns=['Team', 'Games', 'Wins', 'Losses', 'Ties', 'MOV', 'SOS', 'SRS']), 0.0
+    teams = pd.Index(sorted(set(results['Home Team']) | set(results['Away Team'])))
+    home = teams.get_indexer(results['Home Team'])
+    away = teams.get_indexer(results['Away Team'])
+    margin = (results['Home Score'] - results['Away Score']).to_numpy(dtype='float64')
+    n_games, n_teams = len(results), len(teams)
+
+    # One row per game (+1 home, -1 away, +1 home edge), then a row pinning the ratings' sum to zero
+    game_rows = np.arange(n_games)
+    rows = np.concatenate([game_rows, game_rows, np.full(n_teams, n_games)])
+    columns = np.concatenate([home, away, np.arange(n_teams)])
+    values = np.concatenate([np.ones(n_games), -np.ones(n_games), np.ones(n_teams)])
+    if home_field:
+        rows = np.concatenate([rows, game_rows])
+        columns = np.concatenate([columns, np.full(n_games, n_teams)])
+        values = np.concatenate([values, np.ones(n_games)])
+    shape = (n_games + 1, n_teams + int(home_field))
+    target = np.append(margin, 0.0)
+
+    if sparse is not None:
+        matrix = sparse.csr_matrix((values, (rows, columns)), shape=shape)
+        solution = lsqr(matrix, target, atol=1e-12, btol=1e-12)[0]
+    else:
+        matrix = np.zeros(shape)
+        np.add.at(matrix, (rows, columns), values)
+        solution = np.linalg.lstsq(matrix, target, rcond=None)[0]
+
+    points_for = np.bincount(home, results['Home Score'], n_teams) + np.bincount(away, results['Away Score'], n_teams)
+    points_against = np.bincount(home, results['Away Score'], n_teams) + np.bincount(away, results['Home Score'], n_teams)
+    games = np.bincount(home, minlength=n_teams) + np.bincount(away, minlength=n_teams)
+    wins = np.bincount(home[margin > 0], minlength=n_teams) + np.bincount(away[margin < 0], minlength=n_teams)
+    ties = np.bincount(home[margin == 0], minlength=n_teams) + np.bincount(away[margin == 0], minlength=n_teams)
+
+    table = pd.DataFrame({'Team': teams, 'Games': games, 'Wins': wins, 'Losses': games - wins - ties, 'Ties': ties,
+                          'MOV': (points_for - points_against) / games, 'SRS': solution[:n_teams]})
+    table.insert(6, 'SOS', table['SRS'] - table['MOV'])
+    return table.sort_values('SRS', ascending=False).reset_index(drop=True), float(solution[n_teams]) if home_field else 0.0
+
+def power_rankings(results, elo, season=None):
+    """One row per team for a season (the latest by default): record, MOV, SOS, SRS and current Elo"""
+    if results.empty:
+        return pd.DataFrame(columns=['Rank', 'Team', 'Elo', 'SRS'])
+    season = season if season is not None else results['Season'].max()
+    srs, _ = solve_srs(results[results['Season'] == season])
+    rankings = srs.merge(elo, on='Team', how='left').sort_values('Elo', ascending=False, kind='stable')
+    rankings.insert(0, 'Rank', np.arange(1, len(rankings) + 1))
+    return rankings.reset_index(drop=True)
+
+def main():
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Elo and SRS team ratings from game results")
+    parser.add_argument("command", choices=["import", "rankings", "rebuild"])
+    parser.add_argument("files", nargs="*", help="Game result CSV files (for import)")
+    parser.add_argument("--season", type=int, help="Season for the rankings (default: latest)")
+    args = parser.parse_args()
+
+    print("🏈 CJFL TEAM RATINGS")
+    print("=" * 50)
+
+    if args.command == "import":
+        for path in args.files:
+            result = add_results(pd.read_csv(path, dtype=str, keep_default_na=False))
+            print(f"📄 {path}: {result['added']} games added, {result['duplicates']} already stored, "
+                  f"{result['rejected']} rejected")
+            for _, row in result["rejected_rows"].head(5).iterrows():
+                print(f"   ❌ {row.get('Game ID', '')}: {row['Reason']}")
+    if args.command == "rebuild":
+        tracker = EloTracker()
+        print(f"🔁 Replayed {tracker.rebuild()} games")
+        tracker.save()
+
+    results = load_results()
+    if results.empty:
+        print("No game results yet. Import them with: python team_ratings.py import <file>")
+        return
+    rankings = power_rankings(results, load_elo(), args.season)
+    print(f"\n🏆 Power rankings ({args.season or results['Season'].max()}):")
+    for _, row in rankings.iterrows():
+        record = f"{row['Wins']}-{row['Losses']}" + (f"-{row['Ties']}" if row['Ties'] else "")
+        print(f"{row['Rank']:>3}. {row['Team']:<25} {record:<7} Elo {row['Elo']:6.0f}  SRS {row['SRS']:+6.1f}  "
+              f"MOV {row['MOV']:+6.1f}  SOS {row['SOS']:+5.1f}")
+
+if __name__ == "__main__":
+    main()
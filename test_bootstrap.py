@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test script for the bootstrap confidence intervals
+"""
+
+import numpy as np
+import pandas as pd
+
+from bootstrap import (PER_GAME_STATS, TOTAL_STATS, bootstrap_sums, error_bars, player_intervals, resample_counts,
+                       team_intervals)
+from utils import calculate_team_per_game, calculate_team_stats
+
+def roster(team, n_players, seed):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({'Player Name': [f"{team} {i}" for i in range(n_players)], 'Team': team, 'Position': "RB",
+                         'Season': 2024, 'Games Played': rng.integers(4, 13, n_players),
+                         'Passing Yards': rng.integers(0, 500, n_players),
+                         'Rushing Yards': rng.integers(0, 900, n_players),
+                         'Receiving Yards': rng.integers(0, 400, n_players),
+                         'Touchdowns': rng.integers(0, 12, n_players),
+                         'Tackles': rng.integers(0, 60, n_players), 'Sacks': rng.integers(0, 8, n_players),
+                         'Interceptions': rng.integers(0, 4, n_players)})
+
+def test_resampling_is_one_matrix_product():
+    """Count-matrix resampling equals drawing rows one resample at a time"""
+    print("Testing resampling...")
+    rng = np.random.default_rng(3)
+    counts = resample_counts(8, 500, rng)
+    assert counts.shape == (500, 8) and (counts.sum(axis=1) == 8).all()
+
+    values = np.arange(24, dtype='float64').reshape(8, 3)
+    sums = bootstrap_sums(values, 500, np.random.default_rng(3))
+    looped = np.array([np.repeat(values, row.astype(int), axis=0).sum(axis=0) for row in counts])
+    assert np.array_equal(sums, looped)
+
+    # The spread of resampled means matches the textbook standard error
+    sample = np.random.default_rng(4).normal(0, 10, 400)[:, None]
+    means = bootstrap_sums(sample, 4000, np.random.default_rng(5))[:, 0] / len(sample)
+    assert abs(means.std() - sample.std() / np.sqrt(len(sample))) < 0.1
+    print("✅ Resampled sums come from one matrix product")
+
+def test_team_intervals():
+    """Point values match the team comparison numbers and sit inside their intervals"""
+    print("\nTesting team intervals...")
+    data = pd.concat([roster("Calgary Colts", 25, 1), roster("Regina Thunder", 25, 2), roster("Okanagan Sun", 1, 3)],
+                     ignore_index=True)
+    intervals = team_intervals(data, ["Calgary Colts", "Okanagan Sun"])
+    assert set(intervals['Team']) == {"Calgary Colts", "Okanagan Sun"}
+    assert len(intervals) == 2 * (len(TOTAL_STATS) + len(PER_GAME_STATS))
+
+    calgary = intervals[intervals['Team'] == "Calgary Colts"].set_index('Stat')
+    totals = calculate_team_stats(data, "Calgary Colts")
+    per_game = calculate_team_per_game(totals)
+    for stat in TOTAL_STATS:
+        assert np.isclose(calgary.loc[stat, 'Value'], totals[stat])
+    for stat in PER_GAME_STATS:
+        assert np.isclose(calgary.loc[stat, 'Value'], per_game[stat])
+    assert (calgary['Lower'] <= calgary['Value']).all() and (calgary['Value'] <= calgary['Upper']).all()
+    assert (calgary['Upper'] > calgary['Lower']).all()
+
+    # A one-player roster has nothing to resample
+    single = intervals[intervals['Team'] == "Okanagan Sun"]
+    assert np.allclose(single['Lower'], single['Value']) and np.allclose(single['Upper'], single['Value'])
+    pd.testing.assert_frame_equal(intervals, team_intervals(data, ["Calgary Colts", "Okanagan Sun"]))
+    print("✅ Team intervals bracket the comparison values")
+
+def test_player_intervals_and_error_bars():
+    """Player intervals resample box scores; error bars are the distances to each bound"""
+    print("\nTesting player intervals...")
+    rng = np.random.default_rng(8)
+    games = pd.DataFrame({'Game ID': [f"G{i}" for i in range(10)], 'Player Name': "Runner", 'Team': "Calgary Colts",
+                          'Season': 2024, 'Passing Yards': 0, 'Rushing Yards': rng.integers(40, 160, 10),
+                          'Receiving Yards': 0, 'Touchdowns': rng.integers(0, 3, 10), 'Tackles': 0, 'Sacks': 0,
+                          'Interceptions': 0})
+    intervals = player_intervals(games, ["Runner"], confidence=0.95)
+    yards = intervals.set_index('Stat').loc['Yards per Game']
+    assert np.isclose(yards['Value'], games['Rushing Yards'].mean())
+    assert yards['Lower'] < yards['Value'] < yards['Upper']
+
+    bars = error_bars(intervals, ['Yards per Game', 'Fantasy Points'])
+    assert np.isclose(bars['array'][0], yards['Upper'] - yards['Value'])
+    assert np.isclose(bars['arrayminus'][0], yards['Value'] - yards['Lower'])
+    assert bars['array'][1] == 0 and bars['arrayminus'][1] == 0  # stats without an interval get no bar
+    assert player_intervals(games, ["Nobody"]).empty
+    print("✅ Player intervals and error bars")
+
+if __name__ == "__main__":
+    test_resampling_is_one_matrix_product()
+    test_team_intervals()
+    test_player_intervals_and_error_bars()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Test script for the bulk roster import pipeline
+Works on temporary copies, the real dataset is never touched
+"""
+
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pandas as pd
+
+from bulk_import import OUTPUT_COLUMNS, dataset_lock, import_file, merge_rows, validate_chunk, write_atomic
+from player_identity import resolve_identities
+from team_collectors import store_players
+from utils import atomic_path
+
+ROSTER = """Name,Team,Pos,GP,Pass Yds,Rush Yds,Rec Yds,TD,Tackles,Sacks,INT
+Julien Beaulieu,Edmonton Wildcats,QB,10,3400,587,0,25,0,0,0
+Tom New,Edmonton Wildcats,CB,9,0,0,0,0,41,0,3
+Sam Kicker,Edmonton Wildcats,XX,9,0,0,0,0,0,0,0
+Neg Stats,Edmonton Wildcats,RB,9,0,-20,0,1,0,0,0
+Big Lineman,Edmonton Wildcats,OL,9,2500,0,0,0,0,0,0
+Tom New,Edmonton Wildcats,DB,10,0,0,0,0,45,0,4
+"""
+
+def test_validate_chunk():
+    """Column-wise validation flags every bad row with a reason"""
+    print("Testing roster validation...")
+    chunk = pd.DataFrame({
+        'Player Name': ['A One', '', 'C Three', 'D Four'],
+        'Team': ['Calgary Colts'] * 4,
+        'Position': ['RB', 'QB', 'LB', 'WR'],
+        'Games Played': ['10', '10', '20', '10'],
+        'Rushing Yards': ['1,200', '0', '0', '12.5'],
+        'Sacks': ['0', '0', '3', '0']
+    })
+    valid, rejected = validate_chunk(chunk)
+
+    assert list(valid['Player Name']) == ['A One']
+    assert valid['Rushing Yards'].iloc[0] == 1200
+    assert valid['Season'].iloc[0] == 2024
+    reasons = rejected['Reason'].tolist()
+    assert "missing player name" in reasons[0]
+    assert "Games Played above" in reasons[1]
+    assert "not a whole number" in reasons[2]
+    print(f"✅ {len(valid)} valid, {len(rejected)} rejected")
+
+def test_import_file():
+    """Import dedupes against existing players and writes rejects separately"""
+    print("\nTesting roster import...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_file = os.path.join(tmp_dir, "stats.csv")
+        roster_file = os.path.join(tmp_dir, "roster.csv")
+        pd.read_csv("data/cjfl_stats.csv").to_csv(data_file, index=False)
+        with open(roster_file, 'w') as f:
+            f.write(ROSTER)
+        before = pd.read_csv(data_file)
+
+        result = import_file(roster_file, data_file)
+        after = pd.read_csv(data_file)
+
+        assert result['rows_read'] == 6
+        assert result['rejected'] == 3
+        assert result['added'] == 1 and result['updated'] == 1
+        assert len(after) == len(before) + 1
+        assert after.loc[after['Player Name'] == 'Julien Beaulieu', 'Passing Yards'].tolist() == [3400]
+        assert after.loc[after['Player Name'] == 'Tom New', 'Tackles'].tolist() == [45]
+        assert len(pd.read_csv(result['reject_file'])) == 3
+
+        # Re-importing with skip leaves existing players alone
+        result = import_file(roster_file, data_file, on_duplicate='skip')
+        assert result['added'] == 0 and result['skipped'] == 2
+        assert len(pd.read_csv(data_file)) == len(after)
+    print("✅ New players added, existing players updated, rejects reported")
+
+def test_merge_with_identity_mapping():
+    """Spelling variants of a mapped player update the stored row instead of adding a second one"""
+    print("\nTesting merge with identity mapping...")
+    row = {column: 0 for column in OUTPUT_COLUMNS}
+    existing = pd.DataFrame([{**row, 'Player Name': "Julien Beaulieu", 'Team': "Edmonton Wildcats", 'Position': "QB",
+                              'Season': 2024, 'Passing Yards': 3000}])
+    incoming = pd.DataFrame([{**row, 'Player Name': "J. Beaulieu", 'Team': "Edmonton Wildcats", 'Position': "QB",
+                              'Season': 2024, 'Passing Yards': 3400}])
+    mapping = resolve_identities(pd.concat([existing, incoming]))
+
+    merged, added, updated, _ = merge_rows(existing, incoming, mapping=mapping)
+    assert len(merged) == 1 and added.empty and updated == 1
+    assert merged['Passing Yards'].tolist() == [3400]
+
+    merged, added, _, _ = merge_rows(existing, incoming)  # without a mapping the spellings are different players
+    assert len(merged) == 2 and len(added) == 1
+    print("✅ Mapped spellings merge into one row")
+
+WRITER_NAMES = ["Adams", "Baker", "Clark", "Davis", "Evans", "Fraser", "Gagnon", "Hughes", "Irving", "Jones",
+                "Kelly", "Lavoie", "Martin", "Nolan", "Ouellet", "Price"]
+
+def add_player(data_file, i):
+    """One writer process: half go through a roster import, half through the team collectors"""
+    row = {column: 0 for column in OUTPUT_COLUMNS}
+    player = pd.DataFrame([{**row, 'Player Name': f"Writer {WRITER_NAMES[i]}", 'Team': "Calgary Colts", 'Position': "RB",
+                            'Season': 2024, 'Games Played': 8, 'Rushing Yards': 100 + i}])
+    if i % 2:
+        store_players(player, data_file)
+    else:
+        roster_file = f"{data_file}.{i}.csv"
+        player.to_csv(roster_file, index=False)
+        import_file(roster_file, data_file)
+
+def test_concurrent_writers_keep_every_row():
+    """Writers in separate processes serialize on the dataset lock, so no read-merge-write loses a row"""
+    print("\nTesting concurrent dataset writers...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_file = os.path.join(tmp_dir, "stats.csv")
+        pd.DataFrame(columns=OUTPUT_COLUMNS).to_csv(data_file, index=False)
+        with ProcessPoolExecutor(max_workers=8) as pool:
+            list(pool.map(add_player, [data_file] * 16, range(16)))
+        written = pd.read_csv(data_file)
+        assert sorted(written['Rushing Yards']) == list(range(100, 116))
+
+        with dataset_lock(data_file):  # re-entering after every writer released it does not block
+            assert len(pd.read_csv(data_file)) == 16
+    print("✅ Every writer's row survived")
+
+def test_atomic_writes():
+    """Concurrent writers each use their own temp file; a failed write leaves the old file alone"""
+    print("\nTesting atomic writes...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "stats.csv")
+        frames = [pd.DataFrame({'Player Name': [f"Writer {i}"] * 2000, 'Touchdowns': i}) for i in range(8)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(write_atomic, frames, [path] * len(frames)))
+        written = pd.read_csv(path)
+        assert len(written) == 2000 and written['Touchdowns'].nunique() == 1
+
+        try:
+            with atomic_path(path) as tmp_path:
+                with open(tmp_path, 'w') as f:
+                    f.write("half a row")
+                raise RuntimeError("writer crashed")
+        except RuntimeError:
+            pass
+        pd.testing.assert_frame_equal(pd.read_csv(path), written)
+        assert os.listdir(tmp_dir) == ["stats.csv"]
+    print("✅ Atomic writes never collide or leave partial files")
+
+if __name__ == "__main__":
+    test_validate_chunk()
+    test_import_file()
+    test_merge_with_identity_mapping()
+    test_concurrent_writers_keep_every_row()
+    test_atomic_writes()
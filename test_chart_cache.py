@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test script for the content-addressed chart cache and the pre-render pipeline
+Works in a temporary directory
+"""
+
+import os
+import tempfile
+
+import pandas as pd
+
+from chart_cache import LEADERBOARD_STATS, LEAGUE_SCOPE, ChartCache, chart_key, prerender_charts, standard_chart_set
+from utils import add_derived_columns, create_leaderboard_chart
+
+def make_data():
+    rows = []
+    for season in [2023, 2024]:
+        for team in ["Calgary Colts", "Regina Thunder"]:
+            for i in range(4):
+                rows.append({'Player Name': f"{team} {i}", 'Team': team, 'Position': "RB", 'Season': season,
+                             'Games Played': 8 + i, 'Passing Yards': 0, 'Rushing Yards': 100 * (i + 1) + season % 10,
+                             'Receiving Yards': 20 * i, 'Touchdowns': i, 'Tackles': 2 * i, 'Sacks': 0,
+                             'Interceptions': 0})
+    return pd.DataFrame(rows)
+
+def test_chart_key_and_lookup():
+    """Keys follow the figure and render settings; a changed dataset misses the cache"""
+    print("Testing chart keys and lookups...")
+    data = add_derived_columns(make_data())
+    fig = create_leaderboard_chart(data, "Rushing Yards")
+    key = chart_key(fig, 'png')
+    assert key == chart_key(create_leaderboard_chart(data, "Rushing Yards"), 'png')
+    assert key != chart_key(fig, 'svg') and key != chart_key(fig, 'png', width=400)
+
+    changed = data.copy()
+    changed.loc[changed['Rushing Yards'].idxmax(), 'Rushing Yards'] += 1
+    changed_fig = create_leaderboard_chart(changed, "Rushing Yards")
+    assert chart_key(changed_fig, 'png') != key
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = ChartCache(tmpdir)
+        assert cache.lookup(fig) is None
+        path = cache.put(key, 'png', b"image bytes")
+        assert path == cache.path_for(key, 'png') and os.path.exists(path)
+        assert cache.lookup(fig) == b"image bytes"
+        assert cache.render(fig) == b"image bytes"  # a hit never re-renders
+        assert cache.lookup(changed_fig) is None
+        assert [name for name in os.listdir(os.path.dirname(path)) if name.endswith(".tmp")] == []
+    print("✅ Hits for the same figure, misses once the data changes")
+
+def test_standard_chart_set_and_manifest():
+    """League scope has the leaderboards; team scope adds a comparison with every other team"""
+    print("\nTesting the standard chart set...")
+    season_data = add_derived_columns(make_data().query("Season == 2024"))
+    league = standard_chart_set(season_data)
+    assert set(league) == {f"leaderboard_{stat}" for stat in LEADERBOARD_STATS}
+    team = standard_chart_set(season_data, "Calgary Colts")
+    assert set(team) == set(league) | {"comparison_Regina Thunder"}
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache = ChartCache(tmpdir)
+        assert cache.load_manifest() == {}
+        manifest = {"2024": {LEAGUE_SCOPE: {"leaderboard_Sacks": {"png": "abc"}}}}
+        cache.save_manifest(manifest)
+        assert cache.load_manifest() == manifest
+    print("✅ Chart set and manifest round trip")
+
+def test_prerender_charts():
+    """Every scope lands in the manifest; a second run finds everything that was rendered"""
+    print("\nTesting the pre-render pipeline...")
+    data = make_data()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        rendered, cached, failed = prerender_charts(data, [2024], ('svg',), tmpdir, max_workers=1)
+        charts = len(LEADERBOARD_STATS) * 3 + 2  # league and two teams, plus one comparison per team
+        assert rendered + cached + failed == charts and cached == 0
+
+        manifest = ChartCache(tmpdir).load_manifest()
+        assert set(manifest) == {"2024"}
+        assert set(manifest["2024"]) == {LEAGUE_SCOPE, "Calgary Colts", "Regina Thunder"}
+
+        # Static export needs kaleido and Chrome; without them every render fails, with them none are repeated
+        again = prerender_charts(data, [2024], ('svg',), tmpdir, max_workers=1)
+        assert again == (0, rendered, failed)
+    print(f"✅ {charts} charts: {rendered} rendered, {failed} without a static renderer")
+
+if __name__ == "__main__":
+    test_chart_key_and_lookup()
+    test_standard_chart_set_and_manifest()
+    test_prerender_charts()
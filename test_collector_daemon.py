@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Test script for the collector daemon
+Uses a fake fetch function and temporary files, no network access
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+
+import pandas as pd
+
+from collector_daemon import CollectorDaemon, extract_tables, seed_jobs
+from progress_store import ProgressStore
+
+TEAMS = {
+    "Langley Rams": {"website": "https://langleyrams.test/", "priority": 3},
+    "Calgary Colts": {"website": "https://calgarycolts.test/", "priority": 1},
+}
+
+PAGES = {
+    "https://calgarycolts.test/": '<a href="/roster">Roster</a> <a href="/tickets">Tickets</a>',
+    "https://calgarycolts.test/roster": """
+        <table>
+          <tr><th>Name</th><th>Pos</th><th>GP</th><th>Rush Yds</th><th>TD</th></tr>
+          <tr><td>Colt Runner</td><td>RB</td><td>9</td><td>850</td><td>7</td></tr>
+          <tr><td>Bad Row</td><td>XX</td><td>9</td><td>0</td><td>0</td></tr>
+        </table>""",
+    "https://langleyrams.test/": "<p>No stats here</p>",
+}
+
+class FakeWeb:
+    """Serves PAGES, failing the first `failures` requests for each url with a 503"""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.requests = []
+
+    def __call__(self, url):
+        self.requests.append(url)
+        if self.requests.count(url) <= self.failures:
+            return 503, "", {}
+        if url not in PAGES:
+            return 404, "", {}
+        return 200, PAGES[url], {}
+
+def make_daemon(tmpdir, fetch, **kwargs):
+    store = ProgressStore(os.path.join(tmpdir, "progress.db"), os.path.join(tmpdir, "progress.json"))
+    return CollectorDaemon(TEAMS, data_file=os.path.join(tmpdir, "stats.csv"),
+                           checkpoint_file=os.path.join(tmpdir, "checkpoint.json"), progress_store=store,
+                           fetch=fetch, host_delay=0, backoff_base=0.01, **kwargs)
+
+def test_extract_tables():
+    """Stats tables are found and their headers mapped to dataset columns"""
+    print("Testing table extraction...")
+    tables = extract_tables(PAGES["https://calgarycolts.test/roster"])
+    assert len(tables) == 1
+    assert list(tables[0].columns) == ['Player Name', 'Position', 'Games Played', 'Rushing Yards', 'Touchdowns']
+    assert extract_tables(PAGES["https://langleyrams.test/"]) == []
+    print("✅ Roster table extracted")
+
+def test_crawl_with_retries():
+    """Priority order, retries, stats and progress all flow through one pass"""
+    print("\nTesting a full crawl...")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        web = FakeWeb(failures=1)
+        daemon = make_daemon(tmpdir, web, workers=1)
+        stats = asyncio.run(daemon.run_pass(seed_jobs(TEAMS)))
+
+        assert web.requests[0] == "https://calgarycolts.test/", "priority 1 team should be crawled first"
+        assert "https://calgarycolts.test/tickets" not in web.requests
+        assert stats["retries"] == 3 and stats["pages"] == 3 and stats["failed"] == 0
+        assert stats["players_added"] == 1
+
+        data = pd.read_csv(daemon.data_file)
+        assert list(data['Player Name']) == ["Colt Runner"]
+        assert data['Team'].iloc[0] == "Calgary Colts"
+
+        teams = daemon.progress_store.snapshot()["teams"]
+        assert teams["Calgary Colts"]["players_collected"] == 1
+        assert "https://calgarycolts.test/roster" in teams["Calgary Colts"]["data_sources_checked"]
+        assert teams["Langley Rams"]["status"] == "in_progress"
+
+        with open(daemon.checkpoint_file) as f:
+            assert json.load(f)["pending"] == []
+    print(f"✅ Crawled {stats['pages']} pages with {stats['retries']} retries")
+
+def test_resume_from_checkpoint():
+    """A restarted daemon only fetches the pages left in the checkpoint"""
+    print("\nTesting checkpoint resume...")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        checkpoint = {
+            "pending": [{"priority": 1, "url": "https://calgarycolts.test/roster", "team": "Calgary Colts",
+                         "depth": 1, "attempts": 2}],
+            "seen": ["https://calgarycolts.test/", "https://calgarycolts.test/roster"],
+            "stats": {"pages": 1}
+        }
+        with open(os.path.join(tmpdir, "checkpoint.json"), 'w') as f:
+            json.dump(checkpoint, f)
+
+        web = FakeWeb()
+        daemon = make_daemon(tmpdir, web)
+        assert daemon.load_checkpoint()
+        stats = asyncio.run(daemon.run_pass(seed_jobs(TEAMS)))
+
+        assert web.requests == ["https://calgarycolts.test/roster"]
+        assert stats["pages"] == 2 and stats["players_added"] == 1
+    print("✅ Resumed mid-crawl")
+
+if __name__ == "__main__":
+    test_extract_tables()
+    test_crawl_with_retries()
+    test_resume_from_checkpoint()
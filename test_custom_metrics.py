@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test script for user-defined metric formulas
+Works in a temporary directory
+"""
+
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from custom_metrics import MetricEngine, add_metric, compile_expression, compile_metric, load_metrics, remove_metric
+
+PLAYERS = pd.DataFrame({
+    'Player Name': ["Runner", "Rusher", "Backup"], 'Team': ["Calgary Colts"] * 3, 'Position': ["RB", "DL", "RB"],
+    'Season': 2024, 'Games Played': [10, 10, 0], 'Passing Yards': 0, 'Rushing Yards': [900, 0, 0],
+    'Receiving Yards': [300, 0, 0], 'Touchdowns': [12, 0, 0], 'Tackles': [2, 40, 0], 'Sacks': [0, 9, 0],
+    'Interceptions': [0, 1, 0]
+})
+
+def test_formulas_evaluate_vectorized():
+    """Formulas match the same arithmetic in pandas; division by zero gives an empty value"""
+    print("Testing formula evaluation...")
+    engine = MetricEngine([
+        {"name": "Yards per Touchdown", "expression": "total_yards / touchdowns"},
+        {"name": "Defensive Impact", "expression": "tackles + 5 * sacks + 8 * interceptions"},
+        {"name": "Capped", "expression": "min(`Rushing Yards`, 500) + sqrt(abs(-sacks)) ** 2"}
+    ])
+    values = engine.evaluate(PLAYERS)
+    assert values['Yards per Touchdown'].iloc[0] == 100
+    assert values['Yards per Touchdown'].iloc[1:].isna().all()
+    expected = PLAYERS['Tackles'] + 5 * PLAYERS['Sacks'] + 8 * PLAYERS['Interceptions']
+    assert np.array_equal(values['Defensive Impact'].to_numpy(), expected.to_numpy())
+    assert np.allclose(values['Capped'], [500, 9, 0])
+    print("✅ Formulas evaluated over whole columns")
+
+def test_unsafe_formulas_rejected():
+    """Only arithmetic over known columns is accepted"""
+    print("\nTesting formula validation...")
+    for expression in ["__import__('os').system('ls')", "tackles.real", "coach_rating + 1", "max(tackles)",
+                       "min(tackles, sacks, key=1)", "[tackles]", "tackles if sacks else 0", "42", "tackles +"]:
+        try:
+            compile_expression(expression)
+        except ValueError:
+            continue
+        raise AssertionError(f"accepted: {expression}")
+    assert compile_expression("`Total Yards` / Games_Played")[1] == ['Games Played', 'Total Yards']
+    for name in ["<img src=x onerror=alert(1)>", "Yards & Tackles", "`Sacks`"]:
+        try:
+            compile_metric(name, "tackles")
+        except ValueError:
+            continue
+        raise AssertionError(f"accepted name: {name}")
+    assert compile_metric("Player's Impact", "tackles")["name"] == "Player's Impact"
+    print("✅ Unsafe and invalid formulas rejected")
+
+def test_cached_per_version_and_saved():
+    """Columns are computed once per data version; saved metrics survive a reload"""
+    print("\nTesting caching and storage...")
+    engine = MetricEngine()
+    first = engine.apply(PLAYERS, version="v1")
+    computed = engine.values
+    second = engine.apply(PLAYERS, version="v1")
+    assert engine.values is computed
+    assert 'Defensive Impact' in second.columns and 'Defensive Impact' not in PLAYERS.columns
+    pd.testing.assert_frame_equal(first, second)
+    engine.apply(PLAYERS, version="v2")
+    assert engine.values is not computed
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "metrics.json")
+        add_metric("Sack Rate", "sacks / games_played", path)
+        assert [metric["name"] for metric in load_metrics(path)][-1] == "Sack Rate"
+        try:
+            add_metric("Tackles", "tackles * 2", path)
+            raise AssertionError("a metric may not shadow a stat column")
+        except ValueError:
+            pass
+        assert remove_metric("Sack Rate", path) and not remove_metric("Sack Rate", path)
+    print("✅ Metrics cached per version and saved")
+
+if __name__ == "__main__":
+    test_formulas_evaluate_vectorized()
+    test_unsafe_formulas_rejected()
+    test_cached_per_version_and_saved()
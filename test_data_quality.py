@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Test script for the data quality rule engine
+"""
+
+import pandas as pd
+
+from utils import load_csv_data, load_data
+from data_quality import DataQualityEngine
+
+def test_rules_flag_bad_rows():
+    """Each kind of bad row is caught by its rule"""
+    print("Testing quality rules...")
+    data = load_csv_data().head(40).reset_index(drop=True)
+    bad = data.iloc[:4].copy()
+    bad['Player Name'] = ["Ol Passer", "Negative Guy", "Too Many Games", data.loc[5, 'Player Name']]
+    bad['Team'] = [bad['Team'].iloc[0]] * 3 + [data.loc[5, 'Team']]
+    bad['Season'] = data.loc[5, 'Season']
+    bad.iloc[0, bad.columns.get_loc('Position')] = "OL"
+    bad.iloc[0, bad.columns.get_loc('Passing Yards')] = 1200
+    bad.iloc[1, bad.columns.get_loc('Tackles')] = -3
+    bad.iloc[2, bad.columns.get_loc('Games Played')] = 30
+    data = pd.concat([data, bad], ignore_index=True)
+
+    report = DataQualityEngine().validate(data)
+    issues = report['violations'].groupby('Rule')['Player Name'].apply(set).to_dict()
+
+    assert "Ol Passer" in issues['position_stat_consistency']
+    assert "Negative Guy" in issues['negative_stats']
+    assert "Too Many Games" in issues['games_played_bounds']
+    assert issues['duplicate_player'] == {data.loc[5, 'Player Name']}
+    assert report['rows_with_errors'] == 2
+    print(f"✅ {len(report['violations'])} issues found across {len(issues)} rules")
+
+def test_loaded_data_passes_error_rules():
+    """The dashboard's data has no error-level issues; warnings are only reported"""
+    print("\nTesting the loaded dataset against every rule...")
+    report = DataQualityEngine().validate(load_data())
+    assert report['rows_with_errors'] == 0, "Data should pass all error-level quality rules"
+    print(f"✅ Quality score: {report['quality_score']:.1f}% ({report['rows_with_issues']} rows with issues)")
+
+def test_incremental_revalidation():
+    """Only changed rows are re-checked, and results match a full validation"""
+    print("\nTesting incremental re-validation...")
+    data = load_csv_data()
+    engine = DataQualityEngine()
+
+    first = engine.validate(data, version="v1")
+    assert first['rows_revalidated'] == len(data)
+    assert engine.validate(data, version="v1") is first
+
+    edited = data.copy()
+    edited.loc[3, 'Touchdowns'] = 400
+    edited = edited.drop(index=7)
+    second = engine.validate(edited, version="v2")
+    assert second['rows_revalidated'] == 1
+
+    fresh = DataQualityEngine().validate(edited)
+    assert second['rule_counts'] == fresh['rule_counts']
+    assert second['rule_counts']['per_game_outlier'] >= 1
+    print(f"✅ Re-checked {second['rows_revalidated']} of {second['rows']} rows after an edit")
+
+if __name__ == "__main__":
+    test_rules_flag_bad_rows()
+    test_loaded_data_passes_error_rules()
+    test_incremental_revalidation()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test script for the fantasy scoring engine
+"""
+
+import pandas as pd
+
+from fantasy_scoring import (DEFAULT_RULES, POINTS_COLUMN, FantasyScorer, rules_version, score, score_breakdown,
+                             validate_rules, weekly_scores)
+
+SEASONS = pd.DataFrame({
+    'Player Name': ["Passer", "Runner", "Rusher"], 'Team': ["Calgary Colts"] * 3, 'Position': ["QB", "RB", "DL"],
+    'Season': 2024, 'Games Played': 10, 'Passing Yards': [2500, 0, 0], 'Rushing Yards': [100, 1000, 0],
+    'Receiving Yards': [0, 200, 0], 'Touchdowns': [20, 10, 0], 'Tackles': [0, 0, 40], 'Sacks': [0, 0, 8],
+    'Interceptions': [1, 0, 2]
+})
+
+def test_scores_match_rules():
+    """Each row scores sum(points x stat) times its position multiplier"""
+    print("Testing season scoring...")
+    points = score(SEASONS, DEFAULT_RULES)
+    assert list(points.round(6)) == [2500 * 0.04 + 100 * 0.1 + 20 * 6 + 1 * 3, 1000 * 0.1 + 200 * 0.1 + 10 * 6,
+                                     40 + 8 * 2 + 2 * 3]
+
+    rules = dict(DEFAULT_RULES, position_multipliers={"DL": 1.5})
+    assert score(SEASONS, rules).iloc[2] == 1.5 * points.iloc[2]
+    breakdown = score_breakdown(SEASONS, rules)
+    assert breakdown['Sacks Pts'].iloc[2] == 8 * 2 * 1.5
+    assert (breakdown.drop(columns=POINTS_COLUMN).sum(axis=1).round(6) == breakdown[POINTS_COLUMN].round(6)).all()
+    print("✅ Points follow the declared rules")
+
+def test_rule_versions_and_cache():
+    """Changing any rule gives a new version; results are reused per data version"""
+    print("\nTesting rule versions...")
+    changed = dict(DEFAULT_RULES, points=dict(DEFAULT_RULES["points"], Touchdowns=4))
+    assert rules_version(DEFAULT_RULES) != rules_version(changed)
+    assert rules_version(DEFAULT_RULES) == rules_version(dict(DEFAULT_RULES, name="Renamed"))
+
+    scorer = FantasyScorer()
+    first = scorer.points(SEASONS, data_version="v1")
+    assert scorer.points(SEASONS, data_version="v1") is first
+    assert POINTS_COLUMN in scorer.apply(SEASONS, "v1").columns and POINTS_COLUMN not in SEASONS.columns
+
+    for bad in [{"points": {"Punts": 1}}, {"points": {"Sacks": "two"}}, {"points": {"Sacks": 2},
+                                                                          "position_multipliers": {"XX": 2}}]:
+        try:
+            validate_rules(bad)
+        except ValueError:
+            continue
+        raise AssertionError(f"accepted: {bad}")
+    print("✅ Rules versioned and validated")
+
+def test_game_scoring():
+    """Box scores score the same way and roll up to weekly totals"""
+    print("\nTesting per-game scoring...")
+    games = pd.DataFrame({
+        'Game ID': ["G1", "G2", "G2"], 'Week': [1, 2, 2], 'Season': 2024, 'Player Name': ["Runner", "Runner", "Rusher"],
+        'Team': "Calgary Colts", 'Position': ["RB", "RB", "DL"], 'Passing Yards': 0, 'Rushing Yards': [120, 80, 0],
+        'Receiving Yards': 0, 'Touchdowns': [2, 0, 0], 'Tackles': [0, 0, 6], 'Sacks': [0, 0, 2], 'Interceptions': 0
+    })
+    weekly = weekly_scores(games, DEFAULT_RULES)
+    assert weekly.iloc[0]['Player Name'] == "Runner" and weekly.iloc[0]['Week'] == 1
+    assert round(weekly.iloc[0][POINTS_COLUMN], 6) == 24
+    assert len(weekly) == 3
+    print("✅ Games scored and ranked by week")
+
+if __name__ == "__main__":
+    test_scores_match_rules()
+    test_rule_versions_and_cache()
+    test_game_scoring()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test script for the rolling-window form metrics
+Works in a temporary directory
+"""
+
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from form_metrics import FormTracker, current_form, form_column, last_column, load_form
+from game_stats import GameStatsStore
+
+def week_of_games(week, players=6, seed=0):
+    """Box scores for one week: every player plays one game with random stats"""
+    rng = np.random.default_rng(seed + week)
+    return pd.DataFrame({
+        'Game ID': [f"W{week}-{i // 2}" for i in range(players)], 'Game Date': f"2024-08-{week:02d}", 'Week': week,
+        'Player Name': [f"Player {i}" for i in range(players)], 'Team': [f"Team {i % 3}" for i in range(players)],
+        'Opponent': "Rival", 'Position': "RB", 'Season': 2024,
+        'Passing Yards': 0, 'Rushing Yards': rng.integers(0, 150, players), 'Receiving Yards': rng.integers(0, 60, players),
+        'Touchdowns': rng.integers(0, 3, players), 'Tackles': rng.integers(0, 8, players),
+        'Sacks': rng.integers(0, 2, players), 'Interceptions': 0
+    })
+
+def test_matches_full_recompute():
+    """Folding weeks in one at a time gives the same windows as computing over every game"""
+    print("Testing incremental windows...")
+    weeks = [week_of_games(week) for week in range(1, 9)]
+    tracker = FormTracker(window=3, halflife=2.0)
+    tracker.update(pd.concat(weeks[:3], ignore_index=True))
+    for games in weeks[3:]:
+        tracker.update(games)
+
+    incremental = tracker.table().sort_values('Player Name').reset_index(drop=True)
+    full = current_form(pd.concat(weeks, ignore_index=True), window=3, halflife=2.0)
+    full = full.sort_values('Player Name').reset_index(drop=True)
+    pd.testing.assert_frame_equal(incremental, full[incremental.columns], check_dtype=False)
+
+    player = pd.concat(weeks, ignore_index=True).query("`Player Name` == 'Player 0'")
+    assert incremental.loc[0, last_column('Tackles', 3)] == player['Tackles'].tail(3).mean()
+    assert incremental.loc[0, 'Form Games'] == 8
+    print("✅ Incremental last-3 and EWMA match a full recompute")
+
+def make_store(tmpdir):
+    return GameStatsStore(game_file=os.path.join(tmpdir, "games.csv"), data_file=os.path.join(tmpdir, "stats.csv"),
+                          rollup_file=os.path.join(tmpdir, "rollup.csv"), state_file=os.path.join(tmpdir, "rollup.json"))
+
+def sorted_form(form):
+    return form.sort_values('Player Name').reset_index(drop=True)
+
+def test_refresh_reads_new_games():
+    """The tracker picks up games appended to the game file and persists its state"""
+    print("\nTesting refresh from the game store...")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = make_store(tmpdir)
+        state_file = os.path.join(tmpdir, "form.json")
+        store.add_games(week_of_games(1))
+        store.add_games(week_of_games(2))
+        first = load_form(store, state_file)
+        assert (first['Form Games'] == 2).all()
+
+        store.add_games(week_of_games(3))
+        tracker = FormTracker.load(state_file)
+        assert tracker.refresh(store) == 6
+        assert tracker.refresh(store) == 0
+
+        expected = current_form(store.load_games()).sort_values('Player Name').reset_index(drop=True)
+        refreshed = load_form(store, state_file).sort_values('Player Name').reset_index(drop=True)
+        assert np.allclose(refreshed[form_column('Total Yards')], expected[form_column('Total Yards')])
+        assert (refreshed['Form Games'] == 3).all()
+    print("✅ New games folded in from the game file")
+
+def test_backfilled_and_replaced_games():
+    """A late week or a replaced game file gives the same form as a full recompute"""
+    print("\nTesting backfilled weeks and replaced game files...")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = make_store(tmpdir)
+        state_file = os.path.join(tmpdir, "form.json")
+        store.add_games(week_of_games(1))
+        store.add_games(week_of_games(3))
+        load_form(store, state_file)
+
+        store.add_games(week_of_games(2))
+        tracker = FormTracker.load(state_file)
+        assert tracker.backfilled(week_of_games(2)) and not tracker.backfilled(week_of_games(4))
+        try:
+            tracker.update(week_of_games(2))
+            raise AssertionError("a backfilled week must not be folded in out of order")
+        except ValueError:
+            pass
+        backfilled = sorted_form(load_form(store, state_file))
+        expected = sorted_form(current_form(store.load_games()))
+        assert np.allclose(backfilled[form_column('Total Yards')], expected[form_column('Total Yards')])
+        assert (backfilled['Form Games'] == 3).all()
+
+        # Same weeks, different box scores, one more week: the stored offset points into other bytes
+        os.remove(store.game_file)
+        for week in range(1, 5):
+            store.add_games(week_of_games(week, seed=10))
+        replaced = sorted_form(load_form(store, state_file))
+        expected = sorted_form(current_form(store.load_games()))
+        assert np.allclose(replaced[form_column('Total Yards')], expected[form_column('Total Yards')])
+        assert (replaced['Form Games'] == 4).all()
+    print("✅ Backfilled and replaced games trigger a rebuild")
+
+if __name__ == "__main__":
+    test_matches_full_recompute()
+    test_refresh_reads_new_games()
+    test_backfilled_and_replaced_games()
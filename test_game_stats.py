@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Test script for per-game box scores and the incremental season rollup
+Works in a temporary directory
+"""
+
+import os
+import tempfile
+
+import pandas as pd
+
+from game_stats import GameStatsStore, player_game_log, season_rollup
+
+def box_scores(game_id, week, rows):
+    """Box score frame for one game from (player, team, opponent, position, rushing yards, touchdowns)"""
+    return pd.DataFrame([{
+        'Game ID': game_id, 'Game Date': f"2024-08-{week:02d}", 'Week': week, 'Player Name': player,
+        'Team': team, 'Opponent': opponent, 'Position': position, 'Season': 2024,
+        'Rushing Yards': rushing, 'Touchdowns': touchdowns
+    } for player, team, opponent, position, rushing, touchdowns in rows])
+
+def make_store(tmpdir):
+    existing = pd.DataFrame([{'Player Name': 'Season Only', 'Team': 'Regina Thunder', 'Position': 'LB', 'Season': 2024,
+                              'Games Played': 9, 'Passing Yards': 0, 'Rushing Yards': 0, 'Receiving Yards': 0,
+                              'Touchdowns': 0, 'Tackles': 55, 'Sacks': 3, 'Interceptions': 1}])
+    data_file = os.path.join(tmpdir, "cjfl_stats.csv")
+    existing.to_csv(data_file, index=False)
+    return GameStatsStore(game_file=os.path.join(tmpdir, "games.csv"), data_file=data_file,
+                          rollup_file=os.path.join(tmpdir, "rollup.csv"), state_file=os.path.join(tmpdir, "rollup.json"))
+
+def test_incremental_rollup():
+    """Each refresh reads only the new games, and ends up matching a full rebuild"""
+    print("Testing incremental season rollup...")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = make_store(tmpdir)
+        week1 = store.add_games(box_scores("G1", 1, [("Game Back", "Calgary Colts", "Regina Thunder", "RB", 120, 2),
+                                                     ("Other Back", "Regina Thunder", "Calgary Colts", "RB", 40, 0)]))
+        assert week1["added"] == 2 and week1["new_rows"] == 2
+
+        week2 = store.add_games(box_scores("G2", 2, [("Game Back", "Calgary Colts", "Edmonton Huskies", "RB", 85, 1)]))
+        assert week2["new_rows"] == 1 and week2["players_updated"] == 1
+
+        again = store.add_games(box_scores("G2", 2, [("Game Back", "Calgary Colts", "Edmonton Huskies", "RB", 85, 1)]))
+        assert again["added"] == 0 and again["duplicates"] == 1 and again["new_rows"] == 0
+
+        rollup = store.load_rollup().set_index('Player Name')
+        assert rollup.loc['Game Back', 'Games Played'] == 2
+        assert rollup.loc['Game Back', 'Rushing Yards'] == 205
+        assert rollup.loc['Game Back', 'Touchdowns'] == 3
+
+        incremental = store.load_rollup().sort_values('Player Name').reset_index(drop=True)
+        rebuilt = season_rollup(store.load_games()).sort_values('Player Name').reset_index(drop=True)
+        pd.testing.assert_frame_equal(incremental, rebuilt, check_dtype=False)
+
+        # Dashboards keep reading season totals; players without box scores are untouched
+        season = pd.read_csv(store.data_file).set_index('Player Name')
+        assert season.loc['Game Back', 'Rushing Yards'] == 205
+        assert season.loc['Season Only', 'Tackles'] == 55
+        assert len(season) == 3
+    print("✅ Incremental rollup matches a full rebuild")
+
+def test_appended_rows_and_partial_lines():
+    """Rows appended by other tools are picked up; a half-written last line waits for the next refresh"""
+    print("\nTesting refresh of appended rows...")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = make_store(tmpdir)
+        store.add_games(box_scores("G1", 1, [("Game Back", "Calgary Colts", "Regina Thunder", "RB", 100, 1)]))
+
+        with open(store.game_file, 'a') as f:
+            f.write("G2,2024-08-02,2,Game Back,Calgary Colts,Regina Thunder,RB,2024,0,50,0,1,0,0,0\n")
+            f.write("G3,2024-08-03,3,Game Back,Calgary")
+        result = store.refresh()
+        assert result["new_rows"] == 1
+        assert store.load_rollup().loc[0, 'Rushing Yards'] == 150
+
+        with open(store.game_file, 'a') as f:
+            f.write(" Colts,Edmonton Huskies,RB,2024,0,30,0,0,0,0,0\n")
+        assert store.refresh()["new_rows"] == 1
+        assert store.refresh()["new_rows"] == 0
+        assert store.load_rollup().loc[0, 'Games Played'] == 3
+
+        log = player_game_log(store.load_games(), "Game Back")
+        assert list(log['Week']) == [1, 2, 3] and list(log['Total Yards']) == [100, 50, 30]
+    print("✅ Only new, complete rows are read")
+
+def test_replaced_game_file_rebuilds():
+    """A game file replaced by one at least as long is not read from the old offset"""
+    print("\nTesting replaced game file...")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = make_store(tmpdir)
+        store.add_games(box_scores("G1", 1, [("Game Back", "Calgary Colts", "Regina Thunder", "RB", 100, 1)]))
+
+        replacement = os.path.join(tmpdir, "replacement.csv")
+        with open(store.game_file) as f:
+            content = f.read()
+        with open(replacement, 'w') as f:
+            f.write(content.replace("100", "900"))
+            f.write("G2,2024-08-02,2,Game Back,Calgary Colts,Regina Thunder,RB,2024,0,50,0,1,0,0,0\n")
+        os.replace(replacement, store.game_file)
+
+        result = store.refresh()
+        assert result["new_rows"] == 2
+        assert store.load_rollup().loc[0, 'Rushing Yards'] == 950
+        assert store.refresh()["new_rows"] == 0
+    print("✅ Replaced file triggers a full rebuild")
+
+def test_rejects_bad_rows():
+    """Box score rows are validated before they are stored"""
+    print("\nTesting box score validation...")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        store = make_store(tmpdir)
+        games = box_scores("G1", 1, [("Good Back", "Calgary Colts", "Regina Thunder", "rb", 60, 0),
+                                     ("Bad Back", "Calgary Colts", "Regina Thunder", "XX", 10, 0),
+                                     ("", "Calgary Colts", "Regina Thunder", "RB", 10, 0)])
+        result = store.add_games(games)
+        assert result["added"] == 1 and result["rejected"] == 2
+        assert store.load_games()['Position'].tolist() == ["RB"]
+    print("✅ Invalid rows rejected")
+
+if __name__ == "__main__":
+    test_incremental_rollup()
+    test_appended_rows_and_partial_lines()
+    test_replaced_game_file_rebuilds()
+    test_rejects_bad_rows()
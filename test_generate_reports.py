@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Test script for the CJFL batch report generator
+"""
+
+import os
+import tempfile
+
+from utils import load_data
+from generate_reports import generate_reports, frame_to_markdown, summarize
+
+def test_generate_all_reports():
+    """Every team and position gets a Markdown and HTML report"""
+    print("Testing batch report generation...")
+    data = load_data()
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        result = generate_reports(data, output_dir=output_dir, render_charts=False, max_workers=2)
+
+        assert len(result['teams']) >= 20, "Expected a report for every CJFL team"
+        assert set(result['positions']) == set(data['Position'].unique())
+        for paths in list(result['teams'].values()) + list(result['positions'].values()):
+            assert len(paths) == 2
+            for path in paths:
+                assert os.path.getsize(path) > 0
+        assert os.path.exists(result['index'])
+
+        team = data['Team'].iloc[0]
+        with open(result['teams'][team][0], encoding='utf-8') as f:
+            report = f.read()
+        assert "## Team Statistics" in report
+        assert "## Position Breakdown" in report
+
+    print(f"✅ Generated {len(result['teams'])} team and {len(result['positions'])} position reports")
+
+def test_summary_tables():
+    """Team summary totals match the raw data"""
+    print("\nTesting report summary tables...")
+    data = load_data()
+    summary = summarize(data, 'Team')
+
+    assert summary['Players'].sum() == len(data)
+    assert summary['TDs'].sum() == data['Touchdowns'].sum()
+
+    markdown = frame_to_markdown(summary.head(2))
+    assert markdown.splitlines()[0].startswith("| Team |")
+    assert len(markdown.splitlines()) == 4
+    print("✅ Summary tables render correctly")
+
+if __name__ == "__main__":
+    test_generate_all_reports()
+    test_summary_tables()
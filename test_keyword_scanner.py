@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Test script for the single-pass keyword scanner
+"""
+
+import re
+
+from keyword_scanner import KeywordAutomaton, scan_html, scan_stream
+
+PAGE = """<html><head><title>Colts Roster and Stats</title>
+<script>var stats = "roster";</script></head>
+<body>
+  <nav><a href="/Roster">Our Players</a> <a href="/tickets">Tickets</a> <a href="/news">Team STATISTICS</a></nav>
+  <p>Season stats are posted after every game. The roster changes weekly.</p>
+  <h2>Player of the Week</h2>
+</body></html>"""
+
+def naive_matches(text, keywords):
+    """Every (start, keyword) occurrence, found the slow way"""
+    text = text.lower()
+    return sorted((match.start(), keyword) for keyword in keywords
+                  for match in re.finditer(f"(?={re.escape(keyword)})", text))
+
+def test_automaton_matches_naive_search():
+    """Overlapping and nested keywords are all found in one pass"""
+    print("Testing Aho-Corasick matching...")
+    keywords = ['stat', 'statistics', 'tics', 'is', 'team', 'am']
+    automaton = KeywordAutomaton(keywords)
+    for text in ["statistics", "Team statistics and team stats", "sttatistatisticsteamam", ""]:
+        assert sorted(automaton.search(text.lower())) == naive_matches(text, keywords), text
+    print("✅ Automaton agrees with a naive search")
+
+def test_scan_page():
+    """Hits are ranked, script text is skipped and keyword links are collected"""
+    print("\nTesting page scan...")
+    result = scan_html(PAGE, ['roster', 'stats', 'player', 'team'])
+
+    assert result["counts"] == {'roster': 2, 'stats': 2, 'player': 2, 'team': 1}
+    assert result["hits"]['roster'][0]["tag"] == "title", "title text should outrank body text"
+    assert "roster changes weekly" in result["hits"]['roster'][1]["context"]
+    assert [link["href"] for link in result["links"]] == ["/Roster", "/news"]
+    assert result["links"][0]["keywords"] == ['player', 'roster']
+    print(f"✅ {sum(result['counts'].values())} matches, {len(result['links'])} links")
+
+def test_streamed_chunks_match_whole_page():
+    """Feeding the page in small chunks gives the same result as scanning it whole"""
+    print("\nTesting streamed scan...")
+    keywords = ['roster', 'stats', 'player', 'team']
+    chunks = [PAGE[i:i + 7] for i in range(0, len(PAGE), 7)]
+    assert scan_stream(chunks, keywords) == scan_html(PAGE, keywords)
+    print(f"✅ {len(chunks)} chunks scanned")
+
+if __name__ == "__main__":
+    test_automaton_matches_naive_search()
+    test_scan_page()
+    test_streamed_chunks_match_whole_page()
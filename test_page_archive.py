@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test script for the content-addressed page archive
+Works in a temporary directory
+"""
+
+import os
+import tempfile
+
+from page_archive import PageArchive, reextract
+
+ROSTER = """<table>
+  <tr><th>Player</th><th>Pos</th><th>GP</th><th>Tackles</th><th>Sacks</th></tr>
+  <tr><td>Archived Rusher</td><td>DE</td><td>10</td><td>31</td><td>9</td></tr>
+</table>"""
+
+def test_dedup_and_index():
+    """Identical pages are stored once; every fetch is indexed"""
+    print("Testing archive storage...")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        archive = PageArchive(tmpdir)
+        first = archive.store("https://colts.test/roster", ROSTER, team="Calgary Colts", fetched_at="2025-08-01T10:00:00")
+        second = archive.store("https://colts.test/roster", ROSTER, team="Calgary Colts", fetched_at="2025-08-08T10:00:00")
+        archive.store("https://thunder.test/", "<p>Thunder</p>", team="Regina Thunder", fetched_at="2025-08-02T10:00:00")
+
+        assert first == second
+        summary = archive.summary()
+        assert summary["fetches"] == 3 and summary["unique_pages"] == 2
+        assert archive.read(first) == ROSTER
+
+        colts = archive.fetches(team="Calgary Colts")
+        assert list(colts['fetched_at']) == ["2025-08-01T10:00:00", "2025-08-08T10:00:00"]
+        assert len(archive.fetches(latest=True)) == 2
+        assert len(archive.fetches(since="2025-08-05")) == 1
+
+        objects = [name for _, _, files in os.walk(os.path.join(tmpdir, "objects")) for name in files]
+        assert len(objects) == 2
+    print("✅ 3 fetches stored as 2 compressed pages")
+
+def test_reextract_offline():
+    """The extractor re-runs over archived pages in worker processes"""
+    print("\nTesting offline re-extraction...")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        archive = PageArchive(tmpdir)
+        archive.store("https://colts.test/roster", ROSTER, team="Calgary Colts")
+        archive.store("https://colts.test/missing", "Not found", team="Calgary Colts", status=404)
+
+        players, rejected = reextract(archive, workers=2)
+        assert list(players['Player Name']) == ["Archived Rusher"]
+        assert players['Position'].iloc[0] == "DL" and players['Team'].iloc[0] == "Calgary Colts"
+        assert players['Source'].iloc[0] == "https://colts.test/roster"
+        assert rejected == 0
+    print("✅ Players re-extracted without network access")
+
+if __name__ == "__main__":
+    test_dedup_and_index()
+    test_reextract_offline()
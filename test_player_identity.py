@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test script for fuzzy player identity resolution
+"""
+
+import pandas as pd
+
+from player_identity import soundex, jaro_winkler, resolve_identities, apply_player_identity
+
+def make_rows(names_and_teams):
+    return pd.DataFrame([{
+        'Player Name': name, 'Team': team, 'Position': position, 'Season': season,
+        'Games Played': games, 'Passing Yards': 0, 'Rushing Yards': yards, 'Receiving Yards': 0,
+        'Touchdowns': 0, 'Tackles': 0, 'Sacks': 0, 'Interceptions': 0
+    } for name, team, position, season, games, yards in names_and_teams])
+
+def test_string_measures():
+    """Soundex and Jaro-Winkler match their reference values"""
+    print("Testing phonetic and similarity measures...")
+    assert soundex("Robert") == soundex("Rupert") == "R163"
+    assert soundex("Ashcraft") == "A261"
+    assert soundex("Tymczak") == "T522"
+    assert abs(jaro_winkler("martha", "marhta") - 0.9611) < 0.001
+    assert jaro_winkler("dixon", "dixon") == 1.0
+    print("✅ Soundex and Jaro-Winkler correct")
+
+def test_resolve_and_apply():
+    """Spelling variants of one player collapse to a single canonical player"""
+    print("\nTesting identity resolution...")
+    data = make_rows([
+        ("Julien Beaulieu", "Edmonton Wildcats", "QB", 2023, 10, 500),
+        ("J. Beaulieu", "Edmonton Wildcats", "QB", 2024, 10, 587),
+        ("Julien Béaulieu", "Edmonton Wildcats", "QB", 2024, 6, 100),
+        ("Julien Beaulieu", "Calgary Colts", "QB", 2024, 10, 300),
+        ("Declan Schlecht", "Okanagan Sun", "LB", 2024, 9, 0),
+        ("Dreyden Schlecht", "Okanagan Sun", "LB", 2024, 9, 0),
+    ])
+    mapping = resolve_identities(data)
+    ids = dict(zip(zip(mapping['Player Name'], mapping['Team']), mapping['Player ID']))
+
+    edmonton = {ids[(name, "Edmonton Wildcats")] for name in ["Julien Beaulieu", "J. Beaulieu", "Julien Béaulieu"]}
+    assert len(edmonton) == 1
+    assert ids[("Julien Beaulieu", "Calgary Colts")] not in edmonton
+    assert ids[("Declan Schlecht", "Okanagan Sun")] != ids[("Dreyden Schlecht", "Okanagan Sun")]
+
+    resolved = apply_player_identity(data, mapping)
+    wildcats = resolved[resolved['Team'] == "Edmonton Wildcats"]
+    # Full given name wins over the initial; the accented spelling is preferred on a tie
+    assert set(wildcats['Player Name']) == {"Julien Béaulieu"}
+    # The two 2024 rows are one player: keep the more complete one instead of double counting
+    assert len(wildcats) == 2
+    assert wildcats.loc[wildcats['Season'] == 2024, 'Rushing Yards'].tolist() == [587]
+    assert len(resolved) == len(data) - 1
+    print(f"✅ {len(mapping)} variants resolved to {mapping['Player ID'].nunique()} players")
+
+def test_ambiguous_initial():
+    """An initial that fits two different full names joins neither, so no player's row is dropped"""
+    print("\nTesting ambiguous initials...")
+    data = make_rows([
+        ("Julien Beaulieu", "Edmonton Wildcats", "QB", 2024, 10, 500),
+        ("Jacques Beaulieu", "Edmonton Wildcats", "QB", 2024, 8, 200),
+        ("J. Beaulieu", "Edmonton Wildcats", "QB", 2023, 9, 450),
+    ])
+    mapping = resolve_identities(data)
+    ids = dict(zip(mapping['Player Name'], mapping['Player ID']))
+    assert len(set(ids.values())) == 3
+
+    resolved = apply_player_identity(data, mapping)
+    assert len(resolved) == len(data)
+    assert resolved['Rushing Yards'].sum() == data['Rushing Yards'].sum()
+
+    # With only one full name in the block the initial is that player
+    mapping = resolve_identities(data[data['Player Name'] != "Jacques Beaulieu"])
+    assert mapping['Player ID'].nunique() == 1
+    print("✅ Ambiguous initial kept apart")
+
+if __name__ == "__main__":
+    test_string_measures()
+    test_resolve_and_apply()
+    test_ambiguous_initial()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test script for the data collection progress dashboard helpers
+Works in a temporary directory
+"""
+
+import io
+import os
+import tempfile
+
+import pandas as pd
+
+import progress_dashboard
+from progress_dashboard import (DEFAULT_STATUS_STYLE, STATUS_STYLES, build_team_status_table, style_team_status,
+                                top_players_markdown)
+from progress_store import ProgressStore
+
+def test_refresh_every():
+    """Without an interval the section renders once, undecorated"""
+    print("Testing refresh_every...")
+    def section():
+        return "rendered"
+    assert progress_dashboard.refresh_every(None)(section) is section
+    assert progress_dashboard.refresh_every(0)(section) is section
+    assert callable(progress_dashboard.refresh_every(5)(section))
+    print("✅ Sections only rerun with an interval")
+
+def test_progress_cached_per_version():
+    """The snapshot is re-read only when the store's version changes"""
+    print("\nTesting load_progress_data caching...")
+    original = progress_dashboard.get_progress_store
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = ProgressStore(os.path.join(tmp_dir, "progress.db"), json_path=None)
+        progress_dashboard.get_progress_store = lambda: store
+        progress_dashboard.load_progress_data.clear()
+        try:
+            assert progress_dashboard.load_progress_data(store.version()) is None  # nothing recorded yet
+
+            store.update_team("Calgary Colts", add_players=5)
+            first = store.version()
+            assert progress_dashboard.load_progress_data(first)["total_players_collected"] == 5
+
+            store.update_team("Calgary Colts", add_players=2)
+            assert progress_dashboard.load_progress_data(first)["total_players_collected"] == 5
+            assert progress_dashboard.load_progress_data(store.version())["total_players_collected"] == 7
+        finally:
+            progress_dashboard.get_progress_store = original
+            progress_dashboard.load_progress_data.clear()
+    print("✅ Progress re-read once per version")
+
+def test_team_status_table():
+    """Fixed column order, missing fields filled, and one style per status"""
+    print("\nTesting team status table...")
+    columns = ["Team", "Status", "Players Collected", "Last Updated", "Notes"]
+    empty = build_team_status_table({})
+    assert list(empty.columns) == columns and empty.empty
+
+    teams = {
+        "Calgary Colts": {"status": "completed", "players_collected": 42, "last_updated": "2025-07-20T10:00:00",
+                          "notes": "Roster complete", "data_sources_checked": ["website"]},
+        "Regina Thunder": {"status": "in_progress", "players_collected": 5},
+        "Okanagan Sun": {"status": "no_data_available"}
+    }
+    table = build_team_status_table(teams)
+    assert list(table.columns) == columns
+    assert list(table['Team']) == list(teams)
+    assert list(table['Players Collected']) == [42, 5, 0]
+    assert list(table['Last Updated']) == ["2025-07-20T10:00:00", "Never", "Never"]
+    assert list(table['Notes']) == ["Roster complete", "", ""]
+
+    styles = style_team_status(table)._compute().ctx
+    status_column = columns.index("Status")
+    expected = [STATUS_STYLES["completed"], STATUS_STYLES["in_progress"], DEFAULT_STATUS_STYLE]
+    for row, style in enumerate(expected):
+        css = "; ".join(f"{name}: {value}" for name, value in styles[(row, status_column)])
+        assert css == style
+    assert (0, 0) not in styles  # only the Status column is colored
+    style_team_status(empty).to_html()
+    print("✅ Status table and styles")
+
+def test_top_players_markdown():
+    """One section per category with data, players in descending order"""
+    print("\nTesting top players markdown...")
+    data = pd.DataFrame({'Player Name': ["Low", "High", "Mid"],
+                         'Team': ["Calgary Colts", "Regina Thunder", "Okanagan Sun"],
+                         'Position': ["RB", "RB", "QB"], 'Rushing Yards': [100, 1200, 650]})
+    markdown = top_players_markdown(data, ['Rushing Yards', 'Tackles'], top_n=2)
+    assert markdown.startswith("**Rushing Yards:**")
+    assert "- High (Regina Thunder, RB): 1,200\n- Mid (Okanagan Sun, QB): 650" in markdown
+    assert "Low" not in markdown and "Tackles" not in markdown
+
+    data.loc[1, 'Team'], data.loc[2, 'Position'] = None, None
+    assert "- High (, RB): 1,200\n- Mid (Okanagan Sun, ): 650" in top_players_markdown(data, ['Rushing Yards'], 2)
+
+    empty = pd.read_csv(io.StringIO("Player Name,Team,Position,Rushing Yards\n"))
+    assert top_players_markdown(empty, ['Rushing Yards']) == ""
+    print("✅ Top players markdown")
+
+if __name__ == "__main__":
+    test_refresh_every()
+    test_progress_cached_per_version()
+    test_team_status_table()
+    test_top_players_markdown()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Test script for the transactional progress store
+"""
+
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from progress_store import ProgressStore
+
+def add_players(db_path, team_name, times):
+    store = ProgressStore(db_path, json_path=None)
+    for _ in range(times):
+        store.update_team(team_name, add_players=1, default_status="in_progress")
+
+def test_migrates_legacy_json():
+    """Existing collection_progress.json is imported on first open"""
+    print("Testing JSON migration...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        json_path = os.path.join(tmp_dir, "progress.json")
+        with open(json_path, 'w') as f:
+            json.dump({"start_date": "2025-07-19T22:42:49", "teams": {
+                "Calgary Colts": {"status": "completed", "players_collected": 12, "notes": "done"}
+            }}, f)
+
+        store = ProgressStore(os.path.join(tmp_dir, "progress.db"), json_path)
+        progress = store.snapshot()
+        assert progress["start_date"] == "2025-07-19T22:42:49"
+        assert progress["teams"]["Calgary Colts"]["players_collected"] == 12
+        assert progress["total_teams_completed"] == 1
+
+        # Re-opening does not import again
+        store.update_team("Calgary Colts", add_players=3)
+        assert ProgressStore(store.db_path, json_path).snapshot()["total_players_collected"] == 15
+    print("✅ Legacy progress imported once")
+
+def test_concurrent_updates_are_not_lost():
+    """Several processes updating teams at once never lose an increment"""
+    print("\nTesting concurrent writers...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "progress.db")
+        ProgressStore(db_path, json_path=None)
+
+        jobs = [("Calgary Colts", 25), ("Calgary Colts", 25), ("Regina Thunder", 25), ("Calgary Colts", 25)]
+        with ProcessPoolExecutor(max_workers=4) as executor:
+            list(executor.map(add_players, [db_path] * len(jobs), *zip(*jobs)))
+
+        progress = ProgressStore(db_path, json_path=None).snapshot()
+        assert progress["teams"]["Calgary Colts"]["players_collected"] == 75
+        assert progress["teams"]["Regina Thunder"]["players_collected"] == 25
+        assert progress["total_players_collected"] == 100
+    print("✅ 100 concurrent increments, none lost")
+
+def test_views_match_replay():
+    """Incrementally maintained views equal a full replay of the event log"""
+    print("\nTesting materialized views and replay...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = ProgressStore(os.path.join(tmp_dir, "progress.db"), json_path=None)
+        store.update_team("Calgary Colts", status="in_progress", data_source="website")
+        store.update_team("Calgary Colts", add_players=20)
+        checkpoint = store.history()[-1]["timestamp"]
+        store.update_team("Regina Thunder", add_players=5, default_status="in_progress")
+        store.update_team("Calgary Colts", status="completed", players_collected=42, notes="Roster complete")
+
+        summary = store.summary()
+        assert summary["total_teams"] == 2
+        assert summary["status_counts"]["completed"] == 1
+        assert summary["status_counts"]["in_progress"] == 1
+        assert summary["total_players_collected"] == 47
+
+        replayed = store.replay()
+        assert replayed["teams"] == store.snapshot()["teams"]
+        assert replayed["total_players_collected"] == summary["total_players_collected"]
+
+        # Audit: state after the first two events only
+        earlier = store.replay(until=checkpoint)
+        assert list(earlier["teams"]) == ["Calgary Colts"]
+        assert earlier["teams"]["Calgary Colts"]["players_collected"] == 20
+
+        store.rebuild_views()
+        assert store.summary()["status_counts"] == summary["status_counts"]
+        assert [event["event_type"] for event in store.history("Regina Thunder")] == ["team_added", "players_added"]
+        event_count = len(store.history())
+    print(f"✅ {event_count} events, views consistent with replay")
+
+def test_replay_until_filters_out_of_order_events():
+    """Events whose timestamps run behind their ids still count for an earlier cutoff"""
+    print("\nTesting replay cutoff with out-of-order timestamps...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = ProgressStore(os.path.join(tmp_dir, "progress.db"), json_path=None)
+        store.update_team("Calgary Colts", add_players=20)
+        imported = {"status": "completed", "players_collected": 9, "data_sources_checked": [], "notes": "",
+                    "last_updated": "2024-08-01T00:00:00"}
+        with store.transaction() as conn:
+            store._append(conn, "Regina Thunder", "team_imported", imported, "2024-08-01T00:00:00")
+
+        earlier = store.replay(until="2024-12-31T00:00:00")
+        assert list(earlier["teams"]) == ["Regina Thunder"]
+        assert earlier["teams"]["Regina Thunder"]["players_collected"] == 9
+        assert set(store.replay()["teams"]) == {"Calgary Colts", "Regina Thunder"}
+    print("✅ Cutoff keeps every event at or before it")
+
+def test_version_tracks_changes():
+    """Writes and view rebuilds move the version; reads leave it alone"""
+    print("\nTesting progress version...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = ProgressStore(os.path.join(tmp_dir, "progress.db"), json_path=None)
+        initial = store.version()
+        store.summary()
+        store.snapshot()
+        assert store.version() == initial
+
+        store.update_team("Calgary Colts", add_players=3)
+        written = store.version()
+        assert written > initial
+
+        store.rebuild_views()
+        rebuilt = store.version()
+        assert rebuilt > written
+        assert ProgressStore(store.db_path, json_path=None).version() == rebuilt  # reopening is not a change
+
+        store.update_team("Calgary Colts", add_players=1)
+        assert store.version() > rebuilt
+    print("✅ Version moves on writes and rebuilds only")
+
+if __name__ == "__main__":
+    test_migrates_legacy_json()
+    test_concurrent_updates_are_not_lost()
+    test_views_match_replay()
+    test_replay_until_filters_out_of_order_events()
+    test_version_tracks_changes()
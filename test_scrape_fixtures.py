@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Test script for the fixture recorder/replayer
+Records from a throwaway local web server, then replays with the server gone
+"""
+
+import functools
+import os
+import tempfile
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from scrape_fixtures import load_archive, recording, replaying
+from team_collectors import run_collectors
+
+ROSTER = """<a href="roster.html">Roster</a>
+<table>
+  <tr><th>Player</th><th>Pos</th><th>GP</th><th>Rush Yds</th><th>TD</th></tr>
+  <tr><td>Local Runner</td><td>RB</td><td>8</td><td>640</td><td>5</td></tr>
+</table>"""
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+def record_site(tmpdir):
+    """Serve a tiny site from tmpdir, record it and shut the site down again"""
+    site = os.path.join(tmpdir, "site")
+    os.makedirs(site)
+    with open(os.path.join(site, "roster.html"), 'w') as f:
+        f.write(ROSTER)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(QuietHandler, directory=site))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/"
+    archive = os.path.join(tmpdir, "fixtures.json.gz")
+    try:
+        with recording(archive):
+            requests.get(base_url + "roster.html", timeout=5, proxies={"http": None})
+            requests.get(base_url + "missing.html", timeout=5, proxies={"http": None})
+    finally:
+        server.shutdown()
+        server.server_close()
+    return archive, base_url
+
+def test_record_and_replay():
+    """Recorded responses come back byte for byte, unknown urls get a 404"""
+    print("Testing record and replay...")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        archive, base_url = record_site(tmpdir)
+        responses = load_archive(archive)
+        assert responses[base_url + "roster.html"]["status"] == 200
+        assert responses[base_url + "missing.html"]["status"] == 404
+
+        with replaying(archive) as server:
+            assert requests.get(base_url + "roster.html", timeout=5).text == ROSTER
+            assert requests.get(base_url + "missing.html", timeout=5).status_code == 404
+            assert requests.Session().get("https://never-recorded.test/", timeout=5).status_code == 404
+        assert server.hits == 3
+    print("✅ Replayed recorded pages without the original server")
+
+def test_latency_and_errors():
+    """Configured latency is added and errors are injected"""
+    print("\nTesting latency and error injection...")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        archive, base_url = record_site(tmpdir)
+        with replaying(archive, latency=0.05) as server:
+            start = time.perf_counter()
+            requests.get(base_url + "roster.html", timeout=5)
+            assert time.perf_counter() - start >= 0.05
+        with replaying(archive, error_rate=1.0):
+            response = requests.get(base_url + "roster.html", timeout=5)
+            assert response.status_code == 503 and response.headers["Retry-After"] == "1"
+    print("✅ Latency and 503s injected")
+
+def test_collectors_against_fixtures():
+    """The collector framework runs unchanged on replayed pages"""
+    print("\nTesting collectors offline...")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        archive, base_url = record_site(tmpdir)
+        teams = {"Calgary Colts": {"website": base_url + "roster.html", "priority": 1}}
+        with replaying(archive):
+            results, _ = run_collectors(teams, dry_run=True)
+        assert list(results[0]["players"]["Player Name"]) == ["Local Runner"]
+    print("✅ Collected players from the fixture archive")
+
+if __name__ == "__main__":
+    test_record_and_replay()
+    test_latency_and_errors()
+    test_collectors_against_fixtures()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test script for the Monte Carlo season simulator
+Works in a temporary directory
+"""
+
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from season_simulator import add_schedule, load_schedule, play_bracket, prepare_season, simulate_season
+from team_ratings import ELO_HOME_ADVANTAGE, elo_win_probability
+
+CONFERENCES = {"Calgary Colts": "PFC", "Edmonton Huskies": "PFC", "Regina Thunder": "PFC", "Saskatoon Hilltops": "PFC",
+               "Winnipeg Rifles": "PFC", "Langley Rams": "BCFC", "Okanagan Sun": "BCFC", "London Beefeaters": "OFC"}
+TEAMS = list(CONFERENCES)
+
+def game(game_id, week, home, away, home_score=None, away_score=None):
+    row = {'Game ID': game_id, 'Season': 2024, 'Week': week, 'Game Date': f"2024-09-{week:02d}", 'Home Team': home,
+           'Away Team': away}
+    if home_score is not None:
+        row.update({'Home Score': home_score, 'Away Score': away_score})
+    return row
+
+def elo_table(ratings):
+    return pd.DataFrame({'Team': TEAMS, 'Elo': ratings})
+
+def test_odds_match_win_probability():
+    """A single game deciding the last playoff spot gives the Elo win probability"""
+    print("Testing simulated odds...")
+    # Calgary, Winnipeg (2-0) and Edmonton (2-1) are in; Saskatoon and Regina (0-2) play for the last spot
+    results = pd.DataFrame([game("R1", 1, "Calgary Colts", "Regina Thunder", 30, 10),
+                            game("R2", 1, "Winnipeg Rifles", "Saskatoon Hilltops", 20, 10),
+                            game("R3", 2, "Calgary Colts", "Saskatoon Hilltops", 28, 7),
+                            game("R4", 2, "Winnipeg Rifles", "Regina Thunder", 21, 3),
+                            game("R5", 1, "Edmonton Huskies", "Langley Rams", 24, 20),
+                            game("R6", 2, "Edmonton Huskies", "Okanagan Sun", 17, 14),
+                            game("R7", 3, "London Beefeaters", "Edmonton Huskies", 14, 10)])
+    schedule = pd.DataFrame([game("R1", 1, "Calgary Colts", "Regina Thunder"),
+                             game("S1", 4, "Saskatoon Hilltops", "Regina Thunder")])
+    ratings = [1600, 1550, 1450, 1500, 1520, 1500, 1480, 1500]
+    league = prepare_season(results, schedule, elo_table(ratings), CONFERENCES)
+    assert list(league["home"]) == [league["teams"].get_loc("Saskatoon Hilltops")]
+
+    odds = simulate_season(league, n_sims=40000, seed=11).set_index('Team')
+    expected = 100 * elo_win_probability(1500, 1450, ELO_HOME_ADVANTAGE)
+    assert abs(odds.loc["Saskatoon Hilltops", 'Playoff %'] - expected) < 1.0
+    assert odds.loc["Saskatoon Hilltops", 'Playoff %'] + odds.loc["Regina Thunder", 'Playoff %'] == 100
+    assert (odds.loc[["Calgary Colts", "Edmonton Huskies", "Winnipeg Rifles"], 'Playoff %'] == 100).all()
+    assert odds.loc["London Beefeaters", 'Conference Title %'] == 100
+    saskatoon = odds.loc["Saskatoon Hilltops"]
+    assert np.isclose(saskatoon['Projected Wins'], saskatoon['Playoff %'] / 100)
+    print("✅ Playoff odds follow the Elo win probability")
+
+def test_brackets_and_totals():
+    """Every simulation crowns one champion per conference and one national champion"""
+    print("\nTesting playoff brackets...")
+    rng = np.random.default_rng(5)
+    ratings = np.array([1500.0, 1500.0, 1500.0, 3500.0, 1500.0, 1500.0])
+    seeds = np.tile(np.arange(6), (1000, 1))
+    assert (play_bracket(seeds, ratings, 0.0, rng) == 3).mean() > 0.99  # a dominant team almost always wins
+    assert set(play_bracket(seeds[:, :3], np.full(6, 1500.0), 0.0, rng)) == {0, 1, 2}
+
+    rotations = [np.roll(TEAMS, week) for week in range(1, 6)]
+    schedule = pd.DataFrame([game(f"S{week}{i}", week, home, away)
+                             for week, teams in enumerate(rotations, 1)
+                             for i, (home, away) in enumerate(zip(teams[::2], teams[1::2]))])
+    league = prepare_season(pd.DataFrame(columns=list(schedule.columns) + ['Home Score', 'Away Score']), schedule,
+                            elo_table([1500] * len(TEAMS)), CONFERENCES)
+    odds = simulate_season(league, n_sims=6000, seed=2, chunk_size=1000)
+    totals = odds.groupby('Conference')[['Playoff %', 'Conference Title %', 'Championship %']].sum()
+    assert np.allclose(totals['Playoff %'], [200, 100, 400])  # BCFC, OFC, PFC fields of 2, 1 and 4
+    assert np.allclose(totals['Conference Title %'], 100)
+    assert abs(totals['Championship %'].sum() - 100) < 1e-9
+    assert np.isclose(odds['Projected Wins'].sum(), len(schedule))
+    print("✅ Brackets produce exactly one champion per simulation")
+
+def test_seeded_runs_repeat():
+    """The same seed gives the same odds in one process or across a pool"""
+    print("\nTesting deterministic seeds...")
+    schedule = pd.DataFrame([game(f"S{i}", 1 + i // 4, TEAMS[i % 8], TEAMS[(i + 3) % 8]) for i in range(24)])
+    league = prepare_season(pd.DataFrame(columns=list(schedule.columns) + ['Home Score', 'Away Score']), schedule,
+                            elo_table(np.linspace(1400, 1600, len(TEAMS))), CONFERENCES)
+    serial = simulate_season(league, n_sims=3000, seed=42, chunk_size=1000)
+    pooled = simulate_season(league, n_sims=3000, seed=42, workers=2, chunk_size=1000)
+    pd.testing.assert_frame_equal(serial, pooled)
+    assert not simulate_season(league, n_sims=3000, seed=43, chunk_size=1000).equals(serial)
+    try:
+        simulate_season(league, n_sims=0)
+        raise AssertionError("zero simulations must be rejected")
+    except ValueError:
+        pass
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "schedule.csv")
+        bad = pd.DataFrame([game("X1", 1, "Calgary Colts", "Calgary Colts"),
+                            game("", 1, "Okanagan Sun", "Langley Rams")])
+        result = add_schedule(pd.concat([schedule, bad], ignore_index=True), path)
+        assert result["added"] == 24 and result["rejected"] == 2
+        assert add_schedule(schedule, path)["duplicates"] == 24
+        assert len(load_schedule(path)) == 24
+    print("✅ Seeded odds repeat and bad games are rejected")
+
+if __name__ == "__main__":
+    test_odds_match_win_probability()
+    test_brackets_and_totals()
+    test_seeded_runs_repeat()
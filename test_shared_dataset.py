@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared memory-mapped dataset mode
+"""
+
+import os
+import tempfile
+
+import pandas as pd
+
+from utils import load_csv_data, add_derived_columns
+from shared_dataset import (materialize_shared_dataset, attach_shared_dataset,
+                            load_shared_dataset, stored_signature, source_signature)
+
+def test_attach_matches_csv():
+    """Attached frame has the same values as the CSV loader plus derived columns"""
+    print("Testing shared dataset round trip...")
+    expected = add_derived_columns(load_csv_data())
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "stats.arrow")
+        materialize_shared_dataset(load_csv_data(), path)
+        attached = attach_shared_dataset(path)
+
+        assert list(attached.columns) == list(expected.columns)
+        pd.testing.assert_frame_equal(attached, expected, check_dtype=False)
+
+        # Numeric columns are views of the read-only memory map, not private copies
+        assert not attached['Touchdowns'].to_numpy().flags.writeable
+    print(f"✅ Attached {attached.shape[0]} rows zero-copy")
+
+def test_rebuild_when_source_changes():
+    """Only a changed source file triggers a rebuild"""
+    print("\nTesting shared dataset staleness check...")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        source = os.path.join(tmp_dir, "stats.csv")
+        path = os.path.join(tmp_dir, "stats.arrow")
+        load_csv_data().head(10).to_csv(source, index=False)
+
+        calls = []
+        def loader():
+            calls.append(1)
+            return pd.read_csv(source)
+
+        first = load_shared_dataset(loader, path, [source])
+        second = load_shared_dataset(loader, path, [source])
+        assert len(calls) == 1
+        assert len(first) == len(second) == 10
+        assert stored_signature(path) == source_signature([source])
+
+        pd.read_csv(source).head(5).to_csv(source, index=False)
+        third = load_shared_dataset(loader, path, [source])
+        assert len(calls) == 2
+        assert len(third) == 5
+    print("✅ Dataset rebuilt only when the source changed")
+
+if __name__ == "__main__":
+    test_attach_matches_csv()
+    test_rebuild_when_source_changes()
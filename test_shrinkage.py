@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test script for the empirical-Bayes rate shrinkage
+"""
+
+import numpy as np
+import pandas as pd
+
+from shrinkage import MIN_GROUP_PLAYERS, RateShrinker, adjusted_column, shrink_rates, shrinkage_priors
+
+def simulated_league(n_players=600, seed=1):
+    """Running backs with a true touchdown rate each, observed over 1-12 games; returns (data, true rates)"""
+    rng = np.random.default_rng(seed)
+    true_rates = rng.gamma(4.0, 0.25, n_players)  # mean 1, variance 0.25
+    games = rng.integers(1, 13, n_players)
+    data = pd.DataFrame({'Player Name': [f"Player {i}" for i in range(n_players)], 'Team': "Calgary Colts",
+                         'Position': "RB", 'Season': 2024, 'Games Played': games, 'Passing Yards': 0,
+                         'Rushing Yards': 0, 'Receiving Yards': 0, 'Touchdowns': rng.poisson(true_rates * games),
+                         'Tackles': 0, 'Sacks': 0, 'Interceptions': 0})
+    return data, true_rates
+
+def test_priors_and_error():
+    """The fit splits the spread into player differences and noise; shrunk rates are closer to the truth"""
+    print("Testing shrinkage priors...")
+    data, true_rates = simulated_league(n_players=5000)
+    prior = shrinkage_priors(data, 'Touchdowns').loc['RB']
+    assert abs(prior['Prior Mean'] - 1.0) < 0.1
+    assert abs(prior['Spread'] - 0.25) < 0.06 and abs(prior['Noise'] - 1.0) < 0.35  # Poisson noise: variance = mean
+    assert np.isclose(prior['Shrinkage Games'], prior['Noise'] / prior['Spread'])
+
+    adjusted = shrink_rates(data)[adjusted_column('Touchdowns per Game')]
+    raw = data['Touchdowns'] / data['Games Played']
+    assert ((adjusted - true_rates) ** 2).mean() < 0.6 * ((raw - true_rates) ** 2).mean()
+    # Shrinkage pulls every rate toward the mean, short samples the most
+    assert (np.abs(adjusted - prior['Prior Mean']) <= np.abs(raw - prior['Prior Mean']) + 1e-12).all()
+    one_game = data['Games Played'] == 1
+    assert (adjusted - raw).abs()[one_game].mean() > (adjusted - raw).abs()[data['Games Played'] == 12].mean()
+    print("✅ Adjusted rates beat raw rates on simulated players")
+
+def test_small_groups_and_no_games():
+    """Rare positions borrow the league-wide prior; players without games get no rate"""
+    print("\nTesting small groups...")
+    data, _ = simulated_league(n_players=200)
+    data.loc[:MIN_GROUP_PLAYERS - 2, 'Position'] = "K"
+    data.loc[MIN_GROUP_PLAYERS - 1, 'Games Played'] = 0
+    adjusted = shrink_rates(data)[adjusted_column('Touchdowns per Game')]
+    league = shrinkage_priors(data, 'Touchdowns', None).loc['All']
+    kickers = data['Position'] == "K"
+    expected = (data['Touchdowns'] + league['Shrinkage Games'] * league['Prior Mean']) / (
+        data['Games Played'] + league['Shrinkage Games'])
+    assert np.allclose(adjusted[kickers], expected[kickers])
+    assert np.isnan(adjusted[MIN_GROUP_PLAYERS - 1])
+    assert adjusted.drop(index=MIN_GROUP_PLAYERS - 1).notna().all()
+    print("✅ Small groups use the league prior")
+
+def test_cached_per_version():
+    """Adjusted columns are computed once per data version and added to a copy"""
+    print("\nTesting caching...")
+    data, _ = simulated_league(n_players=50)
+    shrinker = RateShrinker()
+    first = shrinker.apply(data, version="v1")
+    computed = shrinker.values
+    shrinker.apply(data, version="v1")
+    assert shrinker.values is computed
+    assert adjusted_column('Yards per Game') in first.columns and adjusted_column('Yards per Game') not in data.columns
+    shrinker.apply(data, version="v2")
+    assert shrinker.values is not computed
+    print("✅ Adjusted rates cached per data version")
+
+if __name__ == "__main__":
+    test_priors_and_error()
+    test_small_groups_and_no_games()
+    test_cached_per_version()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test script for the bounded site crawler
+Uses a fake HTTP session, no network access
+"""
+
+import threading
+
+from site_crawler import BloomFilter, SiteCrawler, normalize_url
+
+SITE = {
+    "https://colts.test/": """<a href="/team/">Team &amp; Players</a> <a href="/tickets">Tickets</a>
+                              <a href="https://www.colts.test/schedule?utm_source=nav#top">Schedule</a>
+                              <a href="https://elsewhere.test/roster">Partner roster</a>""",
+    "https://colts.test/team/": """<a href="../roster/">2024 Roster</a> <a href="/team/stats">Season Stats</a>
+                                   <a href="/">Home</a>""",
+    "https://colts.test/team/stats": "<table><tr><th>Player</th><th>Pos</th></tr><tr><td>A</td><td>QB</td></tr></table>",
+    "https://colts.test/roster/": '<a href="/roster/archive">Roster archive</a>',
+    "https://www.colts.test/schedule": "<p>Schedule</p>",
+}
+
+class FakeResponse:
+    def __init__(self, status_code, text):
+        self.status_code = status_code
+        self.text = text
+
+class FakeSession:
+    def __init__(self):
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def get(self, url, timeout=None):
+        with self.lock:
+            self.requests.append(url)
+        return FakeResponse(200, SITE[url]) if url in SITE else FakeResponse(404, "")
+
+def test_normalize_url():
+    """Equivalent spellings of a URL collapse to one form"""
+    print("Testing URL normalization...")
+    canonical = "https://colts.test/roster/?season=2024&team=colts"
+    for url in ["HTTPS://Colts.TEST:443/roster/?team=colts&season=2024",
+                "https://colts.test//team/../roster/?season=2024&team=colts&utm_source=x#players"]:
+        assert normalize_url(url) == canonical, url
+    assert normalize_url("stats", "https://colts.test/team/") == "https://colts.test/team/stats"
+    assert normalize_url("mailto:info@colts.test") is None
+    assert normalize_url("/logo.png", "https://colts.test/") is None
+    print("✅ URLs normalized")
+
+def test_bloom_filter():
+    """No false negatives, and few false positives at the configured rate"""
+    print("\nTesting Bloom filter...")
+    bloom = BloomFilter(capacity=2000, error_rate=0.01)
+    urls = [f"https://colts.test/page/{i}" for i in range(2000)]
+    added = sum(bloom.add(url) for url in urls)
+    assert added >= 1980, "an add only reports a duplicate on a (rare) false positive"
+    assert not bloom.add(urls[0])
+    assert all(url in bloom for url in urls)
+    false_positives = sum(f"https://other.test/{i}" in bloom for i in range(5000))
+    assert false_positives < 150, false_positives
+    print(f"✅ {false_positives} false positives in 5000 checks, {len(bloom.bits)} bytes")
+
+def test_crawl_site():
+    """Keyword links are followed breadth-first within depth and page budget"""
+    print("\nTesting bounded crawl...")
+    session = FakeSession()
+    result = SiteCrawler(session, max_pages=10, max_depth=2, page_delay=0).crawl_site("Calgary Colts",
+                                                                                      "https://colts.test")
+    visited = [page["url"] for page in result["pages"]]
+    assert visited[0] == "https://colts.test/"
+    assert set(visited[1:3]) == {"https://colts.test/team/", "https://www.colts.test/schedule"}
+    assert visited[1] == "https://colts.test/team/", "higher-scoring links go first"
+    assert "https://colts.test/team/stats" in visited and "https://colts.test/roster/" in visited
+    assert "https://colts.test/roster/archive" not in visited, "depth 3 is beyond the limit"
+    assert not any("elsewhere" in url or "tickets" in url for url in session.requests)
+    assert len(session.requests) == len(set(session.requests))
+    assert next(page for page in result["pages"] if page["url"].endswith("/stats"))["tables"] == 1
+
+    small = SiteCrawler(FakeSession(), max_pages=2, page_delay=0).crawl_site("Calgary Colts", "https://colts.test/")
+    # Budget spent on the homepage and /team/: the schedule link and both links on /team/ are left over
+    assert len(small["pages"]) == 2 and small["over_budget"] == 3
+    print(f"✅ Visited {len(visited)} pages")
+
+if __name__ == "__main__":
+    test_normalize_url()
+    test_bloom_filter()
+    test_crawl_site()
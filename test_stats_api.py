@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test script for the CJFL stats JSON API
+Calls the ASGI app directly, no server or network needed
+"""
+
+import asyncio
+import gzip
+import json
+
+from utils import load_csv_data
+from stats_api import StatsAPI
+
+def request(app, path, query="", headers=None):
+    """Run one GET request through the ASGI app and return (status, headers, body)"""
+    scope = {
+        "type": "http", "method": "GET", "path": path, "query_string": query.encode(),
+        "headers": [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()]
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    response_headers = {name.decode(): value.decode() for name, value in messages[0]["headers"]}
+    return messages[0]["status"], response_headers, messages[1]["body"]
+
+def test_players_pagination():
+    """Players endpoint pages through filter_data results"""
+    print("Testing /players pagination...")
+    app = StatsAPI(loader=load_csv_data)
+    data = load_csv_data()
+
+    status, _, body = request(app, "/players", "page=2&page_size=10")
+    payload = json.loads(body)
+    assert status == 200
+    assert payload["total"] == len(data)
+    assert payload["page"] == 2
+    assert len(payload["data"]) == 10
+
+    team = data['Team'].iloc[0]
+    status, _, body = request(app, "/players", f"team={team}&page_size=500")
+    assert all(row["Team"] == team for row in json.loads(body)["data"])
+    print(f"✅ {payload['total']} players across {payload['pages']} pages")
+
+def test_etag_and_compression():
+    """Repeat requests hit the result cache, honour If-None-Match and gzip on request"""
+    print("\nTesting ETag caching and compression...")
+    app = StatsAPI(loader=load_csv_data)
+
+    status, headers, body = request(app, "/players", "page_size=100")
+    assert status == 200
+    etag = headers["etag"]
+
+    status, _, body_again = request(app, "/players", "page_size=100", {"If-None-Match": etag})
+    assert status == 304
+    assert body_again == b""
+    assert len(app.cache) == 1
+
+    status, headers, compressed = request(app, "/players", "page_size=100", {"Accept-Encoding": "gzip"})
+    assert headers["content-encoding"] == "gzip"
+    assert gzip.decompress(compressed) == body
+
+    for refused in ("gzip;q=0", "br, gzip; q=0.0", "*;q=0", "identity"):
+        status, headers, plain = request(app, "/players", "page_size=100", {"Accept-Encoding": refused})
+        assert "content-encoding" not in headers and plain == body, refused
+    status, headers, _ = request(app, "/players", "page_size=100", {"Accept-Encoding": "br;q=1, *;q=0.5"})
+    assert headers["content-encoding"] == "gzip"
+    print("✅ 304 on matching ETag, gzip bodies decompress to the cached JSON")
+
+def test_leaderboard_and_compare():
+    """Leaderboard and team comparison reuse the dashboard calculations"""
+    print("\nTesting /leaderboard and /teams/compare...")
+    app = StatsAPI(loader=load_csv_data)
+    data = load_csv_data()
+
+    status, _, body = request(app, "/leaderboard", "stat=Rushing+Yards&top=5")
+    leaders = json.loads(body)["data"]
+    assert status == 200
+    assert [row["Rushing Yards"] for row in leaders] == sorted(data['Rushing Yards'].nlargest(5), reverse=True)
+
+    team1, team2 = sorted(data['Team'].unique())[:2]
+    status, _, body = request(app, "/teams/compare", f"team1={team1}&team2={team2}")
+    teams = json.loads(body)["teams"]
+    assert teams[team1]["totals"]["Touchdowns"] == data.loc[data['Team'] == team1, 'Touchdowns'].sum()
+
+    status, _, _ = request(app, "/leaderboard", "stat=Nope")
+    assert status == 400
+    for limits in ("stat=Rushing+Yards&top=0", "stat=Rushing+Yards&top=-3", "page_size=0", "page=-1"):
+        status, _, body = request(app, "/leaderboard" if "stat" in limits else "/players", limits)
+        assert status == 400 and "positive" in json.loads(body)["error"], limits
+    status, _, _ = request(app, "/missing")
+    assert status == 404
+    print("✅ Leaderboard and comparison endpoints return dashboard values")
+
+if __name__ == "__main__":
+    test_players_pagination()
+    test_etag_and_compression()
+    test_leaderboard_and_compare()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test script for the per-team collector framework
+Uses a fake HTTP session and temporary files, no network access
+"""
+
+import os
+import tempfile
+import threading
+
+import pandas as pd
+import requests
+
+from collect_calgary_colts_data import CalgaryColtsCollector
+from page_archive import PageArchive
+from progress_store import ProgressStore
+from team_collectors import TeamCollector, get_collector, run_collectors
+
+TEAMS = {
+    "Calgary Colts": {"website": "https://calgarycolts.test/", "priority": 1,
+                      "social_media": ["https://www.facebook.com/calgarycolts"]},
+    "Regina Thunder": {"website": "https://reginathunder.test/", "priority": 2},
+    "Okanagan Sun": {"website": "https://okanagansun.test/", "priority": 2},
+}
+
+ROSTER = """<table>
+  <tr><th>Player</th><th>Team</th><th>Pos</th><th>GP</th><th>Tackles</th><th>INT</th></tr>
+  <tr><td>Thunder Safety</td><td>Regina Thunder</td><td>S</td><td>10</td><td>44</td><td>3</td></tr>
+  <tr><td>Colts Linebacker</td><td>Calgary Colts</td><td>LB</td><td>9</td><td>61</td><td>1</td></tr>
+</table>"""
+
+PAGES = {
+    "https://calgarycolts.test/": '<a href="/roster">Roster</a>',
+    "https://calgarycolts.test/roster": ROSTER,
+    "https://reginathunder.test/": '<a href="/stats">Stats</a>',
+    "https://reginathunder.test/stats": ROSTER,
+}
+
+class FakeResponse:
+    def __init__(self, status_code, text):
+        self.status_code = status_code
+        self.text = text
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"HTTP {self.status_code}")
+
+class FakeSession:
+    """Stands in for requests.Session; counts requests per url"""
+
+    def __init__(self):
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def get(self, url, timeout=None):
+        with self.lock:
+            self.requests.append(url)
+        return FakeResponse(200, PAGES[url]) if url in PAGES else FakeResponse(404, "")
+
+def test_registry():
+    """Teams with an adapter get it, every other team gets the default collector"""
+    print("Testing collector registry...")
+    colts = get_collector("Calgary Colts", TEAMS["Calgary Colts"], session=FakeSession())
+    thunder = get_collector("Regina Thunder", TEAMS["Regina Thunder"], session=FakeSession())
+    assert isinstance(colts, CalgaryColtsCollector)
+    assert type(thunder) is TeamCollector
+    assert colts.website == "https://calgarycolts.test/"
+    assert colts.social_link("facebook") == "https://www.facebook.com/calgarycolts"
+    print("✅ Adapters resolved from the registry")
+
+def test_run_collectors():
+    """One concurrent pass collects every team and writes the dataset once"""
+    print("\nTesting concurrent collection...")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        data_file = os.path.join(tmpdir, "stats.csv")
+        store = ProgressStore(os.path.join(tmpdir, "progress.db"), os.path.join(tmpdir, "progress.json"))
+        session = FakeSession()
+        archive = PageArchive(os.path.join(tmpdir, "archive"))
+        results, updated = run_collectors(TEAMS, data_file=data_file, progress_store=store, session=session,
+                                          archive=archive)
+
+        by_team = {result["team"]: result for result in results}
+        assert by_team["Calgary Colts"]["added"] == 1 and by_team["Regina Thunder"]["added"] == 1
+        # Each roster lists the other team's player too; validation rejects rows for the wrong team
+        assert by_team["Calgary Colts"]["rejected"] == 1
+        assert by_team["Okanagan Sun"]["errors"] and not by_team["Okanagan Sun"]["pages"]
+        assert len(session.requests) == len(set(session.requests)), "each page should be fetched once"
+        # Both rosters are the same page, so the archive keeps one copy of it
+        assert archive.summary()["fetches"] == 4 and archive.summary()["unique_pages"] == 3
+
+        data = pd.read_csv(data_file)
+        assert sorted(data['Player Name']) == ["Colts Linebacker", "Thunder Safety"]
+        assert data.loc[data['Player Name'] == "Thunder Safety", 'Position'].iloc[0] == "DB"
+
+        teams = store.snapshot()["teams"]
+        assert teams["Regina Thunder"]["players_collected"] == 1
+        assert "https://reginathunder.test/stats" in teams["Regina Thunder"]["data_sources_checked"]
+    print(f"✅ Collected {len(data)} players from {len(results)} teams")
+
+if __name__ == "__main__":
+    test_registry()
+    test_run_collectors()
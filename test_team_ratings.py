@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test script for the Elo and SRS team ratings
+Works in a temporary directory
+"""
+
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from team_ratings import ELO_INITIAL, EloTracker, add_results, load_elo, load_results, power_rankings, solve_srs
+
+TEAMS = ["Calgary Colts", "Edmonton Huskies", "Regina Thunder", "Saskatoon Hilltops", "Winnipeg Rifles",
+         "Okanagan Sun"]
+
+def schedule(strengths, weeks, season=2024, home_edge=3.0):
+    """Round-robin style results whose margins are exactly strength difference plus home edge"""
+    rows = []
+    for week in range(1, weeks + 1):
+        order = np.roll(np.arange(len(TEAMS)), week)
+        for home, away in zip(order[::2], order[1::2]):
+            margin = strengths[home] - strengths[away] + home_edge
+            rows.append({'Game ID': f"{season}-{week}-{home}", 'Season': season, 'Week': week,
+                         'Game Date': f"{season}-08-{week:02d}", 'Home Team': TEAMS[home], 'Away Team': TEAMS[away],
+                         'Home Score': 30 + margin / 2, 'Away Score': 30 - margin / 2})
+    return pd.DataFrame(rows)
+
+def test_srs_recovers_strengths():
+    """With noise-free margins the least-squares solution is the true strength of every team"""
+    print("Testing SRS solve...")
+    strengths = np.array([12.0, 6.0, 2.0, -4.0, -6.0, -10.0])
+    table, home_edge = solve_srs(schedule(strengths, weeks=10))
+    assert abs(home_edge - 3.0) < 1e-6
+    srs = table.set_index('Team').loc[TEAMS, 'SRS'].to_numpy()
+    assert np.allclose(srs, strengths, atol=1e-6)
+    assert table['Team'].iloc[0] == "Calgary Colts"
+    assert np.allclose(table['SOS'], table['SRS'] - table['MOV'])
+    print("✅ SRS matches the true team strengths")
+
+def test_elo_incremental():
+    """Results appended week by week give the same Elo as playing the whole season at once"""
+    print("\nTesting incremental Elo...")
+    strengths = np.array([14.0, 7.0, 0.0, 0.0, -7.0, -14.0])
+    results = pd.concat([schedule(strengths, weeks=6, season=2023), schedule(strengths, weeks=6)], ignore_index=True)
+    results[['Home Score', 'Away Score']] = results[['Home Score', 'Away Score']].round().astype(int)
+
+    all_at_once = EloTracker()
+    all_at_once.update(results)
+    assert abs(sum(all_at_once.ratings.values()) / len(TEAMS) - ELO_INITIAL) < 1e-6
+    assert all_at_once.table()['Team'].iloc[0] == "Calgary Colts"
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path, state = os.path.join(tmpdir, "results.csv"), os.path.join(tmpdir, "elo.json")
+        for (season, week), games in results.groupby(['Season', 'Week'], sort=True):
+            add_results(games, path)
+            incremental = load_elo(path, state)
+        expected = all_at_once.table().set_index('Team')['Elo']
+        assert np.allclose(incremental.set_index('Team').loc[expected.index, 'Elo'], expected)
+        assert EloTracker.load(state).refresh(path) == 0
+
+        rankings = power_rankings(load_results(path), incremental)
+        assert list(rankings['Rank']) == list(range(1, 7)) and (rankings['Games'] == 6).all()
+    print("✅ Incremental Elo matches a full replay")
+
+def test_elo_late_and_replaced_results():
+    """An older season imported after the current one, or a replaced results file, replays every game"""
+    print("\nTesting late and replaced results...")
+    strengths = np.array([14.0, 7.0, 0.0, 0.0, -7.0, -14.0])
+    older, current = schedule(strengths, weeks=6, season=2023), schedule(strengths[::-1], weeks=6)
+    for results in (older, current):
+        results[['Home Score', 'Away Score']] = results[['Home Score', 'Away Score']].round().astype(int)
+    all_at_once = EloTracker()
+    all_at_once.update(pd.concat([older, current], ignore_index=True))
+    expected = all_at_once.table().set_index('Team')['Elo']
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path, state = os.path.join(tmpdir, "results.csv"), os.path.join(tmpdir, "elo.json")
+        add_results(current, path)
+        load_elo(path, state)
+        tracker = EloTracker.load(state)
+        assert tracker.predates(older) and not tracker.predates(schedule(strengths, weeks=1, season=2025))
+        try:
+            tracker.update(older)
+            raise AssertionError("an older season must not be played after the current one")
+        except ValueError:
+            pass
+
+        add_results(older, path)
+        late = load_elo(path, state).set_index('Team')['Elo']
+        assert np.allclose(late.loc[expected.index], expected)
+
+        # Replaced by a file at least as long: only the fingerprint shows the stored offset is stale
+        os.remove(path)
+        add_results(pd.concat([current.assign(**{'Home Score': 0, 'Away Score': 0}), older], ignore_index=True), path)
+        replayed = EloTracker()
+        replayed.update(load_results(path))
+        replaced = load_elo(path, state).set_index('Team')['Elo']
+        assert np.allclose(replaced.loc[expected.index], replayed.table().set_index('Team').loc[expected.index, 'Elo'])
+    print("✅ Late seasons and replaced files match a full replay")
+
+def test_results_validation():
+    """Bad rows are rejected and stored games are not added twice"""
+    print("\nTesting result validation...")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "results.csv")
+        games = pd.DataFrame({'Game ID': ["G1", "G2", "G3"], 'Season': [2024, 2024, 2024], 'Week': [1, 1, 1],
+                              'Game Date': "2024-08-01", 'Home Team': ["Calgary Colts", "Okanagan Sun", "Regina Thunder"],
+                              'Away Team': ["Regina Thunder", "Okanagan Sun", "Calgary Colts"],
+                              'Home Score': [21, 14, -3], 'Away Score': [17, 10, 7]})
+        result = add_results(games, path)
+        assert result["added"] == 1 and result["rejected"] == 2
+        assert add_results(games.head(1), path)["duplicates"] == 1
+        assert len(load_results(path)) == 1
+    print("✅ Invalid and duplicate results rejected")
+
+if __name__ == "__main__":
+    test_srs_recovers_strengths()
+    test_elo_incremental()
+    test_elo_late_and_replaced_results()
+    test_results_validation()
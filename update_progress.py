@@ -4,24 +4,17 @@ CJFL Progress Update Script
 Simple tool to update data collection progress
 """
 
-import json
-import os
 from datetime import datetime
 
+from progress_store import ProgressStore
+
 def load_progress():
-    """Load current progress"""
-    progress_file = "data/collection_progress.json"
-    if os.path.exists(progress_file):
-        with open(progress_file, 'r') as f:
-            return json.load(f)
+    """Load a consistent snapshot of the current progress"""
+    store = ProgressStore()
+    if store.exists():
+        return store.snapshot()
     return None
 
-def save_progress(progress):
-    """Save progress data"""
-    os.makedirs("data", exist_ok=True)
-    with open("data/collection_progress.json", 'w') as f:
-        json.dump(progress, f, indent=2)
-
 def update_team_status():
     """Update team collection status"""
     progress = load_progress()
@@ -94,26 +87,8 @@ def update_specific_team(progress, team_name):
             # Get notes
             notes = input("Notes (optional): ")
             
-            # Update progress
-            if team_name not in progress["teams"]:
-                progress["teams"][team_name] = {
-                    "status": "not_started",
-                    "players_collected": 0,
-                    "data_sources_checked": [],
-                    "notes": "",
-                    "last_updated": datetime.now().isoformat()
-                }
-            
-            progress["teams"][team_name]["status"] = new_status
-            progress["teams"][team_name]["players_collected"] = player_count
-            progress["teams"][team_name]["notes"] = notes
-            progress["teams"][team_name]["last_updated"] = datetime.now().isoformat()
-            
-            # Update total players
-            if new_status == "completed":
-                progress["total_players_collected"] += player_count
-            
-            save_progress(progress)
+            # Update progress (one atomic write for this team only)
+            ProgressStore().update_team(team_name, status=new_status, players_collected=player_count, notes=notes)
             print(f"✅ Updated {team_name}: {new_status} ({player_count} players)")
             
         else:
@@ -133,48 +108,50 @@ def add_new_team(progress):
     priority = int(input("Priority (1-3): "))
     
     if team_name not in progress["teams"]:
-        progress["teams"][team_name] = {
-            "status": "not_started",
-            "players_collected": 0,
-            "data_sources_checked": [],
-            "notes": f"Website: {website}, Contact: {contact}, Priority: {priority}",
-            "last_updated": datetime.now().isoformat()
-        }
-        
-        save_progress(progress)
+        ProgressStore().update_team(team_name, status="not_started",
+                                    notes=f"Website: {website}, Contact: {contact}, Priority: {priority}")
         print(f"✅ Added {team_name}")
     else:
         print(f"❌ {team_name} already exists")
 
 def show_progress_summary():
     """Show current progress summary"""
-    progress = load_progress()
-    if not progress:
+    progress = ProgressStore().summary()
+    if not progress["total_teams"]:
         print("❌ No progress data found")
         return
     
     print("\n📊 PROGRESS SUMMARY")
     print("=" * 40)
     
-    total_teams = len(progress.get("teams", {}))
-    completed = sum(1 for team in progress["teams"].values() if team["status"] == "completed")
-    in_progress = sum(1 for team in progress["teams"].values() if team["status"] == "in_progress")
-    not_started = sum(1 for team in progress["teams"].values() if team["status"] == "not_started")
-    no_data = sum(1 for team in progress["teams"].values() if team["status"] == "no_data_available")
+    status_counts = progress["status_counts"]
     
-    print(f"Total Teams: {total_teams}")
-    print(f"Completed: {completed}")
-    print(f"In Progress: {in_progress}")
-    print(f"Not Started: {not_started}")
-    print(f"No Data Available: {no_data}")
-    print(f"Total Players: {progress.get('total_players_collected', 0)}")
+    print(f"Total Teams: {progress['total_teams']}")
+    print(f"Completed: {status_counts['completed']}")
+    print(f"In Progress: {status_counts['in_progress']}")
+    print(f"Not Started: {status_counts['not_started']}")
+    print(f"No Data Available: {status_counts['no_data_available']}")
+    print(f"Total Players: {progress['total_players_collected']}")
     
     if progress.get("start_date"):
-        from datetime import datetime
         start_date = datetime.fromisoformat(progress["start_date"])
         days_elapsed = (datetime.now() - start_date).days
         print(f"Days Elapsed: {days_elapsed}")
 
+def show_team_history():
+    """Show the recorded collection events for one team (or all teams)"""
+    team_name = input("Team name (or press Enter for all teams): ").strip()
+    events = ProgressStore().history(team_name or None)
+    if not events:
+        print("❌ No history found")
+        return
+    
+    print(f"\n📜 HISTORY: {team_name or 'All Teams'}")
+    print("=" * 40)
+    for event in events:
+        details = ", ".join(f"{key}: {value}" for key, value in event["data"].items())
+        print(f"{event['timestamp'][:19]}  {event['team'] or '-'}  {event['event_type']}  {details}")
+
 def main():
     """Main function"""
     print("🏈 CJFL PROGRESS UPDATE TOOL")
@@ -184,7 +161,8 @@ def main():
         print("\nOptions:")
         print("1. Update team status")
         print("2. Show progress summary")
-        print("3. Exit")
+        print("3. Show team history")
+        print("4. Exit")
         
         try:
             choice = int(input("\nSelect option: "))
@@ -194,6 +172,8 @@ def main():
             elif choice == 2:
                 show_progress_summary()
             elif choice == 3:
+                show_team_history()
+            elif choice == 4:
                 print("👋 Goodbye!")
                 break
             else:
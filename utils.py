@@ -1,9 +1,35 @@
+import os
+import threading
+import uuid
+from contextlib import contextmanager
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 from typing import List, Optional
 
+POSITIONS = ["QB", "RB", "WR", "TE", "OL", "DL", "LB", "DB", "K", "P"]
+
+STAT_COLUMNS = ['Games Played', 'Passing Yards', 'Rushing Yards', 'Receiving Yards',
+                'Touchdowns', 'Tackles', 'Sacks', 'Interceptions']
+
+MAX_GAMES_PER_SEASON = 14
+
+# Highest plausible season total for each stat by position (same position roles as generate_cjfl_data,
+# with headroom for trick plays and long seasons). Used to flag data-entry mistakes on import.
+POSITION_STAT_LIMITS = {
+    'QB': {'Passing Yards': 6000, 'Rushing Yards': 1500, 'Receiving Yards': 100, 'Touchdowns': 60, 'Tackles': 10, 'Sacks': 0, 'Interceptions': 2},
+    'RB': {'Passing Yards': 200, 'Rushing Yards': 3000, 'Receiving Yards': 1000, 'Touchdowns': 35, 'Tackles': 10, 'Sacks': 0, 'Interceptions': 2},
+    'WR': {'Passing Yards': 200, 'Rushing Yards': 500, 'Receiving Yards': 2000, 'Touchdowns': 25, 'Tackles': 10, 'Sacks': 0, 'Interceptions': 2},
+    'TE': {'Passing Yards': 100, 'Rushing Yards': 300, 'Receiving Yards': 1500, 'Touchdowns': 20, 'Tackles': 10, 'Sacks': 0, 'Interceptions': 2},
+    'OL': {'Passing Yards': 0, 'Rushing Yards': 50, 'Receiving Yards': 50, 'Touchdowns': 2, 'Tackles': 10, 'Sacks': 0, 'Interceptions': 1},
+    'DL': {'Passing Yards': 0, 'Rushing Yards': 50, 'Receiving Yards': 50, 'Touchdowns': 4, 'Tackles': 120, 'Sacks': 25, 'Interceptions': 3},
+    'LB': {'Passing Yards': 0, 'Rushing Yards': 100, 'Receiving Yards': 50, 'Touchdowns': 4, 'Tackles': 150, 'Sacks': 20, 'Interceptions': 10},
+    'DB': {'Passing Yards': 0, 'Rushing Yards': 200, 'Receiving Yards': 200, 'Touchdowns': 6, 'Tackles': 120, 'Sacks': 8, 'Interceptions': 15},
+    'K': {'Passing Yards': 100, 'Rushing Yards': 100, 'Receiving Yards': 50, 'Touchdowns': 2, 'Tackles': 10, 'Sacks': 0, 'Interceptions': 0},
+    'P': {'Passing Yards': 100, 'Rushing Yards': 100, 'Receiving Yards': 50, 'Touchdowns': 2, 'Tackles': 10, 'Sacks': 0, 'Interceptions': 0}
+}
+
 def generate_cjfl_data() -> pd.DataFrame:
     """
     Generate realistic CJFL player statistics data for 2022-2024 seasons.
@@ -121,11 +147,29 @@ def load_data() -> pd.DataFrame:
     """
     Load CJFL data. If no CSV file exists, generate simulated data.
     In a real implementation, this would load from a CSV file or database.
+    When CJFL_SHARED_DATASET is set, all processes share one memory-mapped Arrow copy instead.
+    """
+    from shared_dataset import shared_dataset_enabled, load_shared_dataset
+    if shared_dataset_enabled():
+        return load_shared_dataset(load_csv_data)
+    return load_csv_data()
+
+def read_player_stats(path: str) -> pd.DataFrame:
+    """
+    Read a player statistics CSV with duplicate player spellings merged by the identity mapping.
+    Raises FileNotFoundError when the file does not exist.
+    """
+    from player_identity import apply_player_identity
+    return apply_player_identity(pd.read_csv(path))
+
+def load_csv_data() -> pd.DataFrame:
+    """
+    Load CJFL data from the CSV file, generating simulated data if it does not exist.
+    Duplicate player spellings are merged using the player identity mapping when one exists.
     """
     try:
         # Try to load from CSV file
-        data = pd.read_csv('data/cjfl_stats.csv')
-        return data
+        return read_player_stats('data/cjfl_stats.csv')
     except FileNotFoundError:
         # Generate simulated data if no file exists
         data = generate_cjfl_data()
@@ -138,6 +182,77 @@ def load_data() -> pd.DataFrame:
         data.to_csv('data/cjfl_stats.csv', index=False)
         return data
 
+def file_signature(path: str) -> Optional[tuple]:
+    """
+    Modification time and size of a file, or None when it does not exist.
+    Used as a cache key so cached results are recomputed when the file changes.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+@contextmanager
+def atomic_path(path: str):
+    """
+    Temporary file name next to path to write to; it replaces path when the block finishes
+    and is removed if the block fails, so readers never see a half-written file. The name is
+    unique per process, thread and call, so concurrent writers never share a temp file.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.{uuid.uuid4().hex[:12]}.tmp"
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+def add_derived_columns(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add the combined and per-game statistics used by the dashboards.
+    """
+    derived = {
+        'Total Yards': lambda df: df['Passing Yards'] + df['Rushing Yards'] + df['Receiving Yards'],
+        'Total Offensive Yards': lambda df: df['Rushing Yards'] + df['Receiving Yards'],
+        'Yards per Game': lambda df: df['Total Yards'] / df['Games Played'],
+        'Touchdowns per Game': lambda df: df['Touchdowns'] / df['Games Played'],
+        'Tackles per Game': lambda df: df['Tackles'] / df['Games Played'],
+        'Sacks per Game': lambda df: df['Sacks'] / df['Games Played']
+    }
+    
+    # Shallow copy: new columns never touch the caller's frame, existing columns are not duplicated.
+    # Columns that are already present (e.g. from the shared dataset) are reused as-is.
+    data = data.copy(deep=False)
+    for column, compute in derived.items():
+        if column not in data.columns:
+            data[column] = compute(data)
+    return data
+
+def normalize_player_names(names: pd.Series) -> pd.Series:
+    """
+    Comparison form of player names: accents stripped, lower case, punctuation and extra spaces removed.
+    Anything that is not a string becomes an empty name.
+    """
+    names = names.where(names.map(lambda name: isinstance(name, str)), "").astype(str)
+    return (names.str.normalize('NFKD').str.encode('ascii', 'ignore').str.decode('ascii').str.lower()
+            .str.replace("'", "", regex=False).str.replace(r"[^a-z ]", " ", regex=True).str.split().str.join(" "))
+
+def normalize_player_name(name) -> str:
+    """
+    Comparison form of one player name (see normalize_player_names).
+    """
+    return normalize_player_names(pd.Series([name], dtype=object)).iloc[0]
+
+def player_key(data: pd.DataFrame) -> pd.Series:
+    """
+    Identity key of each row: normalized player name, lower-case team and season.
+    Used wherever rows describing the same player-season must be found.
+    """
+    return (normalize_player_names(data['Player Name']) + "|" + data['Team'].astype(str).str.lower()
+            + "|" + data['Season'].astype(str))
+
 def filter_data(data: pd.DataFrame, 
                 seasons: List[int], 
                 teams: List[str], 
@@ -146,7 +261,7 @@ def filter_data(data: pd.DataFrame,
     """
     Filter the dataset based on user selections.
     """
-    filtered = data.copy()
+    filtered = data.copy(deep=False)
     
     # Filter by seasons
     if seasons:
@@ -166,6 +281,44 @@ def filter_data(data: pd.DataFrame,
     
     return filtered
 
+def get_top_players(data: pd.DataFrame, stat_name: str, top_n: int = 10) -> pd.DataFrame:
+    """
+    Leaderboard rows for a statistic, skipping players where the stat is undefined.
+    """
+    return data[data[stat_name].notna()].nlargest(top_n, stat_name)
+
+def calculate_team_stats(data: pd.DataFrame, team: str) -> dict:
+    """
+    Season totals for one team, summed from its player rows.
+    """
+    team_data = data[data['Team'] == team]
+    
+    return {
+        'Total Yards': team_data[['Passing Yards', 'Rushing Yards', 'Receiving Yards']].sum().sum(),
+        'Passing Yards': team_data['Passing Yards'].sum(),
+        'Rushing Yards': team_data['Rushing Yards'].sum(),
+        'Receiving Yards': team_data['Receiving Yards'].sum(),
+        'Touchdowns': team_data['Touchdowns'].sum(),
+        'Tackles': team_data['Tackles'].sum(),
+        'Sacks': team_data['Sacks'].sum(),
+        'Interceptions': team_data['Interceptions'].sum(),
+        'Games Played': team_data['Games Played'].sum(),
+        'Players': len(team_data)
+    }
+
+def calculate_team_per_game(team_stats: dict) -> dict:
+    """
+    Per-game averages from calculate_team_stats totals.
+    """
+    games = team_stats['Games Played']
+    
+    return {
+        'Yards per Game': team_stats['Total Yards'] / games if games > 0 else 0,
+        'Touchdowns per Game': team_stats['Touchdowns'] / games if games > 0 else 0,
+        'Tackles per Game': team_stats['Tackles'] / games if games > 0 else 0,
+        'Sacks per Game': team_stats['Sacks'] / games if games > 0 else 0
+    }
+
 def create_player_profile(player_data: pd.DataFrame) -> go.Figure:
     """
     Create a radar chart for player profile visualization.
@@ -357,9 +510,11 @@ def create_multi_player_profile(player_data: pd.DataFrame) -> go.Figure:
     
     return fig
 
-def create_stat_comparison_chart(player_data: pd.DataFrame, stat_name: str) -> go.Figure:
+def create_stat_comparison_chart(player_data: pd.DataFrame, stat_name: str,
+                                 errors: Optional[dict] = None) -> go.Figure:
     """
     Create a bar chart comparing a specific statistic across multiple players.
+    errors optionally maps player names to Plotly error_y settings (e.g. bootstrap intervals).
     """
     if player_data.empty:
         return go.Figure()
@@ -394,6 +549,7 @@ def create_stat_comparison_chart(player_data: pd.DataFrame, stat_name: str) -> g
             marker_color=color,
             text=[f"{int(player_stats[stat_name]):,}" if stat_name in ['Passing Yards', 'Rushing Yards', 'Receiving Yards'] else str(int(player_stats[stat_name]))],
             textposition='auto',
+            error_y=(errors or {}).get(player_stats['Player Name']),
             showlegend=True
         ))
     
@@ -414,4 +570,43 @@ def create_stat_comparison_chart(player_data: pd.DataFrame, stat_name: str) -> g
         )
     )
     
-    return fig 
\ No newline at end of file
+    return fig 
+def create_leaderboard_chart(data: pd.DataFrame, stat_name: str, top_n: int = 10, title: Optional[str] = None) -> go.Figure:
+    """
+    Create a horizontal bar chart of the top players for a statistic.
+    """
+    if data.empty or stat_name not in data.columns:
+        return go.Figure()
+    
+    top_players = get_top_players(data, stat_name, top_n)
+    
+    fig = px.bar(
+        top_players,
+        x=stat_name,
+        y='Player Name',
+        color='Team',
+        orientation='h',
+        title=title or f"Top {top_n} Players by {stat_name}",
+        labels={stat_name: stat_name, 'Player Name': 'Player'},
+        color_discrete_sequence=px.colors.qualitative.Set3
+    )
+    
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#fafafa'),
+        xaxis=dict(gridcolor='#464646'),
+        yaxis=dict(gridcolor='#464646', autorange='reversed')
+    )
+    
+    return fig
+
+def render_static_chart(fig: go.Figure, image_format: str = 'svg', width: int = 900, height: int = 500) -> Optional[bytes]:
+    """
+    Render a Plotly figure to static image bytes (PNG or SVG).
+    Requires the optional kaleido package; returns None when static export is unavailable.
+    """
+    try:
+        return fig.to_image(format=image_format, width=width, height=height)
+    except Exception:
+        return None